@@ -0,0 +1,62 @@
+import json
+import statistics
+import subprocess
+import sys
+from typing import List
+
+MODULE = "inter_sdk_python.InterSdk"
+LAZY_MODULES = [
+    "inter_sdk_python.banking.BankingSdk",
+    "inter_sdk_python.billing.BillingSdk",
+    "inter_sdk_python.pix.PixSdk",
+]
+RUNS = 10
+MAX_IMPORT_MS = 250.0
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({{"elapsed": elapsed, "modules": len(sys.modules), "loaded": [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+
+def measure() -> dict:
+    """
+    Imports the SDK in a fresh interpreter, so every run pays the cold start cost.
+
+    Returns:
+        dict: Import time in milliseconds, number of loaded modules and the lazy modules that were loaded.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=MODULE, lazy=LAZY_MODULES)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    """
+    Measures the cold import time of InterSdk and fails when it exceeds MAX_IMPORT_MS or when
+    the banking, billing or pix SDKs are imported eagerly.
+    """
+    results: List[dict] = [measure() for _ in range(RUNS)]
+    median = statistics.median(result["elapsed"] for result in results)
+    loaded = sorted({module for result in results for module in result["loaded"]})
+
+    print(f"import {MODULE}: median {median:.1f} ms over {RUNS} runs, {results[0]['modules']} modules loaded")
+
+    failures = []
+    if loaded:
+        failures.append(f"modules imported eagerly: {', '.join(loaded)}")
+    if median > MAX_IMPORT_MS:
+        failures.append(f"median import time above {MAX_IMPORT_MS:.0f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import gc
+import json
+import sys
+import time
+from typing import Callable
+
+import requests
+
+from benchmarks.ModelCodecBenchmark import pix
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.pix.models.DueBilling import DueBilling
+from inter_sdk_python.pix.models.IncludeDueBillingBatchRequest import IncludeDueBillingBatchRequest
+
+BILLINGS = 1_000
+PAGE_ITEMS = 1_000
+ROUNDS = 20
+
+
+def due_billing(index: int) -> DueBilling:
+    """
+    Returns a due billing as sent in batch inclusions.
+    """
+    return DueBilling.from_dict({
+        "chave": "contato@acme.com.br", "solicitacaoPagador": f"Mensalidade {index} - referência março",
+        "calendario": {"dataDeVencimento": f"2024-04-{index % 28 + 1:02d}", "validadeAposVencimento": 30},
+        "devedor": {"cpf": f"{index:011d}", "nome": f"Cliente {index}", "email": f"cliente{index}@example.com",
+                    "cidade": "São Paulo", "uf": "SP", "cep": "01310100", "logradouro": "Avenida Paulista, 1000"},
+        "valor": {"original": f"{index % 100000 / 100:.2f}", "multa": {"modalidade": 2, "valorPerc": "2.00"},
+                  "juros": {"modalidade": 2, "valorPerc": "1.00"}},
+        "infoAdicionais": [{"nome": "Contrato", "valor": f"C-{index}"}],
+        "txid": f"7978c0c97ea847e78e884963{index:08d}"
+    })
+
+
+def response_of(content: bytes) -> requests.Response:
+    """
+    Returns a response holding the given body, as received by HttpUtils.
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = content
+    return response
+
+
+def best_time(function: Callable[[], object]) -> float:
+    """
+    Returns the best time of ROUNDS runs, with the garbage collector paused.
+    """
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - started)
+    finally:
+        gc.enable()
+    return best
+
+
+def main() -> None:
+    """
+    Compares the previous serialization of a due billing batch (to_json, sent as text) and of indented bodies
+    with JsonCodec, and the previous parsing of a page response in debug mode (response.json() twice) with a
+    single JsonCodec.loads of the received bytes, for each JSON library installed.
+    """
+    failures = []
+    request = IncludeDueBillingBatchRequest(description="Mensalidades de março",
+                                            due_billings=[due_billing(index) for index in range(BILLINGS)])
+    content = json.dumps({"parametros": {"paginacao": {"paginaAtual": 0, "itensPorPagina": PAGE_ITEMS}},
+                          "pix": [pix(index) for index in range(PAGE_ITEMS)]}).encode("utf-8")
+    expected = json.loads(content)
+
+    previous = request.to_json().encode("utf-8")
+    indented = json.dumps(request.to_dict(), indent=4).encode("utf-8")
+    before_dumps = best_time(lambda: request.to_json().encode("utf-8"))
+    before_loads = best_time(lambda: (lambda response: (response.json(), response.json()))(response_of(content)))
+    print(f"batch of {BILLINGS} billings: to_json {len(previous):,} bytes, indent=4 {len(indented):,} bytes, "
+          f"{before_dumps * 1000:.2f} ms to serialize")
+    print(f"page of {PAGE_ITEMS} pix: {before_loads * 1000:.2f} ms to parse in debug mode")
+
+    for backend in (JsonCodec.JSON, JsonCodec.UJSON, JsonCodec.ORJSON):
+        try:
+            codec = JsonCodec(backend)
+        except ValueError:
+            print(f"{backend}: not installed")
+            continue
+
+        body = codec.dumps(request.to_dict())
+        if json.loads(body) != json.loads(previous):
+            failures.append(f"{backend}: serialized batch differs from to_json")
+        if codec.loads(content) != expected:
+            failures.append(f"{backend}: parsed page differs from json.loads")
+
+        dumps = best_time(lambda: codec.dumps(request.to_dict()))
+        loads = best_time(lambda: codec.loads(response_of(content).content))
+        print(f"{backend}: batch {len(body):,} bytes ({1 - len(body) / len(previous):.0%} smaller), "
+              f"{dumps * 1000:.2f} ms to serialize ({before_dumps / dumps:.2f}x), "
+              f"page {loads * 1000:.2f} ms to parse ({before_loads / loads:.2f}x)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
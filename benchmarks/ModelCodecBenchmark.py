@@ -0,0 +1,156 @@
+import gc
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, List
+
+from inter_sdk_python.banking.models.EnrichedTransaction import EnrichedTransaction
+from inter_sdk_python.billing.models.RetrievedBilling import RetrievedBilling
+from inter_sdk_python.commons.models.FieldMapping import FieldMapping
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
+from inter_sdk_python.pix.models.Pix import Pix
+
+ITEMS = 50_000
+ROUNDS = 5
+
+
+def enriched_transaction(index: int) -> dict:
+    return {
+        "cpmf": "0", "idTransacao": f"2f9b6d4e-7c1a-4b8e-9a53-{index:012d}", "dataInclusao": "2024-03-01 10:15:00",
+        "dataTransacao": f"2024-03-{index % 28 + 1:02d}", "tipoTransacao": "PIX", "tipoOperacao": "C" if index % 3 else "D",
+        "valor": f"{index % 100000 / 100:.2f}", "titulo": "Pix recebido", "descricao": f"PIX RECEBIDO - Cp :{index:08d}-ACME LTDA",
+        "detalhes": {"tipoDetalhe": "PIX"}
+    }
+
+
+def pix(index: int) -> dict:
+    return {
+        "endToEndId": f"E00416968202403011015{index:011d}", "txid": f"7978c0c97ea847e78e884963{index:08d}",
+        "valor": f"{index % 100000 / 100:.2f}", "chave": "contato@acme.com.br", "horario": "2024-03-01T10:15:00.000+00:00",
+        "infoPagador": f"Pedido {index}",
+        "devolucoes": [{"id": f"D{index}", "rtrId": f"D00416968202403011015{index:011d}", "valor": "1.00",
+                        "horario": {"solicitacao": "2024-03-01T11:00:00.000Z", "liquidacao": "2024-03-01T11:00:01.000Z"},
+                        "status": "DEVOLVIDO"}] if index % 10 == 0 else [],
+        "componentesValor": {"original": {"valor": f"{index % 100000 / 100:.2f}"}}
+    }
+
+
+def retrieved_billing(index: int) -> dict:
+    return {
+        "cobranca": {
+            "codigoSolicitacao": f"8e1b0d1a-3f4c-4e8d-b1a2-{index:012d}", "seuNumero": str(index),
+            "dataEmissao": "2024-03-01", "dataVencimento": f"2024-04-{index % 28 + 1:02d}", "valorNominal": f"{index % 100000 / 100:.2f}",
+            "tipoCobranca": "SIMPLES", "situacao": "A_RECEBER", "dataSituacao": "2024-03-01", "valorTotalRecebido": "0",
+            "arquivada": False, "descontos": [], "multa": {"codigo": "NAOTEMMULTA"}, "mora": {"codigo": "ISENTO"},
+            "pagador": {"cpfCnpj": f"{index:011d}", "tipoPessoa": "FISICA", "nome": f"Cliente {index}",
+                        "endereco": "Rua das Flores", "numero": "100", "bairro": "Centro", "cidade": "Belo Horizonte",
+                        "uf": "MG", "cep": "30110000", "email": f"cliente{index}@example.com"}
+        },
+        "boleto": {"nossoNumero": f"{index:011d}", "codigoBarras": "0" * 44, "linhaDigitavel": "0" * 47},
+        "pix": {"txid": f"txid{index:028d}", "pixCopiaECola": "00020101021226930014br.gov.bcb.pix"}
+    }
+
+
+def interpreted_decode(model: type, data: dict) -> Any:
+    """
+    Decodes a model by walking its FIELD_MAP on every call, the per-field dispatch the compiled codec avoids.
+    """
+    if not ModelCodec.has_field_map(model):
+        return model.from_dict(data)
+    values = {}
+    for mapping in model.FIELD_MAP:
+        value = data.get(mapping.key)
+        if mapping.kind == FieldMapping.VALUE:
+            values[mapping.attribute] = value
+        elif mapping.kind == FieldMapping.MODEL_LIST:
+            values[mapping.attribute] = [interpreted_decode(mapping.type, element) for element in value] if value else []
+        elif not value:
+            values[mapping.attribute] = None
+        elif mapping.kind == FieldMapping.MODEL:
+            values[mapping.attribute] = interpreted_decode(mapping.type, value)
+        elif mapping.kind == FieldMapping.ENUM:
+            values[mapping.attribute] = mapping.type(value)
+        elif mapping.kind == FieldMapping.DECIMAL:
+            values[mapping.attribute] = Decimal(value)
+        else:
+            values[mapping.attribute] = datetime.fromisoformat(value)
+    return model(**values)
+
+
+def interpreted_encode(item: Any) -> dict:
+    """
+    Encodes a model by walking its FIELD_MAP on every call.
+    """
+    if not ModelCodec.has_field_map(type(item)):
+        return item.to_dict()
+    data = {}
+    for mapping in item.FIELD_MAP:
+        value = getattr(item, mapping.attribute)
+        if mapping.kind == FieldMapping.VALUE:
+            data[mapping.key] = value
+        elif mapping.kind == FieldMapping.MODEL_LIST:
+            data[mapping.key] = [interpreted_encode(element) for element in value] if value is not None else []
+        elif value is None:
+            data[mapping.key] = None
+        elif mapping.kind == FieldMapping.MODEL:
+            data[mapping.key] = interpreted_encode(value)
+        elif mapping.kind == FieldMapping.ENUM:
+            data[mapping.key] = value.value
+        elif mapping.kind == FieldMapping.DECIMAL:
+            data[mapping.key] = float(value)
+        else:
+            data[mapping.key] = value.isoformat()
+    return data
+
+
+def throughput(function: Callable, items: List) -> float:
+    """
+    Returns the best number of items converted per second over ROUNDS runs, with the garbage
+    collector paused so both implementations are timed alike.
+    """
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            for item in items:
+                function(item)
+            best = min(best, time.perf_counter() - started)
+    finally:
+        gc.enable()
+    return len(items) / best
+
+
+def main() -> None:
+    """
+    Compares the codec compiled from the FIELD_MAP of each model with a decoder and an encoder
+    interpreting the same table field by field, and fails when both do not produce the same result.
+    """
+    failures = []
+    for model, payload in ((Pix, pix), (EnrichedTransaction, enriched_transaction), (RetrievedBilling, retrieved_billing)):
+        codec = ModelCodec.of(model)
+        payloads = [payload(index) for index in range(ITEMS)]
+        models = [codec.decode(data) for data in payloads]
+
+        if [interpreted_decode(model, data) for data in payloads] != models:
+            failures.append(f"{model.__name__}: codec decoding differs from the interpreted FIELD_MAP")
+        if [interpreted_encode(item) for item in models] != [codec.encode(item) for item in models]:
+            failures.append(f"{model.__name__}: codec encoding differs from the interpreted FIELD_MAP")
+
+        def interpreted(data: dict, model: type = model) -> Any:
+            return interpreted_decode(model, data)
+
+        decode_before, decode_after = throughput(interpreted, payloads), throughput(codec.decode, payloads)
+        encode_before, encode_after = throughput(interpreted_encode, models), throughput(codec.encode, models)
+        print(f"{model.__name__}: decode {decode_before:,.0f} -> {decode_after:,.0f} items/s "
+              f"({decode_after / decode_before:.2f}x), encode {encode_before:,.0f} -> {encode_after:,.0f} items/s "
+              f"({encode_after / encode_before:.2f}x)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
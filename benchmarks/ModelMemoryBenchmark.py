@@ -0,0 +1,84 @@
+import dataclasses
+import gc
+import sys
+import tracemalloc
+from typing import Callable, List
+
+from inter_sdk_python.banking.models.EnrichedTransaction import EnrichedTransaction
+from inter_sdk_python.billing.models.RetrievedBilling import RetrievedBilling
+from inter_sdk_python.pix.models.Pix import Pix
+
+OBJECTS = 100_000
+
+SAMPLES = [
+    (EnrichedTransaction, {
+        "cpmf": "0", "idTransacao": "2f9b6d4e-7c1a-4b8e-9a53-0e6c1d2f3a4b", "dataInclusao": "2024-03-01 10:15:00",
+        "dataTransacao": "2024-03-01", "tipoTransacao": "PIX", "tipoOperacao": "C", "valor": "150.25",
+        "titulo": "Pix recebido", "descricao": "PIX RECEBIDO - Cp :00000000-ACME LTDA",
+        "detalhes": {"nomePagador": "ACME LTDA", "cpfCnpjPagador": "12345678000199"}
+    }),
+    (Pix, {
+        "endToEndId": "E00416968202403011015abcdEFGH123", "txid": "7978c0c97ea847e78e8849634473c1f1",
+        "valor": "150.25", "chave": "contato@acme.com.br", "horario": "2024-03-01T10:15:00.000Z",
+        "infoPagador": "Pedido 1234", "devolucoes": []
+    }),
+    (RetrievedBilling, {
+        "cobranca": {"codigoSolicitacao": "8e1b0d1a-3f4c-4e8d-b1a2-5c6d7e8f9a0b", "seuNumero": "1234",
+                     "dataEmissao": "2024-03-01", "dataVencimento": "2024-03-31", "valorNominal": "150.25",
+                     "tipoCobranca": "SIMPLES", "situacao": "A_RECEBER", "dataSituacao": "2024-03-01",
+                     "pagador": {"cpfCnpj": "12345678909", "nome": "Fulano de Tal"}}
+    }),
+]
+
+
+def unslotted(model: type) -> type:
+    """
+    Returns a plain dataclass with the fields of the model, as the models were declared before
+    being slotted.
+    """
+    return dataclasses.make_dataclass(
+        f"Plain{model.__name__}",
+        [(item.name, item.type, dataclasses.field(default=None)) for item in dataclasses.fields(model)]
+    )
+
+
+def bytes_per_object(create: Callable[[], object]) -> float:
+    """
+    Measures the memory allocated by OBJECTS instances, the field values being shared by all of them.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects: List[object] = [create() for _ in range(OBJECTS)]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    allocated -= sys.getsizeof(objects)
+    return allocated / len(objects)
+
+
+def main() -> None:
+    """
+    Prints the bytes per instance of the largest collections kept by workers, with plain dataclasses
+    (before) and slotted dataclasses (after), and fails when a model still carries a __dict__.
+    """
+    failures = []
+    for model, data in SAMPLES:
+        instance = model.from_dict(data)
+        values = {item.name: getattr(instance, item.name) for item in dataclasses.fields(model)}
+        plain = unslotted(model)
+
+        before = bytes_per_object(lambda: plain(**values))
+        after = bytes_per_object(lambda: model(**values))
+        print(f"{model.__name__}: {before:.0f} -> {after:.0f} bytes per object "
+              f"({100 * (before - after) / before:.0f}% less, {OBJECTS} objects)")
+
+        if hasattr(instance, "__dict__"):
+            failures.append(f"{model.__name__} instances have a __dict__")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import base64
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Iterator, Tuple
+
+from inter_sdk_python.commons.utils.PdfUtils import PdfUtils
+
+PDF_SIZE = 16 * 1024 * 1024
+
+
+def chunks_of(body: bytes) -> Iterator[bytes]:
+    """
+    Yields the body in the chunks a streamed response is read in.
+    """
+    for start in range(0, len(body), PdfUtils.CHUNK_SIZE):
+        yield body[start:start + PdfUtils.CHUNK_SIZE]
+
+
+def previous(body: bytes, path: str) -> None:
+    """
+    The previous implementation: whole body, parsed document and decoded bytes in memory at once.
+    """
+    content = b"".join(chunks_of(body))
+    decoded = base64.b64decode(json.loads(content)["pdf"])
+    with open(path, "wb") as stream:
+        stream.write(decoded)
+
+
+def streamed(body: bytes, path: str) -> None:
+    """
+    PdfUtils.decode writing to the file chunk by chunk.
+    """
+    with open(path, "wb") as stream:
+        PdfUtils.decode(chunks_of(body), stream)
+
+
+def measure(function: Callable[[bytes, str], None], body: bytes, path: str) -> Tuple[float, float]:
+    """
+    Returns the peak memory allocated while decoding, in MiB, and the elapsed time, in seconds.
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    function(body, path)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2 ** 20, elapsed
+
+
+def main() -> None:
+    """
+    Compares the memory peak and time of decoding a PDF response with the previous implementation and
+    with PdfUtils, and fails when both do not write the same file.
+    """
+    failures = []
+    pdf = os.urandom(PDF_SIZE)
+    body = json.dumps({"pdf": base64.b64encode(pdf).decode("ascii")}).encode("utf-8")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, function in (("previous", previous), ("streamed", streamed)):
+            path = os.path.join(directory, f"{name}.pdf")
+            peak, elapsed = measure(function, body, path)
+            with open(path, "rb") as stream:
+                if stream.read() != pdf:
+                    failures.append(f"{name}: written PDF differs from the original")
+            print(f"{name}: {PDF_SIZE / 2 ** 20:.0f} MiB PDF, peak {peak:.2f} MiB allocated, {elapsed * 1000:.0f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
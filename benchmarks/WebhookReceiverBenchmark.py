@@ -0,0 +1,100 @@
+import asyncio
+import json
+import statistics
+import sys
+import time
+from typing import List, Tuple
+
+from inter_sdk_python.commons.models.WebhookEvent import WebhookEvent
+from inter_sdk_python.commons.webhooks.WebhookReceiver import WebhookReceiver
+
+NOTIFICATIONS = 5000
+REDELIVERED = 0.2
+CONNECTIONS = 50
+HANDLER_SECONDS = 0.02
+HANDLER_WORKERS = 16
+
+
+def notification(index: int) -> bytes:
+    """
+    Returns the body of a billing notification, as sent by the API.
+    """
+    return json.dumps([{
+        "codigoSolicitacao": f"b0c4a9e2-{index:08d}", "seuNumero": f"{index:08d}", "situacao": "RECEBIDO",
+        "dataHoraSituacao": "2026-10-17T10:15:00.000Z", "valorTotalRecebido": "150.00", "origemRecebimento": "BOLETO",
+        "nossoNumero": f"{index:011d}", "codigoBarras": "07796" + "0" * 39, "linhaDigitavel": "07790" + "0" * 42,
+    }]).encode("utf-8")
+
+
+async def send(port: int, bodies: List[bytes]) -> Tuple[List[float], List[int]]:
+    """
+    Posts the bodies one after the other on a keep-alive connection.
+
+    Returns:
+        Tuple[List[float], List[int]]: The time until each answer, in seconds, and its status.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    latencies, statuses = [], []
+    for body in bodies:
+        started = time.perf_counter()
+        writer.write(f"POST /billing HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        latencies.append(time.perf_counter() - started)
+        statuses.append(int(head.split(b" ", 2)[1]))
+    writer.close()
+    return latencies, statuses
+
+
+async def run() -> List[str]:
+    unique = int(NOTIFICATIONS * (1 - REDELIVERED))
+    bodies = [notification(index % unique) for index in range(NOTIFICATIONS)]
+    handled: List[WebhookEvent] = []
+    handler_times: List[float] = []
+
+    async def handler(event: WebhookEvent) -> None:
+        started = time.perf_counter()
+        await asyncio.sleep(HANDLER_SECONDS)
+        handled.append(event)
+        handler_times.append(time.perf_counter() - started)
+
+    receiver = WebhookReceiver("127.0.0.1", 0, handler, workers=HANDLER_WORKERS, queue_size=NOTIFICATIONS)
+    await receiver.start()
+    started = time.perf_counter()
+    results = await asyncio.gather(*[send(receiver.port, bodies[index::CONNECTIONS]) for index in range(CONNECTIONS)])
+    acknowledged = time.perf_counter() - started
+    await receiver.stop()
+    handled_in = time.perf_counter() - started
+
+    latencies = sorted(latency for result in results for latency in result[0])
+    statuses = {status for result in results for status in result[1]}
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(f"acknowledged {NOTIFICATIONS} notifications over {CONNECTIONS} connections in {acknowledged:.2f} s "
+          f"({NOTIFICATIONS / acknowledged:.0f}/s), ack latency p50 {p50:.2f} ms p99 {p99:.2f} ms")
+    print(f"handled {len(handled)} events ({receiver.duplicates} redeliveries dropped) in {handled_in:.2f} s "
+          f"with {HANDLER_WORKERS} workers, measured handler time p50 {statistics.median(handler_times) * 1000:.2f} ms")
+
+    failures = []
+    if statuses != {200}:
+        failures.append(f"answers other than 200: {sorted(statuses)}")
+    if len(handled) != unique or receiver.duplicates != NOTIFICATIONS - unique:
+        failures.append(f"expected {unique} events and {NOTIFICATIONS - unique} redeliveries")
+    return failures
+
+
+def main() -> None:
+    """
+    Posts a burst of billing notifications, a fifth of them redeliveries, to a WebhookReceiver with a slow
+    handler and reports the acknowledgement latency next to the measured handler time. Fails only when a
+    notification is not acknowledged with 200 or when redeliveries are handled; timings are not asserted,
+    as they depend on the machine.
+    """
+    failures = asyncio.run(run())
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -85,7 +85,7 @@ def get_inter_sdk_data(environment: str) -> InterSdk:
     password = FuncTestUtils.get_string("Password of the file with the pfx certificate")
     account = FuncTestUtils.get_string("Account")
 
-    inter_sdk = InterSdk(environment, client_id, client_secret, certificate, password)
+    inter_sdk = InterSdk(environment, client_id, client_secret, certificate, password, log_dir="logs", print_version=True)
     inter_sdk.set_account(account)
 
     inter_sdk.set_rate_limit_control(True)
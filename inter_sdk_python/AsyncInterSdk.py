@@ -0,0 +1,293 @@
+import asyncio
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional, Union
+
+from inter_sdk_python.InterSdk import InterSdk
+from inter_sdk_python.banking.AsyncBankingSdk import AsyncBankingSdk
+from inter_sdk_python.billing.AsyncBillingSdk import AsyncBillingSdk
+from inter_sdk_python.commons.models.RetryPolicy import RetryPolicy
+from inter_sdk_python.commons.utils.AsyncHttpClient import AsyncHttpClient
+from inter_sdk_python.commons.utils.AsyncSdkProxy import AsyncSdkProxy
+from inter_sdk_python.pix.AsyncPixSdk import AsyncPixSdk
+
+if TYPE_CHECKING:
+    from inter_sdk_python.commons.models.WebhookEvent import WebhookEvent
+    from inter_sdk_python.commons.utils.TokenStore import TokenStore
+    from inter_sdk_python.commons.webhooks.WebhookReceiver import WebhookReceiver
+
+
+class AsyncInterSdk:
+    DEFAULT_MAX_CONCURRENCY = 32
+
+    def __init__(self, environment: str, client_id: str, client_secret: str, certificate: str, certificate_password: str,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, log_dir: Optional[str] = None, print_version: bool = False):
+        """
+        Asyncio SDK for accessing Inter's PJ APIs. Every method of the banking, billing and pix SDKs
+        is available as an awaitable with the same name, arguments and return models.
+
+        Calls are sent on the event loop over a pool of mutual TLS connections; at most max_concurrency
+        of them (32 by default) are on the wire at once and any number of coroutines can await them,
+        the others wait for a free connection. The few methods writing files or keeping local state,
+        listed by each SDK, run the synchronous SDK on a pool of max_concurrency threads instead.
+
+        Args:
+            environment (str): Environment configuration.
+            client_id (str): Application identifier.
+            client_secret (str): Application secret.
+            certificate (str): Certificate file, e.g., certs/inter.pfx.
+            certificate_password (str): Certificate password.
+            max_concurrency (int): Maximum number of requests on the wire at the same time - default is 32.
+            log_dir (Optional[str]): Directory to be created for daily log files - default is None.
+            print_version (bool): Indicates if the SDK version is printed on creation - default is False.
+
+        Raises:
+            SdkException: If an error occurs during initialization.
+        """
+        self.inter_sdk = InterSdk(environment, client_id, client_secret, certificate, certificate_password,
+                                  log_dir=log_dir, print_version=print_version)
+        self.config = self.inter_sdk.config
+        self.max_concurrency = max_concurrency
+        self.config.pool_size = max(self.config.pool_size, max_concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="inter-sdk")
+        self.http = AsyncHttpClient(self.config, max_concurrency)
+
+        self.banking_sdk = None
+        self.billing_sdk = None
+        self.pix_sdk = None
+
+    def banking(self) -> AsyncBankingSdk:
+        """
+        Async sdk for API banking.
+
+        Returns:
+            AsyncBankingSdk: Awaitable version of BankingSdk.
+        """
+        if self.banking_sdk is None:
+            self.banking_sdk = AsyncBankingSdk(self.config, self.http, AsyncSdkProxy(self.inter_sdk.banking(), self.executor))
+        return self.banking_sdk
+
+    def billing(self) -> AsyncBillingSdk:
+        """
+        Async sdk for API billing.
+
+        Returns:
+            AsyncBillingSdk: Awaitable version of BillingSdk.
+        """
+        if self.billing_sdk is None:
+            self.billing_sdk = AsyncBillingSdk(self.config, self.http, AsyncSdkProxy(self.inter_sdk.billing(), self.executor))
+        return self.billing_sdk
+
+    def pix(self) -> AsyncPixSdk:
+        """
+        Async sdk for API pix.
+
+        Returns:
+            AsyncPixSdk: Awaitable version of PixSdk.
+        """
+        if self.pix_sdk is None:
+            self.pix_sdk = AsyncPixSdk(self.config, self.http, AsyncSdkProxy(self.inter_sdk.pix(), self.executor))
+        return self.pix_sdk
+
+    def webhook_receiver(
+        self,
+        handler: Optional[Callable[["WebhookEvent"], Union[Awaitable[Any], Any]]] = None,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        workers: int = 8,
+        queue_size: int = 10000,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        on_failure: Optional[Callable[["WebhookEvent", Exception], Union[Awaitable[Any], Any]]] = None,
+        secret: Optional[str] = None
+    ) -> "WebhookReceiver":
+        """
+        Returns a server receiving the webhook notifications of billing (/billing), pix (/pix) and banking
+        (/banking), decoded into the callback models of each SDK. Notifications are acknowledged as soon as
+        they are queued and redeliveries are dropped. Start it with "async with" or serve_forever().
+
+        Args:
+            handler (Optional[Callable[[WebhookEvent], Union[Awaitable[Any], Any]]]): Called with each event;
+                      if None, events are consumed with the events() method of the receiver.
+            host (str): Address the server listens on - default is "127.0.0.1". Other addresses than loopback
+                        require an ssl_context with CERT_REQUIRED or a secret.
+            port (int): Port the server listens on - default is 8080.
+            workers (int): Number of events handled at the same time - default is 8.
+            queue_size (int): Maximum number of events waiting to be handled - default is 10000.
+            ssl_context (Optional[ssl.SSLContext]): Serves HTTPS, verifying the client certificate of the API when
+                                                    its verify_mode is CERT_REQUIRED - default is None.
+            on_failure (Optional[Callable[[WebhookEvent, Exception], Union[Awaitable[Any], Any]]]): Called with
+                      each event whose handler raised; such events are not redelivered (optional, can be None).
+            secret (Optional[str]): Value the API must send in the "secret" query parameter, registered in the
+                                    webhook URL with include_webhook (optional, can be None).
+
+        Returns:
+            WebhookReceiver: The receiver, parsing bodies with the JSON library of this SDK.
+
+        Raises:
+            ValueError: If host is not a loopback address and neither a verifying ssl_context nor a secret is given.
+        """
+        from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+        from inter_sdk_python.commons.webhooks.WebhookReceiver import WebhookReceiver
+
+        return WebhookReceiver(host, port, handler, workers, queue_size, ssl_context=ssl_context,
+                               json_codec=JsonCodec.of(self.config), on_failure=on_failure, secret=secret)
+
+    def warning_list(self) -> List[str]:
+        """
+        Returns the list of warnings from the last operation.
+
+        Returns:
+            List[str]: List of warnings, may be empty.
+        """
+        return self.inter_sdk.warning_list()
+
+    def set_debug(self, debug: bool) -> None:
+        """
+        Configures the debug mode. In debug mode, the request and response data will be logged.
+
+        Args:
+            debug (bool): Indicates if debug mode should be enabled.
+        """
+        self.inter_sdk.set_debug(debug)
+
+    def set_rate_limit_control(self, control: bool) -> None:
+        """
+        Indicates whether it will perform automatic rate limit control.
+
+        Args:
+            control (bool): Indicates if the SDK will perform automatic control - default is True.
+        """
+        self.inter_sdk.set_rate_limit_control(control)
+
+    def set_rate_limit(self, key: str, requests_per_minute: float, burst: Optional[int] = None) -> None:
+        """
+        Paces calls on the client side so bulk jobs stay under the published limits instead of
+        waiting for throttling responses.
+
+        Args:
+            key (str): A scope from Constants (e.g. Constants.PIX_READ_SCOPE), a URL path prefix
+                       (e.g. Constants.URL_BILLING) or RateLimiter.DEFAULT for every other call.
+            requests_per_minute (float): Sustained number of calls allowed per minute.
+            burst (Optional[int]): Number of calls that can be sent at once - default is 1.
+
+        Raises:
+            ValueError: If requests_per_minute is not positive or burst is less than 1.
+        """
+        self.inter_sdk.set_rate_limit(key, requests_per_minute, burst)
+
+    def set_retry_policy(self, retry_policy: RetryPolicy) -> None:
+        """
+        Defines how failed calls are retried: attempts, exponential backoff with jitter and overall deadline.
+
+        Args:
+            retry_policy (RetryPolicy): The retry policy; its metrics attribute exposes the attempt counters.
+        """
+        self.inter_sdk.set_retry_policy(retry_policy)
+
+    def set_token_scopes(self, scopes: List[str]) -> None:
+        """
+        Requests a single token covering all the given scopes instead of one token per scope.
+
+        Args:
+            scopes (List[str]): Scopes from Constants used by the application, e.g. Constants.PIX_READ_SCOPE.
+        """
+        self.inter_sdk.set_token_scopes(scopes)
+
+    async def warm_up_tokens(self, scopes: Optional[List[str]] = None) -> None:
+        """
+        Mints the tokens needed by the application ahead of the first calls, e.g. at startup.
+
+        Args:
+            scopes (Optional[List[str]]): Scopes to be prepared - default is the scopes set by set_token_scopes.
+
+        Raises:
+            SdkException: If a token cannot be obtained.
+        """
+        for scope in (scopes if scopes is not None else self.config.token_scopes or []):
+            await self.http.get_token(scope)
+
+    def set_token_store(self, token_store: 'TokenStore') -> None:
+        """
+        Shares OAuth tokens with other processes, e.g. SqliteTokenStore("/tmp/inter-tokens.db").
+
+        Args:
+            token_store (TokenStore): The shared token store.
+        """
+        self.inter_sdk.set_token_store(token_store)
+
+    def set_connection_pool(self, pool_size: int, idle_timeout: Optional[float] = 60) -> None:
+        """
+        Configures the pool of keep-alive connections shared by every call made with this SDK. The pool
+        is never smaller than max_concurrency, so every running call has a connection.
+
+        Args:
+            pool_size (int): Maximum number of connections kept open to the API.
+            idle_timeout (Optional[float]): Seconds without requests after which idle connections are
+                                            evicted - default is 60. None keeps them open until close().
+        """
+        self.inter_sdk.set_connection_pool(max(pool_size, self.max_concurrency), idle_timeout)
+
+    def set_pagination_workers(self, workers: int) -> None:
+        """
+        Retrieves the remaining pages of range retrievals concurrently once the first page gives the
+        total number of pages. Items are still returned in page order.
+
+        Args:
+            workers (int): Maximum number of pages retrieved at the same time - default is 1 (sequential).
+        """
+        self.inter_sdk.set_pagination_workers(workers)
+
+    def set_lazy_models(self, lazy: bool) -> None:
+        """
+        Indicates whether the items of enriched statement, pix and billing pages keep the received data and
+        decode each field only on first access, which is cheaper when only a few fields are read.
+
+        Args:
+            lazy (bool): Indicates if page items are decoded lazily - default is False.
+        """
+        self.inter_sdk.set_lazy_models(lazy)
+
+    def set_json_backend(self, backend: str) -> None:
+        """
+        Selects the library serializing request bodies and parsing responses.
+
+        Args:
+            backend (str): JsonCodec.ORJSON, JsonCodec.UJSON, JsonCodec.JSON or JsonCodec.AUTO to use the
+                           fastest one installed - default is JsonCodec.AUTO.
+
+        Raises:
+            ValueError: If the library is unknown or not installed.
+        """
+        self.inter_sdk.set_json_backend(backend)
+
+    def set_account(self, account: str) -> None:
+        """
+        Selects the current account. Necessary only if the application is configured with multiple accounts.
+
+        Args:
+            account (str): Current account number.
+        """
+        self.inter_sdk.set_account(account)
+
+    def get_account(self) -> str:
+        """
+        Returns the selected checking account.
+
+        Returns:
+            str: Selected checking account.
+        """
+        return self.inter_sdk.get_account()
+
+    async def close(self) -> None:
+        """
+        Waits for the calls in flight on the executor and closes the pooled connections.
+        """
+        await self.http.close()
+        await asyncio.to_thread(self.executor.shutdown, True)
+        self.inter_sdk.close()
+
+    async def __aenter__(self) -> 'AsyncInterSdk':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
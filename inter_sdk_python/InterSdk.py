@@ -1,16 +1,21 @@
 import os
 from datetime import datetime, timedelta
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
-from inter_sdk_python.banking.BankingSdk import BankingSdk
-from inter_sdk_python.billing.BillingSdk import BillingSdk
 from inter_sdk_python.commons.enums.EnvironmentEnum import EnvironmentEnum
 from inter_sdk_python.commons.exceptions.CertificateExpiredException import CertificateExpiredException
 from inter_sdk_python.commons.exceptions.CertificateNotFoundException import CertificateNotFoundException
 from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.RateLimit import RateLimit
+from inter_sdk_python.commons.models.RetryPolicy import RetryPolicy
 from inter_sdk_python.commons.structures.Constants import Constants
 from inter_sdk_python.commons.utils.SslUtils import SslUtils
-from inter_sdk_python.pix.PixSdk import PixSdk
+
+if TYPE_CHECKING:
+    from inter_sdk_python.banking.BankingSdk import BankingSdk
+    from inter_sdk_python.billing.BillingSdk import BillingSdk
+    from inter_sdk_python.commons.utils.TokenStore import TokenStore
+    from inter_sdk_python.pix.PixSdk import PixSdk
 
 
 def format_error_message(exception):
@@ -22,10 +27,12 @@ def format_error_message(exception):
 
 class InterSdk:
     VERSION = "inter-sdk-python v1.0.0"
-    warnings = []
-    def __init__(self, environment: str, client_id: str, client_secret: str, certificate: str, certificate_password: str):
+
+    def __init__(self, environment: str, client_id: str, client_secret: str, certificate: str, certificate_password: str,
+                 log_dir: Optional[str] = None, print_version: bool = False):
         """
-        SDK for accessing Inter's PJ APIs.
+        SDK for accessing Inter's PJ APIs. The banking, billing and pix SDKs are only imported on
+        their first use, and nothing is written to the file system unless log_dir is given.
 
         Args:
             environment (str): Environment configuration.
@@ -33,6 +40,9 @@ class InterSdk:
             client_secret (str): Application secret.
             certificate (str): Certificate file, e.g., certs/inter.pfx.
             certificate_password (str): Certificate password.
+            log_dir (Optional[str]): Directory to be created for daily log files, e.g. "logs". Tomorrow's
+                                     file is removed so the weekday files rotate - default is None.
+            print_version (bool): Indicates if the SDK version is printed on creation - default is False.
         
         Raises:
             SdkException: If an error occurs during initialization.
@@ -49,9 +59,10 @@ class InterSdk:
         self.banking_sdk = None
         self.billing_sdk = None
         self.pix_sdk = None
+        self.warnings: List[str] = []
 
         try:
-            private_key, certificate = SslUtils.convert_pfx_to_pem(self.config.certificate, self.config.password)
+            self.config.ssl_context, certificate = SslUtils.get_ssl_context(self.config.certificate, self.config.password)
             expire_soon, days_to_expire = SslUtils.is_certificate_expiring_soon(certificate, Constants.DAYS_TO_EXPIRE)
         except (CertificateExpiredException, CertificateNotFoundException) as e:
             message = format_error_message(e)
@@ -62,21 +73,17 @@ class InterSdk:
         if expire_soon is True:
             self.warnings.append(f"Certificate nearing expiration. Less than {Constants.DAYS_TO_EXPIRE} days left. Expires on {days_to_expire}.")
 
-        self.config.key, self.config.crt = SslUtils.get_cert_key_name(private_key, certificate)
+        if log_dir is not None:
+            os.makedirs(log_dir, exist_ok=True)
 
-        # Create logs directory if it doesn't exist
-        if not os.path.exists("logs"):
-            os.makedirs("logs")
+            tomorrow = os.path.join(log_dir, f"inter-sdk-{(datetime.now() + timedelta(days=1)).strftime('%a')}.log")
+            if os.path.exists(tomorrow):
+                os.remove(tomorrow)
 
-        tomorrow = f"logs/inter-sdk-{(datetime.now() + timedelta(days=1)).strftime('%a')}.log"
-        if os.path.exists(tomorrow):
-            os.remove(tomorrow)
+        if print_version:
+            print(self.VERSION)
 
-        print(self.VERSION)
-        
-        self.warnings: List[str] = []
-
-    def banking(self) -> BankingSdk:
+    def banking(self) -> 'BankingSdk':
         """
         Sdk for API banking.
 
@@ -84,10 +91,11 @@ class InterSdk:
             BankingSdk: The banking SDK instance.
         """
         if self.banking_sdk is None:
+            from inter_sdk_python.banking.BankingSdk import BankingSdk
             self.banking_sdk = BankingSdk(self.config)
         return self.banking_sdk
 
-    def billing(self) -> BillingSdk:
+    def billing(self) -> 'BillingSdk':
         """
         Sdk for API billing.
 
@@ -95,10 +103,11 @@ class InterSdk:
             BillingSdk: The billing SDK instance.
         """
         if self.billing_sdk is None:
+            from inter_sdk_python.billing.BillingSdk import BillingSdk
             self.billing_sdk = BillingSdk(self.config)
         return self.billing_sdk
 
-    def pix(self) -> PixSdk:
+    def pix(self) -> 'PixSdk':
         """
         Sdk for API pix.
 
@@ -106,6 +115,7 @@ class InterSdk:
             PixSdk: The pix SDK instance.
         """
         if self.pix_sdk is None:
+            from inter_sdk_python.pix.PixSdk import PixSdk
             self.pix_sdk = PixSdk(self.config)
         return self.pix_sdk
     
@@ -136,6 +146,139 @@ class InterSdk:
         """
         self.config.rate_limit_control = control
 
+    def set_rate_limit(self, key: str, requests_per_minute: float, burst: Optional[int] = None) -> None:
+        """
+        Paces calls on the client side so bulk jobs stay under the published limits instead of
+        waiting for throttling responses. The pace is lowered automatically when the server still
+        throttles a call and recovers gradually afterwards.
+
+        Args:
+            key (str): A scope from Constants (e.g. Constants.PIX_READ_SCOPE), a URL path prefix
+                       (e.g. Constants.URL_BILLING) or RateLimiter.DEFAULT for every other call.
+            requests_per_minute (float): Sustained number of calls allowed per minute.
+            burst (Optional[int]): Number of calls that can be sent at once - default is 1.
+
+        Raises:
+            ValueError: If requests_per_minute is not positive or burst is less than 1.
+        """
+        from inter_sdk_python.commons.utils.RateLimiter import RateLimiter
+
+        limit = RateLimit(requests_per_minute=requests_per_minute, burst=burst)
+        if self.config.rate_limiter is None:
+            self.config.rate_limiter = RateLimiter()
+        self.config.rate_limiter.set_limit(key, limit)
+
+    def set_retry_policy(self, retry_policy: RetryPolicy) -> None:
+        """
+        Defines how failed calls are retried: attempts, exponential backoff with jitter and overall deadline.
+        Throttled calls (429) are only retried while rate limit control is enabled.
+
+        Args:
+            retry_policy (RetryPolicy): The retry policy; its metrics attribute exposes the attempt counters.
+        """
+        self.config.retry_policy = retry_policy
+
+    def set_token_scopes(self, scopes: List[str]) -> None:
+        """
+        Requests a single token covering all the given scopes instead of one token per scope.
+        Every scope must be enabled for the application.
+
+        Args:
+            scopes (List[str]): Scopes from Constants used by the application, e.g. Constants.PIX_READ_SCOPE.
+        """
+        self.config.token_scopes = list(scopes)
+
+    def warm_up_tokens(self, scopes: Optional[List[str]] = None) -> None:
+        """
+        Mints the tokens needed by the application ahead of the first calls, e.g. at startup.
+
+        Args:
+            scopes (Optional[List[str]]): Scopes to be prepared - default is the scopes set by set_token_scopes.
+
+        Raises:
+            SdkException: If a token cannot be obtained.
+        """
+        from inter_sdk_python.commons.utils.TokenUtils import TokenUtils
+
+        for scope in (scopes if scopes is not None else self.config.token_scopes or []):
+            TokenUtils.get(self.config, scope)
+
+    def set_token_store(self, token_store: 'TokenStore') -> None:
+        """
+        Shares OAuth tokens with other processes, e.g. SqliteTokenStore("/tmp/inter-tokens.db") for
+        every worker of a host. Tokens minted by one process are reused by the others until they expire.
+
+        Args:
+            token_store (TokenStore): The shared token store.
+        """
+        self.config.token_store = token_store
+
+    def set_connection_pool(self, pool_size: int, idle_timeout: Optional[float] = 60) -> None:
+        """
+        Configures the pool of keep-alive connections shared by every call made with this SDK.
+
+        Args:
+            pool_size (int): Maximum number of connections kept open to the API - default is 10.
+            idle_timeout (Optional[float]): Seconds without requests after which idle connections are
+                                            evicted - default is 60. None keeps them open until close().
+        """
+        self.close()
+        self.config.pool_size = pool_size
+        self.config.pool_idle_timeout = idle_timeout
+
+    def set_pagination_workers(self, workers: int) -> None:
+        """
+        Retrieves the remaining pages of range retrievals concurrently once the first page gives the
+        total number of pages. Items are still returned in page order and rate limits set with
+        set_rate_limit apply to every page.
+
+        Args:
+            workers (int): Maximum number of pages retrieved at the same time - default is 1 (sequential).
+        """
+        self.config.pagination_workers = max(1, workers)
+        if workers > self.config.pool_size:
+            self.close()
+            self.config.pool_size = workers
+
+    def set_lazy_models(self, lazy: bool) -> None:
+        """
+        Indicates whether the items of enriched statement, pix and billing pages keep the received data and
+        decode each field only on first access, which is cheaper when only a few fields are read.
+
+        Args:
+            lazy (bool): Indicates if page items are decoded lazily - default is False.
+        """
+        self.config.lazy_models = lazy
+
+    def set_json_backend(self, backend: str) -> None:
+        """
+        Selects the library serializing request bodies and parsing responses. Bodies are always
+        sent compact and encoded as UTF-8, whichever library is used.
+
+        Args:
+            backend (str): JsonCodec.ORJSON, JsonCodec.UJSON, JsonCodec.JSON or JsonCodec.AUTO to use the
+                           fastest one installed - default is JsonCodec.AUTO.
+
+        Raises:
+            ValueError: If the library is unknown or not installed.
+        """
+        from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+
+        self.config.json_codec = JsonCodec(backend)
+
+    def close(self) -> None:
+        """
+        Closes the pooled connections held by this SDK. A new pool is opened on the next call.
+        """
+        if self.config.session_pool is not None:
+            self.config.session_pool.close()
+
+    def __enter__(self) -> 'InterSdk':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def set_account(self, account: str) -> None:
         """
         Selects the current account. Necessary only if the application is configured with multiple accounts.
@@ -0,0 +1,652 @@
+import logging
+from typing import Any, AsyncIterator, List, Optional
+
+from inter_sdk_python.banking.bankstatement.BankStatementClient import BankStatementClient
+from inter_sdk_python.banking.models.Balance import Balance
+from inter_sdk_python.banking.models.BankStatement import BankStatement
+from inter_sdk_python.banking.models.Batch import Batch
+from inter_sdk_python.banking.models.BatchItem import BatchItem
+from inter_sdk_python.banking.models.BatchProcessing import BatchProcessing
+from inter_sdk_python.banking.models.BilletPayment import BilletPayment
+from inter_sdk_python.banking.models.CallbackPage import CallbackPage
+from inter_sdk_python.banking.models.CallbackRetrieveFilter import CallbackRetrieveFilter
+from inter_sdk_python.banking.models.DarfPayment import DarfPayment
+from inter_sdk_python.banking.models.DarfPaymentResponse import DarfPaymentResponse
+from inter_sdk_python.banking.models.DarfPaymentSearchFilter import DarfPaymentSearchFilter
+from inter_sdk_python.banking.models.EnrichedBankStatementPage import EnrichedBankStatementPage
+from inter_sdk_python.banking.models.EnrichedTransaction import EnrichedTransaction
+from inter_sdk_python.banking.models.FilterRetrieveEnrichedStatement import FilterRetrieveEnrichedStatement
+from inter_sdk_python.banking.models.IncludeBatchPaymentResponse import IncludeBatchPaymentResponse
+from inter_sdk_python.banking.models.IncludeDarfPaymentResponse import IncludeDarfPaymentResponse
+from inter_sdk_python.banking.models.IncludePaymentResponse import IncludePaymentResponse
+from inter_sdk_python.banking.models.IncludePixResponse import IncludePixResponse
+from inter_sdk_python.banking.models.Payment import Payment
+from inter_sdk_python.banking.models.PaymentSearchFilter import PaymentSearchFilter
+from inter_sdk_python.banking.models.Pix import Pix
+from inter_sdk_python.banking.models.RetrieveCallbackResponse import RetrieveCallbackResponse
+from inter_sdk_python.banking.models.RetrievePixResponse import RetrievePixResponse
+from inter_sdk_python.banking.payments.BankingPaymentClient import BankingPaymentClient
+from inter_sdk_python.banking.webhooks.BankingWebhookClient import BankingWebhookClient
+from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.IncludeWebhookRequest import IncludeWebhookRequest
+from inter_sdk_python.commons.models.Webhook import Webhook
+from inter_sdk_python.commons.structures.Constants import Constants
+from inter_sdk_python.commons.utils.AsyncHttpClient import AsyncHttpClient
+from inter_sdk_python.commons.utils.AsyncPaginationUtils import AsyncPaginationUtils
+from inter_sdk_python.commons.utils.AsyncSdkProxy import AsyncSdkProxy
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.commons.utils.PdfUtils import PdfUtils
+from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
+
+
+class AsyncBankingSdk:
+    """
+    The AsyncBankingSdk class is the asyncio version of BankingSdk, with the same
+    methods, arguments and models. Calls are sent on the event loop by the
+    AsyncHttpClient of AsyncInterSdk and the iter_* methods return async
+    iterators retrieving the pages as tasks.
+
+    The methods writing files or keeping local state - retrieve_statement_in_pdf,
+    retrieve_enriched_statement_table, the resumable and sharded iterators and
+    statement_sync - run the blocking BankingSdk on the executor of AsyncInterSdk,
+    through AsyncSdkProxy, under the same names.
+    """
+
+    def __init__(self, config: Config, http: AsyncHttpClient, blocking: AsyncSdkProxy):
+        """
+        Args:
+            config (Config): The configuration object containing client information.
+            http (AsyncHttpClient): The client sending the calls.
+            blocking (AsyncSdkProxy): The BankingSdk running on the executor, for the methods without a native version.
+        """
+        self.config = config
+        self.http = http
+        self.blocking = blocking
+        self.bank_statement_client = BankStatementClient()
+        self.banking_payment_client = BankingPaymentClient()
+        self.banking_webhook_client = BankingWebhookClient()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.blocking, name)
+
+    async def retrieve_statement(self, initial_date: str, final_date: str) -> BankStatement:
+        """
+        Retrieves the statement for a specific period. The maximum period between the dates is 90 days.
+
+        Args:
+            initial_date (str): Starting date for the statement query in YYYY-MM-DD format.
+            final_date (str): Ending date for the statement query in YYYY-MM-DD format.
+
+        Returns:
+            List[Transaction]: A list of transactions.
+
+        Raises:
+            SdkException: If there is an error during the statement retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/extrato-1
+        """
+        logging.info("RetrieveBankStatement {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BANKING_STATEMENT) + f"?dataInicio={initial_date}&dataFim={final_date}"
+
+        json_response = await self.http.call_get(url, Constants.READ_BALANCE_SCOPE, "Error retrieving statement")
+        return BankStatement.from_dict(json_response)
+
+    async def retrieve_statement_in_pdf_bytes(self, initial_date: str, final_date: str) -> bytes:
+        """
+        Retrieves the statement in PDF format for a specific period, in memory. The maximum period between the dates is 90 days.
+
+        Args:
+            initial_date (str): Starting date for the statement export in YYYY-MM-DD format.
+            final_date (str): Ending date for the statement export in YYYY-MM-DD format.
+
+        Returns:
+            bytes: The PDF document; io.BytesIO(result) gives a file-like object.
+
+        Raises:
+            SdkException: If there is an error during the PDF statement retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/extratoexport
+        """
+        logging.info("RetrieveBankStatementInPdf {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BANKING_STATEMENT_PDF) + f"?dataInicio={initial_date}&dataFim={final_date}"
+
+        response = await self.http.call_get_raw(url, Constants.READ_BALANCE_SCOPE, "Error retrieving statement in pdf")
+        return PdfUtils.decode_content(response.content)
+
+    async def retrieve_enriched_statement(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter_retrieve: FilterRetrieveEnrichedStatement,
+        page: int,
+        page_size: int
+    ) -> EnrichedBankStatementPage:
+        """
+        Retrieves enriched statements with detailed information about each transaction for a specific period. The maximum period between the dates is 90 days.
+
+        Args:
+            initial_date (str): Starting date for the statement export in YYYY-MM-DD format.
+            final_date (str): Ending date for the statement export in YYYY-MM-DD format.
+            filter_retrieve (Optional[FilterRetrieveEnrichedStatement]): Filters for the query (optional, can be None).
+            page (int): Page number starting from 0.
+            page_size (int): Size of the page, default = 50.
+
+        Returns:
+            EnrichedBankStatementPage: A list of enriched transactions.
+
+        Raises:
+            SdkException: If there is an error during the enriched statement retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/extratocomplete-1
+        """
+        logging.info("RetrieveEnrichedBankStatement {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        return await self._get_enriched_statement_page(initial_date, final_date, page, page_size, filter_retrieve)
+
+    async def retrieve_enriched_statement_with_range(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: FilterRetrieveEnrichedStatement
+    ) -> list[EnrichedBankStatementPage]:
+        """
+        Retrieves enriched statements within a date range using the specified filters.
+
+        Args:
+            initial_date (str): Starting date for the query in YYYY-MM-DD format.
+            final_date (str): Ending date for the query in YYYY-MM-DD format.
+            filter (Optional[FilterRetrieveEnrichedStatement]): Filters for the query (optional, can be None).
+
+        Returns:
+            List[EnrichedTransaction]: A list of enriched transactions.
+
+        Raises:
+            SdkException: If there is an error during the enriched statement retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/extratocomplete
+        """
+        return await AsyncPaginationUtils.collect(
+            self.config,
+            lambda page: self._get_enriched_statement_page(initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.transactions
+        )
+
+    def iter_enriched_statement_with_range(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: FilterRetrieveEnrichedStatement
+    ) -> AsyncIterator[EnrichedTransaction]:
+        """
+        Yields the enriched transactions for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): Starting date for the query in YYYY-MM-DD format.
+            final_date (str): Ending date for the query in YYYY-MM-DD format.
+            filter (Optional[FilterRetrieveEnrichedStatement]): Filters for the query (optional, can be None).
+
+        Returns:
+            AsyncIterator[EnrichedTransaction]: The enriched transactions, in page order.
+
+        Raises:
+            SdkException: If there is an error during the enriched statement retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/extratocomplete
+        """
+        logging.info("RetrieveEnrichedBankStatement {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        return AsyncPaginationUtils.iterate(
+            self.config,
+            lambda page: self._get_enriched_statement_page(initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.transactions
+        )
+
+    async def retrieve_enriched_statement_page(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: FilterRetrieveEnrichedStatement,
+        page: int
+    ) -> EnrichedBankStatementPage:
+        """
+        Retrieves enriched statements with detailed information about each transaction for a specific period. The maximum period between the dates is 90 days.
+
+        Args:
+            initial_date (str): Starting date for the statement export in YYYY-MM-DD format.
+            final_date (str): Ending date for the statement export in YYYY-MM-DD format.
+            filter (Optional[FilterRetrieveEnrichedStatement]): Filters for the query (optional, can be None).
+            page (int): Page number starting from 0.
+
+        Returns:
+            EnrichedBankStatementPage: A list of enriched transactions.
+
+        Raises:
+            SdkException: If there is an error during the enriched statement retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/extratocomplete-1
+        """
+        logging.info("RetrieveEnrichedBankStatement {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        return await self._get_enriched_statement_page(initial_date, final_date, page, None, filter)
+
+    async def retrieve_balance(self, balance_date: str) -> Balance:
+        """
+        Retrieves the balance for a specific period.
+
+        Args:
+            balance_date (str): Date for querying the positional balance in YYYY-MM-DD format.
+
+        Returns:
+            Balance: An object containing the account balances as of the specified date.
+
+        Raises:
+            SdkException: If there is an error during the balance retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/saldo-1
+        """
+        logging.info("BalanceRetrieval banking... config.clientId = %s, balanceDate = %s", self.config.client_id, balance_date)
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BANKING_BALANCE)
+        if balance_date:
+            url += f"?dataSaldo={balance_date}"
+
+        json_response = await self.http.call_get(url, Constants.READ_BALANCE_SCOPE, "Error retrieving balance")
+        return Balance.from_dict(json_response)
+
+    async def include_payment(self, payment: BilletPayment) -> IncludePaymentResponse:
+        """
+        Method for including an immediate payment or scheduling the payment of a billet, agreement, or tax with a barcode.
+
+        Args:
+            payment (BilletPayment): Payment data.
+
+        Returns:
+            IncludePaymentResponse: An object containing quantity of approvers, payment status, transaction code, etc.
+
+        Raises:
+            SdkException: If there is an error during the payment inclusion process.
+
+        See: https://developers.bancointer.com.br/v4/reference/pagarboleto
+        """
+        logging.info("IncludePayment {} {}".format(self.config.client_id, payment.barcode))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BANKING_PAYMENT)
+
+        json_request = JsonCodec.of(self.config).dumps(payment.to_dict())
+        json_response = await self.http.call_post(url, Constants.BILLET_PAYMENT_WRITE_SCOPE, "Error including payment", json_request)
+        return IncludePaymentResponse.from_dict(json_response)
+
+    async def retrieve_payment(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: PaymentSearchFilter
+    ) -> List[Payment]:
+        """
+        Retrieves information about billets payments.
+
+        Args:
+            initial_date (str): Starting date, according to the "filterDateBy" field. Accepted format: YYYY-MM-DD.
+            final_date (str): Ending date, according to the "filterDateBy" field. Accepted format: YYYY-MM-DD.
+            filter (Optional[PaymentSearchFilter]): Filters for the query (optional, can be None).
+
+        Returns:
+            List[Payment]: A list of payments.
+
+        Raises:
+            SdkException: If there is an error during the payment retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/buscarinformacoespagamentos
+        """
+        logging.info("RetrievePayments banking {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BANKING_PAYMENT)}?dataInicio={initial_date}&dataFim={final_date}"
+        url += self.banking_payment_client.add_payment_filters(filter)
+
+        json_response = await self.http.call_get(url, Constants.BILLET_PAYMENT_READ_SCOPE, "Error retrieving payments")
+        return [Payment.from_dict(item) for item in json_response]
+
+    async def include_darf_payment(self, payment: DarfPayment) -> IncludeDarfPaymentResponse:
+        """
+        Method for including an immediate DARF payment without a barcode.
+
+        Args:
+            payment (DarfPayment): Payment data.
+
+        Returns:
+            IncludeDarfPaymentResponse: An object containing authentication, operation number, return type, transaction code, etc.
+
+        Raises:
+            SdkException: If there is an error during the DARF payment inclusion process.
+
+        See: https://developers.bancointer.com.br/v4/reference/pagamentosdarf-1
+        """
+        logging.info("IncludeDarfPayment banking {} {}".format(self.config.client_id, payment.revenue_code))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BANKING_PAYMENT_DARF)
+
+        json_request = JsonCodec.of(self.config).dumps(payment.to_dict())
+        json_response = await self.http.call_post(url, Constants.DARF_PAYMENT_WRITE_SCOPE, "Error including DARF payment", json_request)
+        return IncludeDarfPaymentResponse.from_dict(json_response)
+
+    async def retrieve_darf_payments(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: DarfPaymentSearchFilter
+    ) -> List[DarfPaymentResponse]:
+        """
+        Retrieves information about DARF payments.
+
+        Args:
+            initial_date (str): Starting date, according to the "filterDateBy" field. Accepted format: YYYY-MM-DD.
+            final_date (str): Ending date, according to the "filterDateBy" field. Accepted format: YYYY-MM-DD.
+            filter (Optional[DarfPaymentSearchFilter]): Filters for the query (optional, can be None).
+
+        Returns:
+            List[DarfPaymentResponse]: A list of DARF payments.
+
+        Raises:
+            SdkException: If there is an error during the DARF payment retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/buscarinformacoespagamentodarf
+        """
+        logging.info("RetrieveDarfPayments banking {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BANKING_PAYMENT_DARF)}?dataInicio={initial_date}&dataFim={final_date}"
+        url += self.banking_payment_client.add_darf_filters(filter)
+
+        json_response = await self.http.call_get(url, Constants.BILLET_PAYMENT_READ_SCOPE, "Error retrieving DARF payment")
+        return [DarfPaymentResponse.from_dict(item) for item in json_response]
+
+    async def include_batch_payment(
+        self,
+        my_identifier: str,
+        payments: List[BatchItem]
+    ) -> IncludeBatchPaymentResponse:
+        """
+        Inclusion of a batch of payments entered by the client.
+
+        Args:
+            my_identifier (str): Identifier for the batch for the client.
+            payments (List[BatchItem]): Payments to be processed.
+
+        Returns:
+            IncludeBatchPaymentResponse: Information regarding the batch processing.
+
+        Raises:
+            SdkException: If there is an error during the batch payment inclusion process.
+
+        See: https://developers.bancointer.com.br/v4/reference/pagamentoslote
+        """
+        logging.info("IncludeBatchPayment banking {} {} {}".format(self.config.client_id, my_identifier, len(payments)))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BANKING_PAYMENT_BATCH)
+        request = Batch(my_identifier=my_identifier, payments=payments)
+
+        json_request = JsonCodec.of(self.config).dumps(request.to_dict())
+        json_response = await self.http.call_post(url, Constants.BATCH_PAYMENT_WRITE_SCOPE, "Error including payment in batch", json_request)
+        return IncludeBatchPaymentResponse.from_dict(json_response)
+
+    async def retrieve_payment_batch(self, batch_id: str) -> BatchProcessing:
+        """
+        Retrieves a batch of payments entered by the client.
+
+        Args:
+            batch_id (str): Identifier for the batch.
+
+        Returns:
+            BatchProcessing: Information regarding the batch processing.
+
+        Raises:
+            SdkException: If there is an error during the batch payment retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/buscarinformacoespagamentolote
+        """
+        logging.info("RetrievePaymentBatch {} {}".format(self.config.client_id, batch_id))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BANKING_PAYMENT_BATCH)}/{batch_id}"
+
+        json_response = await self.http.call_get(url, Constants.BATCH_PAYMENT_READ_SCOPE, "Error to retrieve batch")
+        return BankingPaymentClient.to_batch_processing(json_response)
+
+    async def include_pix(self, pix: Pix) -> IncludePixResponse:
+        """
+        Method for including a Pix payment/transfer using banking data or a key.
+
+        Args:
+            pix (Pix): Pix data.
+
+        Returns:
+            IncludePixResponse: An object containing endToEndId, etc.
+
+        Raises:
+            SdkException: If there is an error during the Pix payment inclusion process.
+
+        See: https://developers.bancointer.com.br/v4/reference/realizarpagamentopix-1
+        """
+        logging.info("IncludePix {} {}".format(self.config.client_id, pix.description))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BANKING_PAYMENT_PIX)
+
+        json_request = JsonCodec.of(self.config).dumps(pix.to_dict())
+        json_response = await self.http.call_post(url, Constants.PIX_PAYMENT_WRITE_SCOPE, "Error including pix", json_request)
+        return IncludePixResponse.from_dict(json_response)
+
+    async def retrieve_pix(self, request_code: str) -> RetrievePixResponse:
+        """
+        Method for retrieving a Pix payment/transfer.
+
+        Args:
+            request_code (str): Pix data.
+
+        Returns:
+            RetrievePixResponse: An object containing endToEndId, etc.
+
+        Raises:
+            SdkException: If there is an error during the Pix retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/realizarpagamentopix-1
+        """
+        logging.info("RetrievePix {} {}".format(self.config.client_id, request_code))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BANKING_PAYMENT_PIX)}/{request_code}"
+
+        json_response = await self.http.call_get(url, Constants.PIX_PAYMENT_READ_SCOPE, "Error retrieving pix")
+        return RetrievePixResponse.from_dict(json_response)
+
+    async def include_webhook(self, webhook_type: str, webhook_url: str) -> None:
+        """
+        Method intended to create a webhook to receive notifications for confirmation of Pix payments (callbacks).
+
+        Args:
+            webhook_type (str): The type of the webhook.
+            webhook_url (str): The client's HTTPS server URL.
+
+        Raises:
+            SdkException: If there is an error during the webhook inclusion process.
+
+        See: https://developers.bancointer.com.br/v4/reference/webhookput
+        """
+        logging.info("IncludeWebhookBanking {} {} {}".format(self.config.client_id, webhook_type, webhook_url))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BANKING_WEBHOOK)}/{webhook_type}"
+
+        json_request = JsonCodec.of(self.config).dumps(IncludeWebhookRequest(webhook_url=webhook_url).to_dict())
+        await self.http.call_put(url, Constants.WEBHOOK_BANKING_WRITE_SCOPE, "Error including webhook", json_request)
+
+    async def retrieve_webhook(self, webhook_type: str) -> Webhook:
+        """
+        Retrieve the registered webhook.
+
+        Args:
+            webhook_type (str): The type of the webhook.
+
+        Returns:
+            Webhook: The registered webhook.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/webhookget-3
+        """
+        logging.info("RetrieveWebhook banking {} {}".format(self.config.client_id, webhook_type))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BANKING_WEBHOOK)}/{webhook_type}"
+
+        json_response = await self.http.call_get(url, Constants.WEBHOOK_BANKING_READ_SCOPE, "Error retrieving webhook")
+        return Webhook.from_dict(json_response)
+
+    async def delete_webhook(self, webhook_type: str) -> None:
+        """
+        Deletes the webhook.
+
+        Args:
+            webhook_type (str): The type of the webhook to delete.
+
+        Raises:
+            SdkException: If there is an error during the deletion process.
+
+        See: https://developers.bancointer.com.br/v4/reference/webhookdelete-3
+        """
+        logging.info("DeleteWebhook banking {} {}".format(self.config.client_id, webhook_type))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BANKING_WEBHOOK)}/{webhook_type}"
+
+        await self.http.call_delete(url, Constants.WEBHOOK_BANKING_WRITE_SCOPE, "Error deleting webhook")
+
+    async def retrieve_callback(
+        self,
+        webhook_type: str,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: CallbackRetrieveFilter
+    ) -> List[RetrieveCallbackResponse]:
+        """
+        Retrieves a collection of callbacks for a specific period, according to the provided parameters, without pagination.
+
+        Args:
+            webhook_type (str): The type of the webhook.
+            initial_date_hour (str): Starting date, accepted format: YYYY-MM-DD.
+            final_date_hour (str): Ending date, accepted format: YYYY-MM-DD.
+            filter (Optional[CallbackRetrieveFilter]): Filters for the query (optional, can be None).
+
+        Returns:
+            List[RetrieveCallbackResponse]: A list of callback responses.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/pesquisarboletos
+        """
+        return await AsyncPaginationUtils.collect(
+            self.config,
+            lambda page: self._get_callback_page(webhook_type, initial_date_hour, final_date_hour, page, None, filter),
+            lambda current_page: current_page.data
+        )
+
+    def iter_callbacks(
+        self,
+        webhook_type: str,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: CallbackRetrieveFilter
+    ) -> AsyncIterator[RetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            webhook_type (str): The type of the webhook.
+            initial_date_hour (str): Starting date, accepted format: YYYY-MM-DD.
+            final_date_hour (str): Ending date, accepted format: YYYY-MM-DD.
+            filter (Optional[CallbackRetrieveFilter]): Filters for the query (optional, can be None).
+
+        Returns:
+            AsyncIterator[RetrieveCallbackResponse]: The callbacks, in page order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/pesquisarboletos
+        """
+        logging.info("RetrieveCallbacks {} {}-{}".format(self.config.client_id, initial_date_hour, final_date_hour))
+
+        return AsyncPaginationUtils.iterate(
+            self.config,
+            lambda page: self._get_callback_page(webhook_type, initial_date_hour, final_date_hour, page, None, filter),
+            lambda current_page: current_page.data
+        )
+
+    async def retrieve_callback_page(
+        self,
+        webhook_type: str,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: CallbackRetrieveFilter,
+        page: int = 1,
+        page_size: int = 10
+    ) -> CallbackPage:
+        """
+        Retrieves a collection of billets for a specific period, according to the provided parameters, with pagination.
+
+        Args:
+            webhook_type (str): The type of the webhook.
+            initial_date_hour (str): Starting date, accepted format: YYYY-MM-DD.
+            final_date_hour (str): Ending date, accepted format: YYYY-MM-DD.
+            filter (Optional[CallbackRetrieveFilter]): Filters for the query (optional, can be None).
+            page (int): The page number to retrieve.
+            page_size (int): The number of items per page.
+
+        Returns:
+            CallbackPage: A paginated response containing callbacks.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/pesquisarboletos
+        """
+        logging.info("RetrieveCallbacks {} {}-{}".format(self.config.client_id, initial_date_hour, final_date_hour))
+
+        return await self._get_callback_page(webhook_type, initial_date_hour, final_date_hour, page, page_size, filter)
+
+    async def payment_scheduling_cancel(self, transaction_code: str) -> None:
+        """
+        Cancels the scheduling of a payment.
+
+        Args:
+            transaction_code (str): Unique transaction code.
+
+        Raises:
+            SdkException: If there is an error during the cancellation process.
+        """
+        logging.info("CancelPaymentScheduling banking {} {}".format(self.config.client_id, transaction_code))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BANKING_PAYMENT)}/{transaction_code}"
+
+        await self.http.call_delete(url, Constants.BILLET_PAYMENT_WRITE_SCOPE, "Error canceling payment scheduling")
+
+    async def _get_enriched_statement_page(self, initial_date: str, final_date: str, page: int, page_size: Optional[int],
+                                           filter_retrieve: FilterRetrieveEnrichedStatement) -> EnrichedBankStatementPage:
+        url = UrlUtils.build_url(self.config, Constants.URL_BANKING_ENRICHED_STATEMENT)
+        url += f"?dataInicio={initial_date}&dataFim={final_date}&pagina={page}"
+        if page_size is not None:
+            url += f"&tamanhoPagina={page_size}"
+        url += BankStatementClient.add_filters(filter_retrieve)
+
+        json_response = await self.http.call_get(url, Constants.READ_BALANCE_SCOPE, "Error retrieving enriched statement")
+        return EnrichedBankStatementPage.from_dict(json_response, self.config.lazy_models)
+
+    async def _get_callback_page(self, webhook_type: str, initial_date_hour: str, final_date_hour: str, page: int,
+                                 page_size: Optional[int], filter: CallbackRetrieveFilter) -> CallbackPage:
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BANKING_WEBHOOK)}/{webhook_type}/callbacks"
+        url += f"?dataHoraInicio={initial_date_hour}&dataHoraFim={final_date_hour}&pagina={page}"
+        if page_size is not None:
+            url += f"&tamanhoPagina={page_size}"
+        url += self.banking_webhook_client.add_filters(filter)
+
+        json_response = await self.http.call_get(url, Constants.WEBHOOK_BANKING_READ_SCOPE, "Error retrieving callbacks")
+        return CallbackPage.from_dict(json_response)
@@ -1,4 +1,5 @@
-from typing import List
+from datetime import timedelta
+from typing import TYPE_CHECKING, BinaryIO, Iterator, List, Optional, Union
 
 from inter_sdk_python.banking.balance.BalanceClient import BalanceClient
 from inter_sdk_python.banking.bankstatement.BankStatementClient import BankStatementClient
@@ -24,12 +25,17 @@ from inter_sdk_python.banking.models.PaymentSearchFilter import PaymentSearchFil
 from inter_sdk_python.banking.models.Pix import Pix
 from inter_sdk_python.banking.models.RetrieveCallbackResponse import RetrieveCallbackResponse
 from inter_sdk_python.banking.models.RetrievePixResponse import RetrievePixResponse
+from inter_sdk_python.banking.models.StatementTable import StatementTable
 from inter_sdk_python.banking.models.Transaction import Transaction
 from inter_sdk_python.banking.payments.BankingPaymentClient import BankingPaymentClient
 from inter_sdk_python.banking.pix.BankingPixClient import BankingPixClient
 from inter_sdk_python.banking.webhooks.BankingWebhookClient import BankingWebhookClient
 from inter_sdk_python.commons.models.Config import Config
 from inter_sdk_python.commons.models.Webhook import Webhook
+from inter_sdk_python.commons.utils.DateRangeSharder import DateRangeSharder
+
+if TYPE_CHECKING:
+    from inter_sdk_python.banking.sync.StatementSync import StatementSync
 
 
 class BankingSdk:
@@ -62,14 +68,15 @@ class BankingSdk:
 
         return self.bank_statement_client.retrieve_statement(self.config, initial_date, final_date)
     
-    def retrieve_statement_in_pdf(self, initial_date: str, final_date: str, file: str) -> None:
+    def retrieve_statement_in_pdf(self, initial_date: str, final_date: str, file: Union[str, BinaryIO]) -> None:
         """
         Retrieves the statement in PDF format for a specific period. The maximum period between the dates is 90 days.
+        The PDF is decoded while it is received, without holding the response in memory.
 
         Args:
             initial_date (str): Starting date for the statement export in YYYY-MM-DD format.
             final_date (str): Ending date for the statement export in YYYY-MM-DD format.
-            file (str): PDF file path that will be saved.
+            file (Union[str, BinaryIO]): PDF file path that will be saved, or a binary stream receiving the PDF.
 
         Raises:
             SdkException: If there is an error during the PDF statement retrieval process.
@@ -81,6 +88,27 @@ class BankingSdk:
         
         self.bank_statement_client.retrieve_statement_in_pdf(self.config, initial_date, final_date, file)
 
+    def retrieve_statement_in_pdf_bytes(self, initial_date: str, final_date: str) -> bytes:
+        """
+        Retrieves the statement in PDF format for a specific period, in memory. The maximum period between the dates is 90 days.
+
+        Args:
+            initial_date (str): Starting date for the statement export in YYYY-MM-DD format.
+            final_date (str): Ending date for the statement export in YYYY-MM-DD format.
+
+        Returns:
+            bytes: The PDF document; io.BytesIO(result) gives a file-like object.
+
+        Raises:
+            SdkException: If there is an error during the PDF statement retrieval process.
+
+        See: https://developers.bancointer.com.br/v4/reference/extratoexport
+        """
+        if self.bank_statement_client is None:
+            self.bank_statement_client = BankStatementClient()
+
+        return self.bank_statement_client.retrieve_statement_in_pdf_bytes(self.config, initial_date, final_date)
+
     def retrieve_enriched_statement(
         self, 
         initial_date: str, 
@@ -138,6 +166,124 @@ class BankingSdk:
             self.bank_statement_client = BankStatementClient()
         
         return self.bank_statement_client.retrieve_statement_with_range(self.config, initial_date, final_date, filter)
+
+    def iter_enriched_statement_with_range(
+        self, 
+        initial_date: str, 
+        final_date: str, 
+        filter: FilterRetrieveEnrichedStatement
+    ) -> Iterator[EnrichedTransaction]:
+        """
+        Yields the enriched transactions for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): Starting date for the query in YYYY-MM-DD format.
+            final_date (str): Ending date for the query in YYYY-MM-DD format.
+            filter (Optional[FilterRetrieveEnrichedStatement]): Filters for the query (optional, can be None).
+
+        Returns:
+            Iterator[EnrichedTransaction]: The enriched transactions, in page order.
+
+        Raises:
+            SdkException: If there is an error during the enriched statement retrieval process.
+        
+        See: https://developers.bancointer.com.br/v4/reference/extratocomplete
+        """
+        if self.bank_statement_client is None:
+            self.bank_statement_client = BankStatementClient()
+        
+        return self.bank_statement_client.iter_statement_with_range(self.config, initial_date, final_date, filter)
+
+    def retrieve_enriched_statement_table(
+        self, 
+        initial_date: str, 
+        final_date: str, 
+        filter: FilterRetrieveEnrichedStatement
+    ) -> StatementTable:
+        """
+        Retrieves the enriched transactions for a specific period into a columnar table, page by page, without
+        creating a list of transaction objects. Totals by day or type, filters and sorting then run over typed arrays.
+
+        Args:
+            initial_date (str): Starting date for the query in YYYY-MM-DD format.
+            final_date (str): Ending date for the query in YYYY-MM-DD format.
+            filter (Optional[FilterRetrieveEnrichedStatement]): Filters for the query (optional, can be None).
+
+        Returns:
+            StatementTable: The dates, amounts in cents, types and identifiers of the transactions.
+
+        Raises:
+            SdkException: If there is an error during the enriched statement retrieval process.
+        
+        See: https://developers.bancointer.com.br/v4/reference/extratocomplete
+        """
+        return StatementTable.from_transactions(self.iter_enriched_statement_with_range(initial_date, final_date, filter))
+
+    def iter_enriched_statement_resumable(
+        self, 
+        initial_date: str, 
+        final_date: str, 
+        filter: FilterRetrieveEnrichedStatement, 
+        checkpoint_file: str, 
+        page_size: Optional[int] = None
+    ) -> Iterator[EnrichedTransaction]:
+        """
+        Yields the enriched transactions for a specific period page by page, resuming after the last page recorded in
+        checkpoint_file, where the progress is saved after each page.
+
+        Args:
+            initial_date (str): Starting date for the query in YYYY-MM-DD format.
+            final_date (str): Ending date for the query in YYYY-MM-DD format.
+            filter (Optional[FilterRetrieveEnrichedStatement]): Filters for the query (optional, can be None).
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[EnrichedTransaction]: The enriched transactions not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the enriched statement retrieval process.
+        
+        See: https://developers.bancointer.com.br/v4/reference/extratocomplete
+        """
+        if self.bank_statement_client is None:
+            self.bank_statement_client = BankStatementClient()
+        
+        return self.bank_statement_client.iter_statement_resumable(self.config, initial_date, final_date, filter, checkpoint_file, page_size)
+
+    def iter_enriched_statement_sharded(
+        self, 
+        initial_date: str, 
+        final_date: str, 
+        filter: FilterRetrieveEnrichedStatement, 
+        shard_size: Optional[timedelta] = None, 
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[EnrichedTransaction]:
+        """
+        Yields the enriched transactions for a long period, split into day windows retrieved concurrently by up to
+        set_pagination_workers workers. Windows with too many pages are split again and items are
+        yielded in chronological window order.
+
+        Args:
+            initial_date (str): Starting date, format: YYYY-MM-DD.
+            final_date (str): Ending date, format: YYYY-MM-DD.
+            filter (Optional[FilterRetrieveEnrichedStatement]): Filters for the query (optional, can be None).
+            shard_size (Optional[timedelta]): Length of each window - default is one day.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[EnrichedTransaction]: The enriched transactions, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+        
+        See: https://developers.bancointer.com.br/v4/reference/extratocomplete
+        """
+        if self.bank_statement_client is None:
+            self.bank_statement_client = BankStatementClient()
+        
+        return self.bank_statement_client.iter_statement_sharded(self.config, initial_date, final_date, filter, shard_size, max_pages_per_shard)
     
     def retrieve_enriched_statement_page(
         self, 
@@ -451,6 +597,105 @@ class BankingSdk:
         
         return self.banking_webhook_client.retrieve_callbacks_in_range(self.config, webhook_type, initial_date_hour, final_date_hour, filter)
 
+    def iter_callbacks(
+        self, 
+        webhook_type: str, 
+        initial_date_hour: str, 
+        final_date_hour: str, 
+        filter: CallbackRetrieveFilter
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            webhook_type (str): The type of the webhook.
+            initial_date_hour (str): Starting date, accepted format: YYYY-MM-DD.
+            final_date_hour (str): Ending date, accepted format: YYYY-MM-DD.
+            filter (Optional[CallbackRetrieveFilter]): Filters for the query (optional, can be None).
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callbacks, in page order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+        
+        See: https://developers.bancointer.com.br/v4/reference/pesquisarboletos
+        """
+        if self.banking_webhook_client is None:
+            self.banking_webhook_client = BankingWebhookClient()
+        
+        return self.banking_webhook_client.iter_callbacks_in_range(self.config, webhook_type, initial_date_hour, final_date_hour, filter)
+
+    def iter_callbacks_resumable(
+        self, 
+        webhook_type: str, 
+        initial_date_hour: str, 
+        final_date_hour: str, 
+        filter: CallbackRetrieveFilter, 
+        checkpoint_file: str, 
+        page_size: Optional[int] = None
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a specific period page by page, resuming after the last page recorded in
+        checkpoint_file, where the progress is saved after each page.
+
+        Args:
+            webhook_type (str): The type of the webhook.
+            initial_date_hour (str): Starting date, accepted format: YYYY-MM-DD.
+            final_date_hour (str): Ending date, accepted format: YYYY-MM-DD.
+            filter (Optional[CallbackRetrieveFilter]): Filters for the query (optional, can be None).
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callbacks not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process.
+        
+        See: https://developers.bancointer.com.br/v4/reference/pesquisarboletos
+        """
+        if self.banking_webhook_client is None:
+            self.banking_webhook_client = BankingWebhookClient()
+        
+        return self.banking_webhook_client.iter_callbacks_resumable(self.config, webhook_type, initial_date_hour, final_date_hour, filter, checkpoint_file, page_size)
+
+    def iter_callbacks_sharded(
+        self, 
+        webhook_type: str, 
+        initial_date_hour: str, 
+        final_date_hour: str, 
+        filter: CallbackRetrieveFilter, 
+        shard_size: Optional[timedelta] = None, 
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a long period, split into hour windows retrieved concurrently by up to
+        set_pagination_workers workers. Windows with too many pages are split again and items are
+        yielded in chronological window order.
+
+        Args:
+            webhook_type (str): The type of the webhook.
+            initial_date_hour (str): Starting date, format: YYYY-MM-DDTHH:MM:SSZ.
+            final_date_hour (str): Ending date, format: YYYY-MM-DDTHH:MM:SSZ.
+            filter (Optional[CallbackRetrieveFilter]): Filters for the query (optional, can be None).
+            shard_size (Optional[timedelta]): Length of each window - default is one hour.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callbacks, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+        
+        See: https://developers.bancointer.com.br/v4/reference/pesquisarboletos
+        """
+        if self.banking_webhook_client is None:
+            self.banking_webhook_client = BankingWebhookClient()
+        
+        return self.banking_webhook_client.iter_callbacks_sharded(self.config, webhook_type, initial_date_hour, final_date_hour, filter, shard_size, max_pages_per_shard)
+
     def retrieve_callback_page(
         self, 
         webhook_type: str, 
@@ -497,4 +742,20 @@ class BankingSdk:
         if self.banking_payment_client is None:
             self.banking_payment_client = BankingPaymentClient()
         
-        self.banking_payment_client.cancel(self.config, transaction_code)
\ No newline at end of file
+        self.banking_payment_client.cancel(self.config, transaction_code)
+
+    def statement_sync(self, path: str, overlap_days: int = 1) -> 'StatementSync':
+        """
+        Returns a synchronizer keeping a local SQLite copy of the enriched statement. Each call to its
+        sync() method requests only the days since the previous one and returns the new or changed
+        transactions of the selected account.
+
+        Args:
+            path (str): Path of the database file, created if it does not exist.
+            overlap_days (int): Days before the last synchronized date requested again - default is 1.
+
+        Returns:
+            StatementSync: The synchronizer bound to this SDK configuration.
+        """
+        from inter_sdk_python.banking.sync.StatementSync import StatementSync
+        return StatementSync(self.config, path, overlap_days)
@@ -1,16 +1,19 @@
-import base64
 import json
 import logging
-from typing import List
+from datetime import timedelta
+from typing import BinaryIO, Iterator, List, Optional, Union
 
 from inter_sdk_python.banking.models.BankStatement import BankStatement
 from inter_sdk_python.banking.models.EnrichedBankStatementPage import EnrichedBankStatementPage
 from inter_sdk_python.banking.models.EnrichedTransaction import EnrichedTransaction
 from inter_sdk_python.banking.models.FilterRetrieveEnrichedStatement import FilterRetrieveEnrichedStatement
 from inter_sdk_python.commons.models.Config import Config
-from inter_sdk_python.commons.models.PdfReturn import PdfReturn
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
 from inter_sdk_python.commons.structures.Constants import Constants
+from inter_sdk_python.commons.utils.DateRangeSharder import DateRangeSharder
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.PaginationUtils import PaginationUtils
+from inter_sdk_python.commons.utils.PdfUtils import PdfUtils
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 
 class BankStatementClient:
@@ -40,15 +43,16 @@ class BankStatementClient:
             logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
             raise
 
-    def retrieve_statement_in_pdf(self, config: Config, initial_date: str, final_date: str, file: str) -> None:
+    def retrieve_statement_in_pdf(self, config: Config, initial_date: str, final_date: str, file: Union[str, BinaryIO]) -> None:
         """
         Retrieves the bank statement in PDF format for a specified date range and saves it to a file.
+        The response is decoded while it is received, so memory use does not grow with the size of the PDF.
 
         Args:
             config (Config): The configuration object containing necessary parameters such as client ID.
             initial_date (str): The start date for the bank statement period.
             final_date (str): The end date for the bank statement period.
-            file (str): The path where the PDF file will be saved.
+            file (Union[str, BinaryIO]): The path where the PDF file will be saved, or a binary stream receiving it.
 
         Raises:
             SdkException: If an error occurs during the retrieval of the statement or if an error
@@ -59,13 +63,39 @@ class BankStatementClient:
         url = UrlUtils.build_url(config, Constants.URL_BANKING_STATEMENT_PDF)
         url += f"?dataInicio={initial_date}&dataFim={final_date}"
         
-        json_response = HttpUtils.call_get(config, url, Constants.READ_BALANCE_SCOPE, "Error retrieving statement in pdf")
+        response = HttpUtils.call_get_stream(config, url, Constants.READ_BALANCE_SCOPE, "Error retrieving statement in pdf")
         
         try:
-            pdf_return = PdfReturn.from_dict(json_response)
-            decoded_bytes = base64.b64decode(pdf_return.pdf)
-            with open(file, 'wb') as stream:
-                stream.write(decoded_bytes)
+            PdfUtils.write(response, file)
+        except Exception as io_exception:
+            logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
+            raise
+
+    def retrieve_statement_in_pdf_bytes(self, config: Config, initial_date: str, final_date: str) -> bytes:
+        """
+        Retrieves the bank statement in PDF format for a specified date range, in memory.
+
+        Args:
+            config (Config): The configuration object containing necessary parameters such as client ID.
+            initial_date (str): The start date for the bank statement period.
+            final_date (str): The end date for the bank statement period.
+
+        Returns:
+            bytes: The PDF document.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval of the statement or if an error
+                        occurs during the PDF decoding.
+        """
+        logging.info("RetrieveBankStatementInPdf {} {}-{}".format(config.client_id, initial_date, final_date))
+
+        url = UrlUtils.build_url(config, Constants.URL_BANKING_STATEMENT_PDF)
+        url += f"?dataInicio={initial_date}&dataFim={final_date}"
+
+        response = HttpUtils.call_get_stream(config, url, Constants.READ_BALANCE_SCOPE, "Error retrieving statement in pdf")
+
+        try:
+            return PdfUtils.to_bytes(response)
         except Exception as io_exception:
             logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
             raise
@@ -107,22 +137,113 @@ class BankStatementClient:
         Returns:
             List[EnrichedTransaction]: A list of all transactions within the date range.
 
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+        """
+        return list(self.iter_statement_with_range(config, initial_date, final_date, filter_retrieve))
+
+    def iter_statement_with_range(self, config: Config, initial_date: str, final_date: str, filter_retrieve: FilterRetrieveEnrichedStatement) -> Iterator[EnrichedTransaction]:
+        """
+        Yields the transactions within the specified date range page by page, so at most config.pagination_workers
+        pages are kept in memory and the first items are available as soon as the first page is retrieved.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date of the statement range (inclusive).
+            final_date (str): The end date of the statement range (inclusive).
+            filter_retrieve (Optional[FilterRetrieveEnrichedStatement]): Optional filters for retrieving enriched bank statements.
+
+        Returns:
+            Iterator[EnrichedTransaction]: The transactions, in page order.
+
         Raises:
             SdkException: If there is an error during the retrieval process.
         """
         logging.info("RetrieveEnrichedBankStatement {} {}-{}".format(config.client_id, initial_date, final_date))
-        page = 0
-        transactions = []
-        
-        while True:
-            transaction_page = self.get_page(config, initial_date, final_date, page, None, filter_retrieve)
-            transactions.extend(transaction_page.transactions)
-            
-            if page >= transaction_page.total_pages:
-                break
-            page += 1
 
-        return transactions
+        yield from PaginationUtils.iterate(
+            config,
+            lambda page: self.get_page(config, initial_date, final_date, page, None, filter_retrieve),
+            lambda current_page: current_page.transactions
+        )
+
+    def iter_statement_resumable(
+        self,
+        config: Config,
+        initial_date: str,
+        final_date: str,
+        filter_retrieve: FilterRetrieveEnrichedStatement,
+        checkpoint_file: str,
+        page_size: Optional[int] = None
+    ) -> Iterator[EnrichedTransaction]:
+        """
+        Yields the transactions within the specified date range, resuming after the last page recorded in
+        checkpoint_file. The checkpoint is saved there after each page, so an interrupted retrieval
+        continues from the next page when called again with the same arguments.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date of the statement range (inclusive).
+            final_date (str): The end date of the statement range (inclusive).
+            filter_retrieve (Optional[FilterRetrieveEnrichedStatement]): Optional filters for retrieving enriched bank statements.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[EnrichedTransaction]: The transactions not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process.
+        """
+        logging.info("RetrieveEnrichedBankStatement {} {}-{}".format(config.client_id, initial_date, final_date))
+
+        checkpoint = PaginationCheckpoint.of(Constants.URL_BANKING_ENRICHED_STATEMENT, initial_date, final_date, filter_retrieve, None, page_size)
+        yield from PaginationUtils.iterate_resumable(
+            checkpoint_file,
+            checkpoint,
+            lambda page: self.get_page(config, initial_date, final_date, page, page_size, filter_retrieve),
+            lambda current_page: current_page.transactions
+        )
+
+    def iter_statement_sharded(
+        self,
+        config: Config,
+        initial_date: str,
+        final_date: str,
+        filter_retrieve: FilterRetrieveEnrichedStatement,
+        shard_size: Optional[timedelta] = None,
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[EnrichedTransaction]:
+        """
+        Yields the transactions within the specified range, splitting it into day windows retrieved
+        concurrently by up to config.pagination_workers workers. Windows with too many pages are split
+        again, and items are yielded in chronological window order.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start of the range (inclusive), YYYY-MM-DD.
+            final_date (str): The end of the range (inclusive), YYYY-MM-DD.
+            filter_retrieve (Optional[FilterRetrieveEnrichedStatement]): Optional filters for retrieving enriched bank statements.
+            shard_size (Optional[timedelta]): Length of each window - default is one day.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[EnrichedTransaction]: The transactions, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveEnrichedBankStatement {} {}-{}".format(config.client_id, initial_date, final_date))
+
+        yield from DateRangeSharder.of(config, shard_size, max_pages_per_shard).iterate(
+            initial_date,
+            final_date,
+            lambda start, end, page: self.get_page(config, start, end, page, None, filter_retrieve),
+            lambda current_page: current_page.transactions,
+            lambda transaction: transaction.transaction_id or repr(transaction)
+        )
 
     def get_page(self, config: Config, initial_date: str, final_date: str, page: int, page_size: int, filter_retrieve: FilterRetrieveEnrichedStatement) -> EnrichedBankStatementPage:
         """
@@ -153,7 +274,7 @@ class BankStatementClient:
         json_response = HttpUtils.call_get(config, url, Constants.READ_BALANCE_SCOPE, "Error retrieving enriched statement")
         
         try:
-            return EnrichedBankStatementPage.from_dict(json_response)
+            return EnrichedBankStatementPage.from_dict(json_response, config.lazy_models)
         except Exception as io_exception:
             logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
             raise
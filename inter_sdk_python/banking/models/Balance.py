@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict
 
-@dataclass
+@dataclass(slots=True)
 class Balance:
     """
     The Balance class represents details about the financial balance,
@@ -5,7 +5,7 @@ from inter_sdk_python.banking.enums.AccountType import AccountType
 from inter_sdk_python.banking.models.FinancialInstitution import FinancialInstitution
 
 
-@dataclass
+@dataclass(slots=True)
 class BankDetails:
     """
     The BankDetails class contains information about bank account details,
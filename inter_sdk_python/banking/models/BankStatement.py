@@ -4,7 +4,7 @@ from typing import List, Optional, Dict
 from inter_sdk_python.banking.models.Transaction import Transaction
 
 
-@dataclass
+@dataclass(slots=True)
 class BankStatement:
     """
     The BankStatement class represents a summary of transactions 
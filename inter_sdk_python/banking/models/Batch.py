@@ -4,7 +4,7 @@ from decimal import Decimal
 from typing import List, Optional, Dict, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class DarfPaymentBatch:
     payment_type: str = field(default="DARF", init=False)
     detail: Optional[str] = None
@@ -78,7 +78,7 @@ class DarfPaymentBatch:
             "valorPrincipal": float(self.principal_value) if self.principal_value is not None else None,
         }
 
-@dataclass
+@dataclass(slots=True)
 class BilletBatch:
     payment_type: str = field(default="BOLETO", init=False)
     detail: Optional[str] = None
@@ -116,7 +116,7 @@ class BilletBatch:
             "cpfCnpjBeneficiario": self.beneficiary_document
         }
 
-@dataclass
+@dataclass(slots=True)
 class Batch:
     my_identifier: Optional[str] = field(default=None)
     payments: Optional[List[Union[BilletBatch, DarfPaymentBatch]]] = field(default=None)
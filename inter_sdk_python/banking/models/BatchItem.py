@@ -1,4 +1,4 @@
 from abc import ABC
 
 class BatchItem(ABC):
-    pass
\ No newline at end of file
+    __slots__ = ()
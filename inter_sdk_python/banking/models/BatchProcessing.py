@@ -4,7 +4,7 @@ from typing import List, Optional, Dict, Union
 from inter_sdk_python.banking.models.Batch import BilletBatch, DarfPaymentBatch
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchProcessing:
     """
     The BatchProcessing class represents the details of a batch payment processing,
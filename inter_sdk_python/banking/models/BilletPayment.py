@@ -4,7 +4,7 @@ from decimal import Decimal
 from typing import Optional, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class BilletPayment:
     """
     The BilletPayment class represents the details of a boleto payment,
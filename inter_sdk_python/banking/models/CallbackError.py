@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class CallbackError:
     """
     The CallbackError class represents an error returned in a callback,
@@ -4,7 +4,7 @@ from typing import List, Optional, Dict
 from inter_sdk_python.banking.models.RetrieveCallbackResponse import RetrieveCallbackResponse
 
 
-@dataclass
+@dataclass(slots=True)
 class CallbackPage:
     """
     The CallbackPage class represents a paginated response for callback data,
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class CallbackRetrieveFilter:
     """
     The CallbackRetrieveFilter class represents a filter for retrieving callbacks,
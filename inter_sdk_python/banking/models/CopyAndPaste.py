@@ -4,7 +4,7 @@ from typing import Optional, Dict
 from inter_sdk_python.banking.models.Recipient import Recipient
 
 
-@dataclass
+@dataclass(slots=True)
 class CopyAndPaste(Recipient):
     """
     The CopyAndPaste class represents a recipient using the Copy and Paste method,
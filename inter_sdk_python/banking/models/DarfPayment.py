@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class DarfPayment:
     """
     The DarfPayment class represents a payment for the DARF (Documento de Arrecadação de Receitas Federais),
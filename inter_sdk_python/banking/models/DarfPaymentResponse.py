@@ -3,7 +3,7 @@ from decimal import Decimal
 from typing import Optional, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class DarfPaymentResponse:
     """
     The DarfPaymentResponse class represents the response for a DARF payment request,
@@ -4,7 +4,7 @@ from typing import Optional, Dict
 from inter_sdk_python.banking.enums.DarfPaymentDateType import DarfPaymentDateType
 
 
-@dataclass
+@dataclass(slots=True)
 class DarfPaymentSearchFilter:
     """
     The DarfPaymentSearchFilter class represents the search filter for DARF payments,
@@ -2,9 +2,11 @@ from dataclasses import dataclass
 from typing import List, Optional, Dict
 
 from inter_sdk_python.banking.models.EnrichedTransaction import EnrichedTransaction
+from inter_sdk_python.banking.models.LazyEnrichedTransaction import LazyEnrichedTransaction
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichedBankStatementPage:
     """
     The EnrichedBankStatementPage class represents a paginated response for enriched bank statements,
@@ -33,16 +35,18 @@ class EnrichedBankStatementPage:
     """A list of enriched transactions for the current page."""
 
     @staticmethod
-    def from_dict(data: Dict) -> 'EnrichedBankStatementPage':
+    def from_dict(data: Dict, lazy: bool = False) -> 'EnrichedBankStatementPage':
         """
         Create an EnrichedBankStatementPage instance from a dictionary.
 
         Args:
             data (dict): A dictionary containing the enriched bank statement page data.
+            lazy (bool): Indicates if the transactions decode each field only on first access - default is False.
 
         Returns:
             EnrichedBankStatementPage: An instance of EnrichedBankStatementPage.
         """
+        decode = LazyEnrichedTransaction.wrap if lazy else ModelCodec.of(EnrichedTransaction).decode
         return EnrichedBankStatementPage(
             total_pages=data.get("totalPaginas"),
             total_elements=data.get("totalElementos"),
@@ -50,7 +54,7 @@ class EnrichedBankStatementPage:
             first_page=data.get("primeiraPagina"),
             page_size=data.get("tamanhoPagina"),
             number_of_elements=data.get("numeroDeElementos"),
-            transactions=[EnrichedTransaction.from_dict(item) for item in data.get("transacoes", [])]
+            transactions=[decode(item) for item in data.get("transacoes", [])]
         )
 
     def to_dict(self) -> dict:
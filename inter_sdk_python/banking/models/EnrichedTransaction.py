@@ -2,9 +2,11 @@ from dataclasses import dataclass
 from typing import Optional, Dict
 
 from inter_sdk_python.banking.models.EnrichedTransactionDetails import EnrichedTransactionDetails
+from inter_sdk_python.commons.models.FieldMapping import FieldMapping
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichedTransaction:
     """
     The EnrichedTransaction class represents a transaction with enriched details,
@@ -41,6 +43,20 @@ class EnrichedTransaction:
     details: Optional[EnrichedTransactionDetails] = None
     """Detailed information about the transaction."""
 
+    FIELD_MAP = (
+        FieldMapping("cpmf", "cpmf"),
+        FieldMapping("transaction_id", "idTransacao"),
+        FieldMapping("inclusion_date", "dataInclusao"),
+        FieldMapping("transaction_date", "dataTransacao"),
+        FieldMapping("transaction_type", "tipoTransacao"),
+        FieldMapping("operation_type", "tipoOperacao"),
+        FieldMapping("value", "valor"),
+        FieldMapping("title", "titulo"),
+        FieldMapping("description", "descricao"),
+        FieldMapping("details", "detalhes", FieldMapping.MODEL, EnrichedTransactionDetails)
+    )
+    """The API key and conversion of each attribute, compiled by ModelCodec."""
+
     @staticmethod
     def from_dict(data: Dict) -> 'EnrichedTransaction':
         """
@@ -52,18 +68,7 @@ class EnrichedTransaction:
         Returns:
             EnrichedTransaction: An instance of EnrichedTransaction.
         """
-        return EnrichedTransaction(
-            cpmf=data.get("cpmf"),
-            transaction_id=data.get("idTransacao"),
-            inclusion_date=data.get("dataInclusao"),
-            transaction_date=data.get("dataTransacao"),
-            transaction_type=data.get("tipoTransacao"),
-            operation_type=data.get("tipoOperacao"),
-            value=data.get("valor"),
-            title=data.get("titulo"),
-            description=data.get("descricao"),
-            details=EnrichedTransactionDetails.from_dict(data["detalhes"]) if data.get("detalhes") else None
-        )
+        return ModelCodec.of(EnrichedTransaction).decode(data)
 
     def to_dict(self) -> dict:
         """
@@ -72,15 +77,4 @@ class EnrichedTransaction:
         Returns:
             dict: A dictionary representation of the EnrichedTransaction instance.
         """
-        return {
-            "cpmf": self.cpmf,
-            "idTransacao": self.transaction_id,
-            "dataInclusao": self.inclusion_date,
-            "dataTransacao": self.transaction_date,
-            "tipoTransacao": self.transaction_type,
-            "tipoOperacao": self.operation_type,
-            "valor": self.value,
-            "titulo": self.title,
-            "descricao": self.description,
-            "detalhes": self.details.to_dict() if self.details else None
-        }
\ No newline at end of file
+        return ModelCodec.of(EnrichedTransaction).encode(self)
\ No newline at end of file
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+from inter_sdk_python.commons.models.FieldMapping import FieldMapping
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
+
+@dataclass(slots=True)
 class EnrichedTransactionDetails:
     """
     The EnrichedTransactionDetails class represents additional details related to a transaction,
@@ -11,6 +14,11 @@ class EnrichedTransactionDetails:
     detail_type: Optional[str] = None
     """The type of detail associated with the transaction."""
 
+    FIELD_MAP = (
+        FieldMapping("detail_type", "tipoDetalhe"),
+    )
+    """The API key and conversion of each attribute, compiled by ModelCodec."""
+
     @staticmethod
     def from_dict(data: Dict) -> 'EnrichedTransactionDetails':
         """
@@ -22,9 +30,7 @@ class EnrichedTransactionDetails:
         Returns:
             EnrichedTransactionDetails: An instance of EnrichedTransactionDetails.
         """
-        return EnrichedTransactionDetails(
-            detail_type=data.get("tipoDetalhe")
-        )
+        return ModelCodec.of(EnrichedTransactionDetails).decode(data)
 
     def to_dict(self) -> dict:
         """
@@ -33,6 +39,4 @@ class EnrichedTransactionDetails:
         Returns:
             dict: A dictionary representation of the EnrichedTransactionDetails instance.
         """
-        return {
-            "tipoDetalhe": self.detail_type
-        }
\ No newline at end of file
+        return ModelCodec.of(EnrichedTransactionDetails).encode(self)
\ No newline at end of file
@@ -5,7 +5,7 @@ from inter_sdk_python.banking.enums.OperationType import OperationType
 from inter_sdk_python.banking.enums.TransactionType import TransactionType
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterRetrieveEnrichedStatement:
     """
     The FilterRetrieveEnrichedStatement class represents the filters used to retrieve
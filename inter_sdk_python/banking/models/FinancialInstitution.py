@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class FinancialInstitution:
     """
     The FinancialInstitution class represents a financial institution with its code,
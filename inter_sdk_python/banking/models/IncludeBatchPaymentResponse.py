@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class IncludeBatchPaymentResponse:
     """
     The IncludeBatchPaymentResponse class represents the response for an include batch payment request,
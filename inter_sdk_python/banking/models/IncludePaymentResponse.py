@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class IncludePaymentResponse:
     """
     The IncludePaymentResponse class represents the response for including a payment,
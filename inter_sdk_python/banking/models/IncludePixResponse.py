@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class IncludePixResponse:
     """
     The IncludePixResponse class represents the response for including a PIX payment,
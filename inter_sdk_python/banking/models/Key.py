@@ -4,7 +4,7 @@ from typing import Optional, Dict
 from inter_sdk_python.banking.models.Recipient import Recipient
 
 
-@dataclass
+@dataclass(slots=True)
 class Key(Recipient):
     """
     The Key class represents a key used for PIX transactions,
@@ -0,0 +1,11 @@
+from inter_sdk_python.banking.models.EnrichedTransaction import EnrichedTransaction
+from inter_sdk_python.commons.models.LazyModel import LazyModel
+
+
+class LazyEnrichedTransaction(LazyModel, EnrichedTransaction):
+    """
+    The LazyEnrichedTransaction class is an EnrichedTransaction that decodes
+    each field from the raw dictionary on first access, details included.
+    """
+
+    __slots__ = ("_data", "_cache")
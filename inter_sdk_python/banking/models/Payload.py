@@ -5,7 +5,7 @@ from inter_sdk_python.banking.models.CallbackError import CallbackError
 from inter_sdk_python.banking.models.Receiver import Receiver
 
 
-@dataclass
+@dataclass(slots=True)
 class Payload:
     """
     The Payload class represents the details of a payment payload,
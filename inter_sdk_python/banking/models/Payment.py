@@ -3,7 +3,7 @@ from decimal import Decimal
 from typing import Optional, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     """
     The Payment class represents the details of a payment transaction,
@@ -4,7 +4,7 @@ from typing import Optional, Dict
 from inter_sdk_python.banking.enums.PaymentDateType import PaymentDateType
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentSearchFilter:
     """
     The PaymentSearchFilter class represents the filter criteria for searching payments,
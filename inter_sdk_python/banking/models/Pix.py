@@ -5,7 +5,7 @@ from typing import Optional, Dict
 from inter_sdk_python.banking.models.Recipient import Recipient
 
 
-@dataclass
+@dataclass(slots=True)
 class Pix:
     """
     The Pix class represents a PIX payment transaction,
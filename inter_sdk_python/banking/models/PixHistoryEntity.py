@@ -4,7 +4,7 @@ from typing import Optional, Dict
 from inter_sdk_python.banking.enums.PixStatus import PixStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class PixHistoryEntity:
     """
     The PixHistoryEntity class represents a historical entry 
@@ -6,7 +6,7 @@ from inter_sdk_python.banking.models.PixTransactionError import PixTransactionEr
 from inter_sdk_python.banking.models.Receiver import Receiver
 
 
-@dataclass
+@dataclass(slots=True)
 class PixTransaction:
     """
     The PixTransaction class represents a PIX transaction,
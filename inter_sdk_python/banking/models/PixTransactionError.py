@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class PixTransactionError:
     """
     The PixTransactionError class represents an error associated with 
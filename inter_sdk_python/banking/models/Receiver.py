@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class Receiver:
     """
     The Receiver class represents the recipient of a PIX transaction,
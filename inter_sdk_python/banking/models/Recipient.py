@@ -1,4 +1,4 @@
 from abc import ABC
 
 class Recipient(ABC):
-    pass
\ No newline at end of file
+    __slots__ = ()
@@ -4,7 +4,7 @@ from typing import Optional, List, Dict
 from inter_sdk_python.banking.models.Payload import Payload
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrieveCallbackResponse:
     """
     The RetrieveCallbackResponse class represents the response
@@ -5,7 +5,7 @@ from inter_sdk_python.banking.models.PixHistoryEntity import PixHistoryEntity
 from inter_sdk_python.banking.models.PixTransaction import PixTransaction
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievePixResponse:
     """
     The RetrievePixResponse class represents the response 
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from inter_sdk_python.banking.models.EnrichedTransaction import EnrichedTransaction
+
+
+@dataclass(slots=True)
+class StatementSyncResult:
+    """
+    The StatementSyncResult class represents the outcome of an enriched
+    statement synchronization: the window requested from the API and the
+    transactions that were not in the local store or whose content changed.
+    """
+
+    account: str
+    """The account synchronized, empty for the default account of the application."""
+
+    initial_date: str
+    """The start of the window requested from the API (inclusive)."""
+
+    final_date: str
+    """The end of the window requested from the API (inclusive)."""
+
+    new: List[EnrichedTransaction] = field(default_factory=list)
+    """Transactions seen for the first time."""
+
+    changed: List[EnrichedTransaction] = field(default_factory=list)
+    """Transactions already stored whose content changed since the last synchronization."""
+
+    unchanged: int = 0
+    """Number of transactions received again without changes."""
@@ -0,0 +1,283 @@
+from array import array
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from inter_sdk_python.banking.models.EnrichedTransaction import EnrichedTransaction
+from inter_sdk_python.banking.models.Transaction import Transaction
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class StatementTable:
+    """
+    The StatementTable class is a columnar view of a statement: one typed array
+    per attribute instead of one object per transaction. Dates are kept as
+    ordinal days, amounts as integer cents and transaction and operation types
+    as codes into small lookup lists, so filters, totals and sorting run over
+    the arrays. NumPy arrays are used when NumPy is installed, array.array
+    otherwise; results are the same with both.
+
+    Amounts are absolute, as sent by the API. Signed totals count credits
+    (operation type C) as positive and debits (operation type D) as negative.
+    """
+
+    CREDIT = "C"
+    DEBIT = "D"
+
+    def __init__(self, date_ordinals: Sequence[int], amount_cents: Sequence[int], operation_codes: Sequence[int],
+                 type_codes: Sequence[int], transaction_ids: List[Optional[str]], operation_types: List[str],
+                 transaction_types: List[str]):
+        """
+        Args:
+            date_ordinals (Sequence[int]): Transaction dates, as date.toordinal().
+            amount_cents (Sequence[int]): Absolute amounts, in cents.
+            operation_codes (Sequence[int]): Indexes into operation_types.
+            type_codes (Sequence[int]): Indexes into transaction_types.
+            transaction_ids (List[Optional[str]]): Transaction identifiers, None when not sent by the API.
+            operation_types (List[str]): Distinct operation types, e.g. ["C", "D"].
+            transaction_types (List[str]): Distinct transaction types, e.g. ["PIX", "BOLETO_COBRANCA"].
+        """
+        self.date_ordinals = StatementTable._column("i", date_ordinals)
+        self.amount_cents = StatementTable._column("q", amount_cents)
+        self.operation_codes = StatementTable._column("b", operation_codes)
+        self.type_codes = StatementTable._column("h", type_codes)
+        self.transaction_ids = transaction_ids
+        self.operation_types = operation_types
+        self.transaction_types = transaction_types
+
+    @staticmethod
+    def from_transactions(transactions: Iterable[Union[Transaction, EnrichedTransaction]]) -> 'StatementTable':
+        """
+        Builds the table in a single pass, so a generator such as BankingSdk.iter_enriched_statement_with_range
+        is consumed without keeping the transaction objects.
+
+        Args:
+            transactions (Iterable[Union[Transaction, EnrichedTransaction]]): Statement or enriched statement transactions.
+
+        Returns:
+            StatementTable: The columnar view of the transactions.
+        """
+        dates, cents, operations, types = array("i"), array("q"), array("b"), array("h")
+        ids: List[Optional[str]] = []
+        operation_index: Dict[str, int] = {}
+        type_index: Dict[str, int] = {}
+
+        for transaction in transactions:
+            transaction_date = getattr(transaction, "transaction_date", None) or getattr(transaction, "entry_date", None)
+            dates.append(date.fromisoformat(transaction_date[:10]).toordinal() if transaction_date else 0)
+            cents.append(int((Decimal(transaction.value) * 100).to_integral_value()) if transaction.value else 0)
+            operations.append(operation_index.setdefault(transaction.operation_type or "", len(operation_index)))
+            types.append(type_index.setdefault(transaction.transaction_type or "", len(type_index)))
+            ids.append(getattr(transaction, "transaction_id", None))
+
+        return StatementTable(dates, cents, operations, types, ids, list(operation_index), list(type_index))
+
+    def __len__(self) -> int:
+        return len(self.amount_cents)
+
+    def filter(
+        self,
+        initial_date: Optional[str] = None,
+        final_date: Optional[str] = None,
+        operation_type: Optional[str] = None,
+        transaction_types: Optional[Iterable[str]] = None,
+        min_cents: Optional[int] = None,
+        max_cents: Optional[int] = None
+    ) -> 'StatementTable':
+        """
+        Returns the rows matching every criterion given, in their current order.
+
+        Args:
+            initial_date (Optional[str]): First date, YYYY-MM-DD (optional, can be None).
+            final_date (Optional[str]): Last date, YYYY-MM-DD (optional, can be None).
+            operation_type (Optional[str]): StatementTable.CREDIT or StatementTable.DEBIT (optional, can be None).
+            transaction_types (Optional[Iterable[str]]): Accepted transaction types (optional, can be None).
+            min_cents (Optional[int]): Smallest absolute amount, in cents (optional, can be None).
+            max_cents (Optional[int]): Largest absolute amount, in cents (optional, can be None).
+
+        Returns:
+            StatementTable: A new table with the matching rows.
+        """
+        conditions: List[Tuple[Sequence[int], str, object]] = []
+        if initial_date is not None:
+            conditions.append((self.date_ordinals, ">=", date.fromisoformat(initial_date).toordinal()))
+        if final_date is not None:
+            conditions.append((self.date_ordinals, "<=", date.fromisoformat(final_date).toordinal()))
+        if operation_type is not None:
+            codes = {self.operation_types.index(operation_type)} if operation_type in self.operation_types else set()
+            conditions.append((self.operation_codes, "in", codes))
+        if transaction_types is not None:
+            wanted = set(transaction_types)
+            codes = {code for code, name in enumerate(self.transaction_types) if name in wanted}
+            conditions.append((self.type_codes, "in", codes))
+        if min_cents is not None:
+            conditions.append((self.amount_cents, ">=", min_cents))
+        if max_cents is not None:
+            conditions.append((self.amount_cents, "<=", max_cents))
+
+        if numpy is not None:
+            mask = numpy.ones(len(self), dtype=bool)
+            for column, operator, operand in conditions:
+                if operator == ">=":
+                    mask &= column >= operand
+                elif operator == "<=":
+                    mask &= column <= operand
+                else:
+                    mask &= numpy.isin(column, list(operand))
+            return self.take(numpy.flatnonzero(mask))
+
+        rows: Iterable[int] = range(len(self))
+        for column, operator, operand in conditions:
+            if operator == ">=":
+                rows = [row for row in rows if column[row] >= operand]
+            elif operator == "<=":
+                rows = [row for row in rows if column[row] <= operand]
+            else:
+                rows = [row for row in rows if column[row] in operand]
+        return self.take(rows)
+
+    def sort(self, by: str = "date", descending: bool = False) -> 'StatementTable':
+        """
+        Returns the rows ordered by a column. The sort is stable, so rows with the same key keep their order.
+
+        Args:
+            by (str): "date", "amount" (absolute) or "signed_amount" - default is "date".
+            descending (bool): Indicates if the largest keys come first - default is False.
+
+        Returns:
+            StatementTable: A new table with the rows sorted.
+
+        Raises:
+            ValueError: If the column is unknown.
+        """
+        if by == "date":
+            keys = self.date_ordinals
+        elif by == "amount":
+            keys = self.amount_cents
+        elif by == "signed_amount":
+            keys = self.signed_cents()
+        else:
+            raise ValueError(f"Unknown sort column '{by}'")
+
+        if numpy is not None:
+            order = numpy.argsort(-keys if descending else keys, kind="stable")
+        else:
+            order = sorted(range(len(self)), key=lambda row: -keys[row] if descending else keys[row])
+        return self.take(order)
+
+    def signed_cents(self) -> Sequence[int]:
+        """
+        Returns the amounts in cents, credits positive and debits negative. Rows with another
+        operation type count as zero.
+        """
+        signs = [1 if name == StatementTable.CREDIT else -1 if name == StatementTable.DEBIT else 0
+                 for name in self.operation_types]
+        if numpy is not None:
+            return self.amount_cents * numpy.array(signs or [0], dtype=numpy.int64)[self.operation_codes]
+        return array("q", (cents * signs[code] for cents, code in zip(self.amount_cents, self.operation_codes)))
+
+    def total(self, operation_type: Optional[str] = None) -> int:
+        """
+        Returns the sum of the amounts, in cents.
+
+        Args:
+            operation_type (Optional[str]): StatementTable.CREDIT or StatementTable.DEBIT to sum only those
+                                            amounts - default is None, the net of credits minus debits.
+
+        Returns:
+            int: The total, in cents.
+        """
+        _, values = self._amounts(operation_type, self.amount_cents)
+        return int(values.sum()) if numpy is not None else sum(values)
+
+    def sum_by_day(self, operation_type: Optional[str] = None) -> Dict[str, int]:
+        """
+        Returns the sum of the amounts of each day, in cents.
+
+        Args:
+            operation_type (Optional[str]): StatementTable.CREDIT or StatementTable.DEBIT to sum only those
+                                            amounts - default is None, the net of credits minus debits.
+
+        Returns:
+            Dict[str, int]: Totals by date (YYYY-MM-DD), in date order; transactions without a date under "".
+        """
+        totals = StatementTable._group(*self._amounts(operation_type, self.date_ordinals))
+        return {date.fromordinal(ordinal).isoformat() if ordinal else "": total for ordinal, total in sorted(totals.items())}
+
+    def sum_by_type(self, operation_type: Optional[str] = None) -> Dict[str, int]:
+        """
+        Returns the sum of the amounts of each transaction type, in cents.
+
+        Args:
+            operation_type (Optional[str]): StatementTable.CREDIT or StatementTable.DEBIT to sum only those
+                                            amounts - default is None, the net of credits minus debits.
+
+        Returns:
+            Dict[str, int]: Totals by transaction type.
+        """
+        totals = StatementTable._group(*self._amounts(operation_type, self.type_codes))
+        return {self.transaction_types[code]: total for code, total in sorted(totals.items())}
+
+    def take(self, rows: Iterable[int]) -> 'StatementTable':
+        """
+        Returns a new table with the given rows, in the given order.
+        """
+        if numpy is not None:
+            rows = numpy.asarray(rows, dtype=numpy.intp)
+            ids = [self.transaction_ids[row] for row in rows.tolist()]
+            return StatementTable(self.date_ordinals[rows], self.amount_cents[rows], self.operation_codes[rows],
+                                  self.type_codes[rows], ids, self.operation_types, self.transaction_types)
+
+        rows = list(rows)
+        return StatementTable(
+            array("i", (self.date_ordinals[row] for row in rows)),
+            array("q", (self.amount_cents[row] for row in rows)),
+            array("b", (self.operation_codes[row] for row in rows)),
+            array("h", (self.type_codes[row] for row in rows)),
+            [self.transaction_ids[row] for row in rows],
+            self.operation_types,
+            self.transaction_types
+        )
+
+    def rows(self) -> Iterator[Tuple[Optional[str], str, str, int, Optional[str]]]:
+        """
+        Yields each row as (date, operation type, transaction type, amount in cents, transaction id).
+        """
+        for ordinal, operation, kind, cents, transaction_id in zip(
+                self.date_ordinals, self.operation_codes, self.type_codes, self.amount_cents, self.transaction_ids):
+            yield (date.fromordinal(int(ordinal)).isoformat() if ordinal else None, self.operation_types[operation],
+                   self.transaction_types[kind], int(cents), transaction_id)
+
+    def _amounts(self, operation_type: Optional[str], keys: Sequence[int]) -> Tuple[Sequence[int], Sequence[int]]:
+        if operation_type is None:
+            return keys, self.signed_cents()
+        code = self.operation_types.index(operation_type) if operation_type in self.operation_types else -1
+        if numpy is not None:
+            mask = self.operation_codes == code
+            return keys[mask], self.amount_cents[mask]
+        selected = [(key, cents) for key, cents, operation in zip(keys, self.amount_cents, self.operation_codes)
+                    if operation == code]
+        return [key for key, _ in selected], [cents for _, cents in selected]
+
+    @staticmethod
+    def _group(keys: Sequence[int], values: Sequence[int]) -> Dict[int, int]:
+        if numpy is not None:
+            unique, inverse = numpy.unique(keys, return_inverse=True)
+            totals = numpy.zeros(len(unique), dtype=numpy.int64)
+            numpy.add.at(totals, inverse, values)
+            return dict(zip(unique.tolist(), totals.tolist()))
+
+        totals: Dict[int, int] = {}
+        for key, value in zip(keys, values):
+            totals[key] = totals.get(key, 0) + value
+        return totals
+
+    @staticmethod
+    def _column(typecode: str, values: Sequence[int]):
+        if numpy is not None:
+            return numpy.asarray(values, dtype=numpy.dtype(typecode if typecode != "q" else "int64"))
+        return values if isinstance(values, array) and values.typecode == typecode else array(typecode, values)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+@dataclass(slots=True)
 class TransactionDetails:
     """
     The TransactionDetails class represents the details of a financial
@@ -16,6 +16,7 @@ from inter_sdk_python.banking.models.PaymentSearchFilter import PaymentSearchFil
 from inter_sdk_python.commons.models.Config import Config
 from inter_sdk_python.commons.structures.Constants import Constants
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 
 
@@ -68,7 +69,7 @@ class BankingPaymentClient:
         request = Batch(my_identifier=my_identifier, payments=payments)
         
         try:
-            json_request = request.to_json()
+            json_request = JsonCodec.of(config).dumps(request.to_dict())
             json_response = HttpUtils.call_post(config, url, Constants.BATCH_PAYMENT_WRITE_SCOPE, "Error including payment in batch", json_request)
             return IncludeBatchPaymentResponse.from_dict(json_response)
         except Exception as io_exception:
@@ -98,7 +99,7 @@ class BankingPaymentClient:
         url = UrlUtils.build_url(config, Constants.URL_BANKING_PAYMENT_DARF)
         
         try:
-            json_request = pagamento.to_json()
+            json_request = JsonCodec.of(config).dumps(pagamento.to_dict())
             json_response = HttpUtils.call_post(config, url, Constants.DARF_PAYMENT_WRITE_SCOPE, "Error including DARF payment", json_request)
             return IncludeDarfPaymentResponse.from_dict(json_response)
         except Exception as io_exception:
@@ -128,7 +129,7 @@ class BankingPaymentClient:
         url = UrlUtils.build_url(config, Constants.URL_BANKING_PAYMENT)
         
         try:
-            json_request = payment.to_json()
+            json_request = JsonCodec.of(config).dumps(payment.to_dict())
             json_response = HttpUtils.call_post(config, url, Constants.BILLET_PAYMENT_WRITE_SCOPE, "Error including payment", json_request)
             return IncludePaymentResponse.from_dict(json_response)
         except Exception as io_exception:
@@ -191,27 +192,40 @@ class BankingPaymentClient:
         json_response = HttpUtils.call_get(config, url, Constants.BATCH_PAYMENT_READ_SCOPE, "Error to retrieve batch")
 
         try:
-            payments = []
-
-            if "pagamentos" in json_response and json_response["pagamentos"]:
-                for item in json_response["pagamentos"]:
-                    payment_type = item.get("tipoPagamento")
-                    if payment_type == "BILLET":
-                        billet_batch = BilletBatch.from_dict(item)
-                        payments.append(billet_batch)
-                    else:
-                        darf_batch = DarfPaymentBatch.from_dict(item)
-                        payments.append(darf_batch)
-                
-                json_response["pagamentos"] = None
-
-            batch_processing = BatchProcessing.from_dict(json_response)
-            batch_processing.payments = payments
-            return batch_processing
+            return BankingPaymentClient.to_batch_processing(json_response)
         except Exception as e:
             logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=e)
             raise
 
+    @staticmethod
+    def to_batch_processing(json_response: dict) -> BatchProcessing:
+        """
+        Decodes a payment batch, whose payments are billet or DARF payments depending on their tipoPagamento.
+
+        Args:
+            json_response (dict): The payment batch returned by the API.
+
+        Returns:
+            BatchProcessing: The payment batch along with the individual payments.
+        """
+        payments = []
+
+        if "pagamentos" in json_response and json_response["pagamentos"]:
+            for item in json_response["pagamentos"]:
+                payment_type = item.get("tipoPagamento")
+                if payment_type == "BILLET":
+                    billet_batch = BilletBatch.from_dict(item)
+                    payments.append(billet_batch)
+                else:
+                    darf_batch = DarfPaymentBatch.from_dict(item)
+                    payments.append(darf_batch)
+
+            json_response["pagamentos"] = None
+
+        batch_processing = BatchProcessing.from_dict(json_response)
+        batch_processing.payments = payments
+        return batch_processing
+
     def retrieve_payment_list_in_range(self, config: Config, initial_date: str, final_date: str, filtro: PaymentSearchFilter) -> list[Payment]:
         """
         Retrieves a list of payments based on the specified date range and filters.
@@ -6,6 +6,7 @@ from inter_sdk_python.banking.models.RetrievePixResponse import RetrievePixRespo
 from inter_sdk_python.commons.models.Config import Config
 from inter_sdk_python.commons.structures.Constants import Constants
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 
 
@@ -30,7 +31,7 @@ class BankingPixClient:
         url = UrlUtils.build_url(config, Constants.URL_BANKING_PAYMENT_PIX)
         
         try:
-            json_request =pix.to_json()
+            json_request = JsonCodec.of(config).dumps(pix.to_dict())
             json_response = HttpUtils.call_post(config, url, Constants.PIX_PAYMENT_WRITE_SCOPE, "Error including pix", json_request)
             return IncludePixResponse.from_dict(json_response)
         except Exception as io_exception:
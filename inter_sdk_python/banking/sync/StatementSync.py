@@ -0,0 +1,163 @@
+import hashlib
+import json
+import logging
+import time
+from datetime import date
+from typing import Iterator, List, Optional, Tuple
+
+from inter_sdk_python.banking.bankstatement.BankStatementClient import BankStatementClient
+from inter_sdk_python.banking.models.EnrichedTransaction import EnrichedTransaction
+from inter_sdk_python.banking.models.FilterRetrieveEnrichedStatement import FilterRetrieveEnrichedStatement
+from inter_sdk_python.banking.models.StatementSyncResult import StatementSyncResult
+from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.utils.SqliteWatermarkStore import SqliteWatermarkStore
+
+
+class StatementSync:
+    """
+    The StatementSync class keeps a local SQLite copy of the enriched statement
+    of each account. Every call to sync() requests only the window since the
+    last synchronization of the account, widened by overlap_days to catch late
+    postings, and reports the transactions that are new or whose content
+    changed. Transactions are identified by transaction_id, and by a hash of
+    their content when the API sends none.
+    """
+
+    def __init__(self, config: Config, path: str, overlap_days: int = 1):
+        """
+        Opens or creates the statement database.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            path (str): Path of the database file.
+            overlap_days (int): Days before the last synchronized date requested again - default is 1.
+        """
+        self.config = config
+        self.path = path
+        self.overlap_days = max(0, overlap_days)
+        self.bank_statement_client = BankStatementClient()
+        self.database = SqliteWatermarkStore(path, (
+            "CREATE TABLE IF NOT EXISTS transactions ("
+            "account TEXT NOT NULL, transaction_id TEXT NOT NULL, transaction_date TEXT, "
+            "row_hash TEXT NOT NULL, data TEXT NOT NULL, synced_at REAL NOT NULL, "
+            "PRIMARY KEY (account, transaction_id))",
+            "CREATE INDEX IF NOT EXISTS transactions_date ON transactions (account, transaction_date)",
+        ), "synced")
+
+    def sync(self, initial_date: Optional[str] = None, final_date: Optional[str] = None,
+             filter: Optional[FilterRetrieveEnrichedStatement] = None) -> StatementSyncResult:
+        """
+        Retrieves the enriched statement of the selected account since its last synchronization
+        and stores it, returning only the transactions that are new or changed.
+
+        Args:
+            initial_date (Optional[str]): Start of the first synchronization, YYYY-MM-DD. Ignored once the
+                                          account has a watermark, unless it is later than the watermark.
+            final_date (Optional[str]): End of the window, YYYY-MM-DD - default is today.
+            filter (Optional[FilterRetrieveEnrichedStatement]): Filters for the query (optional, can be None).
+                                                                 The watermark only advances when no filter is used.
+
+        Returns:
+            StatementSyncResult: The window requested and the new and changed transactions.
+
+        Raises:
+            ValueError: If the account was never synchronized and initial_date is not given.
+            SdkException: If there is an error during the retrieval process.
+        """
+        account = self.config.account or ""
+        final_date = final_date or date.today().isoformat()
+        start = self.window_start(account, initial_date)
+        logging.info("SyncEnrichedBankStatement {} account={} {}-{}".format(self.config.client_id, account, start, final_date))
+
+        result = StatementSyncResult(account=account, initial_date=start, final_date=final_date)
+        batch: List[EnrichedTransaction] = []
+        for transaction in self.bank_statement_client.iter_statement_with_range(self.config, start, final_date, filter):
+            batch.append(transaction)
+            if len(batch) >= SqliteWatermarkStore.BATCH_SIZE:
+                self.store(account, batch, result)
+                batch = []
+        self.store(account, batch, result)
+
+        if filter is None:
+            self.database.advance_watermark(account, final_date)
+        return result
+
+    def window_start(self, account: str, initial_date: Optional[str]) -> str:
+        """
+        Returns the first date sync() requests for the account, overlap_days before its last synchronized date.
+        """
+        return self.database.window_start(account, initial_date, self.overlap_days)
+
+    def get_watermark(self, account: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the last date synchronized for the account.
+
+        Args:
+            account (Optional[str]): The account number - default is the account selected in the configuration.
+
+        Returns:
+            Optional[str]: The date, YYYY-MM-DD, or None if the account was never synchronized.
+        """
+        return self.database.get_watermark(account if account is not None else self.config.account or "")
+
+    def transactions(self, initial_date: str, final_date: str, account: Optional[str] = None) -> Iterator[EnrichedTransaction]:
+        """
+        Yields the stored transactions of a period, without calling the API.
+
+        Args:
+            initial_date (str): Starting date, YYYY-MM-DD.
+            final_date (str): Ending date, YYYY-MM-DD.
+            account (Optional[str]): The account number - default is the account selected in the configuration.
+
+        Returns:
+            Iterator[EnrichedTransaction]: The transactions, ordered by transaction date.
+        """
+        account = account if account is not None else self.config.account or ""
+        cursor = self.database.connection().execute(
+            "SELECT data FROM transactions WHERE account = ? AND substr(transaction_date, 1, 10) BETWEEN ? AND ? "
+            "ORDER BY transaction_date, rowid",
+            (account, initial_date, final_date)
+        )
+        for (data,) in cursor:
+            yield EnrichedTransaction.from_dict(json.loads(data))
+
+    def store(self, account: str, transactions: List[EnrichedTransaction], result: StatementSyncResult) -> None:
+        """
+        Upserts a batch of transactions in a single database transaction, recording in the result
+        which ones are new or changed.
+        """
+        if not transactions:
+            return
+
+        rows = [(transaction, *StatementSync.row_of(transaction)) for transaction in transactions]
+        now = time.time()
+        with self.database.transaction() as connection:
+            for transaction, transaction_id, row_hash, data in rows:
+                stored = connection.execute(
+                    "SELECT row_hash FROM transactions WHERE account = ? AND transaction_id = ?", (account, transaction_id)
+                ).fetchone()
+                if stored is not None and stored[0] == row_hash:
+                    result.unchanged += 1
+                    continue
+
+                connection.execute(
+                    "INSERT OR REPLACE INTO transactions (account, transaction_id, transaction_date, row_hash, data, synced_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (account, transaction_id, transaction.transaction_date, row_hash, data, now)
+                )
+                (result.new if stored is None else result.changed).append(transaction)
+
+    @staticmethod
+    def row_of(transaction: EnrichedTransaction) -> Tuple[str, str, str]:
+        """
+        Returns the identifier, content hash and serialized content of a transaction.
+        """
+        data = json.dumps(transaction.to_dict(), sort_keys=True, separators=(",", ":"))
+        row_hash = hashlib.sha256(data.encode()).hexdigest()
+        return transaction.transaction_id or f"hash:{row_hash}", row_hash, data
+
+    def close(self) -> None:
+        """
+        Closes the statement database connection of the current thread.
+        """
+        self.database.close()
@@ -0,0 +1,3 @@
+# __init__.py
+VERSION = '1.0.0'
+DEBUG = False
\ No newline at end of file
@@ -1,6 +1,7 @@
 import json
 import logging
-from typing import List
+from datetime import timedelta
+from typing import Iterator, List, Optional
 
 from inter_sdk_python.banking.models.CallbackPage import CallbackPage
 from inter_sdk_python.banking.models.CallbackRetrieveFilter import CallbackRetrieveFilter
@@ -8,8 +9,11 @@ from inter_sdk_python.banking.models.RetrieveCallbackResponse import RetrieveCal
 from inter_sdk_python.commons.models.Config import Config
 from inter_sdk_python.commons.models.IncludeWebhookRequest import IncludeWebhookRequest
 from inter_sdk_python.commons.models.Webhook import Webhook
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
 from inter_sdk_python.commons.structures.Constants import Constants
+from inter_sdk_python.commons.utils.DateRangeSharder import DateRangeSharder
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.PaginationUtils import PaginationUtils
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 from inter_sdk_python.commons.utils.WebhookUtil import WebhookUtil
 
@@ -113,25 +117,129 @@ class BankingWebhookClient:
             List[RetrieveCallbackResponse]: A list containing all callback responses
                                               within the specified date range.
 
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        return list(self.iter_callbacks_in_range(config, webhook_type, initial_date, final_date, filter))
+
+    def iter_callbacks_in_range(
+        self, 
+        config: Config, 
+        webhook_type: str, 
+        initial_date: str, 
+        final_date: str, 
+        filter: CallbackRetrieveFilter
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callback responses within the specified date range page by page, so at most config.pagination_workers
+        pages are kept in memory and the first items are available as soon as the first page is retrieved.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            webhook_type (str): The type of the webhook to retrieve callbacks for.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (Optional[CallbackRetrieveFilter]): Optional filters to apply to the callback retrieval.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callback responses, in page order.
+
         Raises:
             SdkException: If there is an error during the retrieval process, such as network issues
                            or API response errors.
         """
         logging.info("RetrieveCallbacks {} {}-{}".format(config.client_id, initial_date, final_date))
-        page = 0
-        callbacks = []
 
-        while True:
-            callback_page = self.get_page(config, webhook_type, initial_date, final_date, page, None, filter)
+        yield from PaginationUtils.iterate(
+            config,
+            lambda page: self.get_page(config, webhook_type, initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.data
+        )
+
+    def iter_callbacks_resumable(
+        self,
+        config: Config,
+        webhook_type: str,
+        initial_date: str,
+        final_date: str,
+        filter: CallbackRetrieveFilter,
+        checkpoint_file: str,
+        page_size: Optional[int] = None
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callback responses within the specified date range, resuming after the last page recorded in
+        checkpoint_file. The checkpoint is saved there after each page, so an interrupted retrieval
+        continues from the next page when called again with the same arguments.
 
-            if callback_page.data is not None:
-                callbacks.extend(callback_page.data)
+        Args:
+            config (Config): The configuration object containing client information.
+            webhook_type (str): The type of the webhook to retrieve callbacks for.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (Optional[CallbackRetrieveFilter]): Optional filters to apply to the callback retrieval.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callback responses not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveCallbacks {} {}-{}".format(config.client_id, initial_date, final_date))
+
+        checkpoint = PaginationCheckpoint.of(f"{Constants.URL_BANKING_WEBHOOK}/{webhook_type}/callbacks", initial_date, final_date, filter, None, page_size)
+        yield from PaginationUtils.iterate_resumable(
+            checkpoint_file,
+            checkpoint,
+            lambda page: self.get_page(config, webhook_type, initial_date, final_date, page, page_size, filter),
+            lambda current_page: current_page.data
+        )
+
+    def iter_callbacks_sharded(
+        self,
+        config: Config,
+        webhook_type: str,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: CallbackRetrieveFilter,
+        shard_size: Optional[timedelta] = None,
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callback responses within the specified range, splitting it into hour windows retrieved
+        concurrently by up to config.pagination_workers workers. Windows with too many pages are split
+        again, and items are yielded in chronological window order.
 
-            page += 1
-            if page >= callback_page.total_pages:
-                break
+        Args:
+            config (Config): The configuration object containing client information.
+            webhook_type (str): The type of the webhook to retrieve callbacks for.
+            initial_date_hour (str): The start of the range (inclusive), YYYY-MM-DDTHH:MM:SSZ.
+            final_date_hour (str): The end of the range (inclusive), YYYY-MM-DDTHH:MM:SSZ.
+            filter (Optional[CallbackRetrieveFilter]): Optional filters to apply to the callback retrieval.
+            shard_size (Optional[timedelta]): Length of each window - default is one hour.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callback responses, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveCallbacks {} {}-{}".format(config.client_id, initial_date_hour, final_date_hour))
 
-        return callbacks
+        yield from DateRangeSharder.of(config, shard_size, max_pages_per_shard).iterate(
+            initial_date_hour,
+            final_date_hour,
+            lambda start, end, page: self.get_page(config, webhook_type, start, end, page, None, filter),
+            lambda current_page: current_page.data,
+            repr,
+            lambda callback: callback.trigger_date_time
+        )
 
     def retrieve_webhook(self, config: Config, webhook_type: str) -> Webhook:
         """
@@ -0,0 +1,407 @@
+import logging
+from typing import Any, AsyncIterator, List, Optional
+
+from inter_sdk_python.billing.billing.BillingClient import BillingClient
+from inter_sdk_python.billing.models.BillingCallbackPage import BillingCallbackPage
+from inter_sdk_python.billing.models.BillingIssueRequest import BillingIssueRequest
+from inter_sdk_python.billing.models.BillingIssueResponse import BillingIssueResponse
+from inter_sdk_python.billing.models.BillingPage import BillingPage
+from inter_sdk_python.billing.models.BillingRetrievalFilter import BillingRetrievalFilter
+from inter_sdk_python.billing.models.BillingRetrieveCallbackResponse import BillingRetrieveCallbackResponse
+from inter_sdk_python.billing.models.BillingRetrieveCallbacksFilter import BillingRetrieveCallbacksFilter
+from inter_sdk_python.billing.models.CancelBillingRequest import CancelBillingRequest
+from inter_sdk_python.billing.models.RetrievedBilling import RetrievedBilling
+from inter_sdk_python.billing.models.Sorting import Sorting
+from inter_sdk_python.billing.models.SummaryItem import SummaryItem
+from inter_sdk_python.billing.webhooks.BillingWebhookClient import BillingWebhookClient
+from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.IncludeWebhookRequest import IncludeWebhookRequest
+from inter_sdk_python.commons.models.Webhook import Webhook
+from inter_sdk_python.commons.structures.Constants import Constants
+from inter_sdk_python.commons.utils.AsyncHttpClient import AsyncHttpClient
+from inter_sdk_python.commons.utils.AsyncPaginationUtils import AsyncPaginationUtils
+from inter_sdk_python.commons.utils.AsyncSdkProxy import AsyncSdkProxy
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.commons.utils.PdfUtils import PdfUtils
+from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
+
+
+class AsyncBillingSdk:
+    """
+    The AsyncBillingSdk class is the asyncio version of BillingSdk, with the same
+    methods, arguments and models. Calls are sent on the event loop by the
+    AsyncHttpClient of AsyncInterSdk and the iter_* methods return async
+    iterators retrieving the pages as tasks.
+
+    The methods writing files or keeping local state - retrieve_billing_pdf,
+    download_billing_pdfs, download_billing_pdfs_to_zip, the resumable and sharded
+    iterators, billing_bulk_issuer, billing_bulk_canceller and billing_mirror - run
+    the blocking BillingSdk on the executor of AsyncInterSdk, through AsyncSdkProxy,
+    under the same names.
+    """
+
+    def __init__(self, config: Config, http: AsyncHttpClient, blocking: AsyncSdkProxy):
+        """
+        Args:
+            config (Config): The configuration object containing client information.
+            http (AsyncHttpClient): The client sending the calls.
+            blocking (AsyncSdkProxy): The BillingSdk running on the executor, for the methods without a native version.
+        """
+        self.config = config
+        self.http = http
+        self.blocking = blocking
+        self.billing_client = BillingClient()
+        self.billing_webhook_client = BillingWebhookClient()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.blocking, name)
+
+    async def cancel_billing(self, request_code: str, cancellation_reason: str) -> None:
+        """
+        Cancels a billing request specified by the request code.
+
+        Args:
+            request_code (str): The unique code identifying the billing request to be canceled.
+            cancellation_reason (str): Reason for canceling the billing request.
+
+        Raises:
+            SdkException: If an error occurs during the cancellation process.
+        """
+        logging.info("CancelBilling {} {} {}".format(self.config.client_id, request_code, cancellation_reason))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BILLING) + f"/{request_code}/cancelar"
+
+        json_request = JsonCodec.of(self.config).dumps(CancelBillingRequest(cancellation_reason).to_dict())
+        await self.http.call_post(url, Constants.BILLET_BILLING_WRITE_SCOPE, "Error canceling billing", json_request)
+
+    async def issue_billing(self, billing_issue_request: BillingIssueRequest) -> BillingIssueResponse:
+        """
+        Issues a billing request based on the provided billing issue details.
+
+        Args:
+            billing_issue_request (BillingIssueRequest): The request object containing details for the billing issue.
+
+        Returns:
+            BillingIssueResponse: A response object containing the outcome of the billing issue process.
+
+        Raises:
+            SdkException: If an error occurs during the billing issue process.
+        """
+        logging.info("IssueBilling {} {}".format(self.config.client_id, billing_issue_request.your_number))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BILLING)
+
+        json_request = JsonCodec.of(self.config).dumps(billing_issue_request.to_dict())
+        json_response = await self.http.call_post(url, Constants.BILLET_BILLING_WRITE_SCOPE, "Error issuing billing", json_request)
+        return BillingIssueResponse.from_dict(json_response)
+
+    async def retrieve_billing(self, request_code: str) -> RetrievedBilling:
+        """
+        Retrieves the billing information based on the specified request code.
+
+        Args:
+            request_code (str): The unique code identifying the billing request to retrieve.
+
+        Returns:
+            RetrievedBilling: An object containing the details of the retrieved billing information.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveIssue {} requestCode={}".format(self.config.client_id, request_code))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BILLING) + f"/{request_code}"
+
+        json_response = await self.http.call_get(url, Constants.BILLET_BILLING_READ_SCOPE, "Error retrieving billing")
+        return RetrievedBilling.from_dict(json_response)
+
+    async def retrieve_billing_collection(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: BillingRetrievalFilter,
+        sort: Sorting
+    ) -> List[RetrievedBilling]:
+        """
+        Retrieves a collection of billing information for a specified period, applying optional filters and sorting.
+
+        Args:
+            initial_date (str): The starting date for the billing retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing retrieval. Format: YYYY-MM-DD.
+            filter (Optional[BillingRetrievalFilter]): Optional filter criteria to refine the billing retrieval.
+            sort (Optional[Sorting]): Optional sorting parameters for the retrieved collection.
+
+        Returns:
+            List[RetrievedBilling]: A list of retrieved billing information objects.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        return await AsyncPaginationUtils.collect(
+            self.config,
+            lambda page: self._get_billing_page(initial_date, final_date, page, None, filter, sort),
+            lambda current_page: current_page.billings
+        )
+
+    def iter_billing_collection(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: BillingRetrievalFilter,
+        sort: Sorting
+    ) -> AsyncIterator[RetrievedBilling]:
+        """
+        Yields the billings for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the billing retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing retrieval. Format: YYYY-MM-DD.
+            filter (Optional[BillingRetrievalFilter]): Optional filter criteria to refine the billing retrieval.
+            sort (Optional[Sorting]): Optional sorting parameters for the retrieved collection.
+
+        Returns:
+            AsyncIterator[RetrievedBilling]: The billings, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveBillingCollection {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        return AsyncPaginationUtils.iterate(
+            self.config,
+            lambda page: self._get_billing_page(initial_date, final_date, page, None, filter, sort),
+            lambda current_page: current_page.billings
+        )
+
+    async def retrieve_billing_collection_page(
+        self,
+        initial_date: str,
+        final_date: str,
+        page: int,
+        page_size: int,
+        filter: BillingRetrievalFilter,
+        sort: Sorting
+    ) -> BillingPage:
+        """
+        Retrieves a paginated collection of billing information for a specified period, applying optional filters and sorting.
+
+        Args:
+            initial_date (str): The starting date for the billing retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing retrieval. Format: YYYY-MM-DD.
+            page (int): The page number for pagination.
+            page_size (Optional[int]): The number of items per page. If None, default size will be used.
+            filter (Optional[BillingRetrievalFilter]): Optional filter criteria to refine the billing retrieval.
+            sort (Optional[Sorting]): Optional sorting parameters for the retrieved collection.
+
+        Returns:
+            BillingPage: A BillingPage object containing the retrieved billing information.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveBillingCollection {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        return await self._get_billing_page(initial_date, final_date, page, page_size, filter, sort)
+
+    async def retrieve_billing_pdf_bytes(self, request_code: str) -> bytes:
+        """
+        Retrieves the billing PDF document based on the specified request code, in memory.
+
+        Args:
+            request_code (str): The unique code identifying the billing request for which the PDF should be retrieved.
+
+        Returns:
+            bytes: The PDF document; io.BytesIO(result) gives a file-like object.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveBillingPdf {} requestCode={}".format(self.config.client_id, request_code))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BILLING) + f"/{request_code}/pdf"
+
+        response = await self.http.call_get_raw(url, Constants.BILLET_BILLING_READ_SCOPE, "Error retrieving billing pdf")
+        return PdfUtils.decode_content(response.content)
+
+    async def retrieve_billing_summary(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: BillingRetrievalFilter
+    ) -> list[SummaryItem]:
+        """
+        Retrieves a summary of billing information for a specified period, applying optional filters.
+
+        Args:
+            initial_date (str): The starting date for the billing summary retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing summary retrieval. Format: YYYY-MM-DD.
+            filter (Optional[BillingRetrievalFilter]): Optional filter criteria to refine the billing summary retrieval.
+
+        Returns:
+            Summary: A Summary object containing the billing information summary.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveBillingSummary {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BILLING_SUMMARY)}?dataInicial={initial_date}&dataFinal={final_date}"
+        url += self.billing_client.add_filters(filter)
+
+        json_response = await self.http.call_get(url, Constants.BILLET_BILLING_READ_SCOPE, "Error retrieving billing summary")
+        return [SummaryItem.from_dict(item) for item in json_response]
+
+    async def retrieve_callbacks(
+        self,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: BillingRetrieveCallbacksFilter,
+        page_size: int
+    ) -> List[BillingRetrieveCallbackResponse]:
+        """
+        Retrieves a list of callback responses for a specified period, applying optional filters.
+
+        Args:
+            initial_date_hour (str): The starting date and hour for the callback retrieval. Format: YYYY-MM-DDTHH:mm.
+            final_date_hour (str): The ending date and hour for the callback retrieval. Format: YYYY-MM-DDTHH:mm.
+            filter (Optional[BillingRetrieveCallbacksFilter]): Optional filter criteria to refine the callback retrieval.
+
+        Returns:
+            List[BillingRetrieveCallbackResponse]: A list of RetrieveCallbackResponse objects containing the retrieved callback information.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        return await AsyncPaginationUtils.collect(
+            self.config,
+            lambda page: self._get_callback_page(initial_date_hour, final_date_hour, page, page_size, filter),
+            lambda current_page: current_page.callbacks
+        )
+
+    def iter_callbacks(
+        self,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: BillingRetrieveCallbacksFilter,
+        page_size: int
+    ) -> AsyncIterator[BillingRetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date_hour (str): The starting date and hour for the callback retrieval. Format: YYYY-MM-DDTHH:mm.
+            final_date_hour (str): The ending date and hour for the callback retrieval. Format: YYYY-MM-DDTHH:mm.
+            filter (Optional[BillingRetrieveCallbacksFilter]): Optional filter criteria to refine the callback retrieval.
+
+        Returns:
+            AsyncIterator[BillingRetrieveCallbackResponse]: The callbacks, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveCallback {} {}-{}".format(self.config.client_id, initial_date_hour, final_date_hour))
+
+        return AsyncPaginationUtils.iterate(
+            self.config,
+            lambda page: self._get_callback_page(initial_date_hour, final_date_hour, page, page_size, filter),
+            lambda current_page: current_page.callbacks
+        )
+
+    async def retrieve_callbacks_page(
+        self,
+        initial_date_hour: str,
+        final_date_hour: str,
+        page: int,
+        page_size: int,
+        filter: BillingRetrieveCallbacksFilter
+    ) -> BillingCallbackPage:
+        """
+        Retrieves a paginated list of callbacks for a specified period, applying optional filters.
+
+        Args:
+            initial_date_hour (str): The starting date and hour for the callback retrieval. Format: YYYY-MM-DDTHH:mm.
+            final_date_hour (str): The ending date and hour for the callback retrieval. Format: YYYY-MM-DDTHH:mm.
+            page (int): The page number for pagination.
+            page_size (Optional[int]): The number of items per page. If None, default size will be used.
+            filter (Optional[BillingRetrieveCallbacksFilter]): Optional filter criteria to refine the callback retrieval.
+
+        Returns:
+            BillingCallbackPage: A CallbackPage object containing the paginated list of retrieved callbacks.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveCallback {} {}-{}".format(self.config.client_id, initial_date_hour, final_date_hour))
+
+        return await self._get_callback_page(initial_date_hour, final_date_hour, page, page_size, filter)
+
+    async def include_webhook(self, url: str) -> None:
+        """
+        Includes a webhook URL for receiving notifications.
+
+        Args:
+            url (str): The URL of the webhook to be included.
+
+        Raises:
+            SdkException: If an error occurs during the inclusion process.
+        """
+        logging.info("IncludeWebhook billing {} {}".format(self.config.client_id, url))
+
+        json_request = JsonCodec.of(self.config).dumps(IncludeWebhookRequest(webhook_url=url).to_dict())
+        await self.http.call_put(
+            UrlUtils.build_url(self.config, Constants.URL_BILLING_WEBHOOK), Constants.BILLET_BILLING_WRITE_SCOPE,
+            "Error including webhook", json_request
+        )
+
+    async def retrieve_webhook(self) -> Webhook:
+        """
+        Retrieves the currently configured webhook information.
+
+        Returns:
+            Webhook: A Webhook object containing the details of the configured webhook.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveWebhook billing {}".format(self.config.client_id))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BILLING_WEBHOOK)
+
+        json_response = await self.http.call_get(url, Constants.BILLET_BILLING_READ_SCOPE, "Error retrieving webhook")
+        return Webhook.from_dict(json_response)
+
+    async def delete_webhook(self) -> None:
+        """
+        Deletes the currently configured webhook.
+
+        Raises:
+            SdkException: If an error occurs during the deletion process.
+        """
+        logging.info("DeleteWebhook billing {}".format(self.config.client_id))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_BILLING_WEBHOOK)
+
+        await self.http.call_delete(url, Constants.BILLET_BILLING_WRITE_SCOPE, "Error deleting webhook")
+
+    async def _get_billing_page(self, initial_date: str, final_date: str, page: int, page_size: Optional[int],
+                                filter: BillingRetrievalFilter, sort: Sorting) -> BillingPage:
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BILLING)}?dataInicial={initial_date}&dataFinal={final_date}&paginacao.paginaAtual={page}"
+        if page_size is not None:
+            url += f"&paginacao.itensPorPagina={page_size}"
+        url += self.billing_client.add_filters(filter) + self.billing_client.add_sort(sort)
+
+        json_response = await self.http.call_get(url, Constants.BILLET_BILLING_READ_SCOPE, "Error retrieving billing collection")
+        return BillingPage.from_dict(json_response, self.config.lazy_models)
+
+    async def _get_callback_page(self, initial_date_hour: str, final_date_hour: str, page: int, page_size: Optional[int],
+                                 filter: BillingRetrieveCallbacksFilter) -> BillingCallbackPage:
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_BILLING_WEBHOOK_CALLBACKS)}"
+        url += f"?dataHoraInicio={initial_date_hour}&dataHoraFim={final_date_hour}&pagina={page}"
+        if page_size is not None:
+            url += f"&itensPorPagina={page_size}"
+        url += self.billing_webhook_client.add_filters(filter)
+
+        json_response = await self.http.call_get(url, Constants.BILLET_BILLING_READ_SCOPE, "Error retrieving callbacks")
+        return BillingCallbackPage.from_dict(json_response)
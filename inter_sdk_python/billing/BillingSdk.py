@@ -1,6 +1,10 @@
-from typing import List
+from datetime import timedelta
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, List, Optional, Union
 
 from inter_sdk_python.billing.billing.BillingClient import BillingClient
+from inter_sdk_python.billing.bulk.BillingBulkCanceller import BillingBulkCanceller
+from inter_sdk_python.billing.bulk.BillingBulkIssuer import BillingBulkIssuer
+from inter_sdk_python.billing.bulk.BillingPdfDownloader import BillingPdfDownloader
 from inter_sdk_python.billing.models.BillingCallbackPage import BillingCallbackPage
 from inter_sdk_python.billing.models.BillingIssueRequest import BillingIssueRequest
 from inter_sdk_python.billing.models.BillingIssueResponse import BillingIssueResponse
@@ -8,6 +12,7 @@ from inter_sdk_python.billing.models.BillingPage import BillingPage
 from inter_sdk_python.billing.models.BillingRetrievalFilter import BillingRetrievalFilter
 from inter_sdk_python.billing.models.BillingRetrieveCallbackResponse import BillingRetrieveCallbackResponse
 from inter_sdk_python.billing.models.BillingRetrieveCallbacksFilter import BillingRetrieveCallbacksFilter
+from inter_sdk_python.billing.models.BulkReport import BulkReport
 from inter_sdk_python.billing.models.RetrievedBilling import RetrievedBilling
 from inter_sdk_python.billing.models.Sorting import Sorting
 from inter_sdk_python.billing.models.Summary import Summary
@@ -15,6 +20,10 @@ from inter_sdk_python.billing.models.SummaryItem import SummaryItem
 from inter_sdk_python.billing.webhooks.BillingWebhookClient import BillingWebhookClient
 from inter_sdk_python.commons.models.Config import Config
 from inter_sdk_python.commons.models.Webhook import Webhook
+from inter_sdk_python.commons.utils.DateRangeSharder import DateRangeSharder
+
+if TYPE_CHECKING:
+    from inter_sdk_python.billing.mirror.BillingMirror import BillingMirror
 
 
 class BillingSdk:
@@ -102,6 +111,99 @@ class BillingSdk:
         
         return self.billing_client.retrieve_billing_in_range(self.config, initial_date, final_date, filter, sort)
 
+    def iter_billing_collection(
+        self, 
+        initial_date: str, 
+        final_date: str, 
+        filter: BillingRetrievalFilter, 
+        sort: Sorting
+    ) -> Iterator[RetrievedBilling]:
+        """
+        Yields the billings for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the billing retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing retrieval. Format: YYYY-MM-DD.
+            filter (Optional[BillingRetrievalFilter]): Optional filter criteria to refine the billing retrieval.
+            sort (Optional[Sorting]): Optional sorting parameters for the retrieved collection.
+
+        Returns:
+            Iterator[RetrievedBilling]: The billings, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.billing_client is None:
+            self.billing_client = BillingClient()
+        
+        return self.billing_client.iter_billing_in_range(self.config, initial_date, final_date, filter, sort)
+
+    def iter_billing_collection_resumable(
+        self, 
+        initial_date: str, 
+        final_date: str, 
+        filter: BillingRetrievalFilter, 
+        sort: Sorting, 
+        checkpoint_file: str, 
+        page_size: Optional[int] = None
+    ) -> Iterator[RetrievedBilling]:
+        """
+        Yields the billings for a specific period page by page, resuming after the last page recorded in
+        checkpoint_file, where the progress is saved after each page.
+
+        Args:
+            initial_date (str): The starting date for the billing retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing retrieval. Format: YYYY-MM-DD.
+            filter (Optional[BillingRetrievalFilter]): Optional filter criteria to refine the billing retrieval.
+            sort (Optional[Sorting]): Optional sorting parameters for the retrieved collection.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[RetrievedBilling]: The billings not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.billing_client is None:
+            self.billing_client = BillingClient()
+        
+        return self.billing_client.iter_billing_resumable(self.config, initial_date, final_date, filter, sort, checkpoint_file, page_size)
+
+    def iter_billing_collection_sharded(
+        self, 
+        initial_date: str, 
+        final_date: str, 
+        filter: BillingRetrievalFilter, 
+        sort: Sorting, 
+        shard_size: Optional[timedelta] = None, 
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[RetrievedBilling]:
+        """
+        Yields the billings for a long period, split into day windows retrieved concurrently by up to
+        set_pagination_workers workers. Windows with too many pages are split again and items are
+        yielded in chronological window order.
+
+        Args:
+            initial_date (str): Starting date, format: YYYY-MM-DD.
+            final_date (str): Ending date, format: YYYY-MM-DD.
+            filter (Optional[BillingRetrievalFilter]): Optional filter criteria to refine the billing retrieval.
+            sort (Optional[Sorting]): Optional sorting parameters for the retrieved collection.
+            shard_size (Optional[timedelta]): Length of each window - default is one day.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[RetrievedBilling]: The billings, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+        """
+        if self.billing_client is None:
+            self.billing_client = BillingClient()
+        
+        return self.billing_client.iter_billing_sharded(self.config, initial_date, final_date, filter, sort, shard_size, max_pages_per_shard)
+
     def retrieve_billing_collection_page(
         self, 
         initial_date: str, 
@@ -133,13 +235,14 @@ class BillingSdk:
         
         return self.billing_client.retrieve_billing_page(self.config, initial_date, final_date, page, page_size, filter, sort)
     
-    def retrieve_billing_pdf(self, request_code: str, file: str) -> None:
+    def retrieve_billing_pdf(self, request_code: str, file: Union[str, BinaryIO]) -> None:
         """
         Retrieves the billing PDF document based on the specified request code and saves it to a file.
+        The PDF is decoded while it is received, without holding the response in memory.
 
         Args:
             request_code (str): The unique code identifying the billing request for which the PDF should be retrieved.
-            file (str): The path to the file where the PDF will be saved.
+            file (Union[str, BinaryIO]): The path to the file where the PDF will be saved, or a binary stream receiving it.
 
         Raises:
             SdkException: If an error occurs during the retrieval process.
@@ -149,6 +252,100 @@ class BillingSdk:
         
         self.billing_client.retrieve_billing_in_pdf(self.config, request_code, file)
 
+    def retrieve_billing_pdf_bytes(self, request_code: str) -> bytes:
+        """
+        Retrieves the billing PDF document based on the specified request code, in memory.
+
+        Args:
+            request_code (str): The unique code identifying the billing request for which the PDF should be retrieved.
+
+        Returns:
+            bytes: The PDF document; io.BytesIO(result) gives a file-like object.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.billing_client is None:
+            self.billing_client = BillingClient()
+
+        return self.billing_client.retrieve_billing_in_pdf_bytes(self.config, request_code)
+
+    def download_billing_pdfs(self, request_codes: Iterable[str], directory: str, workers: int = 4) -> BulkReport:
+        """
+        Retrieves the PDFs of many billings concurrently, under the rate limits set with InterSdk.set_rate_limit,
+        and writes them to a directory as <request code>.pdf. PDFs already in the directory are skipped, so an
+        interrupted download is resumed by running it again.
+
+        Args:
+            request_codes (Iterable[str]): Request codes of the billings.
+            directory (str): The target directory, created if it does not exist.
+            workers (int): Maximum number of PDFs retrieved at the same time - default is 4.
+
+        Returns:
+            BulkReport: The outcome of each request code, in the given order; failures do not stop the download.
+        """
+        return BillingPdfDownloader(self.config, workers).to_directory(request_codes, directory)
+
+    def download_billing_pdfs_to_zip(self, request_codes: Iterable[str], archive: str, workers: int = 4) -> BulkReport:
+        """
+        Retrieves the PDFs of many billings concurrently, under the rate limits set with InterSdk.set_rate_limit,
+        and adds them to a zip archive as <request code>.pdf while they arrive. An existing archive is appended
+        to and the PDFs it already holds are skipped, so an interrupted download is resumed by running it again.
+
+        Args:
+            request_codes (Iterable[str]): Request codes of the billings.
+            archive (str): Path of the zip archive.
+            workers (int): Maximum number of PDFs retrieved at the same time - default is 4.
+
+        Returns:
+            BulkReport: The outcome of each request code, in the given order; failures do not stop the download.
+        """
+        return BillingPdfDownloader(self.config, workers).to_zip(request_codes, archive)
+
+    def billing_bulk_issuer(self, journal: str, workers: int = 8, requests_per_minute: Optional[float] = None) -> BillingBulkIssuer:
+        """
+        Returns an issuer of many billings at once. Its issue(requests) method sends up to workers requests at
+        the same time and records each outcome in a journal file, using the your_number of each request as its
+        idempotency key, so an interrupted run is resumed by running it again without issuing any billing twice.
+
+        Args:
+            journal (str): Path of the progress journal, created if it does not exist.
+            workers (int): Maximum number of billings issued at the same time - default is 8.
+            requests_per_minute (Optional[float]): Pace of the issuance calls of this issuer, on top of the
+                                                   limits set with InterSdk.set_rate_limit, which are left
+                                                   unchanged - default is None, not pacing them further.
+
+        Returns:
+            BillingBulkIssuer: The issuer bound to this SDK configuration; close it to close the journal.
+        """
+        return BillingBulkIssuer(self.config, journal, workers, requests_per_minute)
+
+    def billing_bulk_canceller(
+        self,
+        journal: str,
+        workers: int = 8,
+        mirror: Optional['BillingMirror'] = None,
+        requests_per_minute: Optional[float] = None
+    ) -> BillingBulkCanceller:
+        """
+        Returns a canceller of many billings at once. Its cancel(cancellations) method takes pairs of request
+        code and reason, sends up to workers requests at the same time and records each outcome in a journal
+        file, skipping billings already cancelled, so an interrupted run is resumed by running it again.
+
+        Args:
+            journal (str): Path of the progress journal, created if it does not exist.
+            workers (int): Maximum number of billings cancelled at the same time - default is 8.
+            mirror (Optional[BillingMirror]): A local mirror used to skip billings already cancelled
+                                              (optional, can be None).
+            requests_per_minute (Optional[float]): Pace of the cancellation calls of this canceller, on top of
+                                                   the limits set with InterSdk.set_rate_limit, which are left
+                                                   unchanged - default is None, not pacing them further.
+
+        Returns:
+            BillingBulkCanceller: The canceller bound to this SDK configuration; close it to close the journal.
+        """
+        return BillingBulkCanceller(self.config, journal, workers, mirror, requests_per_minute)
+
     def retrieve_billing_summary(
         self, 
         initial_date: str, 
@@ -200,6 +397,95 @@ class BillingSdk:
         
         return self.billing_webhook_client.retrieve_callbacks_in_range(self.config, initial_date_hour, final_date_hour, filter, page_size)
 
+    def iter_callbacks(
+        self, 
+        initial_date_hour: str, 
+        final_date_hour: str, 
+        filter: BillingRetrieveCallbacksFilter,
+        page_size: int
+    ) -> Iterator[BillingRetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date_hour (str): The starting date and hour for the callback retrieval. Format: YYYY-MM-DDTHH:mm.
+            final_date_hour (str): The ending date and hour for the callback retrieval. Format: YYYY-MM-DDTHH:mm.
+            filter (Optional[BillingRetrieveCallbacksFilter]): Optional filter criteria to refine the callback retrieval.
+
+        Returns:
+            Iterator[BillingRetrieveCallbackResponse]: The callbacks, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.billing_webhook_client is None:
+            self.billing_webhook_client = BillingWebhookClient()
+        
+        return self.billing_webhook_client.iter_callbacks_in_range(self.config, initial_date_hour, final_date_hour, filter, page_size)
+
+    def iter_callbacks_resumable(
+        self, 
+        initial_date_hour: str, 
+        final_date_hour: str, 
+        filter: BillingRetrieveCallbacksFilter,
+        page_size: int, 
+        checkpoint_file: str
+    ) -> Iterator[BillingRetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a specific period page by page, resuming after the last page recorded in
+        checkpoint_file, where the progress is saved after each page.
+
+        Args:
+            initial_date_hour (str): The starting date and hour for the callback retrieval. Format: YYYY-MM-DDTHH:mm.
+            final_date_hour (str): The ending date and hour for the callback retrieval. Format: YYYY-MM-DDTHH:mm.
+            filter (Optional[BillingRetrieveCallbacksFilter]): Optional filter criteria to refine the callback retrieval.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+
+        Returns:
+            Iterator[BillingRetrieveCallbackResponse]: The callbacks not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.billing_webhook_client is None:
+            self.billing_webhook_client = BillingWebhookClient()
+        
+        return self.billing_webhook_client.iter_callbacks_resumable(self.config, initial_date_hour, final_date_hour, filter, page_size, checkpoint_file)
+
+    def iter_callbacks_sharded(
+        self, 
+        initial_date_hour: str, 
+        final_date_hour: str, 
+        filter: BillingRetrieveCallbacksFilter, 
+        page_size: int, 
+        shard_size: Optional[timedelta] = None, 
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[BillingRetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a long period, split into hour windows retrieved concurrently by up to
+        set_pagination_workers workers. Windows with too many pages are split again and items are
+        yielded in chronological window order.
+
+        Args:
+            initial_date_hour (str): Starting date, format: YYYY-MM-DDTHH:MM:SSZ.
+            final_date_hour (str): Ending date, format: YYYY-MM-DDTHH:MM:SSZ.
+            filter (Optional[BillingRetrieveCallbacksFilter]): Optional filter criteria to refine the callback retrieval.
+            page_size (int): The number of items per page.
+            shard_size (Optional[timedelta]): Length of each window - default is one hour.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[BillingRetrieveCallbackResponse]: The callbacks, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+        """
+        if self.billing_webhook_client is None:
+            self.billing_webhook_client = BillingWebhookClient()
+        
+        return self.billing_webhook_client.iter_callbacks_sharded(self.config, initial_date_hour, final_date_hour, filter, page_size, shard_size, max_pages_per_shard)
+
     def retrieve_callbacks_page(
         self, 
         initial_date_hour: str, 
@@ -269,4 +555,19 @@ class BillingSdk:
         if self.billing_webhook_client is None:
             self.billing_webhook_client = BillingWebhookClient()
         
-        self.billing_webhook_client.delete_webhook(self.config)
\ No newline at end of file
+        self.billing_webhook_client.delete_webhook(self.config)
+
+    def billing_mirror(self, path: str, overlap_days: int = 1) -> 'BillingMirror':
+        """
+        Returns a local SQLite mirror of the billings. Its refresh() method requests only the days since
+        the previous refresh, and queries such as overdue(payer_cpf_cnpj) are answered without API calls.
+
+        Args:
+            path (str): Path of the database file, created if it does not exist.
+            overlap_days (int): Days before the last refreshed date requested again - default is 1.
+
+        Returns:
+            BillingMirror: The mirror bound to this SDK configuration.
+        """
+        from inter_sdk_python.billing.mirror.BillingMirror import BillingMirror
+        return BillingMirror(self.config, path, overlap_days)
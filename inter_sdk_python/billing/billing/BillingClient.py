@@ -1,7 +1,6 @@
-import base64
-import json
 import logging
-from typing import List
+from datetime import timedelta
+from typing import BinaryIO, Iterator, List, Optional, Union
 
 from inter_sdk_python.billing.models.BillingIssueRequest import BillingIssueRequest
 from inter_sdk_python.billing.models.BillingIssueResponse import BillingIssueResponse
@@ -13,9 +12,13 @@ from inter_sdk_python.billing.models.Sorting import Sorting
 from inter_sdk_python.billing.models.Summary import Summary
 from inter_sdk_python.billing.models.SummaryItem import SummaryItem
 from inter_sdk_python.commons.models.Config import Config
-from inter_sdk_python.commons.models.PdfReturn import PdfReturn
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
 from inter_sdk_python.commons.structures.Constants import Constants
+from inter_sdk_python.commons.utils.DateRangeSharder import DateRangeSharder
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.commons.utils.PaginationUtils import PaginationUtils
+from inter_sdk_python.commons.utils.PdfUtils import PdfUtils
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 
 
@@ -41,7 +44,7 @@ class BillingClient:
         request = CancelBillingRequest(cancellation_reason)
         
         try:
-            json_request = request.to_json()
+            json_request = JsonCodec.of(config).dumps(request.to_dict())
             HttpUtils.call_post(config, url, Constants.BILLET_BILLING_WRITE_SCOPE, "Error canceling billing", json_request)
         except Exception as io_exception:
             logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
@@ -67,7 +70,7 @@ class BillingClient:
         url = UrlUtils.build_url(config, Constants.URL_BILLING)
         
         try:
-            json_request = billing_issue_request.to_json()
+            json_request = JsonCodec.of(config).dumps(billing_issue_request.to_dict())
             json_response = HttpUtils.call_post(config, url, Constants.BILLET_BILLING_WRITE_SCOPE, "Error issuing billing", json_request)
             return BillingIssueResponse.from_dict(json_response)
         except Exception as io_exception:
@@ -137,31 +140,132 @@ class BillingClient:
         Returns:
             List[RetrievedBilling]: A list of objects containing all billing records within the specified date range.
 
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                          or API response errors.
+        """
+        return list(self.iter_billing_in_range(config, initial_date, final_date, filter, sort))
+
+    def iter_billing_in_range(self, config: Config, initial_date: str, final_date: str, filter: BillingRetrievalFilter, sort: Sorting) -> Iterator[RetrievedBilling]:
+        """
+        Yields the billing records within the specified date range page by page, so at most config.pagination_workers
+        pages are kept in memory and the first items are available as soon as the first page is retrieved.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (Optional[BillingRetrievalFilter]): Optional filters to be applied to the billing retrieval.
+            sort (Optional[Sorting]): Optional sorting criteria for the billing retrieval.
+
+        Returns:
+            Iterator[RetrievedBilling]: The billing records, in page order.
+
         Raises:
             SdkException: If there is an error during the retrieval process, such as network issues
                           or API response errors.
         """
         logging.info("RetrieveBillingCollection {} {}-{}".format(config.client_id, initial_date, final_date))
-        page = 0
-        billing_records = []
-        
-        while True:
-            billing_page = self.get_page(config, initial_date, final_date, page, None, filter, sort)
-            billing_records.extend(billing_page.billings)
-            if page >= billing_page.total_pages:
-                break
-            page += 1
-            
-        return billing_records
-
-    def retrieve_billing_in_pdf(self, config: Config, request_code: str, file_path: str) -> None:
+
+        yield from PaginationUtils.iterate(
+            config,
+            lambda page: self.get_page(config, initial_date, final_date, page, None, filter, sort),
+            lambda current_page: current_page.billings
+        )
+
+    def iter_billing_resumable(
+        self,
+        config: Config,
+        initial_date: str,
+        final_date: str,
+        filter: BillingRetrievalFilter,
+        sort: Sorting,
+        checkpoint_file: str,
+        page_size: Optional[int] = None
+    ) -> Iterator[RetrievedBilling]:
+        """
+        Yields the billing records within the specified date range, resuming after the last page recorded in
+        checkpoint_file. The checkpoint is saved there after each page, so an interrupted retrieval
+        continues from the next page when called again with the same arguments.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (Optional[BillingRetrievalFilter]): Optional filters to be applied to the billing retrieval.
+            sort (Optional[Sorting]): Optional sorting criteria for the billing retrieval.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[RetrievedBilling]: The billing records not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process, such as network issues
+                          or API response errors.
+        """
+        logging.info("RetrieveBillingCollection {} {}-{}".format(config.client_id, initial_date, final_date))
+
+        checkpoint = PaginationCheckpoint.of(Constants.URL_BILLING, initial_date, final_date, filter, sort, page_size)
+        yield from PaginationUtils.iterate_resumable(
+            checkpoint_file,
+            checkpoint,
+            lambda page: self.get_page(config, initial_date, final_date, page, page_size, filter, sort),
+            lambda current_page: current_page.billings
+        )
+
+    def iter_billing_sharded(
+        self,
+        config: Config,
+        initial_date: str,
+        final_date: str,
+        filter: BillingRetrievalFilter,
+        sort: Sorting,
+        shard_size: Optional[timedelta] = None,
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[RetrievedBilling]:
+        """
+        Yields the billing records within the specified range, splitting it into day windows retrieved
+        concurrently by up to config.pagination_workers workers. Windows with too many pages are split
+        again, and items are yielded in chronological window order.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start of the range (inclusive), YYYY-MM-DD.
+            final_date (str): The end of the range (inclusive), YYYY-MM-DD.
+            filter (Optional[BillingRetrievalFilter]): Optional filters to be applied to the billing retrieval.
+            sort (Optional[Sorting]): Optional sorting criteria, applied inside each window.
+            shard_size (Optional[timedelta]): Length of each window - default is one day.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[RetrievedBilling]: The billing records, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveBillingCollection {} {}-{}".format(config.client_id, initial_date, final_date))
+
+        yield from DateRangeSharder.of(config, shard_size, max_pages_per_shard).iterate(
+            initial_date,
+            final_date,
+            lambda start, end, page: self.get_page(config, start, end, page, None, filter, sort),
+            lambda current_page: current_page.billings,
+            lambda billing: billing.billing.request_code if billing.billing is not None else repr(billing)
+        )
+
+    def retrieve_billing_in_pdf(self, config: Config, request_code: str, file_path: Union[str, BinaryIO]) -> None:
         """
         Retrieves the billing PDF identified by the provided request code and saves it to a specified file.
+        The response is decoded while it is received, so memory use does not grow with the size of the PDF.
 
         Args:
             config (Config): The configuration object containing client information.
             request_code (str): The unique identifier for the billing request whose PDF is to be retrieved.
-            file_path (str): The file path where the PDF document will be saved.
+            file_path (Union[str, BinaryIO]): The file path where the PDF document will be saved, or a binary
+                                              stream receiving it.
 
         Raises:
             SdkException: If there is an error during the retrieval process, such as network issues
@@ -171,14 +275,35 @@ class BillingClient:
         
         url = UrlUtils.build_url(config, Constants.URL_BILLING) + f"/{request_code}/pdf"
         
-        json_response = HttpUtils.call_get(config, url, Constants.BILLET_BILLING_READ_SCOPE, "Error retrieving billing pdf")
+        response = HttpUtils.call_get_stream(config, url, Constants.BILLET_BILLING_READ_SCOPE, "Error retrieving billing pdf")
+        try:
+            PdfUtils.write(response, file_path)
+        except Exception as io_exception:
+            logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
+            raise
+
+    def retrieve_billing_in_pdf_bytes(self, config: Config, request_code: str) -> bytes:
+        """
+        Retrieves the billing PDF identified by the provided request code, in memory.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            request_code (str): The unique identifier for the billing request whose PDF is to be retrieved.
+
+        Returns:
+            bytes: The PDF document.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                          or API response errors.
+        """
+        logging.info("RetrieveBillingPdf {} requestCode={}".format(config.client_id, request_code))
+
+        url = UrlUtils.build_url(config, Constants.URL_BILLING) + f"/{request_code}/pdf"
+
+        response = HttpUtils.call_get_stream(config, url, Constants.BILLET_BILLING_READ_SCOPE, "Error retrieving billing pdf")
         try:
-            pdf_return = PdfReturn.from_dict(json_response)
-            decoded_bytes = base64.b64decode(pdf_return.pdf)
-            
-            with open(file_path, 'wb') as stream:
-                stream.write(decoded_bytes)
-                
+            return PdfUtils.to_bytes(response)
         except Exception as io_exception:
             logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
             raise
@@ -238,7 +363,7 @@ class BillingClient:
 
         json_response = HttpUtils.call_get(config, url, Constants.BILLET_BILLING_READ_SCOPE, "Error retrieving billing collection")
         try:
-            return BillingPage.from_dict(json_response)
+            return BillingPage.from_dict(json_response, config.lazy_models)
         except Exception as io_exception:
             logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
             raise
@@ -258,9 +383,9 @@ class BillingClient:
 
         string_filter = []
         if filter.filter_date_by is not None:
-            string_filter.append(f"&filtrarDataPor={filter.filter_date_by}")
+            string_filter.append(f"&filtrarDataPor={filter.filter_date_by.value}")
         if filter.situation is not None:
-            string_filter.append(f"&situacao={filter.situation}")
+            string_filter.append(f"&situacao={filter.situation.value}")
         if filter.payer is not None:
             string_filter.append(f"&pessoaPagadora={filter.payer}")
         if filter.payer_cpf_cnpj is not None:
@@ -268,7 +393,7 @@ class BillingClient:
         if filter.your_number is not None:
             string_filter.append(f"&seuNumero={filter.your_number}")
         if filter.billing_type is not None:
-            string_filter.append(f"&tipoCobranca={filter.billing_type}")
+            string_filter.append(f"&tipoCobranca={filter.billing_type.value}")
 
         return ''.join(string_filter)
 
@@ -0,0 +1,155 @@
+import functools
+import logging
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, Set, Tuple, Union
+
+from inter_sdk_python.billing.billing.BillingClient import BillingClient
+from inter_sdk_python.billing.bulk.BulkExecutor import BulkExecutor
+from inter_sdk_python.billing.bulk.ProgressJournal import ProgressJournal
+from inter_sdk_python.billing.enums.BillingDateType import BillingDateType
+from inter_sdk_python.billing.enums.BillingSituation import BillingSituation
+from inter_sdk_python.billing.enums.BulkItemStatus import BulkItemStatus
+from inter_sdk_python.billing.models.BillingRetrievalFilter import BillingRetrievalFilter
+from inter_sdk_python.billing.models.BulkItemResult import BulkItemResult
+from inter_sdk_python.billing.models.BulkReport import BulkReport
+from inter_sdk_python.commons.models.Config import Config
+
+if TYPE_CHECKING:
+    from inter_sdk_python.billing.mirror.BillingMirror import BillingMirror
+
+
+class BillingBulkCanceller:
+    """
+    The BillingBulkCanceller class cancels many billings with up to workers
+    requests in flight, paced by requests_per_minute when it is given and by
+    the rate limiter of the configuration.
+
+    Billings already cancelled are skipped without a call when they are known
+    to be: recorded as cancelled in the progress journal by a previous run,
+    cancelled in the local BillingMirror, or listed as cancelled by the
+    pre-fetch of cancel(). Every cancellation is recorded in the journal as
+    PENDING before it is sent and with its outcome afterwards; when the
+    outcome of a call is unknown, the billing is retrieved to find out whether
+    it was cancelled, so a re-run only sends what is still open.
+    """
+
+    def __init__(self, config: Config, journal: Union[str, ProgressJournal], workers: int = 8,
+                 mirror: Optional['BillingMirror'] = None, requests_per_minute: Optional[float] = None):
+        """
+        Args:
+            config (Config): The configuration object containing client information.
+            journal (Union[str, ProgressJournal]): The progress journal, or the path of its file.
+            workers (int): Maximum number of billings cancelled at the same time - default is 8. Keep it
+                           within the connection pool size (InterSdk.set_connection_pool).
+            mirror (Optional[BillingMirror]): A local mirror of the billings consulted before each call
+                                              (optional, can be None).
+            requests_per_minute (Optional[float]): Pace of the cancellation calls of this canceller, with
+                                                   bursts of up to workers calls, on top of the limits set
+                                                   with InterSdk.set_rate_limit, which are left unchanged -
+                                                   default is None, not pacing them further.
+        """
+        self.config = config
+        self.journal = journal if isinstance(journal, ProgressJournal) else ProgressJournal(journal)
+        self.workers = max(1, workers)
+        self.mirror = mirror
+        self.billing_client = BillingClient()
+        self.pace = BulkExecutor.pacer(requests_per_minute, self.workers)
+
+    def cancel(
+        self,
+        cancellations: Iterable[Tuple[str, str]],
+        prefetch_initial_date: Optional[str] = None,
+        prefetch_final_date: Optional[str] = None
+    ) -> BulkReport:
+        """
+        Cancels the billings. Failures do not stop the run; running the same cancellations again
+        retries only the failed ones.
+
+        Args:
+            cancellations (Iterable[Tuple[str, str]]): Pairs of request code and cancellation reason.
+            prefetch_initial_date (Optional[str]): With prefetch_final_date, the billings cancelled in this
+                                                   range (by due date, YYYY-MM-DD) are retrieved once, before
+                                                   any cancellation, and skipped (optional, can be None).
+            prefetch_final_date (Optional[str]): The end of the pre-fetched range (optional, can be None).
+
+        Returns:
+            BulkReport: The outcome of each request code, in the given order. Billings found already cancelled
+                        are SKIPPED.
+        """
+        cancelled: Set[str] = set()
+        if prefetch_initial_date is not None and prefetch_final_date is not None:
+            filter = BillingRetrievalFilter(filter_date_by=BillingDateType.VENCIMENTO, situation=BillingSituation.CANCELADO)
+            for billing in self.billing_client.iter_billing_in_range(self.config, prefetch_initial_date,
+                                                                     prefetch_final_date, filter, None):
+                if billing.billing is not None and billing.billing.request_code is not None:
+                    cancelled.add(billing.billing.request_code)
+
+        report = BulkReport()
+        report.results.extend(BulkExecutor.run(self.workers, self._tasks(cancellations, cancelled), "inter-sdk-cancel"))
+        logging.info("CancelBillings succeeded=%s skipped=%s failed=%s",
+                     len(report.succeeded()), len(report.skipped()), len(report.failed()))
+        return report
+
+    def close(self) -> None:
+        """
+        Closes the progress journal.
+        """
+        self.journal.close()
+
+    def __enter__(self) -> 'BillingBulkCanceller':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _tasks(self, cancellations: Iterable[Tuple[str, str]], cancelled: Set[str]) -> Iterator[Callable[[], BulkItemResult]]:
+        seen: Set[str] = set()
+        for request_code, reason in cancellations:
+            if request_code in seen:
+                yield functools.partial(BulkItemResult, request_code, BulkItemStatus.SKIPPED)
+            else:
+                seen.add(request_code)
+                yield functools.partial(self._cancel, request_code, reason, request_code in cancelled)
+
+    def _cancel(self, request_code: str, reason: str, prefetched: bool) -> BulkItemResult:
+        entry = self.journal.get(request_code)
+        try:
+            if entry is not None and entry["status"] == BulkItemStatus.SUCCEEDED.value:
+                return BulkItemResult(request_code, BulkItemStatus.SKIPPED)
+            if prefetched or self._cancelled_in_mirror(request_code) or (
+                    entry is not None and entry["status"] == BulkItemStatus.PENDING.value and self._cancelled(request_code)):
+                self.journal.record(request_code, BulkItemStatus.SUCCEEDED)
+                return BulkItemResult(request_code, BulkItemStatus.SKIPPED)
+        except Exception as exception:
+            return BulkItemResult(request_code, BulkItemStatus.FAILED, error=BulkExecutor.error_of(exception))
+
+        self.journal.record(request_code, BulkItemStatus.PENDING)
+        if self.pace is not None:
+            self.pace.acquire()
+        try:
+            self.billing_client.cancel_billing(self.config, request_code, reason)
+        except Exception as exception:
+            error = BulkExecutor.error_of(exception)
+            if not BulkExecutor.is_rejected(exception):
+                try:
+                    applied = self._cancelled(request_code)
+                except Exception:
+                    # Still unknown: the entry stays PENDING and the next run checks the billing again.
+                    return BulkItemResult(request_code, BulkItemStatus.FAILED, error=error)
+                if applied:
+                    self.journal.record(request_code, BulkItemStatus.SUCCEEDED)
+                    return BulkItemResult(request_code, BulkItemStatus.SUCCEEDED)
+            self.journal.record(request_code, BulkItemStatus.FAILED, error=error.to_dict())
+            return BulkItemResult(request_code, BulkItemStatus.FAILED, error=error)
+
+        self.journal.record(request_code, BulkItemStatus.SUCCEEDED)
+        return BulkItemResult(request_code, BulkItemStatus.SUCCEEDED)
+
+    def _cancelled_in_mirror(self, request_code: str) -> bool:
+        if self.mirror is None:
+            return False
+        billing = self.mirror.get(request_code)
+        return billing is not None and billing.billing is not None and billing.billing.situation == BillingSituation.CANCELADO
+
+    def _cancelled(self, request_code: str) -> bool:
+        billing = self.billing_client.retrieve_billing(self.config, request_code)
+        return billing.billing is not None and billing.billing.situation == BillingSituation.CANCELADO
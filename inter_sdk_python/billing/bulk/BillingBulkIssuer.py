@@ -0,0 +1,166 @@
+import functools
+import logging
+from datetime import date, timedelta
+from typing import Callable, Iterable, Iterator, Optional, Set, Union
+
+from inter_sdk_python.billing.billing.BillingClient import BillingClient
+from inter_sdk_python.billing.bulk.BulkExecutor import BulkExecutor
+from inter_sdk_python.billing.bulk.ProgressJournal import ProgressJournal
+from inter_sdk_python.billing.enums.BillingDateType import BillingDateType
+from inter_sdk_python.billing.enums.BulkItemStatus import BulkItemStatus
+from inter_sdk_python.billing.models.BillingIssueRequest import BillingIssueRequest
+from inter_sdk_python.billing.models.BillingIssueResponse import BillingIssueResponse
+from inter_sdk_python.billing.models.BillingRetrievalFilter import BillingRetrievalFilter
+from inter_sdk_python.billing.models.BulkItemResult import BulkItemResult
+from inter_sdk_python.billing.models.BulkReport import BulkReport
+from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.Error import Error
+
+
+class BillingBulkIssuer:
+    """
+    The BillingBulkIssuer class issues many billings with up to workers
+    requests in flight, paced by requests_per_minute when it is given and by
+    the rate limiter of the configuration, which slows down automatically
+    when the API throttles the calls.
+
+    The "seu número" (your_number) of each request is its idempotency key and
+    must be unique within the run; repeated ones are reported as FAILED. Every
+    request is recorded in a progress journal as PENDING before it is sent and
+    with its outcome afterwards, so:
+
+    - billings recorded as issued are never sent again when a run is resumed;
+    - when the outcome of a call is unknown (server error, timeout or a crash
+      while the call was in flight), the entry stays PENDING until the billing
+      is found by its your_number, and the next run looks it up again before
+      sending it, so retries never issue it twice.
+    """
+
+    LOOKUP_PAGE_SIZE = 10
+
+    def __init__(self, config: Config, journal: Union[str, ProgressJournal], workers: int = 8,
+                 requests_per_minute: Optional[float] = None):
+        """
+        Args:
+            config (Config): The configuration object containing client information.
+            journal (Union[str, ProgressJournal]): The progress journal, or the path of its file.
+            workers (int): Maximum number of billings issued at the same time - default is 8. Keep it
+                           within the connection pool size (InterSdk.set_connection_pool).
+            requests_per_minute (Optional[float]): Pace of the issuance calls of this issuer, with bursts of
+                                                   up to workers calls, on top of the limits set with
+                                                   InterSdk.set_rate_limit, which are left unchanged -
+                                                   default is None, not pacing them further.
+        """
+        self.config = config
+        self.journal = journal if isinstance(journal, ProgressJournal) else ProgressJournal(journal)
+        self.workers = max(1, workers)
+        self.billing_client = BillingClient()
+        self.report = BulkReport()
+        self.pace = BulkExecutor.pacer(requests_per_minute, self.workers)
+
+    def issue(self, requests: Iterable[BillingIssueRequest]) -> Iterator[BillingIssueResponse]:
+        """
+        Issues the billings, yielding the response of each billing issued, in the order of the requests.
+        Billings issued by a previous run with the same journal are yielded without being sent again.
+
+        Failed requests are not yielded and do not stop the run: the outcome of every request, with
+        the error of the failed ones, is added to report, keyed by your_number. Running the same
+        requests again retries only the failed ones.
+
+        Args:
+            requests (Iterable[BillingIssueRequest]): The billings to be issued, e.g. a generator.
+
+        Returns:
+            Iterator[BillingIssueResponse]: The request code of each billing issued.
+        """
+        try:
+            for result in BulkExecutor.run(self.workers, self._tasks(requests), "inter-sdk-issue"):
+                self.report.results.append(result)
+                if result.status != BulkItemStatus.FAILED and result.value is not None:
+                    yield BillingIssueResponse(request_code=result.value)
+        finally:
+            logging.info("IssueBillings succeeded=%s skipped=%s failed=%s", len(self.report.succeeded()),
+                         len(self.report.skipped()), len(self.report.failed()))
+
+    def close(self) -> None:
+        """
+        Closes the progress journal.
+        """
+        self.journal.close()
+
+    def __enter__(self) -> 'BillingBulkIssuer':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _tasks(self, requests: Iterable[BillingIssueRequest]) -> Iterator[Callable[[], BulkItemResult]]:
+        seen: Set[str] = set()
+        for request in requests:
+            key = request.your_number
+            if not key or key in seen:
+                yield functools.partial(BillingBulkIssuer._rejected, key)
+            else:
+                seen.add(key)
+                yield functools.partial(self._issue, request)
+
+    def _issue(self, request: BillingIssueRequest) -> BulkItemResult:
+        key = request.your_number
+        entry = self.journal.get(key)
+        try:
+            if entry is not None and entry["status"] == BulkItemStatus.SUCCEEDED.value:
+                return BulkItemResult(key, BulkItemStatus.SKIPPED, entry.get("requestCode"))
+            if entry is not None and entry["status"] == BulkItemStatus.PENDING.value:
+                request_code = self._lookup(key, entry.get("date"))
+                if request_code is not None:
+                    self.journal.record(key, BulkItemStatus.SUCCEEDED, requestCode=request_code)
+                    return BulkItemResult(key, BulkItemStatus.SKIPPED, request_code)
+        except Exception as exception:
+            return BulkItemResult(key, BulkItemStatus.FAILED, error=BulkExecutor.error_of(exception))
+
+        issue_date = date.today().isoformat()
+        self.journal.record(key, BulkItemStatus.PENDING, date=issue_date)
+        if self.pace is not None:
+            self.pace.acquire()
+        try:
+            response = self.billing_client.issue_billing(self.config, request)
+        except Exception as exception:
+            error = BulkExecutor.error_of(exception)
+            if BulkExecutor.is_rejected(exception):
+                self.journal.record(key, BulkItemStatus.FAILED, error=error.to_dict())
+                return BulkItemResult(key, BulkItemStatus.FAILED, error=error)
+            try:
+                request_code = self._lookup(key, issue_date)
+            except Exception:
+                request_code = None
+            if request_code is None:
+                # Still unknown, as billings may be created after the call fails: the entry stays PENDING
+                # and the next run looks the billing up again before sending it.
+                return BulkItemResult(key, BulkItemStatus.FAILED, error=error)
+            response = BillingIssueResponse(request_code=request_code)
+
+        self.journal.record(key, BulkItemStatus.SUCCEEDED, requestCode=response.request_code)
+        return BulkItemResult(key, BulkItemStatus.SUCCEEDED, response.request_code)
+
+    def _lookup(self, key: str, issue_date: Optional[str]) -> Optional[str]:
+        """
+        Returns the request code of the billing with the given your_number issued around issue_date, if any.
+        """
+        day = date.fromisoformat(issue_date) if issue_date else date.today()
+        final_day = max(day, date.today()) + timedelta(days=1)
+        page = self.billing_client.retrieve_billing_page(
+            self.config, (day - timedelta(days=1)).isoformat(), final_day.isoformat(), 0, BillingBulkIssuer.LOOKUP_PAGE_SIZE,
+            BillingRetrievalFilter(filter_date_by=BillingDateType.EMISSAO, your_number=key), None
+        )
+        for billing in page.billings:
+            if billing.billing is not None and billing.billing.your_number == key:
+                return billing.billing.request_code
+        return None
+
+    @staticmethod
+    def _rejected(key: Optional[str]) -> BulkItemResult:
+        if not key:
+            return BulkItemResult("", BulkItemStatus.FAILED, error=Error(title="Invalid request",
+                                                                          detail="your_number is required"))
+        return BulkItemResult(key, BulkItemStatus.FAILED, error=Error(title="Invalid request",
+                                                                      detail="duplicate your_number"))
@@ -0,0 +1,138 @@
+import functools
+import logging
+import os
+import re
+import zipfile
+from typing import Callable, Iterable, Iterator, Optional, Set
+
+from inter_sdk_python.billing.billing.BillingClient import BillingClient
+from inter_sdk_python.billing.bulk.BulkExecutor import BulkExecutor
+from inter_sdk_python.billing.enums.BulkItemStatus import BulkItemStatus
+from inter_sdk_python.billing.models.BulkItemResult import BulkItemResult
+from inter_sdk_python.billing.models.BulkReport import BulkReport
+from inter_sdk_python.commons.models.Config import Config
+
+
+class BillingPdfDownloader:
+    """
+    The BillingPdfDownloader class retrieves the PDFs of many billings with up
+    to workers requests in flight, each one paced by the rate limiter of the
+    configuration, and writes them to a directory or a zip archive as
+    <request code>.pdf.
+
+    Downloads can be resumed: PDFs already in the directory or the archive are
+    skipped, and files are only given their final name once complete, so
+    running the same download again only retrieves the missing and failed
+    ones. Every request code gets a result in the report, in the given order.
+    """
+
+    REQUEST_CODE = re.compile(r"[A-Za-z0-9_-]+")
+
+    def __init__(self, config: Config, workers: int = 4):
+        """
+        Args:
+            config (Config): The configuration object containing client information.
+            workers (int): Maximum number of PDFs retrieved at the same time - default is 4. Keep it
+                           within the connection pool size (InterSdk.set_connection_pool).
+        """
+        self.config = config
+        self.workers = max(1, workers)
+        self.billing_client = BillingClient()
+
+    def to_directory(self, request_codes: Iterable[str], directory: str) -> BulkReport:
+        """
+        Writes the PDF of each billing to the directory, created if it does not exist.
+
+        Args:
+            request_codes (Iterable[str]): Request codes of the billings.
+            directory (str): The target directory.
+
+        Returns:
+            BulkReport: The outcome of each request code; value is the path of the PDF.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        def download(request_code: str) -> BulkItemResult:
+            path = os.path.join(directory, BillingPdfDownloader.file_name(request_code))
+            if os.path.exists(path):
+                return BulkItemResult(request_code, BulkItemStatus.SKIPPED, path)
+            self.billing_client.retrieve_billing_in_pdf(self.config, request_code, path)
+            return BulkItemResult(request_code, BulkItemStatus.SUCCEEDED, path)
+
+        return self._run(request_codes, download)
+
+    def to_zip(self, request_codes: Iterable[str], archive: str) -> BulkReport:
+        """
+        Writes the PDF of each billing to a zip archive, appending to it when it already exists.
+        PDFs are added as they arrive, so at most workers of them are held in memory.
+
+        Args:
+            request_codes (Iterable[str]): Request codes of the billings.
+            archive (str): Path of the zip archive.
+
+        Returns:
+            BulkReport: The outcome of each request code; value is the name of the entry in the archive.
+        """
+        with zipfile.ZipFile(archive, "a" if os.path.exists(archive) else "w") as zip_file:
+            entries = set(zip_file.namelist())
+            documents = {}
+
+            def download(request_code: str) -> BulkItemResult:
+                name = BillingPdfDownloader.file_name(request_code)
+                if name in entries:
+                    return BulkItemResult(request_code, BulkItemStatus.SKIPPED, name)
+                documents[request_code] = self.billing_client.retrieve_billing_in_pdf_bytes(self.config, request_code)
+                return BulkItemResult(request_code, BulkItemStatus.SUCCEEDED, name)
+
+            def store(result: BulkItemResult) -> BulkItemResult:
+                document = documents.pop(result.key, None)
+                if document is not None:
+                    zip_file.writestr(result.value, document)
+                    entries.add(result.value)
+                return result
+
+            return self._run(request_codes, download, store)
+
+    @staticmethod
+    def file_name(request_code: str) -> str:
+        """
+        Returns the name of the PDF of a billing in the directory or archive.
+
+        Raises:
+            ValueError: If the request code could not be used as a file name.
+        """
+        if not BillingPdfDownloader.REQUEST_CODE.fullmatch(request_code):
+            raise ValueError(f"Invalid request code '{request_code}'")
+        return f"{request_code}.pdf"
+
+    def _run(self, request_codes: Iterable[str], download: Callable[[str], BulkItemResult],
+             store: Optional[Callable[[BulkItemResult], BulkItemResult]] = None) -> BulkReport:
+        report = BulkReport()
+        for result in BulkExecutor.run(self.workers, BillingPdfDownloader._tasks(request_codes, download), "inter-sdk-pdf"):
+            if store is not None and result.status == BulkItemStatus.SUCCEEDED:
+                try:
+                    result = store(result)
+                except Exception as exception:
+                    result = BulkItemResult(result.key, BulkItemStatus.FAILED, error=BulkExecutor.error_of(exception))
+            report.results.append(result)
+
+        logging.info("DownloadBillingPdfs succeeded=%s skipped=%s failed=%s",
+                     len(report.succeeded()), len(report.skipped()), len(report.failed()))
+        return report
+
+    @staticmethod
+    def _tasks(request_codes: Iterable[str], download: Callable[[str], BulkItemResult]) -> Iterator[Callable[[], BulkItemResult]]:
+        seen: Set[str] = set()
+        for request_code in request_codes:
+            if request_code in seen:
+                yield functools.partial(BulkItemResult, request_code, BulkItemStatus.SKIPPED)
+            else:
+                seen.add(request_code)
+                yield functools.partial(BillingPdfDownloader._attempt, download, request_code)
+
+    @staticmethod
+    def _attempt(download: Callable[[str], BulkItemResult], request_code: str) -> BulkItemResult:
+        try:
+            return download(request_code)
+        except Exception as exception:
+            return BulkItemResult(request_code, BulkItemStatus.FAILED, error=BulkExecutor.error_of(exception))
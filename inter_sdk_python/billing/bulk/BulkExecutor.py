@@ -0,0 +1,80 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+from inter_sdk_python.commons.exceptions.ClientException import ClientException
+from inter_sdk_python.commons.models.Error import Error
+from inter_sdk_python.commons.models.RateLimit import RateLimit
+from inter_sdk_python.commons.utils.TokenBucket import TokenBucket
+
+R = TypeVar("R")
+
+
+class BulkExecutor:
+    """
+    The BulkExecutor class holds what the bulk operations of the billing SDK
+    share: running tasks with a bounded number in flight, pacing them and
+    turning the exceptions of failed items into errors for their results.
+    """
+
+    @staticmethod
+    def run(workers: int, tasks: Iterable[Callable[[], R]], thread_name_prefix: str = "inter-sdk-bulk") -> Iterator[R]:
+        """
+        Runs the tasks on a thread pool with a sliding window of workers tasks in flight and yields their
+        results in the order of the tasks. Tasks are taken from the iterable only as the window advances,
+        so a generator of any length can be given. When the iterator is closed early, the tasks in flight
+        are awaited and the others are not run.
+
+        Args:
+            workers (int): Maximum number of tasks running at the same time.
+            tasks (Iterable[Callable[[], R]]): The tasks; they should report failures in their result.
+            thread_name_prefix (str): Prefix of the names of the worker threads.
+
+        Returns:
+            Iterator[R]: The result of each task.
+        """
+        workers = max(1, workers)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix)
+        pending: deque[Future] = deque()
+        try:
+            for task in tasks:
+                pending.append(executor.submit(task))
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def pacer(requests_per_minute: Optional[float], burst: int) -> Optional[TokenBucket]:
+        """
+        Returns a token bucket pacing the calls of one bulk operation, or None when requests_per_minute is
+        None. The bucket belongs to the operation alone: the rate limiter of the configuration is left as
+        it is, and its limits still apply to every call.
+
+        Raises:
+            ValueError: If requests_per_minute is not positive or burst is below one.
+        """
+        if requests_per_minute is None:
+            return None
+        limit = RateLimit(requests_per_minute=requests_per_minute, burst=burst)
+        return TokenBucket(limit.requests_per_minute / 60.0, limit.burst)
+
+    @staticmethod
+    def error_of(exception: Exception) -> Error:
+        """
+        Returns the API error carried by an SdkException, or an error describing any other exception.
+        """
+        error = getattr(exception, "error", None)
+        return error if isinstance(error, Error) else Error(title=type(exception).__name__, detail=str(exception))
+
+    @staticmethod
+    def is_rejected(exception: Exception) -> bool:
+        """
+        Indicates whether a failed call was answered with a client error (4xx), meaning it had no effect.
+        Any other failure, such as a server error or a timeout, may have been applied by the API.
+        """
+        return isinstance(exception, ClientException) or isinstance(exception.__context__, ClientException)
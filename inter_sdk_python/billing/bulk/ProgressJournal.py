@@ -0,0 +1,105 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from inter_sdk_python.billing.enums.BulkItemStatus import BulkItemStatus
+
+
+class ProgressJournal:
+    """
+    The ProgressJournal class records the progress of a bulk operation in a
+    JSON Lines file, one line per event, so a run interrupted at any point can
+    be resumed from the last recorded state of each item.
+
+    Lines are appended and flushed as they are recorded; with fsync they are
+    also forced to disk, which survives power loss at the cost of throughput.
+    A line cut short by a crash is ignored when the journal is opened again.
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        """
+        Opens the journal, loading the items recorded by previous runs.
+
+        Args:
+            path (str): Path of the journal file, created if it does not exist.
+            fsync (bool): Indicates if every line is forced to disk - default is False.
+        """
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        complete = True
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8", errors="replace") as stream:
+                for number, line in enumerate(stream, start=1):
+                    complete = line.endswith("\n")
+                    try:
+                        entry = json.loads(line)
+                        self._entries[entry["key"]] = entry
+                    except (ValueError, KeyError, TypeError):
+                        logging.warning("Ignoring line %s of journal %s", number, path)
+        else:
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+
+        self._stream = open(path, "a", encoding="utf-8")
+        if not complete:
+            self._stream.write("\n")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the last entry recorded for an item.
+
+        Args:
+            key (str): The key of the item.
+
+        Returns:
+            Optional[Dict[str, Any]]: The entry, with at least "key", "status" and "at", or None.
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def status(self, key: str) -> Optional[BulkItemStatus]:
+        """
+        Returns the last status recorded for an item, None if it was never recorded.
+        """
+        entry = self.get(key)
+        return BulkItemStatus(entry["status"]) if entry is not None else None
+
+    def record(self, key: str, status: BulkItemStatus, **fields: Any) -> Dict[str, Any]:
+        """
+        Appends an entry for an item. Safe to call from several threads.
+
+        Args:
+            key (str): The key of the item.
+            status (BulkItemStatus): The status of the item.
+            **fields (Any): Other JSON values stored with the entry.
+
+        Returns:
+            Dict[str, Any]: The recorded entry.
+        """
+        entry = {"key": key, "status": status.value, "at": time.time(), **fields}
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._stream.write(line)
+            self._stream.flush()
+            if self.fsync:
+                os.fsync(self._stream.fileno())
+            self._entries[key] = entry
+        return entry
+
+    def close(self) -> None:
+        """
+        Closes the journal file.
+        """
+        with self._lock:
+            self._stream.close()
+
+    def __enter__(self) -> 'ProgressJournal':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,18 @@
+from enum import Enum
+
+class BulkItemStatus(Enum):
+    """
+    The BulkItemStatus enum represents the outcome of an item of a bulk
+    operation, such as the download of the PDFs of many billings.
+
+    SUCCEEDED: The item was processed in this run.
+    SKIPPED: The item had already been processed, e.g. in a previous run, and was not sent again.
+    FAILED: The item could not be processed; running the operation again retries it.
+    PENDING: The item was sent and its outcome is not known yet. Only found in progress journals,
+             for items in flight when a run was interrupted.
+    """
+
+    SUCCEEDED = "SUCCEEDED"
+    SKIPPED = "SKIPPED"
+    FAILED = "FAILED"
+    PENDING = "PENDING"
@@ -0,0 +1,295 @@
+import hashlib
+import json
+import logging
+import time
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Set, Tuple, Union
+
+from inter_sdk_python.billing.billing.BillingClient import BillingClient
+from inter_sdk_python.billing.enums.BillingDateType import BillingDateType
+from inter_sdk_python.billing.enums.BillingSituation import BillingSituation
+from inter_sdk_python.billing.models.BillingMirrorRefreshResult import BillingMirrorRefreshResult
+from inter_sdk_python.billing.models.BillingPayload import BillingPayload
+from inter_sdk_python.billing.models.BillingRetrievalFilter import BillingRetrievalFilter
+from inter_sdk_python.billing.models.BillingRetrieveCallbackResponse import BillingRetrieveCallbackResponse
+from inter_sdk_python.billing.models.RetrievedBilling import RetrievedBilling
+from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.utils.SqliteWatermarkStore import SqliteWatermarkStore
+
+
+class BillingMirror:
+    """
+    The BillingMirror class keeps a local SQLite copy of the billings of each
+    account, indexed by request code, situation, due date and payer, so reports
+    can be answered without calling the API.
+
+    Every call to refresh() requests only the window since the previous refresh,
+    widened by overlap_days, once per date type: billings issued, paid or due in
+    the window. Situation changes that happen outside those dates, such as
+    cancellations, are applied from the billing webhook callbacks with
+    apply_callbacks().
+    """
+
+    REFRESH_DATE_TYPES = (BillingDateType.EMISSAO, BillingDateType.PAGAMENTO, BillingDateType.VENCIMENTO)
+    OPEN_SITUATIONS = (BillingSituation.A_RECEBER, BillingSituation.ATRASADO)
+
+    def __init__(self, config: Config, path: str, overlap_days: int = 1):
+        """
+        Opens or creates the mirror database.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            path (str): Path of the database file.
+            overlap_days (int): Days before the last refreshed date requested again - default is 1.
+        """
+        self.config = config
+        self.path = path
+        self.overlap_days = max(0, overlap_days)
+        self.billing_client = BillingClient()
+        self.database = SqliteWatermarkStore(path, (
+            "CREATE TABLE IF NOT EXISTS billings ("
+            "account TEXT NOT NULL, request_code TEXT NOT NULL, your_number TEXT, situation TEXT, "
+            "due_date TEXT, issue_date TEXT, situation_date TEXT, payer_cpf_cnpj TEXT, "
+            "row_hash TEXT NOT NULL, data TEXT NOT NULL, updated_at REAL NOT NULL, "
+            "PRIMARY KEY (account, request_code))",
+            "CREATE INDEX IF NOT EXISTS billings_situation ON billings (account, situation, due_date)",
+            "CREATE INDEX IF NOT EXISTS billings_due_date ON billings (account, due_date)",
+            "CREATE INDEX IF NOT EXISTS billings_payer ON billings (account, payer_cpf_cnpj, due_date)",
+            "CREATE INDEX IF NOT EXISTS billings_your_number ON billings (account, your_number)",
+        ), "refreshed")
+
+    def refresh(self, initial_date: Optional[str] = None, final_date: Optional[str] = None) -> BillingMirrorRefreshResult:
+        """
+        Retrieves the billings of the selected account issued, paid or due since the last refresh
+        and stores them, returning only the billings that are new or changed.
+
+        Args:
+            initial_date (Optional[str]): Start of the first refresh, YYYY-MM-DD. Ignored once the
+                                          account has a watermark, unless it is later than the watermark.
+            final_date (Optional[str]): End of the window, YYYY-MM-DD - default is today.
+
+        Returns:
+            BillingMirrorRefreshResult: The window requested and the new and changed billings.
+
+        Raises:
+            ValueError: If the account was never refreshed and initial_date is not given.
+            SdkException: If there is an error during the retrieval process.
+        """
+        account = self.config.account or ""
+        final_date = final_date or date.today().isoformat()
+        start = self.window_start(account, initial_date)
+        logging.info("RefreshBillingMirror {} account={} {}-{}".format(self.config.client_id, account, start, final_date))
+
+        result = BillingMirrorRefreshResult(account=account, initial_date=start, final_date=final_date)
+        seen: Set[str] = set()
+        for date_type in BillingMirror.REFRESH_DATE_TYPES:
+            filter = BillingRetrievalFilter(filter_date_by=date_type)
+            batch: List[RetrievedBilling] = []
+            for billing in self.billing_client.iter_billing_in_range(self.config, start, final_date, filter, None):
+                request_code = billing.billing.request_code if billing.billing else None
+                if request_code is None or request_code in seen:
+                    continue
+                seen.add(request_code)
+                batch.append(billing)
+                if len(batch) >= SqliteWatermarkStore.BATCH_SIZE:
+                    self.store(account, batch, result)
+                    batch = []
+            self.store(account, batch, result)
+
+        self.database.advance_watermark(account, final_date)
+        return result
+
+    def apply_callbacks(self, callbacks: Iterable[Union[BillingRetrieveCallbackResponse, BillingPayload, dict]]) -> int:
+        """
+        Updates the situation of mirrored billings from billing webhook notifications, either received
+        by the application's webhook or retrieved with BillingSdk.iter_callbacks. Notifications older
+        than the stored situation and billings not mirrored yet are ignored.
+
+        Args:
+            callbacks (Iterable[Union[BillingRetrieveCallbackResponse, BillingPayload, dict]]): Callbacks, their
+                payloads or the payload dictionaries posted to the webhook.
+
+        Returns:
+            int: Number of mirrored billings updated.
+        """
+        payloads: List[BillingPayload] = []
+        for callback in callbacks:
+            if isinstance(callback, BillingRetrieveCallbackResponse):
+                payloads.extend(callback.payload)
+            elif isinstance(callback, dict):
+                payloads.append(BillingPayload.from_dict(callback))
+            else:
+                payloads.append(callback)
+
+        account = self.config.account or ""
+        updated = 0
+        now = time.time()
+        with self.database.transaction() as connection:
+            for payload in payloads:
+                if payload.request_code is None or payload.situation is None:
+                    continue
+                stored = connection.execute(
+                    "SELECT data, situation_date FROM billings WHERE account = ? AND request_code = ?",
+                    (account, payload.request_code)
+                ).fetchone()
+                situation_date = (payload.status_date_time or "")[:10] or None
+                if stored is None or (stored[1] and situation_date and situation_date < stored[1]):
+                    continue
+
+                data = json.loads(stored[0])
+                billing = data.get("cobranca") or {}
+                billing["situacao"] = payload.situation.value
+                billing["dataSituacao"] = situation_date or billing.get("dataSituacao")
+                if payload.total_amount_received is not None:
+                    billing["valorTotalRecebido"] = payload.total_amount_received
+                if payload.receiving_origin is not None:
+                    billing["origemRecebimento"] = payload.receiving_origin.value
+                data["cobranca"] = billing
+
+                _, row_hash, serialized = BillingMirror.row_of(RetrievedBilling.from_dict(data))
+                connection.execute(
+                    "UPDATE billings SET situation = ?, situation_date = ?, row_hash = ?, data = ?, updated_at = ? "
+                    "WHERE account = ? AND request_code = ?",
+                    (payload.situation.value, billing["dataSituacao"], row_hash, serialized, now, account, payload.request_code)
+                )
+                updated += 1
+        return updated
+
+    def get(self, request_code: str) -> Optional[RetrievedBilling]:
+        """
+        Returns a mirrored billing, without calling the API.
+
+        Args:
+            request_code (str): The unique code identifying the billing (codigoSolicitacao).
+
+        Returns:
+            Optional[RetrievedBilling]: The billing, or None if it is not mirrored.
+        """
+        row = self.database.connection().execute(
+            "SELECT data FROM billings WHERE account = ? AND request_code = ?", (self.config.account or "", request_code)
+        ).fetchone()
+        return RetrievedBilling.from_dict(json.loads(row[0])) if row is not None else None
+
+    def find(
+        self,
+        situations: Optional[Iterable[BillingSituation]] = None,
+        payer_cpf_cnpj: Optional[str] = None,
+        due_from: Optional[str] = None,
+        due_to: Optional[str] = None,
+        your_number: Optional[str] = None
+    ) -> List[RetrievedBilling]:
+        """
+        Returns the mirrored billings matching every criterion given, without calling the API.
+
+        Args:
+            situations (Optional[Iterable[BillingSituation]]): Accepted situations (optional, can be None).
+            payer_cpf_cnpj (Optional[str]): The CPF or CNPJ of the payer (optional, can be None).
+            due_from (Optional[str]): First due date, YYYY-MM-DD (optional, can be None).
+            due_to (Optional[str]): Last due date, YYYY-MM-DD (optional, can be None).
+            your_number (Optional[str]): The number given by the issuer (optional, can be None).
+
+        Returns:
+            List[RetrievedBilling]: The billings, ordered by due date.
+        """
+        conditions = ["account = ?"]
+        parameters: list = [self.config.account or ""]
+        if situations is not None:
+            values = [situation.value for situation in situations]
+            conditions.append(f"situation IN ({', '.join('?' * len(values))})")
+            parameters.extend(values)
+        if payer_cpf_cnpj is not None:
+            conditions.append("payer_cpf_cnpj = ?")
+            parameters.append(payer_cpf_cnpj)
+        if due_from is not None:
+            conditions.append("due_date >= ?")
+            parameters.append(due_from)
+        if due_to is not None:
+            conditions.append("due_date <= ?")
+            parameters.append(due_to)
+        if your_number is not None:
+            conditions.append("your_number = ?")
+            parameters.append(your_number)
+
+        cursor = self.database.connection().execute(
+            f"SELECT data FROM billings WHERE {' AND '.join(conditions)} ORDER BY due_date, request_code", parameters
+        )
+        return [RetrievedBilling.from_dict(json.loads(data)) for (data,) in cursor]
+
+    def overdue(self, payer_cpf_cnpj: Optional[str] = None, today: Optional[str] = None) -> List[RetrievedBilling]:
+        """
+        Returns the mirrored billings still open after their due date, without calling the API.
+
+        Args:
+            payer_cpf_cnpj (Optional[str]): The CPF or CNPJ of the payer (optional, can be None).
+            today (Optional[str]): Reference date, YYYY-MM-DD - default is today.
+
+        Returns:
+            List[RetrievedBilling]: The overdue billings, ordered by due date.
+        """
+        yesterday = (date.fromisoformat(today) if today else date.today()) - timedelta(days=1)
+        return self.find(BillingMirror.OPEN_SITUATIONS, payer_cpf_cnpj, due_to=yesterday.isoformat())
+
+    def window_start(self, account: str, initial_date: Optional[str]) -> str:
+        """
+        Returns the first date refresh() requests for the account, overlap_days before its last refreshed date.
+        """
+        return self.database.window_start(account, initial_date, self.overlap_days)
+
+    def get_watermark(self, account: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the last date refreshed for the account.
+
+        Args:
+            account (Optional[str]): The account number - default is the account selected in the configuration.
+
+        Returns:
+            Optional[str]: The date, YYYY-MM-DD, or None if the account was never refreshed.
+        """
+        return self.database.get_watermark(account if account is not None else self.config.account or "")
+
+    def store(self, account: str, billings: List[RetrievedBilling], result: BillingMirrorRefreshResult) -> None:
+        """
+        Upserts a batch of billings in a single database transaction, recording in the result
+        which ones are new or changed.
+        """
+        if not billings:
+            return
+
+        rows = [(billing, *BillingMirror.row_of(billing)) for billing in billings]
+        now = time.time()
+        with self.database.transaction() as connection:
+            for billing, request_code, row_hash, data in rows:
+                stored = connection.execute(
+                    "SELECT row_hash FROM billings WHERE account = ? AND request_code = ?", (account, request_code)
+                ).fetchone()
+                if stored is not None and stored[0] == row_hash:
+                    result.unchanged += 1
+                    continue
+
+                detail = billing.billing
+                connection.execute(
+                    "INSERT OR REPLACE INTO billings (account, request_code, your_number, situation, due_date, issue_date, "
+                    "situation_date, payer_cpf_cnpj, row_hash, data, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (account, request_code, detail.your_number, detail.situation.value if detail.situation else None,
+                     detail.due_date, detail.issue_date, detail.situation_date,
+                     detail.payer.cpf_cnpj if detail.payer else None, row_hash, data, now)
+                )
+                (result.new if stored is None else result.changed).append(billing)
+
+    @staticmethod
+    def row_of(billing: RetrievedBilling) -> Tuple[str, str, str]:
+        """
+        Returns the request code, content hash and serialized content of a billing. The nominal value
+        is kept as a string so it is read back as the same Decimal.
+        """
+        content = billing.to_dict()
+        if billing.billing is not None and billing.billing.nominal_value is not None:
+            content["cobranca"]["valorNominal"] = str(billing.billing.nominal_value)
+        data = json.dumps(content, sort_keys=True, separators=(",", ":"))
+        return billing.billing.request_code, hashlib.sha256(data.encode()).hexdigest(), data
+
+    def close(self) -> None:
+        """
+        Closes the mirror database connection of the current thread.
+        """
+        self.database.close()
@@ -6,7 +6,7 @@ from inter_sdk_python.billing.enums.BillingSituation import BillingSituation
 from inter_sdk_python.billing.enums.BillingType import BillingType
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseBillingRetrievalFilter:
     """
     The BaseBillingRetrievalFilter class represents the filter criteria 
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from typing import Optional, Dict
 
-@dataclass
+from inter_sdk_python.commons.models.FieldMapping import FieldMapping
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
+
+@dataclass(slots=True)
 class BillingBilletRetrievingResponse:
     """
     The BillingBilletRetrievingResponse class represents the response 
@@ -18,6 +21,13 @@ class BillingBilletRetrievingResponse:
     digit_line: Optional[str] = None
     """The digit line representation of the billing billet."""
 
+    FIELD_MAP = (
+        FieldMapping("our_number", "nossoNumero"),
+        FieldMapping("barcode", "codigoBarras"),
+        FieldMapping("digit_line", "linhaDigitavel")
+    )
+    """The API key and conversion of each attribute, compiled by ModelCodec."""
+
     @staticmethod
     def from_dict(data: Dict) -> 'BillingBilletRetrievingResponse':
         """
@@ -29,11 +39,7 @@ class BillingBilletRetrievingResponse:
         Returns:
             BillingBilletRetrievingResponse: An instance of BillingBilletRetrievingResponse.
         """
-        return BillingBilletRetrievingResponse(
-            our_number=data.get("nossoNumero"),
-            barcode=data.get("codigoBarras"),
-            digit_line=data.get("linhaDigitavel")
-        )
+        return ModelCodec.of(BillingBilletRetrievingResponse).decode(data)
 
     def to_dict(self) -> dict:
         """
@@ -42,8 +48,4 @@ class BillingBilletRetrievingResponse:
         Returns:
             dict: A dictionary representation of the BillingBilletRetrievingResponse instance.
         """
-        return {
-            "nossoNumero": self.our_number,
-            "codigoBarras": self.barcode,
-            "linhaDigitavel": self.digit_line
-        }
\ No newline at end of file
+        return ModelCodec.of(BillingBilletRetrievingResponse).encode(self)
\ No newline at end of file
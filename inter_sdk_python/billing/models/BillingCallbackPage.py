@@ -4,7 +4,7 @@ from typing import Optional, List, Dict
 from inter_sdk_python.billing.models.BillingRetrieveCallbackResponse import BillingRetrieveCallbackResponse
 
 
-@dataclass
+@dataclass(slots=True)
 class BillingCallbackPage:
     """
     The BillingCallbackPage class represents a paginated response 
@@ -10,7 +10,7 @@ from inter_sdk_python.billing.models.Mora import Mora
 from inter_sdk_python.billing.models.Person import Person
 
 
-@dataclass
+@dataclass(slots=True)
 class BillingIssueRequest:
     """
     The BillingIssueRequest class represents a request to issue a billing,
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class BillingIssueResponse:
     """
     The BillingIssueResponse class represents the response received after
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from inter_sdk_python.billing.models.RetrievedBilling import RetrievedBilling
+
+
+@dataclass(slots=True)
+class BillingMirrorRefreshResult:
+    """
+    The BillingMirrorRefreshResult class represents the outcome of a billing
+    mirror refresh: the window requested from the API and the billings that
+    were not in the local mirror or whose content changed.
+    """
+
+    account: str
+    """The account refreshed, empty for the default account of the application."""
+
+    initial_date: str
+    """The start of the window requested from the API (inclusive)."""
+
+    final_date: str
+    """The end of the window requested from the API (inclusive)."""
+
+    new: List[RetrievedBilling] = field(default_factory=list)
+    """Billings seen for the first time."""
+
+    changed: List[RetrievedBilling] = field(default_factory=list)
+    """Billings already mirrored whose content changed since the last refresh."""
+
+    unchanged: int = 0
+    """Number of billings received again without changes."""
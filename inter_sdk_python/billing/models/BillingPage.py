@@ -1,10 +1,12 @@
 from dataclasses import dataclass, field
 from typing import Optional, List
 
+from inter_sdk_python.billing.models.LazyRetrievedBilling import LazyRetrievedBilling
 from inter_sdk_python.billing.models.RetrievedBilling import RetrievedBilling
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
 
 
-@dataclass
+@dataclass(slots=True)
 class BillingPage:
     """
     The BillingPage class represents a paginated response containing a
@@ -43,16 +45,18 @@ class BillingPage:
         return self.total_pages if self.total_pages is not None else 0
 
     @staticmethod
-    def from_dict(data: dict) -> 'BillingPage':
+    def from_dict(data: dict, lazy: bool = False) -> 'BillingPage':
         """
         Create a BillingPage instance from a dictionary.
 
         Args:
             data (dict): A dictionary containing the billing page data.
+            lazy (bool): Indicates if the billings decode each field only on first access - default is False.
 
         Returns:
             BillingPage: An instance of BillingPage.
         """
+        decode = LazyRetrievedBilling.wrap if lazy else ModelCodec.of(RetrievedBilling).decode
         return BillingPage(
             total_pages=data.get("totalPaginas"),
             total_elements=data.get("totalElementos"),
@@ -60,7 +64,7 @@ class BillingPage:
             first_page=data.get("primeiraPagina"),
             page_size=data.get("tamanhoPagina"),
             number_of_elements=data.get("numeroDeElementos"),
-            billings=[RetrievedBilling.from_dict(item) for item in data.get("cobrancas", [])]
+            billings=[decode(item) for item in data.get("cobrancas", [])]
         )
 
     def to_dict(self) -> dict:
@@ -5,7 +5,7 @@ from inter_sdk_python.billing.enums.BillingSituation import BillingSituation
 from inter_sdk_python.billing.enums.ReceivingOrigin import ReceivingOrigin
 
 
-@dataclass
+@dataclass(slots=True)
 class BillingPayload:
     """
     The BillingPayload class represents the data structure used for
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+from inter_sdk_python.commons.models.FieldMapping import FieldMapping
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
+
+@dataclass(slots=True)
 class BillingPixRetrievingResponse:
     """
     The BillingPixRetrievingResponse class represents the response received
@@ -19,6 +22,12 @@ class BillingPixRetrievingResponse:
     pix_copy_and_paste: Optional[str] = None
     """The copy-paste string for the Pix payment."""
 
+    FIELD_MAP = (
+        FieldMapping("transaction_id", "txid"),
+        FieldMapping("pix_copy_and_paste", "pixCopiaECola")
+    )
+    """The API key and conversion of each attribute, compiled by ModelCodec."""
+
     @staticmethod
     def from_dict(data: dict) -> 'BillingPixRetrievingResponse':
         """
@@ -30,10 +39,7 @@ class BillingPixRetrievingResponse:
         Returns:
             BillingPixRetrievingResponse: An instance of BillingPixRetrievingResponse.
         """
-        return BillingPixRetrievingResponse(
-            transaction_id=data.get("txid"),
-            pix_copy_and_paste=data.get("pixCopiaECola")
-        )
+        return ModelCodec.of(BillingPixRetrievingResponse).decode(data)
 
     def to_dict(self) -> dict:
         """
@@ -42,7 +48,4 @@ class BillingPixRetrievingResponse:
         Returns:
             dict: A dictionary containing the Pix retrieving response data.
         """
-        return {
-            "txid": self.transaction_id,
-            "pixCopiaECola": self.pix_copy_and_paste
-        }
\ No newline at end of file
+        return ModelCodec.of(BillingPixRetrievingResponse).encode(self)
\ No newline at end of file
@@ -1,9 +1,9 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
 from inter_sdk_python.billing.models.BaseBillingRetrievalFilter import BaseBillingRetrievalFilter
 
 
-@dataclass
+@dataclass(slots=True)
 class BillingRetrievalFilter(BaseBillingRetrievalFilter):
     """
     The BillingRetrievalFilter class extends the base filter
@@ -34,7 +34,7 @@ class BillingRetrievalFilter(BaseBillingRetrievalFilter):
         """
         base_filter = BaseBillingRetrievalFilter.from_dict(data)
         return BillingRetrievalFilter(
-            **base_filter.__dict__,
+            **{item.name: getattr(base_filter, item.name) for item in fields(BaseBillingRetrievalFilter)},
             page=data.get("pagina", 0),
             items_per_page=data.get("itensPorPagina", 0)
         )
\ No newline at end of file
@@ -4,7 +4,7 @@ from typing import Optional, List
 from inter_sdk_python.billing.models.BillingPayload import BillingPayload
 
 
-@dataclass
+@dataclass(slots=True)
 class BillingRetrieveCallbackResponse:
     """
     The BillingRetrieveCallbackResponse class represents the response structure
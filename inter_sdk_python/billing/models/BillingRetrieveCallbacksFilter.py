@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class BillingRetrieveCallbacksFilter:
     """
     The BillingRetrieveCallbacksFilter class represents the filter criteria
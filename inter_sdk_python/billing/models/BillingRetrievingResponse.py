@@ -9,9 +9,11 @@ from inter_sdk_python.billing.models.Discount import Discount
 from inter_sdk_python.billing.models.Fine import Fine
 from inter_sdk_python.billing.models.Mora import Mora
 from inter_sdk_python.billing.models.Person import Person
+from inter_sdk_python.commons.models.FieldMapping import FieldMapping
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
 
 
-@dataclass
+@dataclass(slots=True)
 class BillingRetrievingResponse:
     """
     The BillingRetrievingResponse class represents the response received
@@ -70,6 +72,26 @@ class BillingRetrievingResponse:
     payer: Optional[Person] = None
     """The payer's information."""
 
+    FIELD_MAP = (
+        FieldMapping("request_code", "codigoSolicitacao"),
+        FieldMapping("your_number", "seuNumero"),
+        FieldMapping("issue_date", "dataEmissao"),
+        FieldMapping("due_date", "dataVencimento"),
+        FieldMapping("nominal_value", "valorNominal", FieldMapping.DECIMAL),
+        FieldMapping("billing_type", "tipoCobranca", FieldMapping.ENUM, BillingType),
+        FieldMapping("situation", "situacao", FieldMapping.ENUM, BillingSituation),
+        FieldMapping("situation_date", "dataSituacao"),
+        FieldMapping("total_amount_received", "valorTotalRecebido"),
+        FieldMapping("receiving_origin", "origemRecebimento", FieldMapping.ENUM, ReceivingOrigin),
+        FieldMapping("cancellation_reason", "motivoCancelamento"),
+        FieldMapping("archived", "arquivada"),
+        FieldMapping("discounts", "descontos", FieldMapping.MODEL_LIST, Discount),
+        FieldMapping("fine", "multa", FieldMapping.MODEL, Fine),
+        FieldMapping("interest", "mora", FieldMapping.MODEL, Mora),
+        FieldMapping("payer", "pagador", FieldMapping.MODEL, Person)
+    )
+    """The API key and conversion of each attribute, compiled by ModelCodec."""
+
     @staticmethod
     def from_dict(data: dict) -> 'BillingRetrievingResponse':
         """
@@ -81,24 +103,7 @@ class BillingRetrievingResponse:
         Returns:
             BillingRetrievingResponse: An instance of BillingRetrievingResponse.
         """
-        return BillingRetrievingResponse(
-            request_code=data.get("codigoSolicitacao"),
-            your_number=data.get("seuNumero"),
-            issue_date=data.get("dataEmissao"),
-            due_date=data.get("dataVencimento"),
-            nominal_value=Decimal(data["valorNominal"]) if data.get("valorNominal") else None,
-            billing_type=BillingType(data["tipoCobranca"]) if data.get("tipoCobranca") else None,
-            situation=BillingSituation(data["situacao"]) if data.get("situacao") else None,
-            situation_date=data.get("dataSituacao"),
-            total_amount_received=data.get("valorTotalRecebido"),
-            receiving_origin=ReceivingOrigin(data["origemRecebimento"]) if data.get("origemRecebimento") else None,
-            cancellation_reason=data.get("motivoCancelamento"),
-            archived=data.get("arquivada"),
-            discounts=[Discount.from_dict(d) for d in data.get("descontos", [])],
-            fine=Fine.from_dict(data["multa"]) if data.get("multa") else None,
-            interest=Mora.from_dict(data["mora"]) if data.get("mora") else None,
-            payer=Person.from_dict(data["pagador"]) if data.get("pagador") else None
-        )
+        return ModelCodec.of(BillingRetrievingResponse).decode(data)
 
     def to_dict(self) -> dict:
         """
@@ -106,21 +111,4 @@ class BillingRetrievingResponse:
         Returns:
             dict: A dictionary containing the billing retrieving response data.
         """
-        return {
-            "codigoSolicitacao": self.request_code,
-            "seuNumero": self.your_number,
-            "dataEmissao": self.issue_date,
-            "dataVencimento": self.due_date,
-            "valorNominal": float(self.nominal_value) if self.nominal_value is not None else None,
-            "tipoCobranca": self.billing_type.name if self.billing_type else None,
-            "situacao": self.situation.name if self.situation else None,
-            "dataSituacao": self.situation_date,
-            "valorTotalRecebido": self.total_amount_received,
-            "origemRecebimento": self.receiving_origin.name if self.receiving_origin else None,
-            "motivoCancelamento": self.cancellation_reason,
-            "arquivada": self.archived,
-            "descontos": [discount.to_dict() for discount in self.discounts],
-            "multa": self.fine.to_dict() if self.fine else None,
-            "mora": self.interest.to_dict() if self.interest else None,
-            "pagador": self.payer.to_dict() if self.payer else None
-        }
\ No newline at end of file
+        return ModelCodec.of(BillingRetrievingResponse).encode(self)
\ No newline at end of file
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from inter_sdk_python.billing.enums.BulkItemStatus import BulkItemStatus
+from inter_sdk_python.commons.models.Error import Error
+
+
+@dataclass(slots=True)
+class BulkItemResult:
+    """
+    The BulkItemResult class represents the outcome of one item of a bulk
+    operation: the key identifying the item, its status and either the
+    result of the operation or the error that made it fail.
+    """
+
+    key: str
+    """The key of the item, e.g. the request code of the billing."""
+
+    status: BulkItemStatus
+    """Whether the item succeeded, was skipped or failed."""
+
+    value: Optional[str] = None
+    """The result of the item, e.g. the file or archive entry where the PDF was written."""
+
+    error: Optional[Error] = None
+    """The error of a failed item."""
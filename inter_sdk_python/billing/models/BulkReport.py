@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from inter_sdk_python.billing.enums.BulkItemStatus import BulkItemStatus
+from inter_sdk_python.billing.models.BulkItemResult import BulkItemResult
+
+
+@dataclass(slots=True)
+class BulkReport:
+    """
+    The BulkReport class represents the outcome of a bulk operation, with
+    one result per item in the order the items were given.
+    """
+
+    results: List[BulkItemResult] = field(default_factory=list)
+    """The result of each item."""
+
+    def succeeded(self) -> List[BulkItemResult]:
+        """
+        Returns the items processed in this run.
+        """
+        return [result for result in self.results if result.status == BulkItemStatus.SUCCEEDED]
+
+    def skipped(self) -> List[BulkItemResult]:
+        """
+        Returns the items that had already been processed and were not sent again.
+        """
+        return [result for result in self.results if result.status == BulkItemStatus.SKIPPED]
+
+    def failed(self) -> List[BulkItemResult]:
+        """
+        Returns the items that failed; running the operation again with the same items retries them.
+        """
+        return [result for result in self.results if result.status == BulkItemStatus.FAILED]
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class CancelBillingRequest:
     """
     The CancelBillingRequest class represents a request to cancel a billing.
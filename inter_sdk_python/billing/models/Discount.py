@@ -5,7 +5,7 @@ from typing import Optional
 from inter_sdk_python.banking.enums.DiscountCode import DiscountCode
 
 
-@dataclass
+@dataclass(slots=True)
 class Discount:
     """
     The Discount class represents a discount applied to a specific
@@ -5,7 +5,7 @@ from typing import Optional
 from inter_sdk_python.billing.enums.FineCode import FineCode
 
 
-@dataclass
+@dataclass(slots=True)
 class Fine:
     """
     Represents a fine with a specific code, rate, and value.
@@ -0,0 +1,12 @@
+from inter_sdk_python.billing.models.BillingRetrievingResponse import BillingRetrievingResponse
+from inter_sdk_python.commons.models.LazyModel import LazyModel
+
+
+class LazyBillingRetrievingResponse(LazyModel, BillingRetrievingResponse):
+    """
+    The LazyBillingRetrievingResponse class is a BillingRetrievingResponse that
+    decodes each field from the raw dictionary on first access, discounts,
+    fine, interest and payer included.
+    """
+
+    __slots__ = ("_data", "_cache")
@@ -0,0 +1,17 @@
+from inter_sdk_python.billing.models.LazyBillingRetrievingResponse import LazyBillingRetrievingResponse
+from inter_sdk_python.billing.models.RetrievedBilling import RetrievedBilling
+from inter_sdk_python.commons.models.LazyModel import LazyModel
+
+
+class LazyRetrievedBilling(LazyModel, RetrievedBilling):
+    """
+    The LazyRetrievedBilling class is a RetrievedBilling that decodes the
+    billing, slip and Pix parts from the raw dictionary on first access, the
+    billing part being itself decoded field by field.
+    """
+
+    __slots__ = ("_data", "_cache")
+
+    DECODERS = {
+        "billing": lambda data: LazyBillingRetrievingResponse.wrap(data["cobranca"]) if data.get("cobranca") else None
+    }
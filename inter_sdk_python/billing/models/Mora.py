@@ -5,7 +5,7 @@ from typing import Optional
 from inter_sdk_python.billing.enums.MoraCode import MoraCode
 
 
-@dataclass
+@dataclass(slots=True)
 class Mora:
     """
     The Mora class represents the interest applied to an overdue
@@ -2,9 +2,11 @@ from dataclasses import dataclass
 from typing import Optional
 
 from inter_sdk_python.billing.enums.PersonType import PersonType
+from inter_sdk_python.commons.models.FieldMapping import FieldMapping
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """
     The Person class represents an individual's or company's information,
@@ -54,6 +56,23 @@ class Person:
     phone: Optional[str] = None
     """The telephone number of the person or company."""
 
+    FIELD_MAP = (
+        FieldMapping("cpf_cnpj", "cpfCnpj"),
+        FieldMapping("person_type", "tipoPessoa", FieldMapping.ENUM, PersonType),
+        FieldMapping("name", "nome"),
+        FieldMapping("address", "endereco"),
+        FieldMapping("number", "numero"),
+        FieldMapping("complement", "complemento"),
+        FieldMapping("neighborhood", "bairro"),
+        FieldMapping("city", "cidade"),
+        FieldMapping("state", "uf"),
+        FieldMapping("zip_code", "cep"),
+        FieldMapping("email", "email"),
+        FieldMapping("area_code", "ddd"),
+        FieldMapping("phone", "telefone")
+    )
+    """The API key and conversion of each attribute, compiled by ModelCodec."""
+
     @staticmethod
     def from_dict(data: dict) -> 'Person':
         """
@@ -65,21 +84,7 @@ class Person:
         Returns:
             Person: An instance of Person.
         """
-        return Person(
-            cpf_cnpj=data.get("cpfCnpj"),
-            person_type=PersonType(data["tipoPessoa"]) if data.get("tipoPessoa") else None,
-            name=data.get("nome"),
-            address=data.get("endereco"),
-            number=data.get("numero"),
-            complement=data.get("complemento"),
-            neighborhood=data.get("bairro"),
-            city=data.get("cidade"),
-            state=data.get("uf"),
-            zip_code=data.get("cep"),
-            email=data.get("email"),
-            area_code=data.get("ddd"),
-            phone=data.get("telefone")
-        )
+        return ModelCodec.of(Person).decode(data)
 
     def to_dict(self) -> dict:
         """
@@ -88,18 +93,4 @@ class Person:
         Returns:
             dict: A dictionary containing the person data.
         """
-        return {
-            "cpfCnpj": self.cpf_cnpj,
-            "tipoPessoa": self.person_type.value if self.person_type else None,
-            "nome": self.name,
-            "endereco": self.address,
-            "numero": self.number,
-            "complemento": self.complement,
-            "bairro": self.neighborhood,
-            "cidade": self.city,
-            "uf": self.state,
-            "cep": self.zip_code,
-            "email": self.email,
-            "ddd": self.area_code,
-            "telefone": self.phone
-        }
+        return ModelCodec.of(Person).encode(self)
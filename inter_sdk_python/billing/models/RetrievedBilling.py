@@ -4,9 +4,11 @@ from typing import Optional
 from inter_sdk_python.billing.models.BillingBilletRetrievingResponse import BillingBilletRetrievingResponse
 from inter_sdk_python.billing.models.BillingPixRetrievingResponse import BillingPixRetrievingResponse
 from inter_sdk_python.billing.models.BillingRetrievingResponse import BillingRetrievingResponse
+from inter_sdk_python.commons.models.FieldMapping import FieldMapping
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievedBilling:
     """
     The RetrievedBilling class represents the response containing different
@@ -27,6 +29,13 @@ class RetrievedBilling:
     pix: Optional[BillingPixRetrievingResponse] = None
     """The Pix payment details associated with the billing."""
 
+    FIELD_MAP = (
+        FieldMapping("billing", "cobranca", FieldMapping.MODEL, BillingRetrievingResponse),
+        FieldMapping("slip", "boleto", FieldMapping.MODEL, BillingBilletRetrievingResponse),
+        FieldMapping("pix", "pix", FieldMapping.MODEL, BillingPixRetrievingResponse)
+    )
+    """The API key and conversion of each attribute, compiled by ModelCodec."""
+
     @staticmethod
     def from_dict(data: dict) -> 'RetrievedBilling':
         """
@@ -38,11 +47,7 @@ class RetrievedBilling:
         Returns:
             RetrievedBilling: An instance of RetrievedBilling.
         """
-        return RetrievedBilling(
-            billing=BillingRetrievingResponse.from_dict(data["cobranca"]) if data.get("cobranca") else None,
-            slip=BillingBilletRetrievingResponse.from_dict(data["boleto"]) if data.get("boleto") else None,
-            pix=BillingPixRetrievingResponse.from_dict(data["pix"]) if data.get("pix") else None
-        )
+        return ModelCodec.of(RetrievedBilling).decode(data)
 
     def to_dict(self) -> dict:
         """
@@ -51,8 +56,4 @@ class RetrievedBilling:
         Returns:
             dict: A dictionary containing the retrieved billing data.
         """
-        return {
-            "cobranca": self.billing.to_dict() if self.billing else None,
-            "boleto": self.slip.to_dict() if self.slip else None,
-            "pix": self.pix.to_dict() if self.pix else None
-        }
\ No newline at end of file
+        return ModelCodec.of(RetrievedBilling).encode(self)
\ No newline at end of file
@@ -5,7 +5,7 @@ from inter_sdk_python.billing.enums.OrderBy import OrderBy
 from inter_sdk_python.billing.enums.OrderType import OrderType
 
 
-@dataclass
+@dataclass(slots=True)
 class Sorting:
     """
     The Sorting class represents the sorting criteria used
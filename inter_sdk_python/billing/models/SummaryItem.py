@@ -3,7 +3,7 @@ from decimal import Decimal
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryItem:
     """
     The SummaryItem class represents a summary item in a billing context.
@@ -1,6 +1,7 @@
 import json
 import logging
-from typing import List
+from datetime import timedelta
+from typing import Iterator, List, Optional
 
 from inter_sdk_python.billing.models.BillingCallbackPage import BillingCallbackPage
 from inter_sdk_python.billing.models.BillingRetrieveCallbackResponse import BillingRetrieveCallbackResponse
@@ -8,8 +9,11 @@ from inter_sdk_python.billing.models.BillingRetrieveCallbacksFilter import Billi
 from inter_sdk_python.commons.models.Config import Config
 from inter_sdk_python.commons.models.IncludeWebhookRequest import IncludeWebhookRequest
 from inter_sdk_python.commons.models.Webhook import Webhook
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
 from inter_sdk_python.commons.structures.Constants import Constants
+from inter_sdk_python.commons.utils.DateRangeSharder import DateRangeSharder
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.PaginationUtils import PaginationUtils
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 from inter_sdk_python.commons.utils.WebhookUtil import WebhookUtil
 
@@ -113,18 +117,121 @@ class BillingWebhookClient:
             SdkException: If there is an error during the retrieval process, such as network issues
                            or API response errors.
         """
+        return list(self.iter_callbacks_in_range(config, initial_date_hour, final_date_hour, filter, page_size))
+
+    def iter_callbacks_in_range(
+        self, 
+        config: Config, 
+        initial_date_hour: str, 
+        final_date_hour: str, 
+        filter: BillingRetrieveCallbacksFilter,
+        page_size: int
+    ) -> Iterator[BillingRetrieveCallbackResponse]:
+        """
+        Yields the callback responses within the specified date range page by page, so at most config.pagination_workers
+        pages are kept in memory and the first items are available as soon as the first page is retrieved.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date_hour (str): The start date and hour for the retrieval range (inclusive).
+            final_date_hour (str): The end date and hour for the retrieval range (inclusive).
+            filter (Optional[BillingRetrieveCallbacksFilter]): Optional filters to be applied to the callback retrieval.
+
+        Returns:
+            Iterator[BillingRetrieveCallbackResponse]: The callback responses, in page order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveCallback {} {}-{}".format(config.client_id, initial_date_hour, final_date_hour))
+
+        yield from PaginationUtils.iterate(
+            config,
+            lambda page: self.get_page(config, initial_date_hour, final_date_hour, page, page_size, filter),
+            lambda current_page: current_page.callbacks
+        )
+
+    def iter_callbacks_resumable(
+        self,
+        config: Config,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: BillingRetrieveCallbacksFilter,
+        page_size: int,
+        checkpoint_file: str
+    ) -> Iterator[BillingRetrieveCallbackResponse]:
+        """
+        Yields the callback responses within the specified date range, resuming after the last page recorded in
+        checkpoint_file. The checkpoint is saved there after each page, so an interrupted retrieval
+        continues from the next page when called again with the same arguments.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date_hour (str): The start date and hour for the retrieval range (inclusive).
+            final_date_hour (str): The end date and hour for the retrieval range (inclusive).
+            filter (Optional[BillingRetrieveCallbacksFilter]): Optional filters to be applied to the callback retrieval.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+
+        Returns:
+            Iterator[BillingRetrieveCallbackResponse]: The callback responses not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
         logging.info("RetrieveCallback {} {}-{}".format(config.client_id, initial_date_hour, final_date_hour))
-        page = 0
-        callbacks = []
 
-        while True:
-            callback_page = self.get_page(config, initial_date_hour, final_date_hour, page, page_size, filter)
-            callbacks.extend(callback_page.callbacks)
-            page += 1
-            if page >= callback_page.total_pages:
-                break
+        checkpoint = PaginationCheckpoint.of(Constants.URL_BILLING_WEBHOOK_CALLBACKS, initial_date_hour, final_date_hour, filter, None, page_size)
+        yield from PaginationUtils.iterate_resumable(
+            checkpoint_file,
+            checkpoint,
+            lambda page: self.get_page(config, initial_date_hour, final_date_hour, page, page_size, filter),
+            lambda current_page: current_page.callbacks
+        )
+
+    def iter_callbacks_sharded(
+        self,
+        config: Config,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: BillingRetrieveCallbacksFilter,
+        page_size: int,
+        shard_size: Optional[timedelta] = None,
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[BillingRetrieveCallbackResponse]:
+        """
+        Yields the callback responses within the specified range, splitting it into hour windows retrieved
+        concurrently by up to config.pagination_workers workers. Windows with too many pages are split
+        again, and items are yielded in chronological window order.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date_hour (str): The start of the range (inclusive), YYYY-MM-DDTHH:MM:SSZ.
+            final_date_hour (str): The end of the range (inclusive), YYYY-MM-DDTHH:MM:SSZ.
+            filter (Optional[BillingRetrieveCallbacksFilter]): Optional filters to be applied to the callback retrieval.
+            page_size (int): The number of items per page.
+            shard_size (Optional[timedelta]): Length of each window - default is one hour.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[BillingRetrieveCallbackResponse]: The callback responses, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveCallback {} {}-{}".format(config.client_id, initial_date_hour, final_date_hour))
 
-        return callbacks
+        yield from DateRangeSharder.of(config, shard_size, max_pages_per_shard).iterate(
+            initial_date_hour,
+            final_date_hour,
+            lambda start, end, page: self.get_page(config, start, end, page, page_size, filter),
+            lambda current_page: current_page.callbacks,
+            repr,
+            lambda callback: callback.trigger_date_time
+        )
 
     def retrieve_webhook(self, config: Config) -> Webhook:
         """
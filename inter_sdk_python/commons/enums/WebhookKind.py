@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class WebhookKind(Enum):
+    """
+    The WebhookKind enum represents the APIs whose webhook notifications can
+    be received, each one decoded into the callback model of its SDK.
+
+    BILLING: Billing notifications, decoded into BillingRetrieveCallbackResponse.
+    PIX: Pix notifications, decoded into the pix RetrieveCallbackResponse.
+    BANKING: Payment and pix payment notifications, decoded into the banking RetrieveCallbackResponse.
+    """
+
+    BILLING = "BILLING"
+    PIX = "PIX"
+    BANKING = "BANKING"
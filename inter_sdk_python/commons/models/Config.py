@@ -1,7 +1,15 @@
-from dataclasses import dataclass
-from typing import Optional
+import ssl
+from dataclasses import dataclass, field
+from typing import List, Optional, TYPE_CHECKING
 
 from ..enums.EnvironmentEnum import EnvironmentEnum
+from ..models.RetryPolicy import RetryPolicy
+
+if TYPE_CHECKING:
+    from ..utils.JsonCodec import JsonCodec
+    from ..utils.RateLimiter import RateLimiter
+    from ..utils.SessionPool import SessionPool
+    from ..utils.TokenStore import TokenStore
 
 
 @dataclass
@@ -22,4 +30,15 @@ class Config:
     key: Optional[str] = ""
     crt: Optional[str] = ""
     account: Optional[str] = None
-    rate_limit_control: bool = True
\ No newline at end of file
+    rate_limit_control: bool = True
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    rate_limiter: Optional["RateLimiter"] = field(default=None, repr=False, compare=False)
+    token_scopes: Optional[List[str]] = None
+    token_store: Optional["TokenStore"] = field(default=None, repr=False, compare=False)
+    pool_size: int = 10
+    pool_idle_timeout: Optional[float] = 60
+    session_pool: Optional["SessionPool"] = field(default=None, repr=False, compare=False)
+    pagination_workers: int = 1
+    lazy_models: bool = False
+    json_codec: Optional["JsonCodec"] = field(default=None, repr=False, compare=False)
+    ssl_context: Optional[ssl.SSLContext] = field(default=None, repr=False, compare=False)
\ No newline at end of file
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class FieldMapping:
+    """
+    The FieldMapping class describes how an attribute of a model is read from
+    and written to the dictionaries of the API. A model lists its mappings in
+    its FIELD_MAP attribute, from which ModelCodec compiles the decoder and
+    encoder of the model.
+    """
+
+    VALUE = "value"
+    MODEL = "model"
+    MODEL_LIST = "model_list"
+    ENUM = "enum"
+    DECIMAL = "decimal"
+    DATETIME = "datetime"
+
+    attribute: str
+    """The name of the attribute of the model."""
+
+    key: str
+    """The key of the value in the API dictionary."""
+
+    kind: str = VALUE
+    """How the value is converted: VALUE, MODEL, MODEL_LIST, ENUM, DECIMAL or DATETIME."""
+
+    type: Optional[type] = None
+    """The nested model of MODEL and MODEL_LIST mappings, or the enum of ENUM mappings."""
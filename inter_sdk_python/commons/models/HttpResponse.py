@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from typing import Mapping
+
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass(slots=True)
+class HttpResponse:
+    """
+    The HttpResponse class holds a response fully read by AsyncHttpClient. It
+    exposes the attributes of requests.Response used by HttpUtils, so error
+    responses are handled the same way by the synchronous and asyncio clients.
+    """
+
+    status_code: int
+    """The HTTP status received."""
+
+    reason: str = ""
+    """The reason phrase of the status line."""
+
+    headers: Mapping[str, str] = field(default_factory=CaseInsensitiveDict)
+    """The response headers, with case-insensitive names."""
+
+    content: bytes = b""
+    """The body, already decompressed."""
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
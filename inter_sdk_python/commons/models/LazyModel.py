@@ -0,0 +1,86 @@
+import dataclasses
+from typing import Any, Callable, Dict, Optional, Union
+
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
+
+_MISSING = object()
+
+
+class LazyField:
+    """
+    Descriptor reading a field of a LazyModel from the raw dictionary on first access
+    and caching the decoded value for the next ones.
+    """
+
+    __slots__ = ("name", "key", "decode")
+
+    def __init__(self, name: str, decoder: Union[str, Callable[[dict], Any]]):
+        self.name = name
+        self.key: Optional[str] = decoder if isinstance(decoder, str) else None
+        self.decode: Optional[Callable[[dict], Any]] = None if isinstance(decoder, str) else decoder
+
+    def __get__(self, item: Any, owner: Optional[type] = None) -> Any:
+        if item is None:
+            return self
+        cache = item._cache
+        value = cache.get(self.name, _MISSING)
+        if value is _MISSING:
+            value = item._data.get(self.key) if self.decode is None else self.decode(item._data)
+            cache[self.name] = value
+        return value
+
+    def __set__(self, item: Any, value: Any) -> None:
+        try:
+            item._cache[self.name] = value
+        except AttributeError:
+            item._data = {}
+            item._cache = {self.name: value}
+
+
+class LazyModel:
+    """
+    The LazyModel class is the base of the lazy variants of the page item models
+    (e.g. LazyEnrichedTransaction). A lazy item keeps the dictionary received
+    from the API and decodes each field only when it is first read, caching the
+    decoded value, so nested models that are never read are never built.
+
+    Lazy variants are declared as class LazyX(LazyModel, X), subclassing the
+    model they stand for, so isinstance checks, equality, to_dict and
+    dataclasses.asdict keep working. Fields are decoded as described by the
+    FIELD_MAP of the model; a variant may replace the decoder of some fields
+    in DECODERS, mapping the field name either to the key of a plain value in
+    the raw dictionary or to a function decoding it from the raw dictionary.
+    """
+
+    __slots__ = ()
+
+    DECODERS: Dict[str, Union[str, Callable[[dict], Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        decoders = {**ModelCodec.of(cls.__bases__[-1]).field_decoders(), **cls.DECODERS}
+        for name, decoder in decoders.items():
+            setattr(cls, name, LazyField(name, decoder))
+
+    @classmethod
+    def wrap(cls, data: dict) -> Any:
+        """
+        Creates an item over the raw dictionary without decoding any field.
+
+        Args:
+            data (dict): The item as received from the API.
+
+        Returns:
+            Any: An instance of the lazy variant.
+        """
+        item = object.__new__(cls)
+        item._data = data
+        item._cache = {}
+        return item
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, type(self).__bases__[-1]):
+            return NotImplemented
+        return all(getattr(self, item.name) == getattr(other, item.name) for item in dataclasses.fields(self))
+
+    __hash__ = None
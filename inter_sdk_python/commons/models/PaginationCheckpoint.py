@@ -0,0 +1,159 @@
+import dataclasses
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional
+
+
+@dataclass
+class PaginationCheckpoint:
+    """
+    The PaginationCheckpoint class records how far a paginated retrieval went:
+    the query (operation, range, filter, sort and page size) and the last page
+    whose items were fully consumed. Saved to a file after every page, it lets
+    an interrupted export resume from the next page instead of page 0.
+    """
+
+    operation: str
+    """The endpoint being paginated, e.g. Constants.URL_BILLING."""
+
+    initial_date: str
+    """The start of the range (inclusive)."""
+
+    final_date: str
+    """The end of the range (inclusive)."""
+
+    filter: Optional[dict] = None
+    """The filter of the retrieval, as plain values."""
+
+    sort: Optional[dict] = None
+    """The sorting of the retrieval, as plain values."""
+
+    page_size: Optional[int] = None
+    """The number of items per page, None for the API default."""
+
+    last_completed_page: int = -1
+    """The last page whose items were all consumed, -1 when none was."""
+
+    total_pages: Optional[int] = None
+    """The number of pages reported by the last page retrieved, None before the first one."""
+
+    @property
+    def next_page(self) -> int:
+        """The page to be retrieved next."""
+        return self.last_completed_page + 1
+
+    @property
+    def completed(self) -> bool:
+        """Indicates whether every page was consumed."""
+        return self.total_pages is not None and self.next_page >= self.total_pages
+
+    @staticmethod
+    def of(operation: str, initial_date: str, final_date: str, filter: Any = None, sort: Any = None,
+           page_size: Optional[int] = None) -> 'PaginationCheckpoint':
+        """
+        Creates a checkpoint for a retrieval that has not started yet.
+
+        Args:
+            operation (str): The endpoint being paginated.
+            initial_date (str): The start of the range (inclusive).
+            final_date (str): The end of the range (inclusive).
+            filter (Any): The filter object of the retrieval, if any.
+            sort (Any): The sorting object of the retrieval, if any.
+            page_size (Optional[int]): The number of items per page.
+
+        Returns:
+            PaginationCheckpoint: A checkpoint positioned before page 0.
+        """
+        return PaginationCheckpoint(
+            operation=operation,
+            initial_date=initial_date,
+            final_date=final_date,
+            filter=PaginationCheckpoint.to_plain(filter),
+            sort=PaginationCheckpoint.to_plain(sort),
+            page_size=page_size
+        )
+
+    def matches(self, other: 'PaginationCheckpoint') -> bool:
+        """
+        Indicates whether both checkpoints describe the same query, regardless of progress.
+        """
+        return (self.operation, self.initial_date, self.final_date, self.filter, self.sort, self.page_size) == \
+               (other.operation, other.initial_date, other.final_date, other.filter, other.sort, other.page_size)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the checkpoint into a dictionary of JSON-compatible values.
+        """
+        return dataclasses.asdict(self)
+
+    @staticmethod
+    def from_dict(data: dict) -> 'PaginationCheckpoint':
+        """
+        Create a PaginationCheckpoint instance from a dictionary.
+
+        Args:
+            data (dict): A dictionary containing the checkpoint data.
+
+        Returns:
+            PaginationCheckpoint: An instance of PaginationCheckpoint.
+        """
+        return PaginationCheckpoint(
+            operation=data["operation"],
+            initial_date=data["initial_date"],
+            final_date=data["final_date"],
+            filter=data.get("filter"),
+            sort=data.get("sort"),
+            page_size=data.get("page_size"),
+            last_completed_page=data.get("last_completed_page", -1),
+            total_pages=data.get("total_pages")
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Writes the checkpoint to a JSON file. The file is replaced atomically, so a crash while
+        saving leaves the previous checkpoint intact.
+
+        Args:
+            path (str): The checkpoint file.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as stream:
+                json.dump(self.to_dict(), stream)
+                stream.flush()
+                os.fsync(stream.fileno())
+            os.replace(temporary, path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+    @staticmethod
+    def load(path: str) -> Optional['PaginationCheckpoint']:
+        """
+        Reads a checkpoint saved by save().
+
+        Args:
+            path (str): The checkpoint file.
+
+        Returns:
+            Optional[PaginationCheckpoint]: The checkpoint, or None if the file does not exist.
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as stream:
+            return PaginationCheckpoint.from_dict(json.load(stream))
+
+    @staticmethod
+    def to_plain(value: Any) -> Optional[dict]:
+        """
+        Converts a filter or sorting dataclass into JSON-compatible values, enums being replaced by their value.
+        """
+        if value is None:
+            return None
+        data = dataclasses.asdict(value) if dataclasses.is_dataclass(value) else value
+        return json.loads(json.dumps(data, default=lambda item: item.value if isinstance(item, Enum) else str(item)))
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class RateLimit:
+    """
+    The RateLimit class describes the pace allowed for a scope or URL prefix,
+    usually set just under the limit published for the endpoint.
+    """
+
+    requests_per_minute: float
+    """Sustained number of requests allowed per minute."""
+
+    burst: Optional[int] = None
+    """Number of requests that can be sent at once after an idle period. Defaults to one."""
+
+    def __post_init__(self):
+        if self.requests_per_minute is None or self.requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be positive, got {self.requests_per_minute}")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
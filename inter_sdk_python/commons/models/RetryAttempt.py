@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class RetryAttempt:
+    """
+    The RetryAttempt class describes a single HTTP attempt made by the SDK,
+    reported to RetryPolicy.on_attempt so retry behaviour can be observed and tuned.
+    """
+
+    method: str
+    """The HTTP method of the request."""
+
+    url: str
+    """The requested URL."""
+
+    attempt: int
+    """The attempt number, starting at 1."""
+
+    status_code: Optional[int] = None
+    """The HTTP status received, or None when the request failed before a response."""
+
+    error: Optional[str] = None
+    """The connection error raised by the attempt, if any."""
+
+    elapsed: float = 0.0
+    """Seconds spent on the attempt."""
+
+    delay: float = 0.0
+    """Seconds waited before the next attempt, 0 when the request is not retried."""
+
+    retried: bool = False
+    """Indicates whether another attempt follows this one."""
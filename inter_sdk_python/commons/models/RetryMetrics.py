@@ -0,0 +1,68 @@
+import threading
+from typing import Dict
+
+from inter_sdk_python.commons.models.RetryAttempt import RetryAttempt
+
+
+class RetryMetrics:
+    """
+    The RetryMetrics class aggregates the attempts made under a RetryPolicy.
+    It is shared by every thread using the same configuration.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.throttled = 0
+        self.server_errors = 0
+        self.connection_errors = 0
+        self.total_delay = 0.0
+
+    def record(self, attempt: RetryAttempt) -> None:
+        """
+        Adds an attempt to the counters.
+
+        Args:
+            attempt (RetryAttempt): The attempt to be recorded.
+        """
+        with self._lock:
+            self.attempts += 1
+            if attempt.retried:
+                self.retries += 1
+                self.total_delay += attempt.delay
+            if attempt.status_code == 429:
+                self.throttled += 1
+            elif attempt.status_code is not None and attempt.status_code >= 500:
+                self.server_errors += 1
+            if attempt.error is not None:
+                self.connection_errors += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Returns a copy of the counters.
+
+        Returns:
+            dict: The current value of every counter.
+        """
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "server_errors": self.server_errors,
+                "connection_errors": self.connection_errors,
+                "total_delay": self.total_delay
+            }
+
+    def reset(self) -> None:
+        """
+        Sets every counter back to zero.
+        """
+        with self._lock:
+            self.attempts = 0
+            self.retries = 0
+            self.throttled = 0
+            self.server_errors = 0
+            self.connection_errors = 0
+            self.total_delay = 0.0
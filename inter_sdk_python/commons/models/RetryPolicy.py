@@ -0,0 +1,161 @@
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, FrozenSet, Mapping, Optional
+
+from inter_sdk_python.commons.models.RetryAttempt import RetryAttempt
+from inter_sdk_python.commons.models.RetryMetrics import RetryMetrics
+
+
+@dataclass
+class RetryPolicy:
+    """
+    The RetryPolicy class defines how the SDK retries failed calls: throttled
+    requests (429) are retried for every method when rate limit control is on,
+    while server errors and connection failures are retried only for idempotent
+    methods. Delays grow exponentially with jitter, and a Retry-After or
+    rate-limit reset header sent by the server takes precedence.
+    """
+
+    max_attempts: int = 5
+    """Maximum number of attempts, including the first one."""
+
+    base_delay: float = 1.0
+    """Delay in seconds before the first retry."""
+
+    max_delay: float = 60.0
+    """Upper bound in seconds for the computed backoff."""
+
+    multiplier: float = 2.0
+    """Factor applied to the delay on each new attempt."""
+
+    jitter: bool = True
+    """Indicates whether the backoff is randomized between zero and the computed delay."""
+
+    deadline: Optional[float] = 300.0
+    """Maximum number of seconds spent on a call including waits, None for no limit."""
+
+    retry_server_errors: bool = True
+    """Indicates whether 5xx responses of idempotent methods are retried."""
+
+    retry_connection_errors: bool = True
+    """Indicates whether connection failures and timeouts of idempotent methods are retried."""
+
+    idempotent_methods: FrozenSet[str] = frozenset({"GET", "PUT", "DELETE"})
+    """HTTP methods that can be safely sent again after a server or connection error."""
+
+    on_attempt: Optional[Callable[[RetryAttempt], None]] = field(default=None, repr=False, compare=False)
+    """Optional callback invoked after every attempt."""
+
+    metrics: RetryMetrics = field(default_factory=RetryMetrics, repr=False, compare=False)
+    """Counters aggregated over every attempt made under this policy."""
+
+    RATE_LIMIT_RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+    def should_retry(self, method: str, status_code: Optional[int], error: Optional[Exception], rate_limit_control: bool) -> bool:
+        """
+        Indicates whether the outcome of an attempt can be retried.
+
+        Args:
+            method (str): The HTTP method of the request.
+            status_code (Optional[int]): The HTTP status received, None if the attempt failed.
+            error (Optional[Exception]): The connection error raised by the attempt, if any.
+            rate_limit_control (bool): Indicates if throttled requests should be retried.
+
+        Returns:
+            bool: True when the request should be sent again.
+        """
+        if error is not None:
+            return self.retry_connection_errors and method in self.idempotent_methods
+        if status_code == 429:
+            return rate_limit_control
+        if status_code is not None and status_code >= 500:
+            return self.retry_server_errors and method in self.idempotent_methods
+        return False
+
+    def next_delay(self, attempt: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """
+        Computes how long to wait before the next attempt.
+
+        Args:
+            attempt (int): The number of the attempt that just failed, starting at 1.
+            headers (Optional[Mapping[str, str]]): The response headers, if a response was received.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        server_delay = self.delay_from_headers(headers) if headers is not None else None
+        if server_delay is not None:
+            return server_delay
+
+        delay = min(self.max_delay, self.base_delay * (self.multiplier ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def allows(self, attempt: int, elapsed: float, delay: float) -> bool:
+        """
+        Indicates whether another attempt fits in max_attempts and deadline.
+
+        Args:
+            attempt (int): The number of the attempt that just failed, starting at 1.
+            elapsed (float): Seconds already spent on the call.
+            delay (float): Seconds that would be waited before the next attempt.
+
+        Returns:
+            bool: True when another attempt can be made.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        return self.deadline is None or elapsed + delay <= self.deadline
+
+    def record(self, attempt: RetryAttempt) -> None:
+        """
+        Reports an attempt to the metrics and to the on_attempt callback.
+
+        Args:
+            attempt (RetryAttempt): The attempt to be reported.
+        """
+        self.metrics.record(attempt)
+        if self.on_attempt is not None:
+            self.on_attempt(attempt)
+
+    @staticmethod
+    def delay_from_headers(headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Reads the wait requested by the server from Retry-After (seconds or HTTP date)
+        or from a rate-limit reset header (seconds or epoch timestamp).
+
+        Args:
+            headers (Mapping[str, str]): The response headers.
+
+        Returns:
+            Optional[float]: The delay in seconds, or None when no header is present.
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+            try:
+                retry_date = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+
+        for header in RetryPolicy.RATE_LIMIT_RESET_HEADERS:
+            reset = headers.get(header)
+            if not reset:
+                continue
+            try:
+                value = float(reset)
+            except ValueError:
+                continue
+            if value > 1_000_000_000:
+                value -= time.time()
+            return max(0.0, value)
+
+        return None
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Union
+
+from inter_sdk_python.banking.models.RetrieveCallbackResponse import RetrieveCallbackResponse as BankingRetrieveCallbackResponse
+from inter_sdk_python.billing.models.BillingRetrieveCallbackResponse import BillingRetrieveCallbackResponse
+from inter_sdk_python.commons.enums.WebhookKind import WebhookKind
+from inter_sdk_python.pix.models.RetrieveCallbackResponse import RetrieveCallbackResponse as PixRetrieveCallbackResponse
+
+
+@dataclass(slots=True)
+class WebhookEvent:
+    """
+    The WebhookEvent class represents a webhook notification accepted by the
+    WebhookReceiver, holding only the items not received before.
+    """
+
+    kind: WebhookKind
+    """The API that sent the notification."""
+
+    path: str
+    """The path of the request, without the query string."""
+
+    callback: Union[BillingRetrieveCallbackResponse, PixRetrieveCallbackResponse, BankingRetrieveCallbackResponse]
+    """The notification, decoded into the callback model of the API; only the payload is filled."""
+
+    received_at: float
+    """The time the notification was received, in seconds since the epoch."""
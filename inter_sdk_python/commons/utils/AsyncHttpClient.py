@@ -0,0 +1,417 @@
+import asyncio
+import gzip
+import logging
+import ssl
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional, Set, Tuple, Union
+from urllib.parse import urlencode, urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+from inter_sdk_python.commons.exceptions.CertificateException import CertificateException
+from inter_sdk_python.commons.exceptions.SdkException import SdkException
+from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.Error import Error
+from inter_sdk_python.commons.models.GetTokenResponse import GetTokenResponse
+from inter_sdk_python.commons.models.HttpResponse import HttpResponse
+from inter_sdk_python.commons.models.RetryAttempt import RetryAttempt
+from inter_sdk_python.commons.structures.Constants import Constants
+from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.commons.utils.TokenUtils import TokenUtils
+from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
+
+
+class AsyncHttpClient:
+    """
+    The AsyncHttpClient class sends the calls of AsyncInterSdk on the event loop,
+    speaking HTTP/1.1 over asyncio streams with the mutual TLS context of the
+    configuration. Keep-alive connections are pooled per host and an
+    asyncio.Semaphore bounds the connections in use to max_concurrency, so any
+    number of coroutines can await calls while at most that many requests are
+    on the wire and no thread is involved.
+
+    Calls are retried with config.retry_policy, paced by config.rate_limiter and
+    authenticated with the token cache of TokenUtils, like the calls of HttpUtils.
+    """
+
+    DEFAULT_PORTS = {"http": 80, "https": 443}
+    LINE_LIMIT = 64 * 1024
+    EMPTY_LINES = (b"\r\n", b"\n", b"")
+
+    def __init__(self, config: Config, max_concurrency: int):
+        """
+        Args:
+            config (Config): The configuration object containing client information.
+            max_concurrency (int): Maximum number of requests on the wire at the same time.
+        """
+        self.config = config
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._idle: Dict[Tuple[str, str, int], Deque[Tuple[asyncio.StreamReader, asyncio.StreamWriter, float]]] = {}
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._token_locks: Dict[str, asyncio.Lock] = {}
+        self._refreshing: Set[asyncio.Task] = set()
+
+    async def call_get(self, url: str, scope: str, message: str) -> Any:
+        logging.info("http GET %s", url)
+        return await self.call("GET", url, scope, message, "")
+
+    async def call_put(self, url: str, scope: str, message: str, json_data: Union[str, bytes]) -> Any:
+        return await self.call("PUT", url, scope, message, json_data)
+
+    async def call_patch(self, url: str, scope: str, message: str, json_data: Union[str, bytes]) -> Any:
+        return await self.call("PATCH", url, scope, message, json_data)
+
+    async def call_post(self, url: str, scope: str, message: str, json_data: Union[str, bytes]) -> Any:
+        return await self.call("POST", url, scope, message, json_data)
+
+    async def call_delete(self, url: str, scope: str, message: str) -> Any:
+        logging.info("http DELETE %s", url)
+        return await self.call("DELETE", url, scope, message, "")
+
+    async def call(self, method: str, url: str, scope: str, message: str, json_data: Union[str, bytes]) -> Any:
+        """
+        Sends a call and returns its decoded JSON body, or "" for responses without content.
+
+        Raises:
+            SdkException: If the request fails or the API answers with an error.
+        """
+        try:
+            response = await self.execute(method, url, scope, message, json_data)
+
+            if response.status_code in HttpUtils.NO_CONTENT:
+                return ""
+
+            body = JsonCodec.of(self.config).loads(response.content)
+            if self.config.debug and body:
+                logging.info(body)
+
+            return body
+
+        except Exception as exception:
+            raise HttpUtils.to_sdk_exception(message, exception)
+
+    async def call_get_raw(self, url: str, scope: str, message: str) -> HttpResponse:
+        """
+        Sends a GET call and returns the response without decoding its body, e.g. for PDF documents.
+
+        Raises:
+            SdkException: If the request fails or the API answers with an error.
+        """
+        logging.info("http GET %s", url)
+        try:
+            return await self.execute("GET", url, scope, message, "")
+        except Exception as exception:
+            raise HttpUtils.to_sdk_exception(message, exception)
+
+    async def execute(self, method: str, url: str, scope: str, message: str, json_data: Union[str, bytes]) -> HttpResponse:
+        """
+        Sends the request, retrying it as defined by config.retry_policy, and returns the
+        final successful response. Error responses are raised as ClientException or ServerException.
+        """
+        config = self.config
+        policy = config.retry_policy
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            attempt_started = time.monotonic()
+            response = None
+            error = None
+            if config.rate_limiter is not None:
+                await config.rate_limiter.acquire_async(scope, url)
+            try:
+                response = await self.send(method, url, scope, json_data)
+            except (OSError, EOFError) as exception:
+                error = exception
+
+            status_code = response.status_code if response is not None else None
+            if status_code == HttpUtils.TOO_MANY_REQUESTS and config.rate_limiter is not None:
+                config.rate_limiter.penalize(scope, url)
+
+            retry = policy.should_retry(method, status_code, error, config.rate_limit_control)
+            delay = 0.0
+            if retry:
+                delay = policy.next_delay(attempt, response.headers if response is not None else None)
+                retry = policy.allows(attempt, time.monotonic() - started, delay)
+                if not retry:
+                    delay = 0.0
+
+            policy.record(RetryAttempt(
+                method=method,
+                url=url,
+                attempt=attempt,
+                status_code=status_code,
+                error=str(error) if error is not None else None,
+                elapsed=time.monotonic() - attempt_started,
+                delay=delay,
+                retried=retry
+            ))
+
+            if not retry:
+                break
+
+            logging.warning("http retry %s %s attempt=%s status=%s in %.2fs", method, url, attempt, status_code, delay)
+            await asyncio.sleep(delay)
+
+        if error is not None:
+            raise error
+
+        if response is None:
+            raise SdkException(
+                "No response received",
+                Error(title="No response", detail="The response object is None", timestamp=None)
+            )
+
+        HttpUtils.handle_response(url, response, message, False)
+        return response
+
+    async def send(self, method: str, url: str, scope: str, json_data: Union[str, bytes]) -> HttpResponse:
+        headers = HttpUtils.build_headers(self.config, await self.get_token(scope))
+        body = json_data.encode() if isinstance(json_data, str) else json_data
+        return await self.request(method, url, headers, body if method in ("PUT", "POST", "PATCH") else b"")
+
+    async def request(self, method: str, url: str, headers: Dict[str, str], body: bytes) -> HttpResponse:
+        """
+        Sends a request on a pooled connection, waiting for one of the max_concurrency slots.
+
+        Raises:
+            OSError: If the connection fails or is closed before the response is complete.
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port or AsyncHttpClient.DEFAULT_PORTS[parts.scheme])
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {parts.netloc}", "Accept-Encoding: gzip",
+                 "Accept: */*", "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        if body or method in ("PUT", "POST", "PATCH"):
+            lines.append(f"Content-Length: {len(body)}")
+        data = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+        async with self._semaphore:
+            connection = self._checkout(key)
+            if connection is None:
+                connection = await self._connect(*key)
+            reader, writer = connection
+            try:
+                writer.write(data)
+                await writer.drain()
+                response, keep_alive = await AsyncHttpClient._read_response(reader, method)
+            except BaseException:
+                writer.close()
+                raise
+
+            if keep_alive:
+                self._checkin(key, reader, writer)
+            else:
+                writer.close()
+            return response
+
+    async def get_token(self, scope: str) -> str:
+        """
+        Returns a valid access token for the scope, like TokenUtils.get: concurrent coroutines missing
+        the cache wait for a single request to the token endpoint, and a token close to expiring is
+        renewed by a background task while the current one keeps being served.
+        """
+        config = self.config
+        token_scope, get_token_response = TokenUtils.find_in_map(config.client_id, config.client_secret, scope)
+
+        if get_token_response is not None:
+            if TokenUtils.should_refresh(get_token_response):
+                self._refresh_in_background(token_scope)
+            return get_token_response.get("access_token")
+
+        token_scope = TokenUtils.resolve_scope(config, scope)
+        async with self._token_lock(token_scope):
+            get_token_response = TokenUtils.get_from_map(config.client_id, config.client_secret, token_scope)
+            if not TokenUtils.validate(get_token_response):
+                get_token_response = await self._obtain_token(token_scope, False)
+                TokenUtils.add_to_map(config.client_id, config.client_secret, token_scope, get_token_response)
+
+        return get_token_response.get("access_token")
+
+    async def generate_token(self, scope: str) -> GetTokenResponse:
+        """
+        Mints a token for the scope at the token endpoint.
+
+        Raises:
+            CertificateException: If the token cannot be obtained.
+        """
+        try:
+            data = urlencode({
+                "client_id": self.config.client_id,
+                "client_secret": self.config.client_secret,
+                "grant_type": "client_credentials",
+                "scope": scope
+            }).encode()
+
+            response = await self.request(
+                "POST",
+                UrlUtils.build_url(config=self.config, url=Constants.URL_TOKEN),
+                {"Content-Type": "application/x-www-form-urlencoded"},
+                data
+            )
+            if response.status_code >= HttpUtils.CLIENT_ERROR_BASE:
+                raise OSError(f"Token endpoint answered {response.status_code} {response.reason}")
+
+            data = JsonCodec.of(self.config).loads(response.content)
+
+            if data.get('created_at') is None:
+                data['created_at'] = datetime.now()
+
+            return data
+
+        except Exception:
+            raise CertificateException(
+                "Erro ao obter Token",
+                Error(title="Erro ao obter Token", detail="Não foi possível obter token utilizando os dados fornecidos")
+            )
+
+    async def close(self) -> None:
+        """
+        Closes the idle connections and stops the background token refreshes. Calls in flight
+        keep their connection and close it when they complete.
+        """
+        for task in list(self._refreshing):
+            task.cancel()
+
+        writers = [writer for connections in self._idle.values() for _, writer, _ in connections]
+        self._idle.clear()
+        for writer in writers:
+            writer.close()
+        await asyncio.gather(*(writer.wait_closed() for writer in writers), return_exceptions=True)
+
+    async def _obtain_token(self, scope: str, refresh: bool) -> GetTokenResponse:
+        if self.config.token_store is not None:
+            # The store serializes minting across processes with a blocking lock.
+            return await asyncio.to_thread(TokenUtils.obtain_token, self.config, scope, refresh)
+        return await self.generate_token(scope)
+
+    def _token_lock(self, scope: str) -> asyncio.Lock:
+        lock = self._token_locks.get(scope)
+        if lock is None:
+            lock = self._token_locks[scope] = asyncio.Lock()
+        return lock
+
+    def _refresh_in_background(self, scope: str) -> None:
+        key = TokenUtils.build_key(self.config.client_id, self.config.client_secret, scope)
+        with TokenUtils.MAP_LOCK:
+            if key in TokenUtils.REFRESHING:
+                return
+            TokenUtils.REFRESHING.add(key)
+
+        task = asyncio.get_running_loop().create_task(self._refresh(scope, key))
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+
+    async def _refresh(self, scope: str, key: str) -> None:
+        config = self.config
+        try:
+            async with self._token_lock(scope):
+                get_token_response = TokenUtils.get_from_map(config.client_id, config.client_secret, scope)
+                if get_token_response is None or TokenUtils.should_refresh(get_token_response):
+                    get_token_response = await self._obtain_token(scope, True)
+                    TokenUtils.add_to_map(config.client_id, config.client_secret, scope, get_token_response)
+        except Exception as exception:
+            logging.warning("Background token refresh failed for scope %s: %s", scope, exception)
+        finally:
+            with TokenUtils.MAP_LOCK:
+                TokenUtils.REFRESHING.discard(key)
+
+    def _checkout(self, key: Tuple[str, str, int]) -> Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]:
+        connections = self._idle.get(key)
+        idle_timeout = self.config.pool_idle_timeout
+        now = time.monotonic()
+        while connections:
+            reader, writer, last_used = connections.pop()
+            # The server may have closed a connection while it was idle.
+            if reader.at_eof() or writer.is_closing() or (idle_timeout is not None and now - last_used > idle_timeout):
+                writer.close()
+                continue
+            return reader, writer
+        return None
+
+    def _checkin(self, key: Tuple[str, str, int], reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connections = self._idle.setdefault(key, deque())
+        if len(connections) >= max(self.config.pool_size, self.max_concurrency):
+            writer.close()
+            return
+        connections.append((reader, writer, time.monotonic()))
+
+    async def _connect(self, scheme: str, host: str, port: int) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if scheme == "https":
+            return await asyncio.open_connection(host, port, ssl=self._get_ssl_context(), limit=AsyncHttpClient.LINE_LIMIT)
+        return await asyncio.open_connection(host, port, limit=AsyncHttpClient.LINE_LIMIT)
+
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            if self.config.ssl_context is not None:
+                self._ssl_context = self.config.ssl_context
+            else:
+                context = ssl.create_default_context()
+                if self.config.crt:
+                    context.load_cert_chain(self.config.crt, self.config.key or None)
+                self._ssl_context = context
+        return self._ssl_context
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader, method: str) -> Tuple[HttpResponse, bool]:
+        while True:
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionResetError("Connection closed by the server before the response")
+            try:
+                version, status, *reason = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+                status_code = int(status)
+            except ValueError:
+                raise ConnectionError(f"Malformed status line: {status_line[:100]!r}")
+
+            headers = CaseInsensitiveDict()
+            while True:
+                line = await reader.readline()
+                if line in AsyncHttpClient.EMPTY_LINES:
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                name, value = name.strip(), value.strip()
+                headers[name] = f"{headers[name]}, {value}" if name in headers else value
+
+            # Interim responses, e.g. 100 Continue, are followed by the final one.
+            if not 100 <= status_code < 200:
+                break
+
+        keep_alive = version == "HTTP/1.1" and headers.get("Connection", "").lower() != "close"
+        if method == "HEAD" or status_code in (204, 304):
+            content = b""
+        elif "chunked" in headers.get("Transfer-Encoding", "").lower():
+            content = await AsyncHttpClient._read_chunked(reader)
+        elif "Content-Length" in headers:
+            content = await reader.readexactly(int(headers["Content-Length"]))
+        else:
+            content = await reader.read()
+            keep_alive = False
+
+        if headers.get("Content-Encoding", "").lower() == "gzip":
+            content = gzip.decompress(content)
+
+        return HttpResponse(status_code, reason[0] if reason else "", headers, content), keep_alive
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            try:
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+            except ValueError:
+                raise ConnectionError(f"Malformed chunk size: {size_line[:100]!r}")
+            if size == 0:
+                while await reader.readline() not in AsyncHttpClient.EMPTY_LINES:
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
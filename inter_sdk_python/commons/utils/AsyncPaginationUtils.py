@@ -0,0 +1,64 @@
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, TypeVar
+
+from inter_sdk_python.commons.models.Config import Config
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+class AsyncPaginationUtils:
+    @staticmethod
+    async def iterate(config: Config, get_page: Callable[[int], Awaitable[P]],
+                      get_items: Callable[[P], Optional[List[T]]]) -> AsyncIterator[T]:
+        """
+        Yields the items of every page of a paginated retrieval, like PaginationUtils.iterate: the first
+        page is retrieved alone to learn the total number of pages, then up to config.pagination_workers
+        pages are retrieved concurrently as tasks and still yielded in page order. Pages retrieved ahead
+        are cancelled when the consumer stops early.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            get_page (Callable[[int], Awaitable[P]]): Retrieves the page with the given number, starting at 0.
+            get_items (Callable[[P], Optional[List[T]]]): Returns the items of a page.
+
+        Returns:
+            AsyncIterator[T]: The items of all pages, in page order.
+
+        Raises:
+            SdkException: If there is an error retrieving a page.
+        """
+        first_page = await get_page(0)
+        for item in get_items(first_page) or []:
+            yield item
+
+        total_pages = first_page.total_pages or 0
+        workers = max(1, config.pagination_workers)
+        pending = deque()
+        next_page = 1
+        try:
+            while next_page < total_pages or pending:
+                while next_page < total_pages and len(pending) < workers:
+                    pending.append(asyncio.ensure_future(get_page(next_page)))
+                    next_page += 1
+
+                current_page = await pending.popleft()
+                if workers == 1:
+                    total_pages = current_page.total_pages or 0
+                for item in get_items(current_page) or []:
+                    yield item
+        finally:
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
+
+    @staticmethod
+    async def collect(config: Config, get_page: Callable[[int], Awaitable[P]],
+                      get_items: Callable[[P], Optional[List[T]]]) -> List[T]:
+        """
+        Returns the items of every page of a paginated retrieval, retrieved as by iterate.
+        """
+        return [item async for item in AsyncPaginationUtils.iterate(config, get_page, get_items)]
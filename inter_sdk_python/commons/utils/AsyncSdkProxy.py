@@ -0,0 +1,76 @@
+import asyncio
+import functools
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Callable, Optional
+
+
+class AsyncSdkProxy:
+    """
+    The AsyncSdkProxy class exposes every public method of a synchronous SDK
+    (BankingSdk, BillingSdk or PixSdk) as an awaitable with the same name and
+    arguments, running it on the executor of an AsyncInterSdk. It serves the
+    methods of the asyncio SDKs that write files or keep local state, whose
+    blocking work must stay off the event loop.
+
+    The iter_* methods become async iterators, consumed with async for, whose
+    items are pulled from the synchronous iterator in batches on the executor;
+    resumable iterators are pulled one item at a time, so their checkpoint never
+    gets ahead of the items handed to the consumer. The synchronous iterator is
+    closed on the executor when the async iterator ends, including when the
+    consumer stops early, so its pending pages and files are released.
+    """
+
+    BATCH_SIZE = 100
+
+    def __init__(self, sdk: Any, executor: ThreadPoolExecutor):
+        self._sdk = sdk
+        self._executor = executor
+
+    def __getattr__(self, name: str) -> Callable:
+        attribute = getattr(self._sdk, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        if name.startswith("iter_"):
+            batch_size = 1 if name.endswith("_resumable") else AsyncSdkProxy.BATCH_SIZE
+
+            @functools.wraps(attribute)
+            async def iterate(*args, **kwargs) -> AsyncIterator:
+                loop = asyncio.get_running_loop()
+                iterator = await loop.run_in_executor(self._executor, functools.partial(attribute, *args, **kwargs))
+                pending = None
+                try:
+                    while True:
+                        pending = self._executor.submit(self._next_batch, iterator, batch_size)
+                        batch = await asyncio.wrap_future(pending)
+                        if not batch:
+                            break
+                        for item in batch:
+                            yield item
+                finally:
+                    await loop.run_in_executor(self._executor, self._close, iterator, pending)
+
+            setattr(self, name, iterate)
+            return iterate
+
+        @functools.wraps(attribute)
+        async def call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(attribute, *args, **kwargs))
+
+        setattr(self, name, call)
+        return call
+
+    @staticmethod
+    def _next_batch(iterator, batch_size: int) -> list:
+        return list(itertools.islice(iterator, batch_size))
+
+    @staticmethod
+    def _close(iterator, pending: Optional[Future]) -> None:
+        # A batch still running after the consumer was cancelled must finish before the generator is closed.
+        if pending is not None:
+            wait([pending])
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,213 @@
+import math
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+from inter_sdk_python.commons.models.Config import Config
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+Shard = Tuple[datetime, datetime]
+
+
+class DateRangeSharder:
+    """
+    The DateRangeSharder class splits a long date range into day or hour windows
+    (shards) and retrieves them concurrently, each shard being paginated on its
+    own. A shard whose first page reports more than max_pages_per_shard pages is
+    split again into smaller windows before the rest of its pages is requested.
+    Items are yielded in chronological shard order, the order of the API being
+    kept inside each shard.
+
+    Ranges are either dates (YYYY-MM-DD), whose shards are whole days with both
+    ends inclusive, or date-times (YYYY-MM-DDTHH:MM:SSZ), whose shards end at the
+    instant the next one starts, so items stamped with fractions of a second are
+    never left between two shards. The API returns the items stamped on a shared
+    boundary in both shards; the later shard drops one copy for each item of the
+    earlier one with the same key, so identical records stay as many as the API
+    returned. When the caller gives the timestamp of the items, only items stamped
+    within the boundary second are compared.
+    """
+
+    DATE_FORMAT = "%Y-%m-%d"
+    DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+    DEFAULT_MAX_PAGES_PER_SHARD = 10
+
+    def __init__(self, workers: int, shard_size: Optional[timedelta] = None, max_pages_per_shard: int = DEFAULT_MAX_PAGES_PER_SHARD):
+        """
+        Args:
+            workers (int): Maximum number of requests in flight at the same time.
+            shard_size (Optional[timedelta]): Length of each window - default is one day for date ranges
+                                              and one hour for date-time ranges.
+            max_pages_per_shard (int): Number of pages above which a shard is split again - default is 10.
+        """
+        self.workers = max(1, workers)
+        self.shard_size = shard_size
+        self.max_pages_per_shard = max(1, max_pages_per_shard)
+
+    @staticmethod
+    def of(config: Config, shard_size: Optional[timedelta] = None,
+           max_pages_per_shard: int = DEFAULT_MAX_PAGES_PER_SHARD) -> 'DateRangeSharder':
+        """
+        Returns a sharder using config.pagination_workers as the number of workers.
+        """
+        return DateRangeSharder(config.pagination_workers, shard_size, max_pages_per_shard)
+
+    def iterate(self, initial_date: str, final_date: str, get_page: Callable[[str, str, int], P],
+                get_items: Callable[[P], Optional[List[T]]], get_key: Callable[[T], Hashable],
+                get_timestamp: Optional[Callable[[T], Any]] = None) -> Iterator[T]:
+        """
+        Yields the items of every shard of the range, in chronological order.
+
+        Args:
+            initial_date (str): The start of the range (inclusive), YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ.
+            final_date (str): The end of the range (inclusive), in the same format as initial_date.
+            get_page (Callable[[str, str, int], P]): Retrieves a page of a window given its start, end and page number.
+            get_items (Callable[[P], Optional[List[T]]]): Returns the items of a page.
+            get_key (Callable[[T], Hashable]): Identifies an item, to drop the copies returned by two date-time
+                                               shards sharing a boundary: its id, or the whole record when it
+                                               has none.
+            get_timestamp (Optional[Callable[[T], Any]]): Returns the date-time of an item, as a datetime or an
+                                                          ISO 8601 string, limiting the comparison to the items
+                                                          stamped on the boundary - default is None, comparing
+                                                          every item, which suits keys that are ids.
+
+        Returns:
+            Iterator[T]: The items of the whole range.
+
+        Raises:
+            ValueError: If the dates cannot be parsed or the range is reversed.
+            SdkException: If there is an error retrieving a page.
+        """
+        date_only = len(initial_date) == len("YYYY-MM-DD")
+        step = timedelta(days=1) if date_only else timedelta(seconds=1)
+        gap = step if date_only else timedelta(0)
+        start = DateRangeSharder.parse(initial_date)
+        end = DateRangeSharder.parse(final_date)
+        if end < start:
+            raise ValueError(f"Invalid range {initial_date} - {final_date}")
+
+        shard_size = self.shard_size or (timedelta(days=1) if date_only else timedelta(hours=1))
+        shard_size = max(step, shard_size)
+
+        def format_date(value: datetime) -> str:
+            return DateRangeSharder.format(value, initial_date, date_only)
+
+        def fetch(shard: Shard):
+            first_page = get_page(format_date(shard[0]), format_date(shard[1]), 0)
+            total_pages = first_page.total_pages or 0
+            if total_pages > self.max_pages_per_shard and DateRangeSharder.steps(shard, step, gap) > 1:
+                parts = math.ceil(total_pages / self.max_pages_per_shard)
+                return True, DateRangeSharder.split(shard, parts, step, gap)
+
+            items = list(get_items(first_page) or [])
+            for page in range(1, total_pages):
+                items.extend(get_items(get_page(format_date(shard[0]), format_date(shard[1]), page)) or [])
+            return False, items
+
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inter-sdk-shard")
+        def on_boundary(item: T, boundary: datetime) -> bool:
+            return get_timestamp is None or DateRangeSharder.within_second(get_timestamp(item), boundary)
+
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inter-sdk-shard")
+        queued = deque(DateRangeSharder.split_by_size((start, end), shard_size, gap))
+        pending = deque()
+        previous: Counter = Counter()
+        try:
+            while queued or pending:
+                while queued and len(pending) < self.workers:
+                    shard = queued.popleft()
+                    pending.append((shard, executor.submit(fetch, shard)))
+
+                shard, future = pending.popleft()
+                resplit, result = future.result()
+                if resplit:
+                    pending.extendleft(reversed([(part, executor.submit(fetch, part)) for part in result]))
+                    continue
+                if date_only:
+                    yield from result
+                    continue
+
+                current: Counter = Counter()
+                for item in result:
+                    if on_boundary(item, shard[1]):
+                        current[get_key(item)] += 1
+                    if previous and on_boundary(item, shard[0]):
+                        key = get_key(item)
+                        if previous[key] > 0:
+                            previous[key] -= 1
+                            continue
+                    yield item
+                previous = current
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def split_by_size(shard: Shard, shard_size: timedelta, gap: timedelta) -> List[Shard]:
+        """
+        Splits a window into consecutive windows of shard_size, the last one possibly shorter, each one
+        starting gap after the end of the previous one: a day for dates, none for date-times.
+        """
+        shards = []
+        start, end = shard
+        while True:
+            shard_end = min(end, start + shard_size - gap)
+            shards.append((start, shard_end))
+            if shard_end >= end:
+                return shards
+            start = shard_end + gap
+
+    @staticmethod
+    def split(shard: Shard, parts: int, step: timedelta, gap: timedelta) -> List[Shard]:
+        """
+        Splits a window into at most parts windows of about the same length, aligned to step.
+        """
+        steps = DateRangeSharder.steps(shard, step, gap)
+        parts = max(1, min(parts, steps))
+        return DateRangeSharder.split_by_size(shard, step * math.ceil(steps / parts), gap)
+
+    @staticmethod
+    def steps(shard: Shard, step: timedelta, gap: timedelta) -> int:
+        """
+        Returns the number of steps in a window: its days for dates, its seconds for date-times.
+        """
+        start, end = shard
+        return (end - start) // step + (1 if gap else 0)
+
+    @staticmethod
+    def within_second(value: Any, boundary: datetime) -> bool:
+        """
+        Tells whether a date-time, given as a datetime or an ISO 8601 string, falls within the second starting
+        at boundary. Values that are missing or cannot be parsed are not on any boundary.
+        """
+        if isinstance(value, str):
+            try:
+                value = DateRangeSharder.parse(value)
+            except ValueError:
+                return False
+        if not isinstance(value, datetime):
+            return False
+        if (value.tzinfo is None) != (boundary.tzinfo is None):
+            value = value.replace(tzinfo=boundary.tzinfo)
+        return value.replace(microsecond=0) == boundary
+
+    @staticmethod
+    def parse(value: str) -> datetime:
+        if len(value) == len("YYYY-MM-DD"):
+            return datetime.strptime(value, DateRangeSharder.DATE_FORMAT)
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    @staticmethod
+    def format(value: datetime, template: str, date_only: bool) -> str:
+        """
+        Formats a shard boundary like the date given by the caller, keeping a trailing Z or offset.
+        """
+        if date_only:
+            return value.strftime(DateRangeSharder.DATE_FORMAT)
+        if template.endswith("Z"):
+            return value.strftime(DateRangeSharder.DATE_TIME_FORMAT) + "Z"
+        return value.isoformat(timespec="seconds")
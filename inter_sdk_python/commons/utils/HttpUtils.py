@@ -1,7 +1,7 @@
 import json
 import logging
 import time
-from typing import Optional
+from typing import Optional, Union
 
 import requests
 
@@ -11,10 +11,12 @@ from ..exceptions.ClientException import ClientException
 from ..exceptions.SdkException import SdkException
 from ..exceptions.ServerException import ServerException
 from ..models.Error import Error
+from ..models.RetryAttempt import RetryAttempt
+from ..utils.JsonCodec import JsonCodec
+from ..utils.SessionPool import SessionPool
 from ..utils.TokenUtils import TokenUtils
 
 class HttpUtils:
-    SLEEP = 60
     CLIENT_ERROR_BASE = 400
     SERVER_ERROR_BASE = 500
     TOO_MANY_REQUESTS = 429
@@ -32,15 +34,15 @@ class HttpUtils:
         return HttpUtils.call(config, "GET", url, scope, message, "")
 
     @staticmethod
-    def call_put(config: Config, url: str, scope: str, message: str, json_data: str) -> str:
+    def call_put(config: Config, url: str, scope: str, message: str, json_data: Union[str, bytes]) -> str:
         return HttpUtils.call(config, "PUT", url, scope, message, json_data)
 
     @staticmethod
-    def call_patch(config: Config, url: str, scope: str, message: str, json_data: str) -> str:
+    def call_patch(config: Config, url: str, scope: str, message: str, json_data: Union[str, bytes]) -> str:
         return HttpUtils.call(config, "PATCH", url, scope, message, json_data)
 
     @staticmethod
-    def call_post(config: Config, url: str, scope: str, message: str, json_data: str) -> str:
+    def call_post(config: Config, url: str, scope: str, message: str, json_data: Union[str, bytes]) -> str:
         return HttpUtils.call(config, "POST", url, scope, message, json_data)
 
     @staticmethod
@@ -49,87 +51,164 @@ class HttpUtils:
         return HttpUtils.call(config, "DELETE", url, scope, message, {})
     
     @staticmethod
-    def call(config: Config, method: str, url: str, scope: str, message: str, json_data: str) -> str:
+    def call(config: Config, method: str, url: str, scope: str, message: str, json_data: Union[str, bytes]) -> str:
         try:
-            access_token = TokenUtils.get(config, scope)
-            
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'x-inter-sdk': 'python',
-                'x-inter-sdk-version': '1.0.2',
-                'Content-Type': 'application/json'
-            }
-
-            if config.account is not None:
-                headers["x-conta-corrente"] = config.account
-
-            response = None
-            if method == "GET":
-                response = requests.get(url, headers=headers, cert=(config.crt, config.key))
-            elif method == "PUT":
-                response = requests.put(
-                    url,
-                    data=json_data,
-                    headers=headers,
-                    cert=(config.crt, config.key)
-                )
-            elif method == "POST":
-                response = requests.post(
-                    url,
-                    data=json_data,
-                    headers=headers,
-                    cert=(config.crt, config.key)
-                )
-            elif method == "PATCH":
-                response = requests.patch(
-                    url,
-                    data=json_data,
-                    headers=headers,
-                    cert=(config.crt, config.key)
-                )
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers, cert=(config.crt, config.key))
-
-            if response is not None:
-                retry = HttpUtils.handle_response(url, response, message, config.rate_limit_control)
-            else:
-                raise SdkException(
-                    "No response received",
-                    Error(title="No response", detail="The response object is None", timestamp=None)
-                )
-            
-            if retry:
-                time.sleep(60)
-                return HttpUtils.call(config, method, url, scope, message, json_data)
-            
-            if config.debug and response.json():
-                logging.info(response.json())
+            response = HttpUtils.execute(config, method, url, scope, message, json_data)
 
             if response.status_code in HttpUtils.NO_CONTENT:
                 return ""
 
-            return response.json()
+            body = JsonCodec.of(config).loads(response.content)
+            if config.debug and body:
+                logging.info(body)
+
+            return body
 
         except Exception as exception:
-            logging.error(Constants, exc_info=True)
-            error = getattr(exception, 'error', None)
-
-            title_detail = None
-            message_detail = None
-            violations = None
-            if error is not None:
-                if hasattr(error, 'title'):
-                    title_detail = error.title
-                if hasattr(error, 'detail'):
-                    message_detail = error.detail
-                if hasattr(error, 'violations'):
-                    violations = error.violations
+            raise HttpUtils.to_sdk_exception(message, exception)
+
+    @staticmethod
+    def call_get_stream(config: Config, url: str, scope: str, message: str) -> requests.Response:
+        """
+        Sends a GET request, retried like the other calls, without reading the body, so large
+        responses can be consumed incrementally with response.iter_content. The caller must close
+        the response.
+
+        Raises:
+            SdkException: If the request fails or the API answers with an error.
+        """
+        logging.info("http GET %s (streamed)", url)
+        try:
+            return HttpUtils.execute(config, "GET", url, scope, message, "", stream=True)
+        except Exception as exception:
+            raise HttpUtils.to_sdk_exception(message, exception)
+
+    @staticmethod
+    def to_sdk_exception(message: str, exception: Exception) -> SdkException:
+        logging.error(Constants, exc_info=True)
+        error = getattr(exception, 'error', None)
+
+        title_detail = None
+        message_detail = None
+        violations = None
+        if error is not None:
+            if hasattr(error, 'title'):
+                title_detail = error.title
+            if hasattr(error, 'detail'):
+                message_detail = error.detail
+            if hasattr(error, 'violations'):
+                violations = error.violations
+
+        return SdkException(
+            message,
+            Error(title=title_detail, detail=message_detail, timestamp=None, violations=violations)
+        )
 
+    @staticmethod
+    def execute(config: Config, method: str, url: str, scope: str, message: str, json_data: Union[str, bytes],
+                stream: bool = False) -> requests.Response:
+        """
+        Sends the request, retrying it as defined by config.retry_policy, and returns the
+        final successful response. Error responses are raised as ClientException or ServerException.
+        With stream, the body of the response is left unread.
+        """
+        policy = config.retry_policy
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            attempt_started = time.monotonic()
+            response = None
+            error = None
+            if config.rate_limiter is not None:
+                config.rate_limiter.acquire(scope, url)
+            try:
+                response = HttpUtils.send(config, method, url, scope, json_data, stream)
+            except (requests.ConnectionError, requests.Timeout) as exception:
+                error = exception
+
+            status_code = response.status_code if response is not None else None
+            if status_code == HttpUtils.TOO_MANY_REQUESTS and config.rate_limiter is not None:
+                config.rate_limiter.penalize(scope, url)
+
+            retry = policy.should_retry(method, status_code, error, config.rate_limit_control)
+            delay = 0.0
+            if retry:
+                delay = policy.next_delay(attempt, response.headers if response is not None else None)
+                retry = policy.allows(attempt, time.monotonic() - started, delay)
+                if not retry:
+                    delay = 0.0
+
+            policy.record(RetryAttempt(
+                method=method,
+                url=url,
+                attempt=attempt,
+                status_code=status_code,
+                error=str(error) if error is not None else None,
+                elapsed=time.monotonic() - attempt_started,
+                delay=delay,
+                retried=retry
+            ))
+
+            if not retry:
+                break
+
+            if response is not None:
+                response.close()
+            logging.warning("http retry %s %s attempt=%s status=%s in %.2fs", method, url, attempt, status_code, delay)
+            time.sleep(delay)
+
+        if error is not None:
+            raise error
+
+        if response is None:
             raise SdkException(
-                message,
-                Error(title=title_detail, detail=message_detail, timestamp=None, violations=violations)
+                "No response received",
+                Error(title="No response", detail="The response object is None", timestamp=None)
             )
 
+        HttpUtils.handle_response(url, response, message, False)
+        return response
+
+    @staticmethod
+    def send(config: Config, method: str, url: str, scope: str, json_data: Union[str, bytes],
+             stream: bool = False) -> Optional[requests.Response]:
+        headers = HttpUtils.build_headers(config, TokenUtils.get(config, scope))
+
+        session = SessionPool.of(config).get_session()
+
+        response = None
+        if method == "GET":
+            response = session.get(url, headers=headers, stream=stream)
+        elif method == "PUT":
+            response = session.put(url, data=json_data, headers=headers)
+        elif method == "POST":
+            response = session.post(url, data=json_data, headers=headers)
+        elif method == "PATCH":
+            response = session.patch(url, data=json_data, headers=headers)
+        elif method == "DELETE":
+            response = session.delete(url, headers=headers)
+
+        return response
+
+    @staticmethod
+    def build_headers(config: Config, access_token: str) -> dict:
+        """
+        Returns the headers sent with every call to the API.
+        """
+        headers = {
+            'Authorization': f'Bearer {access_token}',
+            'x-inter-sdk': 'python',
+            'x-inter-sdk-version': '1.0.2',
+            'Content-Type': 'application/json'
+        }
+
+        if config.account is not None:
+            headers["x-conta-corrente"] = config.account
+
+        return headers
+
     @staticmethod
     def handle_response(url: str, response: requests.Response, message: str, rate_limit_control: bool) -> bool:
         logging.info("http status=%s %s", response.status_code, url)
@@ -0,0 +1,103 @@
+import json
+import threading
+from typing import Any, Callable, Union
+
+from inter_sdk_python.commons.models.Config import Config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonCodec:
+    """
+    The JsonCodec class serializes request bodies and parses response bodies.
+    Bodies are written compact, without indentation or spaces after separators,
+    as UTF-8 bytes, and responses are parsed once, straight from the received
+    bytes. orjson or ujson are used when installed and selected, the json
+    module otherwise; all of them produce the same documents.
+    """
+
+    AUTO = "auto"
+    ORJSON = "orjson"
+    UJSON = "ujson"
+    JSON = "json"
+
+    CREATION_LOCK = threading.Lock()
+
+    def __init__(self, backend: str = AUTO):
+        """
+        Args:
+            backend (str): JsonCodec.ORJSON, JsonCodec.UJSON, JsonCodec.JSON or JsonCodec.AUTO
+                           to use the fastest one installed - default is JsonCodec.AUTO.
+
+        Raises:
+            ValueError: If the backend is unknown or is not installed.
+        """
+        if backend == JsonCodec.AUTO:
+            backend = JsonCodec.ORJSON if orjson is not None else JsonCodec.UJSON if ujson is not None else JsonCodec.JSON
+
+        if backend == JsonCodec.ORJSON and orjson is not None:
+            self._dumps: Callable[[Any], bytes] = orjson.dumps
+            self._loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+        elif backend == JsonCodec.UJSON and ujson is not None:
+            self._dumps = lambda data: ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+            self._loads = ujson.loads
+        elif backend == JsonCodec.JSON:
+            encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+            self._dumps = lambda data: encoder.encode(data).encode("utf-8")
+            self._loads = json.loads
+        else:
+            raise ValueError(f"JSON backend '{backend}' is unknown or not installed")
+
+        self.backend = backend
+
+    @staticmethod
+    def of(config: Config) -> 'JsonCodec':
+        """
+        Returns the codec of the given configuration, creating a JsonCodec.AUTO one on first use.
+
+        Args:
+            config (Config): The configuration object containing client information.
+
+        Returns:
+            JsonCodec: The codec associated with the configuration.
+        """
+        if config.json_codec is None:
+            with JsonCodec.CREATION_LOCK:
+                if config.json_codec is None:
+                    config.json_codec = JsonCodec()
+        return config.json_codec
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Serializes a request body.
+
+        Args:
+            data (Any): The body, usually the result of a to_dict method.
+
+        Returns:
+            bytes: The compact JSON document, encoded as UTF-8.
+        """
+        return self._dumps(data)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Parses a response body.
+
+        Args:
+            data (Union[bytes, str]): The JSON document, as bytes (UTF-8) or text.
+
+        Returns:
+            Any: The parsed document.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+        """
+        return self._loads(data)
@@ -0,0 +1,160 @@
+import dataclasses
+import threading
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from inter_sdk_python.commons.models.FieldMapping import FieldMapping
+
+
+class ModelCodec:
+    """
+    The ModelCodec class converts models to and from the dictionaries of the
+    API using the FIELD_MAP table of the model. On first use of a model, a
+    decoder and an encoder specialized for its fields are generated as Python
+    functions, so the conversion runs without per-field dispatch, passing the
+    attributes positionally when FIELD_MAP follows the order of the fields of
+    the dataclass. Nested models use their own codec when they declare a
+    FIELD_MAP and their from_dict and to_dict methods otherwise.
+
+    Models declaring a FIELD_MAP delegate their from_dict and to_dict methods to
+    their codec, so the table is the only description of their JSON form. Nested
+    models, enums, decimals and date-times are None when the key is missing or
+    empty, and lists are empty.
+    """
+
+    _codecs: Dict[type, 'ModelCodec'] = {}
+    _lock = threading.RLock()
+
+    def __init__(self, model: type):
+        """
+        Compiles the decoder and encoder of a model.
+
+        Args:
+            model (type): A model declaring FIELD_MAP.
+        """
+        self.model = model
+        self.mappings: Tuple[FieldMapping, ...] = tuple(model.FIELD_MAP)
+        self.decode: Callable[[dict], Any] = self._compile_decoder()
+        self.encode: Callable[[Any], dict] = self._compile_encoder()
+
+    @staticmethod
+    def of(model: type) -> 'ModelCodec':
+        """
+        Returns the codec of a model, compiling it on first use.
+
+        Args:
+            model (type): A model declaring FIELD_MAP.
+
+        Returns:
+            ModelCodec: The codec of the model.
+        """
+        codec = ModelCodec._codecs.get(model)
+        if codec is None:
+            with ModelCodec._lock:
+                codec = ModelCodec._codecs.get(model)
+                if codec is None:
+                    codec = ModelCodec(model)
+                    ModelCodec._codecs[model] = codec
+        return codec
+
+    @staticmethod
+    def has_field_map(model: type) -> bool:
+        """
+        Indicates whether a model declares FIELD_MAP.
+        """
+        return "FIELD_MAP" in vars(model)
+
+    def field_decoders(self) -> Dict[str, Union[str, Callable[[dict], Any]]]:
+        """
+        Returns, for each attribute, the key of a plain value or a function decoding the attribute
+        from the API dictionary, as used by LazyModel.
+        """
+        decoders: Dict[str, Union[str, Callable[[dict], Any]]] = {}
+        for mapping in self.mappings:
+            if mapping.kind == FieldMapping.VALUE:
+                decoders[mapping.attribute] = mapping.key
+                continue
+            namespace: Dict[str, Any] = {}
+            expression = self._decode_expression(mapping, "value", "converter", namespace)
+            decoders[mapping.attribute] = self._compile(
+                f"def decode(data):\n    value = data.get({mapping.key!r})\n    return {expression}\n", namespace, "decode"
+            )
+        return decoders
+
+    def _compile_decoder(self) -> Callable[[dict], Any]:
+        namespace: Dict[str, Any] = {"Model": self.model}
+        lines: List[str] = ["def decode(data):", "    get = data.get"]
+        positional = [mapping.attribute for mapping in self.mappings] == \
+                     [item.name for item in dataclasses.fields(self.model) if item.init]
+        arguments: List[str] = []
+        for index, mapping in enumerate(self.mappings):
+            if mapping.kind == FieldMapping.VALUE:
+                expression = f"get({mapping.key!r})"
+            else:
+                lines.append(f"    value_{index} = get({mapping.key!r})")
+                expression = self._decode_expression(mapping, f"value_{index}", f"converter_{index}", namespace)
+            arguments.append(expression if positional else f"{mapping.attribute}={expression}")
+        lines.append(f"    return Model({', '.join(arguments)})")
+        return self._compile("\n".join(lines) + "\n", namespace, "decode")
+
+    def _compile_encoder(self) -> Callable[[Any], dict]:
+        namespace: Dict[str, Any] = {}
+        lines: List[str] = ["def encode(item):"]
+        entries: List[str] = []
+        for index, mapping in enumerate(self.mappings):
+            if mapping.kind == FieldMapping.VALUE:
+                entries.append(f"{mapping.key!r}: item.{mapping.attribute}")
+                continue
+            lines.append(f"    value_{index} = item.{mapping.attribute}")
+            expression = self._encode_expression(mapping, f"value_{index}", f"converter_{index}", namespace)
+            entries.append(f"{mapping.key!r}: {expression}")
+        lines.append(f"    return {{{', '.join(entries)}}}")
+        return self._compile("\n".join(lines) + "\n", namespace, "encode")
+
+    @staticmethod
+    def _decode_expression(mapping: FieldMapping, value: str, converter: str, namespace: Dict[str, Any]) -> str:
+        if mapping.kind == FieldMapping.MODEL:
+            namespace[converter] = ModelCodec._decoder_of(mapping.type)
+            return f"{converter}({value}) if {value} else None"
+        if mapping.kind == FieldMapping.MODEL_LIST:
+            namespace[converter] = ModelCodec._decoder_of(mapping.type)
+            return f"[{converter}(element) for element in {value}] if {value} else []"
+        if mapping.kind == FieldMapping.ENUM:
+            namespace[converter] = mapping.type
+        elif mapping.kind == FieldMapping.DECIMAL:
+            namespace[converter] = Decimal
+        elif mapping.kind == FieldMapping.DATETIME:
+            namespace[converter] = datetime.fromisoformat
+        else:
+            raise ValueError(f"Unknown kind '{mapping.kind}' for {mapping.attribute}")
+        return f"{converter}({value}) if {value} else None"
+
+    @staticmethod
+    def _encode_expression(mapping: FieldMapping, value: str, converter: str, namespace: Dict[str, Any]) -> str:
+        if mapping.kind == FieldMapping.MODEL:
+            namespace[converter] = ModelCodec._encoder_of(mapping.type)
+            return f"{converter}({value}) if {value} is not None else None"
+        if mapping.kind == FieldMapping.MODEL_LIST:
+            namespace[converter] = ModelCodec._encoder_of(mapping.type)
+            return f"[{converter}(element) for element in {value}] if {value} is not None else []"
+        if mapping.kind == FieldMapping.ENUM:
+            return f"{value}.value if {value} is not None else None"
+        if mapping.kind == FieldMapping.DECIMAL:
+            return f"float({value}) if {value} is not None else None"
+        if mapping.kind == FieldMapping.DATETIME:
+            return f"{value}.isoformat() if {value} is not None else None"
+        raise ValueError(f"Unknown kind '{mapping.kind}' for {mapping.attribute}")
+
+    @staticmethod
+    def _decoder_of(model: type) -> Callable[[dict], Any]:
+        return ModelCodec.of(model).decode if ModelCodec.has_field_map(model) else model.from_dict
+
+    @staticmethod
+    def _encoder_of(model: type) -> Callable[[Any], dict]:
+        return ModelCodec.of(model).encode if ModelCodec.has_field_map(model) else model.to_dict
+
+    def _compile(self, source: str, namespace: Dict[str, Any], name: str) -> Callable:
+        code = compile(source, f"<ModelCodec {self.model.__module__}.{self.model.__qualname__}>", "exec")
+        exec(code, namespace)
+        return namespace[name]
@@ -0,0 +1,107 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, TypeVar
+
+from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+
+class PaginationUtils:
+    @staticmethod
+    def iterate(config: Config, get_page: Callable[[int], P], get_items: Callable[[P], Optional[List[T]]]) -> Iterator[T]:
+        """
+        Yields the items of every page of a paginated retrieval. The first page is retrieved alone to
+        learn the total number of pages; with config.pagination_workers above 1 the remaining pages are
+        then retrieved concurrently, at most that many at a time, and still yielded in page order. Up to
+        config.pagination_workers pages are held in memory at a time: the page being consumed and the
+        ones retrieved ahead of it.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            get_page (Callable[[int], P]): Retrieves the page with the given number, starting at 0.
+            get_items (Callable[[P], Optional[List[T]]]): Returns the items of a page.
+
+        Returns:
+            Iterator[T]: The items of all pages, in page order.
+
+        Raises:
+            SdkException: If there is an error retrieving a page.
+        """
+        first_page = get_page(0)
+        yield from get_items(first_page) or []
+
+        total_pages = first_page.total_pages or 0
+        if config.pagination_workers > 1 and total_pages > 2:
+            yield from PaginationUtils.iterate_concurrently(config.pagination_workers, get_page, get_items, 1, total_pages)
+            return
+
+        page = 1
+        while page < total_pages:
+            current_page = get_page(page)
+            yield from get_items(current_page) or []
+            page += 1
+            total_pages = current_page.total_pages or 0
+
+    @staticmethod
+    def iterate_resumable(checkpoint_file: str, checkpoint: PaginationCheckpoint, get_page: Callable[[int], P],
+                          get_items: Callable[[P], Optional[List[T]]]) -> Iterator[T]:
+        """
+        Yields the items of a paginated retrieval starting after the last page recorded in the
+        checkpoint file, and saves the checkpoint once the items of each page have been consumed.
+        A page interrupted halfway is retrieved again on resume, so its items may be seen twice.
+
+        Args:
+            checkpoint_file (str): The file the checkpoint is read from and saved to.
+            checkpoint (PaginationCheckpoint): The query being retrieved, used when the file does not exist yet.
+            get_page (Callable[[int], P]): Retrieves the page with the given number, starting at 0.
+            get_items (Callable[[P], Optional[List[T]]]): Returns the items of a page.
+
+        Returns:
+            Iterator[T]: The items of the pages not consumed yet, in page order.
+
+        Raises:
+            ValueError: If the checkpoint file belongs to a different query.
+            SdkException: If there is an error retrieving a page.
+        """
+        saved = PaginationCheckpoint.load(checkpoint_file)
+        if saved is not None:
+            if not saved.matches(checkpoint):
+                raise ValueError(f"Checkpoint {checkpoint_file} belongs to a different retrieval")
+            checkpoint = saved
+
+        while not checkpoint.completed:
+            page = checkpoint.next_page
+            current_page = get_page(page)
+            checkpoint.total_pages = current_page.total_pages or 0
+            yield from get_items(current_page) or []
+            checkpoint.last_completed_page = page
+            checkpoint.save(checkpoint_file)
+
+    @staticmethod
+    def iterate_concurrently(workers: int, get_page: Callable[[int], P], get_items: Callable[[P], Optional[List[T]]],
+                             first: int, total_pages: int) -> Iterator[T]:
+        """
+        Retrieves the pages from first to total_pages - 1 with a sliding window of workers requests in
+        flight, so at most that many pages are held in memory ahead of the consumer.
+        """
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inter-sdk-page")
+        pending = deque()
+        next_page = first
+        try:
+            while next_page < total_pages and len(pending) < workers:
+                pending.append(executor.submit(get_page, next_page))
+                next_page += 1
+
+            while pending:
+                current_page = pending.popleft().result()
+                if next_page < total_pages:
+                    pending.append(executor.submit(get_page, next_page))
+                    next_page += 1
+                yield from get_items(current_page) or []
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
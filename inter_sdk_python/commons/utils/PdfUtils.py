@@ -0,0 +1,151 @@
+import base64
+import io
+import itertools
+import os
+import re
+from typing import BinaryIO, Iterable, Union
+
+import requests
+
+
+class PdfUtils:
+    """
+    The PdfUtils class writes the PDF documents returned by the API as {"pdf": "<base64>"}
+    without holding the response in memory: the body is read in chunks, the pdf field is
+    located in the first ones and its base64 content is decoded chunk by chunk into the
+    target, so memory stays bounded by CHUNK_SIZE whatever the size of the document.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    PDF_VALUE = re.compile(rb'"pdf"\s*:\s*"')
+    MAX_HEADER_SIZE = 64
+
+    @staticmethod
+    def write(response: requests.Response, target: Union[str, BinaryIO]) -> int:
+        """
+        Decodes the PDF of a streamed response into a file or a binary stream and closes the response.
+        Files are written next to the target and renamed once complete, so a failed download never
+        leaves a truncated document at the target path.
+
+        Args:
+            response (requests.Response): A response from HttpUtils.call_get_stream.
+            target (Union[str, BinaryIO]): The path of the file, or a binary stream open for writing.
+
+        Returns:
+            int: The size of the PDF, in bytes.
+
+        Raises:
+            ValueError: If the response holds no pdf field or its content is not valid base64.
+        """
+        with response:
+            chunks = response.iter_content(PdfUtils.CHUNK_SIZE)
+            if not isinstance(target, str):
+                return PdfUtils.decode(chunks, target)
+
+            partial = f"{target}.part"
+            try:
+                with open(partial, "wb") as stream:
+                    size = PdfUtils.decode(chunks, stream)
+                os.replace(partial, target)
+            except BaseException:
+                if os.path.exists(partial):
+                    os.remove(partial)
+                raise
+            return size
+
+    @staticmethod
+    def to_bytes(response: requests.Response) -> bytes:
+        """
+        Decodes the PDF of a streamed response in memory and closes the response.
+
+        Args:
+            response (requests.Response): A response from HttpUtils.call_get_stream.
+
+        Returns:
+            bytes: The PDF document; io.BytesIO(result) gives a file-like object.
+
+        Raises:
+            ValueError: If the response holds no pdf field or its content is not valid base64.
+        """
+        buffer = io.BytesIO()
+        PdfUtils.write(response, buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def decode_content(content: bytes) -> bytes:
+        """
+        Decodes the PDF of a response body already held in memory, e.g. received by AsyncHttpClient.
+
+        Args:
+            content (bytes): The JSON document returned by the API.
+
+        Returns:
+            bytes: The PDF document.
+
+        Raises:
+            ValueError: If the document holds no pdf field or its content is not valid base64.
+        """
+        buffer = io.BytesIO()
+        PdfUtils.decode((content,), buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def decode(chunks: Iterable[bytes], stream: BinaryIO) -> int:
+        """
+        Decodes the base64 pdf field of a JSON document received in chunks into a binary stream.
+
+        Args:
+            chunks (Iterable[bytes]): The JSON document, in chunks of any size.
+            stream (BinaryIO): The stream receiving the PDF.
+
+        Returns:
+            int: The size of the PDF, in bytes.
+
+        Raises:
+            ValueError: If the document holds no pdf field or its content is not valid base64.
+        """
+        chunks = iter(chunks)
+        head = b""
+        for chunk in chunks:
+            head += chunk
+            match = PdfUtils.PDF_VALUE.search(head)
+            if match is not None:
+                break
+            head = head[-PdfUtils.MAX_HEADER_SIZE:]
+        else:
+            raise ValueError("The response holds no pdf field")
+
+        size = 0
+        pending = b""
+        for chunk in itertools.chain((head[match.end():],), chunks):
+            end = chunk.find(b'"')
+            data = pending + (chunk if end < 0 else chunk[:end])
+
+            pending = b""
+            if end < 0 and data.endswith(b"\\"):
+                data, pending = data[:-1], b"\\"
+            if b"\\" in data:
+                data = PdfUtils._unescape(data)
+
+            usable = len(data) - len(data) % 4
+            if usable:
+                decoded = base64.b64decode(data[:usable], validate=True)
+                stream.write(decoded)
+                size += len(decoded)
+            pending = data[usable:] + pending
+
+            if end >= 0:
+                if pending:
+                    raise ValueError("The pdf field is not valid base64: incomplete final block")
+                return size
+
+        raise ValueError("The response ended inside the pdf field")
+
+    @staticmethod
+    def _unescape(data: bytes) -> bytes:
+        # Serializers may escape the "/" of the base64 alphabet and wrap lines, e.g. MIME base64.
+        data = data.replace(b"\\/", b"/").replace(b"\\r", b"").replace(b"\\n", b"")
+        if b"\\" in data:
+            raise ValueError("The pdf field is not valid base64: unexpected escape sequence")
+        return data
@@ -0,0 +1,88 @@
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from inter_sdk_python.commons.models.RateLimit import RateLimit
+from inter_sdk_python.commons.utils.TokenBucket import TokenBucket
+
+
+class RateLimiter:
+    """
+    The RateLimiter class keeps one token bucket per configured key. A key is either
+    an OAuth scope from Constants (e.g. Constants.PIX_READ_SCOPE) or a URL path prefix
+    (e.g. Constants.URL_BILLING); the longest matching URL prefix wins over the scope,
+    and DEFAULT applies to calls matching neither.
+    """
+
+    DEFAULT = "*"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.limits: Dict[str, RateLimit] = {}
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def set_limit(self, key: str, limit: RateLimit) -> None:
+        """
+        Defines the rate for a scope, a URL path prefix or DEFAULT.
+
+        Args:
+            key (str): The scope, the URL path prefix (starting with "/") or DEFAULT.
+            limit (RateLimit): The allowed rate and burst.
+        """
+        with self._lock:
+            self.limits[key] = limit
+            self.buckets[key] = TokenBucket(limit.requests_per_minute / 60.0, limit.burst or 1)
+
+    def resolve(self, scope: str, url: str) -> Optional[TokenBucket]:
+        """
+        Finds the bucket applied to a call.
+
+        Args:
+            scope (str): The scope of the call.
+            url (str): The URL of the call.
+
+        Returns:
+            Optional[TokenBucket]: The bucket, or None when the call is not limited.
+        """
+        path = urlsplit(url).path
+        with self._lock:
+            prefix = max((key for key in self.buckets if key.startswith("/") and path.startswith(key)), key=len, default=None)
+            if prefix is not None:
+                return self.buckets[prefix]
+            return self.buckets.get(scope) or self.buckets.get(RateLimiter.DEFAULT)
+
+    def acquire(self, scope: str, url: str) -> None:
+        """
+        Blocks until the call can be sent.
+
+        Args:
+            scope (str): The scope of the call.
+            url (str): The URL of the call.
+        """
+        bucket = self.resolve(scope, url)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, scope: str, url: str) -> None:
+        """
+        Suspends the coroutine until the call can be sent.
+
+        Args:
+            scope (str): The scope of the call.
+            url (str): The URL of the call.
+        """
+        bucket = self.resolve(scope, url)
+        if bucket is not None:
+            await bucket.acquire_async()
+
+    def penalize(self, scope: str, url: str) -> None:
+        """
+        Slows down the bucket of a call that was throttled by the server.
+
+        Args:
+            scope (str): The scope of the call.
+            url (str): The URL of the call.
+        """
+        bucket = self.resolve(scope, url)
+        if bucket is not None:
+            bucket.penalize()
@@ -0,0 +1,114 @@
+import queue
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.utils.SslContextAdapter import SslContextAdapter
+
+
+class SessionPool:
+    """
+    The SessionPool class keeps a persistent requests.Session for a Config, so
+    consecutive calls reuse keep-alive connections instead of paying a new TCP
+    and mutual TLS handshake on every request.
+    """
+
+    CREATION_LOCK = threading.Lock()
+
+    def __init__(self, config: Config):
+        self.config = config
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._last_used = 0.0
+
+    @staticmethod
+    def of(config: Config) -> 'SessionPool':
+        """
+        Returns the pool owned by the given configuration, creating it on first use.
+
+        Args:
+            config (Config): The configuration object containing client information.
+
+        Returns:
+            SessionPool: The pool associated with the configuration.
+        """
+        if config.session_pool is None:
+            with SessionPool.CREATION_LOCK:
+                if config.session_pool is None:
+                    config.session_pool = SessionPool(config)
+        return config.session_pool
+
+    def get_session(self) -> requests.Session:
+        """
+        Returns the pooled session. When it has not been used for longer than
+        config.pool_idle_timeout seconds, its idle connections are closed before
+        it is reused; the session itself is kept, so responses other threads are
+        still reading are not interrupted.
+
+        Returns:
+            requests.Session: A session holding the client certificate and the connection pool.
+        """
+        with self._lock:
+            now = time.monotonic()
+            idle_timeout = self.config.pool_idle_timeout
+            if self._session is None:
+                self._session = self._create_session()
+            elif idle_timeout is not None and now - self._last_used > idle_timeout:
+                SessionPool._close_idle_connections(self._session)
+
+            self._last_used = now
+            return self._session
+
+    def close(self) -> None:
+        """
+        Closes every pooled connection. The pool can still be used afterwards,
+        in which case a new session is created.
+        """
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    @staticmethod
+    def _close_idle_connections(session: requests.Session) -> None:
+        """
+        Closes the connections waiting in the urllib3 pools of the session. A connection
+        serving a request is checked out of its pool until the response is read, so it
+        is left alone.
+        """
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None or pool.pool is None:
+                    continue
+                drained = 0
+                while True:
+                    try:
+                        connection = pool.pool.get(block=False)
+                    except queue.Empty:
+                        break
+                    drained += 1
+                    if connection is not None:
+                        connection.close()
+                for _ in range(drained):
+                    try:
+                        pool.pool.put(None, block=False)
+                    except queue.Full:
+                        break
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        if self.config.ssl_context is not None:
+            adapter = SslContextAdapter(self.config.ssl_context, pool_connections=1, pool_maxsize=self.config.pool_size)
+        else:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.config.pool_size)
+            session.cert = (self.config.crt, self.config.key)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
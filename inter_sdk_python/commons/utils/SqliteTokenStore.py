@@ -0,0 +1,67 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+from inter_sdk_python.commons.models.GetTokenResponse import GetTokenResponse
+from inter_sdk_python.commons.utils.TokenStore import TokenStore
+
+
+class SqliteTokenStore(TokenStore):
+    """
+    The SqliteTokenStore class shares tokens between the processes of a host
+    through a SQLite database file, e.g. gunicorn or celery workers. While one
+    process mints a token for a key, the others wait on the database write lock
+    and then reuse that token. The file is created readable by its owner only.
+    """
+
+    BUSY_TIMEOUT = 30.0
+
+    def __init__(self, path: str):
+        """
+        Opens or creates the token database.
+
+        Args:
+            path (str): Path of the database file.
+        """
+        self.path = path
+        self._local = threading.local()
+        if not os.path.exists(path):
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, token TEXT NOT NULL)")
+
+    def get(self, key: str) -> Optional[GetTokenResponse]:
+        row = self._connection().execute("SELECT token FROM tokens WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        get_token_response = json.loads(row[0])
+        get_token_response['created_at'] = datetime.fromtimestamp(get_token_response['created_at'])
+        return get_token_response
+
+    def put(self, key: str, get_token_response: GetTokenResponse) -> None:
+        data = dict(get_token_response)
+        data['created_at'] = data['created_at'].timestamp()
+        self._connection().execute("INSERT OR REPLACE INTO tokens (key, token) VALUES (?, ?)", (key, json.dumps(data)))
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=SqliteTokenStore.BUSY_TIMEOUT, isolation_level=None)
+            self._local.connection = connection
+        return connection
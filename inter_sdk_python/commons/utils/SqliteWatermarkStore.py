@@ -0,0 +1,115 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Iterable, Iterator, Optional
+
+
+class SqliteWatermarkStore:
+    """
+    The SqliteWatermarkStore class holds the SQLite plumbing shared by the
+    local copies of API data (StatementSync, BillingMirror): a database file
+    readable by its owner only, in WAL mode, with one connection per thread,
+    write transactions, and a table with the last date copied per account.
+
+    The watermark columns are named after the operation, e.g. synced_until and
+    synced_at for StatementSync, refreshed_until and refreshed_at for BillingMirror.
+    """
+
+    BUSY_TIMEOUT = 30.0
+    BATCH_SIZE = 500
+
+    def __init__(self, path: str, schema: Iterable[str], operation: str):
+        """
+        Opens or creates the database.
+
+        Args:
+            path (str): Path of the database file.
+            schema (Iterable[str]): Statements creating the tables and indexes of the data, run on every open.
+            operation (str): Past participle naming the watermark columns and errors, e.g. "synced".
+        """
+        self.path = path
+        self.operation = operation
+        self._local = threading.local()
+        if not os.path.exists(path):
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        connection = self.connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        for statement in schema:
+            connection.execute(statement)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS watermarks (account TEXT PRIMARY KEY, {operation}_until TEXT NOT NULL, "
+            f"{operation}_at REAL NOT NULL)"
+        )
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Returns the connection of the current thread, opened in autocommit mode.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=SqliteWatermarkStore.BUSY_TIMEOUT, isolation_level=None)
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Runs the block in a write transaction, committed when the block ends and rolled back when it raises.
+        """
+        connection = self.connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def get_watermark(self, account: str) -> Optional[str]:
+        """
+        Returns the last date copied for the account, YYYY-MM-DD, or None if it was never copied.
+        """
+        row = self.connection().execute(
+            f"SELECT {self.operation}_until FROM watermarks WHERE account = ?", (account,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def advance_watermark(self, account: str, until: str) -> None:
+        """
+        Records that the account was copied until a date; the watermark never moves back.
+        """
+        self.connection().execute(
+            f"INSERT INTO watermarks (account, {self.operation}_until, {self.operation}_at) VALUES (?, ?, ?) "
+            f"ON CONFLICT (account) DO UPDATE SET {self.operation}_until = "
+            f"max({self.operation}_until, excluded.{self.operation}_until), {self.operation}_at = excluded.{self.operation}_at",
+            (account, until, time.time())
+        )
+
+    def window_start(self, account: str, initial_date: Optional[str], overlap_days: int) -> str:
+        """
+        Returns the first date to request for the account: overlap_days before its watermark, or initial_date
+        when that is later or the account has no watermark.
+
+        Raises:
+            ValueError: If the account has no watermark and initial_date is not given.
+        """
+        watermark = self.get_watermark(account)
+        if watermark is None:
+            if initial_date is None:
+                raise ValueError(f"Account '{account}' was never {self.operation}: initial_date is required")
+            return initial_date
+
+        start = (date.fromisoformat(watermark) - timedelta(days=overlap_days)).isoformat()
+        return max(start, initial_date) if initial_date is not None else start
+
+    def close(self) -> None:
+        """
+        Closes the database connection of the current thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
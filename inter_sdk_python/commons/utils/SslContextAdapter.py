@@ -0,0 +1,22 @@
+import ssl
+
+from requests.adapters import HTTPAdapter
+
+
+class SslContextAdapter(HTTPAdapter):
+    """
+    The SslContextAdapter class is an HTTPAdapter whose connections are opened
+    with a given SSL context, which already holds the client certificate.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
@@ -1,7 +1,13 @@
 import datetime
+import hashlib
+import os
+import ssl
 import tempfile
+import threading
 from typing import Any
 
+import certifi
+
 import cryptography
 import cryptography.hazmat
 import cryptography.hazmat.primitives.serialization
@@ -13,45 +19,76 @@ from inter_sdk_python.commons.exceptions.CertificateNotFoundException import Cer
 
 
 class SslUtils:
+    SSL_CONTEXTS: dict[str, tuple[ssl.SSLContext, Any]] = {}
+    SSL_CONTEXTS_LOCK = threading.Lock()
 
     @staticmethod
-    def convert_pfx_to_pem(pfx_file: str, password: str):
+    def read_pfx(pfx_file: str) -> bytes:
         try:
             with open(pfx_file, 'rb') as f:
-                pfx_data = f.read()
+                return f.read()
         except FileNotFoundError as e:
             raise CertificateNotFoundException(pfx_file)
-        
-        p12 = cryptography.hazmat.primitives.serialization.pkcs12.load_key_and_certificates(
-            data=pfx_data,
-            password=password.encode()
-        )
-        private_key, certificate, _ = p12
 
-        return private_key, certificate
-    
     @staticmethod
-    def get_cert_key_name(private_key, certificate):
-        key = tempfile.NamedTemporaryFile(delete=False)
-        cert = tempfile.NamedTemporaryFile(delete=False)
-
-        if private_key is not None:
-            key.write(
-                private_key.private_bytes(
-                    encoding=cryptography.hazmat.primitives.serialization.Encoding.PEM,
-                    format=cryptography.hazmat.primitives.serialization.PrivateFormat.PKCS8,
-                    encryption_algorithm=cryptography.hazmat.primitives.serialization.NoEncryption(),
+    def get_ssl_context(pfx_file: str, password: str) -> tuple[ssl.SSLContext, Any]:
+        """
+        Returns an SSL context holding the client certificate of the PFX file, along with the
+        certificate itself. Contexts are cached by the PFX content and password, so every SDK
+        instance using the same certificate shares one context and the PFX is parsed once.
+        """
+        pfx_data = SslUtils.read_pfx(pfx_file)
+        digest = hashlib.sha256(password.encode() + b":" + pfx_data).hexdigest()
+
+        with SslUtils.SSL_CONTEXTS_LOCK:
+            cached = SslUtils.SSL_CONTEXTS.get(digest)
+            if cached is not None:
+                return cached
+
+            private_key, certificate, additional_certificates = \
+                cryptography.hazmat.primitives.serialization.pkcs12.load_key_and_certificates(
+                    data=pfx_data,
+                    password=password.encode()
                 )
-            )
-            key.close()
+            context = SslUtils.build_ssl_context(private_key, certificate, additional_certificates or [])
+            SslUtils.SSL_CONTEXTS[digest] = (context, certificate)
+            return context, certificate
 
-        if certificate is not None:
-            cert.write(
-                certificate.public_bytes(encoding=cryptography.hazmat.primitives.serialization.Encoding.PEM),
-            )
-            cert.close()
-    
-        return key.name, cert.name
+    @staticmethod
+    def build_ssl_context(private_key, certificate, additional_certificates) -> ssl.SSLContext:
+        context = ssl.create_default_context(cafile=certifi.where())
+
+        encoding = cryptography.hazmat.primitives.serialization.Encoding.PEM
+        key_pem = private_key.private_bytes(
+            encoding=encoding,
+            format=cryptography.hazmat.primitives.serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=cryptography.hazmat.primitives.serialization.NoEncryption(),
+        )
+        cert_pem = b"".join(cert.public_bytes(encoding=encoding) for cert in [certificate, *additional_certificates])
+
+        # ssl only loads client certificates from paths: use anonymous in-memory files when the
+        # platform has them, otherwise a private directory removed as soon as the chain is loaded.
+        if hasattr(os, "memfd_create") and os.path.isdir("/proc/self/fd"):
+            key_fd = os.memfd_create("inter-sdk-key")
+            cert_fd = os.memfd_create("inter-sdk-cert")
+            try:
+                os.write(key_fd, key_pem)
+                os.write(cert_fd, cert_pem)
+                context.load_cert_chain(certfile=f"/proc/self/fd/{cert_fd}", keyfile=f"/proc/self/fd/{key_fd}")
+            finally:
+                os.close(key_fd)
+                os.close(cert_fd)
+        else:
+            with tempfile.TemporaryDirectory() as directory:
+                key_path = os.path.join(directory, "key.pem")
+                cert_path = os.path.join(directory, "cert.pem")
+                with open(os.open(key_path, os.O_CREAT | os.O_WRONLY, 0o600), 'wb') as key_file:
+                    key_file.write(key_pem)
+                with open(cert_path, 'wb') as cert_file:
+                    cert_file.write(cert_pem)
+                context.load_cert_chain(certfile=cert_path, keyfile=key_path)
+
+        return context
 
     @staticmethod
     def is_certificate_expiring_soon(certificate, days) -> tuple[bool, Any]:
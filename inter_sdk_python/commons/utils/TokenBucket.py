@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    The TokenBucket class paces requests to a sustained rate with a burst capacity.
+    Callers reserve a token and wait outside the lock, so the bucket can be shared
+    by threads and by coroutines. After a throttling response the rate is cut by
+    DECREASE_FACTOR and then recovers by RECOVERY_STEP of the configured rate for
+    every RECOVERY_INTERVAL seconds without new throttling.
+    """
+
+    DECREASE_FACTOR = 0.5
+    MIN_RATE_FACTOR = 0.1
+    RECOVERY_STEP = 0.1
+    RECOVERY_INTERVAL = 10.0
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Creates a full bucket.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (int): Maximum number of tokens accumulated.
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self._lock = threading.Lock()
+        self._last_refill = time.monotonic()
+        self._last_adjust = self._last_refill
+
+    def reserve(self) -> float:
+        """
+        Takes a token, going into debt when none is available.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        """
+        Blocks the current thread until a token is available.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """
+        Suspends the current coroutine until a token is available.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self) -> None:
+        """
+        Lowers the rate after the server throttled a request and drops the accumulated burst.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.base_rate * TokenBucket.MIN_RATE_FACTOR, self.rate * TokenBucket.DECREASE_FACTOR)
+            self.tokens = min(self.tokens, 0.0)
+            self._last_adjust = now
+
+    def _refill(self, now: float) -> None:
+        if self.rate < self.base_rate:
+            steps = int((now - self._last_adjust) / TokenBucket.RECOVERY_INTERVAL)
+            if steps > 0:
+                self.rate = min(self.base_rate, self.rate + self.base_rate * TokenBucket.RECOVERY_STEP * steps)
+                self._last_adjust += steps * TokenBucket.RECOVERY_INTERVAL
+
+        self.tokens = min(float(self.capacity), self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import ContextManager, Optional
+
+from inter_sdk_python.commons.models.GetTokenResponse import GetTokenResponse
+
+
+class TokenStore(ABC):
+    """
+    The TokenStore class is the interface for token caches shared beyond the
+    current process. Keys are opaque digests built by TokenUtils, so
+    implementations never see client credentials.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[GetTokenResponse]:
+        """
+        Returns the token stored under the key, or None.
+        """
+
+    @abstractmethod
+    def put(self, key: str, get_token_response: GetTokenResponse) -> None:
+        """
+        Stores a token under the key, replacing any previous one.
+        """
+
+    def lock(self, key: str) -> ContextManager:
+        """
+        Returns a context manager held while a token is minted for the key, so that
+        other processes wait for it instead of minting their own. Does nothing by default.
+        """
+        return nullcontext()
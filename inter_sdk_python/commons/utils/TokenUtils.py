@@ -1,49 +1,186 @@
+import hashlib
+import logging
+import threading
 import time
 from datetime import datetime, timedelta
 
-import requests
-
 from ..exceptions.CertificateException import CertificateException
 from ..models.Config import Config
 from ..models.Error import Error
 from ..models.GetTokenResponse import GetTokenResponse
 from ..structures.Constants import Constants
+from ..utils.JsonCodec import JsonCodec
+from ..utils.SessionPool import SessionPool
 from ..utils.UrlUtils import UrlUtils
 
 class TokenUtils:
     ADDITIONAL_TIME = 60
+    REFRESH_AHEAD_TIME = 300
     TOKEN_MAP: dict[str, GetTokenResponse] = {}
+    MAP_LOCK = threading.Lock()
+    KEY_LOCKS: dict[str, threading.Lock] = {}
+    REFRESHING: set[str] = set()
 
     @staticmethod
     def get(config: Config, scope: str) -> str:
-        get_token_response = TokenUtils.get_from_map(config.client_id, config.client_secret, scope)
-
-        if get_token_response is None or not TokenUtils.validate(get_token_response):
-            get_token_response = TokenUtils.generate_token(config, scope)
-            TokenUtils.add_to_map(config.client_id, config.client_secret, scope, get_token_response)
+        """
+        Returns a valid access token for the scope. Concurrent callers missing the cache wait for a
+        single request to the token endpoint, and a token close to expiring is renewed in the
+        background while the current one keeps being served.
+
+        When config.token_scopes contains the scope, one token covering all of those scopes is
+        requested instead, and any cached token granted for the scope among others is reused.
+        """
+        token_scope, get_token_response = TokenUtils.find_in_map(config.client_id, config.client_secret, scope)
+
+        if get_token_response is not None:
+            if TokenUtils.should_refresh(get_token_response):
+                TokenUtils.refresh_in_background(config, token_scope)
+            return get_token_response.get("access_token")
+
+        token_scope = TokenUtils.resolve_scope(config, scope)
+        with TokenUtils.get_key_lock(config.client_id, config.client_secret, token_scope):
+            get_token_response = TokenUtils.get_from_map(config.client_id, config.client_secret, token_scope)
+            if not TokenUtils.validate(get_token_response):
+                get_token_response = TokenUtils.obtain_token(config, token_scope, False)
+                TokenUtils.add_to_map(config.client_id, config.client_secret, token_scope, get_token_response)
 
         return get_token_response.get("access_token")
 
+    @staticmethod
+    def resolve_scope(config: Config, scope: str) -> str:
+        """
+        Returns the scope string to request from the token endpoint for a call needing the scope.
+        """
+        if config.token_scopes and scope in config.token_scopes:
+            return " ".join(sorted(set(config.token_scopes)))
+        return scope
+
+    @staticmethod
+    def find_in_map(client_id: str, client_secret: str, scope: str):
+        """
+        Finds a valid cached token whose granted scopes include the scope.
+
+        Returns:
+            tuple: The scope string the token was requested with and the token, or (None, None).
+        """
+        get_token_response = TokenUtils.get_from_map(client_id, client_secret, scope)
+        if TokenUtils.validate(get_token_response):
+            return scope, get_token_response
+
+        prefix = TokenUtils.build_key(client_id, client_secret, "")
+        with TokenUtils.MAP_LOCK:
+            candidates = [(key[len(prefix):], value) for key, value in TokenUtils.TOKEN_MAP.items() if key.startswith(prefix)]
+
+        for token_scope, get_token_response in candidates:
+            granted = (get_token_response.get("scope") or token_scope).split()
+            if scope in granted and TokenUtils.validate(get_token_response):
+                return token_scope, get_token_response
+
+        return None, None
+
+    @staticmethod
+    def obtain_token(config: Config, scope: str, refresh: bool) -> GetTokenResponse:
+        """
+        Reuses a token minted by another process through config.token_store when possible,
+        otherwise mints a new one and publishes it to the store.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            scope (str): The scope of the token.
+            refresh (bool): Indicates whether tokens about to expire should be replaced as well.
+        """
+        store = config.token_store
+        if store is None:
+            return TokenUtils.generate_token(config, scope)
+
+        def usable(get_token_response) -> bool:
+            if not TokenUtils.validate(get_token_response):
+                return False
+            return not refresh or not TokenUtils.should_refresh(get_token_response)
+
+        key = TokenUtils.build_key(config.client_id, config.client_secret, scope)
+        get_token_response = store.get(key)
+        if usable(get_token_response):
+            return get_token_response
+
+        with store.lock(key):
+            get_token_response = store.get(key)
+            if usable(get_token_response):
+                return get_token_response
+            get_token_response = TokenUtils.generate_token(config, scope)
+            store.put(key, get_token_response)
+            return get_token_response
+
     @staticmethod
     def validate(get_token_response: GetTokenResponse) -> bool:
         if not get_token_response:
             return False
 
+        now = int(time.time())
+        return (now + TokenUtils.ADDITIONAL_TIME) <= TokenUtils.get_expiration(get_token_response)
+
+    @staticmethod
+    def should_refresh(get_token_response: GetTokenResponse) -> bool:
+        refresh_ahead = min(TokenUtils.REFRESH_AHEAD_TIME, get_token_response['expires_in'] // 4)
+        now = int(time.time())
+        return (now + TokenUtils.ADDITIONAL_TIME + refresh_ahead) > TokenUtils.get_expiration(get_token_response)
+
+    @staticmethod
+    def get_expiration(get_token_response: GetTokenResponse) -> int:
         created_at = get_token_response['created_at']
         expires_in = get_token_response['expires_in']
         expiration_date = created_at + timedelta(seconds=expires_in)
-        now = int(time.time())
-        return (now + TokenUtils.ADDITIONAL_TIME) <= int(expiration_date.timestamp())
+        return int(expiration_date.timestamp())
+
+    @staticmethod
+    def refresh_in_background(config: Config, scope: str) -> None:
+        key = TokenUtils.build_key(config.client_id, config.client_secret, scope)
+        with TokenUtils.MAP_LOCK:
+            if key in TokenUtils.REFRESHING:
+                return
+            TokenUtils.REFRESHING.add(key)
+
+        def refresh():
+            try:
+                with TokenUtils.get_key_lock(config.client_id, config.client_secret, scope):
+                    get_token_response = TokenUtils.get_from_map(config.client_id, config.client_secret, scope)
+                    if get_token_response is None or TokenUtils.should_refresh(get_token_response):
+                        get_token_response = TokenUtils.obtain_token(config, scope, True)
+                        TokenUtils.add_to_map(config.client_id, config.client_secret, scope, get_token_response)
+            except Exception as exception:
+                logging.warning("Background token refresh failed for scope %s: %s", scope, exception)
+            finally:
+                with TokenUtils.MAP_LOCK:
+                    TokenUtils.REFRESHING.discard(key)
+
+        threading.Thread(target=refresh, name="inter-sdk-token-refresh", daemon=True).start()
+
+    @staticmethod
+    def build_key(client_id: str, client_secret: str, scope: str) -> str:
+        credentials = hashlib.sha256(f"{client_id}:{client_secret}".encode()).hexdigest()
+        return f"{credentials}:{scope}"
+
+    @staticmethod
+    def get_key_lock(client_id: str, client_secret: str, scope: str) -> threading.Lock:
+        key = TokenUtils.build_key(client_id, client_secret, scope)
+        with TokenUtils.MAP_LOCK:
+            lock = TokenUtils.KEY_LOCKS.get(key)
+            if lock is None:
+                lock = TokenUtils.KEY_LOCKS[key] = threading.Lock()
+            return lock
 
     @staticmethod
     def get_from_map(client_id: str, client_secret: str, scope: str):
-        key = f"{client_id}:{client_secret}:{scope}"
-        return TokenUtils.TOKEN_MAP.get(key)
+        key = TokenUtils.build_key(client_id, client_secret, scope)
+        with TokenUtils.MAP_LOCK:
+            return TokenUtils.TOKEN_MAP.get(key)
 
     @staticmethod
     def add_to_map(client_id: str, client_secret: str, scope: str, get_token_response: GetTokenResponse):
-        key = f"{client_id}:{client_secret}:{scope}"
-        TokenUtils.TOKEN_MAP[key] = get_token_response
+        key = TokenUtils.build_key(client_id, client_secret, scope)
+        with TokenUtils.MAP_LOCK:
+            TokenUtils.TOKEN_MAP[key] = get_token_response
 
     @staticmethod
     def generate_token(config, scope):
@@ -55,10 +192,10 @@ class TokenUtils:
                 "scope": scope
             }
 
-            response = requests.post(
+            session = SessionPool.of(config).get_session()
+            response = session.post(
                 UrlUtils.build_url(config=config, url=Constants.URL_TOKEN),
-                data=data,
-                cert=(config.crt, config.key)
+                data=data
             )
 
             if response is None:
@@ -66,7 +203,7 @@ class TokenUtils:
 
             response.raise_for_status()
 
-            data = response.json()
+            data = JsonCodec.of(config).loads(response.content)
 
             if data.get('created_at') is None:
                 data['created_at'] = datetime.now()
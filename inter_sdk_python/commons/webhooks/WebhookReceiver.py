@@ -0,0 +1,444 @@
+import asyncio
+import hashlib
+import hmac
+import inspect
+import ipaddress
+import logging
+import ssl
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from inter_sdk_python.banking.models.Payload import Payload
+from inter_sdk_python.banking.models.RetrieveCallbackResponse import RetrieveCallbackResponse as BankingRetrieveCallbackResponse
+from inter_sdk_python.billing.models.BillingPayload import BillingPayload
+from inter_sdk_python.billing.models.BillingRetrieveCallbackResponse import BillingRetrieveCallbackResponse
+from inter_sdk_python.commons.enums.WebhookKind import WebhookKind
+from inter_sdk_python.commons.models.WebhookEvent import WebhookEvent
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.pix.models.PixPayload import PixPayload
+from inter_sdk_python.pix.models.RetrieveCallbackResponse import RetrieveCallbackResponse as PixRetrieveCallbackResponse
+
+
+class WebhookReceiver:
+    """
+    The WebhookReceiver class is an asyncio HTTP server receiving the webhook
+    notifications registered with include_webhook of the billing, pix and
+    banking SDKs, each route decoding its body into the callback model of its
+    API.
+
+    A notification is acknowledged as soon as it is decoded and put in a
+    bounded queue, before it is handled, so slow handlers never delay the
+    answer. Items received before are dropped, so redeliveries are handled
+    only once; a notification whose items were all received before is
+    acknowledged without being queued. When the queue is full the
+    notification is refused with 503, making the API deliver it again later
+    instead of the receiver running out of memory during a burst.
+
+    Events are consumed from queue, with events(), or by a pool of workers
+    tasks calling handler. The counters accepted, duplicates, refused,
+    invalid, unauthorized and failed count the notifications queued,
+    acknowledged as redeliveries, refused with 503, answered with a client
+    error, refused with 401 and whose handler raised. Notifications without
+    items, or with an item carrying no data, are answered with 400.
+
+    By default the receiver listens on the loopback interface only, e.g.
+    behind a TLS proxy authenticating the API. To listen on other addresses
+    it requires either an ssl_context verifying the client certificate of
+    the API (verify_mode CERT_REQUIRED) or a shared secret, sent by the API
+    as the SECRET_PARAMETER query parameter of the webhook URL registered
+    with include_webhook, e.g. https://example.com/billing?secret=...
+
+    Delivery is at most once: the API got its 200 and the items are marked
+    as received before the event is handled, so an event whose handler
+    raises is not delivered again, and its redeliveries are dropped. Events
+    are also lost if the process stops before handling them. Pass on_failure
+    to keep failed events, e.g. in a dead-letter table to be reprocessed, and
+    persist events in the handler before doing slow work with them.
+    """
+
+    DEFAULT_ROUTES = {
+        "/billing": WebhookKind.BILLING,
+        "/pix": WebhookKind.PIX,
+        "/banking": WebhookKind.BANKING,
+    }
+    SECRET_PARAMETER = "secret"
+    MAX_HEADER_SIZE = 16 * 1024
+    KEEP_ALIVE_TIMEOUT = 30
+    RETRY_AFTER = 1
+    BACKLOG = 1024
+
+    REASONS = {
+        200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found", 405: "Method Not Allowed",
+        411: "Length Required", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+        503: "Service Unavailable",
+    }
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        handler: Optional[Callable[[WebhookEvent], Union[Awaitable[Any], Any]]] = None,
+        workers: int = 8,
+        queue_size: int = 10000,
+        routes: Optional[Dict[str, WebhookKind]] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        dedupe_size: int = 100000,
+        max_body_size: int = 1024 * 1024,
+        json_codec: Optional[JsonCodec] = None,
+        on_failure: Optional[Callable[[WebhookEvent, Exception], Union[Awaitable[Any], Any]]] = None,
+        secret: Optional[str] = None
+    ):
+        """
+        Args:
+            host (str): Address the server listens on - default is "127.0.0.1". Other addresses than loopback
+                        require an ssl_context with CERT_REQUIRED or a secret.
+            port (int): Port the server listens on, 0 for any free port - default is 8080.
+            handler (Optional[Callable[[WebhookEvent], Union[Awaitable[Any], Any]]]): Called with each event by
+                      the workers; coroutine functions are awaited, other functions run on the default executor.
+                      If None, events are consumed from queue or events().
+            workers (int): Number of events handled at the same time - default is 8.
+            queue_size (int): Maximum number of events waiting to be handled - default is 10000.
+            routes (Optional[Dict[str, WebhookKind]]): The API of each path - default is DEFAULT_ROUTES.
+            ssl_context (Optional[ssl.SSLContext]): Serves HTTPS, e.g. requiring the client certificate of the
+                                                    API with CERT_REQUIRED - default is None (plain HTTP
+                                                    behind a TLS proxy).
+            dedupe_size (int): Number of most recent items remembered to drop redeliveries - default is 100000.
+            max_body_size (int): Largest body accepted, in bytes - default is 1 MiB.
+            json_codec (Optional[JsonCodec]): Parser of the bodies - default is the fastest library installed.
+            on_failure (Optional[Callable[[WebhookEvent, Exception], Union[Awaitable[Any], Any]]]): Called with
+                      each event whose handler raised and the exception, e.g. to store it as a dead letter; the
+                      event is lost otherwise. Called like handler (optional, can be None).
+            secret (Optional[str]): Value required in the SECRET_PARAMETER query parameter of every request;
+                                    others are answered with 401 (optional, can be None).
+
+        Raises:
+            ValueError: If host is not a loopback address and the requests are authenticated neither by a
+                        client certificate nor by a secret.
+        """
+        verified = ssl_context is not None and ssl_context.verify_mode == ssl.CERT_REQUIRED
+        if not WebhookReceiver.is_loopback(host) and not verified and not secret:
+            raise ValueError(f"Listening on '{host}' requires an ssl_context with CERT_REQUIRED or a secret")
+
+        self.host = host
+        self.port = port
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.routes = dict(routes if routes is not None else WebhookReceiver.DEFAULT_ROUTES)
+        self.ssl_context = ssl_context
+        self.dedupe_size = dedupe_size
+        self.max_body_size = max_body_size
+        self.json_codec = json_codec if json_codec is not None else JsonCodec()
+        self.on_failure = on_failure
+        self.secret = secret
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+
+        self.accepted = 0
+        self.duplicates = 0
+        self.refused = 0
+        self.invalid = 0
+        self.unauthorized = 0
+        self.failed = 0
+
+        self._seen: OrderedDict = OrderedDict()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: List[asyncio.Task] = []
+        self._connections: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        """
+        Starts listening and, if there is a handler, the workers. The port is updated with the bound port.
+        """
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(self._serve, self.host, self.port, ssl=self.ssl_context,
+                                                  limit=WebhookReceiver.MAX_HEADER_SIZE, backlog=WebhookReceiver.BACKLOG)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.handler is not None:
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        logging.info("WebhookReceiver listening on %s:%s", self.host, self.port)
+
+    async def serve_forever(self) -> None:
+        """
+        Starts the receiver, if not started, and serves until cancelled.
+        """
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stops listening, closing open connections, and stops the workers.
+
+        Args:
+            drain (bool): Indicates if the workers handle the queued events before stopping - default is True.
+        """
+        if self._server is None:
+            return
+        server, self._server = self._server, None
+        server.close()
+        for writer in list(self._connections):
+            writer.close()
+        await server.wait_closed()
+
+        if self._tasks:
+            if drain:
+                await self.queue.join()
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+
+    async def events(self) -> AsyncIterator[WebhookEvent]:
+        """
+        Yields the queued events as they arrive, marking each one done when the next one is requested.
+        Use it instead of a handler, from any number of tasks.
+
+        Returns:
+            AsyncIterator[WebhookEvent]: The events.
+        """
+        while True:
+            event = await self.queue.get()
+            try:
+                yield event
+            finally:
+                self.queue.task_done()
+
+    async def __aenter__(self) -> 'WebhookReceiver':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.stop()
+
+    def receive(self, path: str, body: bytes) -> int:
+        """
+        Decodes a notification and queues the items not received before.
+
+        Args:
+            path (str): The path of the request, without the query string.
+            body (bytes): The body of the request.
+
+        Returns:
+            int: The HTTP status of the answer.
+        """
+        kind = self.routes.get(path)
+        if kind is None:
+            self.invalid += 1
+            return 404
+        try:
+            callback = WebhookReceiver.decode(kind, self.json_codec.loads(body))
+        except (ValueError, KeyError, TypeError, AttributeError) as exception:
+            self.invalid += 1
+            logging.warning("Invalid %s webhook notification: %s", kind.value, exception)
+            return 400
+
+        items = WebhookReceiver.items_of(kind, callback)
+        fresh: Dict[bytes, Any] = {}
+        for item in items:
+            data = item.to_dict()
+            if not WebhookReceiver._has_data(data):
+                items = []
+                break
+            key = self._key_of(data)
+            if key not in self._seen and key not in fresh:
+                fresh[key] = item
+        if not items:
+            self.invalid += 1
+            logging.warning("Empty %s webhook notification", kind.value)
+            return 400
+        if not fresh:
+            self.duplicates += 1
+            return 200
+        if self.queue.full():
+            self.refused += 1
+            return 503
+
+        if len(fresh) < len(items):
+            WebhookReceiver.set_items(kind, callback, list(fresh.values()))
+        self.queue.put_nowait(WebhookEvent(kind=kind, path=path, callback=callback, received_at=time.time()))
+        self.accepted += 1
+        for key in fresh:
+            self._seen[key] = None
+        while len(self._seen) > self.dedupe_size:
+            self._seen.popitem(last=False)
+        return 200
+
+    def authorized(self, target: str) -> bool:
+        """
+        Indicates whether a request carries the secret in its query string, or whether no secret is required.
+
+        Args:
+            target (str): The target of the request, with the query string.
+        """
+        if not self.secret:
+            return True
+        query = target.split("?", 1)[1] if "?" in target else ""
+        values = parse_qs(query).get(WebhookReceiver.SECRET_PARAMETER, [])
+        return any(hmac.compare_digest(value.encode(), self.secret.encode()) for value in values)
+
+    @staticmethod
+    def is_loopback(host: str) -> bool:
+        """
+        Indicates whether a host is reachable from this machine only.
+        """
+        if host == "localhost":
+            return True
+        try:
+            return ipaddress.ip_address(host).is_loopback
+        except ValueError:
+            return False
+
+    @staticmethod
+    def decode(kind: WebhookKind, data: Any) -> Union[BillingRetrieveCallbackResponse, PixRetrieveCallbackResponse,
+                                                       BankingRetrieveCallbackResponse]:
+        """
+        Decodes the body of a notification as sent by the API: a list of items, a single item or, for pix,
+        {"pix": [...]}.
+
+        Raises:
+            ValueError: If the body does not hold the notification of the API.
+        """
+        if kind == WebhookKind.BILLING:
+            return BillingRetrieveCallbackResponse(payload=[BillingPayload.from_dict(item) for item in WebhookReceiver._list_of(data)])
+        if kind == WebhookKind.PIX:
+            if isinstance(data, dict) and "pix" in data:
+                data = data["pix"]
+            return PixRetrieveCallbackResponse(payload=PixPayload.from_dict(WebhookReceiver._list_of(data)))
+        return BankingRetrieveCallbackResponse(payload=[Payload.from_dict(item) for item in WebhookReceiver._list_of(data)])
+
+    @staticmethod
+    def items_of(kind: WebhookKind, callback: Any) -> List[Any]:
+        """
+        Returns the payload items of a decoded notification.
+        """
+        if kind == WebhookKind.PIX:
+            return callback.payload.pix_items if callback.payload is not None else []
+        return callback.payload
+
+    @staticmethod
+    def set_items(kind: WebhookKind, callback: Any, items: List[Any]) -> None:
+        """
+        Replaces the payload items of a decoded notification.
+        """
+        if kind == WebhookKind.PIX:
+            callback.payload.pix_items = items
+        else:
+            callback.payload = items
+
+    def _key_of(self, data: dict) -> bytes:
+        # A redelivery carries the same item; a new state of the same billing or transaction differs in some field.
+        return hashlib.blake2b(self.json_codec.dumps(data), digest_size=16).digest()
+
+    @staticmethod
+    def _has_data(value: Any) -> bool:
+        if isinstance(value, dict):
+            return any(WebhookReceiver._has_data(item) for item in value.values())
+        if isinstance(value, list):
+            return any(WebhookReceiver._has_data(item) for item in value)
+        return value is not None and value != ""
+
+    @staticmethod
+    def _list_of(data: Any) -> List[dict]:
+        if isinstance(data, dict):
+            return [data]
+        if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+            raise ValueError("expected a JSON object or a list of objects")
+        return data
+
+    async def _work(self) -> None:
+        while True:
+            event = await self.queue.get()
+            try:
+                await WebhookReceiver._call(self.handler, event)
+            except Exception as exception:
+                self.failed += 1
+                logging.exception("Error handling %s webhook notification", event.kind.value)
+                if self.on_failure is not None:
+                    try:
+                        await WebhookReceiver._call(self.on_failure, event, exception)
+                    except Exception:
+                        logging.exception("Error in on_failure of %s webhook notification", event.kind.value)
+            finally:
+                self.queue.task_done()
+
+    @staticmethod
+    async def _call(function: Callable, *args: Any) -> Any:
+        if inspect.iscoroutinefunction(function):
+            return await function(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), WebhookReceiver.KEEP_ALIVE_TIMEOUT)
+                except asyncio.LimitOverrunError:
+                    await self._answer(writer, 431, False)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+
+                try:
+                    method, target, version, headers = WebhookReceiver._parse_head(head)
+                    length = int(headers.get("content-length", "0"))
+                    if length < 0:
+                        raise ValueError(f"invalid content length {length}")
+                except ValueError:
+                    self.invalid += 1
+                    await self._answer(writer, 400, False)
+                    break
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+                if "chunked" in headers.get("transfer-encoding", "").lower():
+                    self.invalid += 1
+                    await self._answer(writer, 411, False)
+                    break
+                if length > self.max_body_size:
+                    self.invalid += 1
+                    await self._answer(writer, 413, False)
+                    break
+                if headers.get("expect", "").lower() == "100-continue":
+                    writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                body = await reader.readexactly(length) if length else b""
+
+                if method != "POST":
+                    self.invalid += 1
+                    status = 405
+                elif not self.authorized(target):
+                    self.unauthorized += 1
+                    status = 401
+                else:
+                    status = self.receive(target.split("?", 1)[0], body)
+                await self._answer(writer, status, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    @staticmethod
+    def _parse_head(head: bytes) -> Tuple[str, str, str, Dict[str, str]]:
+        lines = head[:-4].decode("latin-1").split("\r\n")
+        method, target, version = lines[0].split(" ", 2)
+        headers = {}
+        for line in lines[1:]:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+        return method, target, version, headers
+
+    @staticmethod
+    async def _answer(writer: asyncio.StreamWriter, status: int, keep_alive: bool) -> None:
+        headers = f"HTTP/1.1 {status} {WebhookReceiver.REASONS[status]}\r\nContent-Length: 0\r\n"
+        if status == 503:
+            headers += f"Retry-After: {WebhookReceiver.RETRY_AFTER}\r\n"
+        if not keep_alive:
+            headers += "Connection: close\r\n"
+        writer.write((headers + "\r\n").encode("latin-1"))
+        await writer.drain()
@@ -0,0 +1,1037 @@
+import logging
+from typing import Any, AsyncIterator, List, Optional
+
+from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.IncludeWebhookRequest import IncludeWebhookRequest
+from inter_sdk_python.commons.models.Webhook import Webhook
+from inter_sdk_python.commons.structures.Constants import Constants
+from inter_sdk_python.commons.utils.AsyncHttpClient import AsyncHttpClient
+from inter_sdk_python.commons.utils.AsyncPaginationUtils import AsyncPaginationUtils
+from inter_sdk_python.commons.utils.AsyncSdkProxy import AsyncSdkProxy
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
+from inter_sdk_python.pix.duebilling.DueBillingClient import DueBillingClient
+from inter_sdk_python.pix.enums.ImmediateBillingType import ImmediateBillingType
+from inter_sdk_python.pix.immediatebillings.ImmediateBillingClient import ImmediateBillingClient
+from inter_sdk_python.pix.locations.LocationClient import LocationClient
+from inter_sdk_python.pix.models.BillingPage import BillingPage
+from inter_sdk_python.pix.models.CallbackRetrieveFilter import CallbackRetrieveFilter
+from inter_sdk_python.pix.models.DetailedDevolution import DetailedDevolution
+from inter_sdk_python.pix.models.DetailedDuePixBilling import DetailedDuePixBilling
+from inter_sdk_python.pix.models.DetailedImmediatePixBilling import DetailedImmediatePixBilling
+from inter_sdk_python.pix.models.DevolutionRequestBody import DevolutionRequestBody
+from inter_sdk_python.pix.models.DueBilling import DueBilling
+from inter_sdk_python.pix.models.DueBillingBatch import DueBillingBatch
+from inter_sdk_python.pix.models.DueBillingBatchPage import DueBillingBatchPage
+from inter_sdk_python.pix.models.DueBillingBatchSummary import DueBillingBatchSummary
+from inter_sdk_python.pix.models.DueBillingPage import DueBillingPage
+from inter_sdk_python.pix.models.GeneratedDueBilling import GeneratedDueBilling
+from inter_sdk_python.pix.models.GeneratedImmediateBilling import GeneratedImmediateBilling
+from inter_sdk_python.pix.models.IncludeDueBillingBatchRequest import IncludeDueBillingBatchRequest
+from inter_sdk_python.pix.models.Location import Location
+from inter_sdk_python.pix.models.LocationPage import LocationPage
+from inter_sdk_python.pix.models.Pix import Pix
+from inter_sdk_python.pix.models.PixBilling import PixBilling
+from inter_sdk_python.pix.models.PixCallbackPage import PixCallbackPage
+from inter_sdk_python.pix.models.PixPage import PixPage
+from inter_sdk_python.pix.models.RetrieveCallbackResponse import RetrieveCallbackResponse
+from inter_sdk_python.pix.models.RetrieveDueBillingFilter import RetrieveDueBillingFilter
+from inter_sdk_python.pix.models.RetrieveImmediateBillingsFilter import RetrieveImmediateBillingsFilter
+from inter_sdk_python.pix.models.RetrieveLocationFilter import RetrieveLocationFilter
+from inter_sdk_python.pix.models.RetrievedPixFilter import RetrievedPixFilter
+from inter_sdk_python.pix.pix.PixClient import PixClient
+from inter_sdk_python.pix.webhooks.PixWebhookClient import PixWebhookClient
+
+
+class AsyncPixSdk:
+    """
+    The AsyncPixSdk class is the asyncio version of PixSdk, with the same
+    methods, arguments and models. Calls are sent on the event loop by the
+    AsyncHttpClient of AsyncInterSdk and the iter_* methods return async
+    iterators retrieving the pages as tasks.
+
+    The resumable and sharded iterators, which keep their progress in local
+    files, run the blocking PixSdk on the executor of AsyncInterSdk, through
+    AsyncSdkProxy, under the same names.
+    """
+
+    def __init__(self, config: Config, http: AsyncHttpClient, blocking: AsyncSdkProxy):
+        """
+        Args:
+            config (Config): The configuration object containing client information.
+            http (AsyncHttpClient): The client sending the calls.
+            blocking (AsyncSdkProxy): The PixSdk running on the executor, for the methods without a native version.
+        """
+        self.config = config
+        self.http = http
+        self.blocking = blocking
+        self.due_billing_client = DueBillingClient()
+        self.immediate_billing_client = ImmediateBillingClient()
+        self.location_client = LocationClient()
+        self.pix_client = PixClient()
+        self.pix_webhook_client = PixWebhookClient()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.blocking, name)
+
+    async def include_due_pix_billing(self, txid: str, billing: DueBilling) -> GeneratedDueBilling:
+        """
+        Includes a due billing entry for a PIX transaction.
+
+        Args:
+            txid (str): The transaction ID associated with the due billing.
+            billing (DueBilling): The DueBilling object containing the billing details to be included.
+
+        Returns:
+            GeneratedDueBilling: A GeneratedDueBilling object containing the details of the included due billing.
+
+        Raises:
+            SdkException: If an error occurs during the inclusion process.
+        """
+        logging.info("IncludeDueBilling {} {}".format(self.config.client_id, txid))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_SCHEDULED_BILLINGS)}/{txid}"
+
+        json_data = JsonCodec.of(self.config).dumps(billing.to_dict())
+        json_response = await self.http.call_put(url, Constants.PIX_SCHEDULED_BILLING_WRITE_SCOPE, "Error including due billing", json_data)
+        return GeneratedDueBilling.from_dict(json_response)
+
+    async def retrieve_due_pix_billing(self, txid: str) -> DetailedDuePixBilling:
+        """
+        Retrieves the detailed due billing information for a specific PIX transaction.
+
+        Args:
+            txid (str): The transaction ID associated with the due billing to be retrieved.
+
+        Returns:
+            DetailedDuePixBilling: A DetailedDuePixBilling object containing the details of the retrieved due billing.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveDueBilling {} txId={}".format(self.config.client_id, txid))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_SCHEDULED_BILLINGS)}/{txid}"
+
+        json_response = await self.http.call_get(url, Constants.PIX_SCHEDULED_BILLING_READ_SCOPE, "Error retrieving due billing")
+        return DetailedDuePixBilling.from_dict(json_response)
+
+    async def retrieve_due_billing_collection_in_range(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveDueBillingFilter
+    ) -> List[DetailedDuePixBilling]:
+        """
+        Retrieves a list of detailed due billing entries for a specified period, applying optional filters.
+
+        Args:
+            initial_date (str): The starting date for the billing collection retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing collection retrieval. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveDueBillingFilter]): Optional filter criteria to refine the billing collection retrieval.
+
+        Returns:
+            List[DetailedDuePixBilling]: A list of DetailedDuePixBilling objects containing the retrieved billing information.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        return await AsyncPaginationUtils.collect(
+            self.config,
+            lambda page: self._get_due_billing_page(initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.due_billings
+        )
+
+    def iter_due_billing_collection_in_range(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveDueBillingFilter
+    ) -> AsyncIterator[DetailedDuePixBilling]:
+        """
+        Yields the due billings for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the billing collection retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing collection retrieval. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveDueBillingFilter]): Optional filter criteria to refine the billing collection retrieval.
+
+        Returns:
+            AsyncIterator[DetailedDuePixBilling]: The due billings, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveDueBillingList {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        return AsyncPaginationUtils.iterate(
+            self.config,
+            lambda page: self._get_due_billing_page(initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.due_billings
+        )
+
+    async def retrieve_due_billing_collection_page(
+        self,
+        initial_date: str,
+        final_date: str,
+        page: int,
+        page_size: int,
+        filter: RetrieveDueBillingFilter
+    ) -> DueBillingPage:
+        """
+        Retrieves a paginated collection of due billing entries for a specified period, applying optional filters.
+
+        Args:
+            initial_date (str): The starting date for the billing collection retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing collection retrieval. Format: YYYY-MM-DD.
+            page (int): The page number for pagination.
+            page_size (Optional[int]): The number of items per page. If None, a default size will be used.
+            filter (Optional[RetrieveDueBillingFilter]): Optional filter criteria to refine the billing collection retrieval.
+
+        Returns:
+            DueBillingPage: A DueBillingPage object containing the paginated list of retrieved due billing entries.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveDueBillingList {} {}-{} page={}".format(self.config.client_id, initial_date, final_date, page))
+
+        return await self._get_due_billing_page(initial_date, final_date, page, page_size, filter)
+
+    async def review_due_pix_billing(self, txid: str, billing: DueBilling) -> GeneratedDueBilling:
+        """
+        Reviews a due billing entry for a PIX transaction.
+
+        Args:
+            txid (str): The transaction ID associated with the due billing to be reviewed.
+            billing (DueBilling): The DueBilling object containing the billing details to be reviewed.
+
+        Returns:
+            GeneratedDueBilling: A GeneratedDueBilling object containing the details of the reviewed due billing.
+
+        Raises:
+            SdkException: If an error occurs during the review process.
+        """
+        logging.info("ReviewDueBilling {} {}".format(self.config.client_id, txid))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_SCHEDULED_BILLINGS)}/{txid}"
+
+        json_data = JsonCodec.of(self.config).dumps(billing.to_dict())
+        json_response = await self.http.call_patch(url, Constants.PIX_SCHEDULED_BILLING_WRITE_SCOPE, "Error retrieving due billing", json_data)
+        return GeneratedDueBilling.from_dict(json_response)
+
+    async def include_due_billing_batch(self, txid: str, batch_request: IncludeDueBillingBatchRequest) -> None:
+        """
+        Includes a batch of due billing entries for a specific PIX transaction.
+
+        Args:
+            txid (str): The transaction ID associated with the due billing batch.
+            batch_request (IncludeDueBillingBatchRequest): The IncludeDueBillingBatchRequest object containing the details of the billing batch to be included.
+
+        Raises:
+            SdkException: If an error occurs during the inclusion process.
+        """
+        logging.info("IncludeDueBillingBatch {} {}".format(self.config.client_id, batch_request))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_SCHEDULED_BILLINGS_BATCH)}/{txid}"
+
+        json_data = JsonCodec.of(self.config).dumps(batch_request.to_dict())
+        await self.http.call_put(url, Constants.PIX_SCHEDULED_BILLING_BATCH_WRITE_SCOPE, "Error including due billing in batch", json_data)
+
+    async def retrieve_due_billing_batch(self, id: str) -> DueBillingBatch:
+        """
+        Retrieves a due billing batch by its identifier.
+
+        Args:
+            id (str): The identifier of the billing batch to be retrieved.
+
+        Returns:
+            DueBillingBatch: A DueBillingBatch object containing the details of the retrieved billing batch.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveDueBillingBatch {} id={}".format(self.config.client_id, id))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_SCHEDULED_BILLINGS_BATCH)}/{id}"
+
+        json_response = await self.http.call_get(url, Constants.PIX_SCHEDULED_BILLING_BATCH_READ_SCOPE, "Error retrieving due billing batch")
+        return DueBillingBatch.from_dict(json_response)
+
+    async def retrieve_due_billing_batch_collection_page(
+        self,
+        initial_date: str,
+        final_date: str,
+        page: int,
+        page_size: int
+    ) -> DueBillingBatchPage:
+        """
+        Retrieves a paginated collection of due billing batches for a specified period.
+
+        Args:
+            initial_date (str): The starting date for the billing batch collection retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing batch collection retrieval. Format: YYYY-MM-DD.
+            page (int): The page number for pagination.
+            page_size (Optional[int]): The number of items per page. If None, a default size will be used.
+
+        Returns:
+            DueBillingBatchPage: A DueBillingBatchPage object containing the paginated list of retrieved due billing batches.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveDueBillingBatchList {} {}-{} page={}".format(self.config.client_id, initial_date, final_date, page))
+
+        return await self._get_due_billing_batch_page(initial_date, final_date, page, page_size)
+
+    async def retrieve_due_billing_batch_collection_in_range(
+        self,
+        initial_date: str,
+        final_date: str
+    ) -> List[DueBillingBatch]:
+        """
+        Retrieves a list of due billing batches for a specified period.
+
+        Args:
+            initial_date (str): The starting date for the billing batch collection retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing batch collection retrieval. Format: YYYY-MM-DD.
+
+        Returns:
+            List[DueBillingBatch]: A list of DueBillingBatch objects containing the retrieved billing batches.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        return await AsyncPaginationUtils.collect(
+            self.config,
+            lambda page: self._get_due_billing_batch_page(initial_date, final_date, page, None),
+            lambda current_page: current_page.batches
+        )
+
+    def iter_due_billing_batch_collection_in_range(
+        self,
+        initial_date: str,
+        final_date: str
+    ) -> AsyncIterator[DueBillingBatch]:
+        """
+        Yields the due billing batches for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the billing batch collection retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing batch collection retrieval. Format: YYYY-MM-DD.
+
+        Returns:
+            AsyncIterator[DueBillingBatch]: The due billing batches, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveDueBillingBatchList {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        return AsyncPaginationUtils.iterate(
+            self.config,
+            lambda page: self._get_due_billing_batch_page(initial_date, final_date, page, None),
+            lambda current_page: current_page.batches
+        )
+
+    async def retrieve_due_billing_batch_by_situation(self, id: str, situation: str) -> DueBillingBatch:
+        """
+        Retrieves the situation of a specific due billing batch by its identifier.
+
+        Args:
+            id (str): The identifier of the billing batch whose situation is to be retrieved.
+            situation (str): The specific situation to filter the results.
+
+        Returns:
+            DueBillingBatch: A DueBillingBatch object containing the details of the retrieved billing batch situation.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveDueBillingBatchSituation {} id={}".format(self.config.client_id, id))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_SCHEDULED_BILLINGS_BATCH)}/{id}/situacao/{situation}"
+
+        json_response = await self.http.call_get(
+            url, Constants.PIX_SCHEDULED_BILLING_BATCH_READ_SCOPE, "Error retrieving due billing batch by situation"
+        )
+        return DueBillingBatch.from_dict(json_response)
+
+    async def retrieve_due_billing_batch_summary(self, id: str) -> DueBillingBatchSummary:
+        """
+        Retrieves the summary of a specific due billing batch by its identifier.
+
+        Args:
+            id (str): The identifier of the billing batch whose summary is to be retrieved.
+
+        Returns:
+            DueBillingBatchSummary: A DueBillingBatchSummary object containing the summary details of the retrieved billing batch.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveDueBillingBatch {} id={}".format(self.config.client_id, id))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_SCHEDULED_BILLINGS_BATCH)}/{id}/sumario"
+
+        json_response = await self.http.call_get(
+            url, Constants.PIX_SCHEDULED_BILLING_BATCH_READ_SCOPE, "Error retrieving due billing batch summary"
+        )
+        return DueBillingBatchSummary.from_dict(json_response)
+
+    async def review_due_billing_batch(self, id: str, request: IncludeDueBillingBatchRequest) -> None:
+        """
+        Reviews a due billing batch identified by its ID.
+
+        Args:
+            id (str): The identifier of the billing batch to be reviewed.
+            request (IncludeDueBillingBatchRequest): The IncludeDueBillingBatchRequest object containing details for the review process.
+
+        Raises:
+            SdkException: If an error occurs during the review process.
+        """
+        logging.info("IncludeDueBillingBatch {} {}".format(self.config.client_id, request))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_SCHEDULED_BILLINGS_BATCH)}/{id}"
+
+        json_data = JsonCodec.of(self.config).dumps(request.to_dict())
+        await self.http.call_patch(url, Constants.PIX_SCHEDULED_BILLING_BATCH_WRITE_SCOPE, "Error reviewing due billing in batch", json_data)
+
+    async def include_immediate_billing(self, billing: PixBilling) -> GeneratedImmediateBilling:
+        """
+        Includes an immediate billing entry for a PIX transaction.
+
+        Args:
+            billing (PixBilling): The PixBilling object containing the details of the immediate billing to be included.
+
+        Returns:
+            GeneratedImmediateBilling: A GeneratedImmediateBilling object containing the details of the included immediate billing.
+
+        Raises:
+            SdkException: If an error occurs during the inclusion process.
+        """
+        logging.info("IncludeImmediateBilling {} {}".format(self.config.client_id, billing.txid))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_PIX_IMMEDIATE_BILLINGS)
+
+        json_data = JsonCodec.of(self.config).dumps(billing.to_dict())
+        if billing.txid is None:
+            json_response = await self.http.call_post(url, Constants.PIX_IMMEDIATE_BILLING_WRITE_SCOPE, "Error including immediate billing", json_data)
+        else:
+            url += f"/{billing.txid}"
+            json_response = await self.http.call_put(url, Constants.PIX_IMMEDIATE_BILLING_WRITE_SCOPE, "Error including immediate billing", json_data)
+        return GeneratedImmediateBilling.from_dict(json_response)
+
+    async def retrieve_immediate_billing(self, txid: str) -> DetailedImmediatePixBilling:
+        """
+        Retrieves the details of an immediate billing entry by its transaction ID.
+
+        Args:
+            txid (str): The transaction ID associated with the immediate billing to be retrieved.
+
+        Returns:
+            DetailedImmediatePixBilling: A DetailedImmediatePixBilling object containing the details of the retrieved immediate billing.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveImmediateBilling {} txId={}".format(self.config.client_id, txid))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_IMMEDIATE_BILLINGS)}/{txid}"
+
+        json_response = await self.http.call_get(url, Constants.PIX_IMMEDIATE_BILLING_READ_SCOPE, "Error retrieving immediate billing")
+        return DetailedImmediatePixBilling.from_dict(json_response)
+
+    async def retrieve_immediate_billing_list(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveImmediateBillingsFilter
+    ) -> List[DetailedImmediatePixBilling]:
+        """
+        Retrieves a list of detailed immediate billing entries for a specified period, optionally filtered.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of immediate billings. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of immediate billings. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveImmediateBillingsFilter]): The filter criteria for retrieving the immediate billings.
+
+        Returns:
+            List[DetailedImmediatePixBilling]: A list of DetailedImmediatePixBilling objects containing the details of the retrieved immediate billings.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        return await AsyncPaginationUtils.collect(
+            self.config,
+            lambda page: self._get_immediate_billing_page(initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.billings
+        )
+
+    def iter_immediate_billing_list(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveImmediateBillingsFilter
+    ) -> AsyncIterator[DetailedImmediatePixBilling]:
+        """
+        Yields the immediate billings for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of immediate billings. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of immediate billings. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveImmediateBillingsFilter]): The filter criteria for retrieving the immediate billings.
+
+        Returns:
+            AsyncIterator[DetailedImmediatePixBilling]: The immediate billings, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveImmediateBillingList {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        return AsyncPaginationUtils.iterate(
+            self.config,
+            lambda page: self._get_immediate_billing_page(initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.billings
+        )
+
+    async def retrieve_immediate_billing_page(
+        self,
+        initial_date: str,
+        final_date: str,
+        page: int,
+        page_size: int,
+        filter: RetrieveImmediateBillingsFilter
+    ) -> BillingPage:
+        """
+        Retrieves a paginated list of immediate billing entries for a specified period, optionally filtered.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of immediate billings. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of immediate billings. Format: YYYY-MM-DD.
+            page (int): The page number for pagination.
+            page_size (Optional[int]): The number of items per page. If None, a default size will be used.
+            filter (Optional[RetrieveImmediateBillingsFilter]): The filter criteria for retrieving the immediate billings.
+
+        Returns:
+            BillingPage: A BillingPage object containing the paginated list of retrieved immediate billings.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveImmediateBillingList {} {}-{} page={}".format(self.config.client_id, initial_date, final_date, page))
+
+        return await self._get_immediate_billing_page(initial_date, final_date, page, page_size, filter)
+
+    async def review_immediate_billing(self, billing: PixBilling) -> GeneratedImmediateBilling:
+        """
+        Reviews an immediate billing entry for a PIX transaction.
+
+        Args:
+            billing (PixBilling): The PixBilling object containing the details of the immediate billing to be reviewed.
+
+        Returns:
+            GeneratedImmediateBilling: A GeneratedImmediateBilling object containing the details of the reviewed immediate billing.
+
+        Raises:
+            SdkException: If an error occurs during the review process.
+        """
+        logging.info("ReviewImmediateBilling {} {}".format(self.config.client_id, billing.txid))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_IMMEDIATE_BILLINGS)}/{billing.txid}"
+
+        json_data = JsonCodec.of(self.config).dumps(billing.to_dict())
+        json_response = await self.http.call_patch(url, Constants.PIX_IMMEDIATE_BILLING_WRITE_SCOPE, "Error reviewing immediate billing", json_data)
+        return GeneratedImmediateBilling.from_dict(json_response)
+
+    async def include_location(self, immediate_billing_type: ImmediateBillingType) -> Location:
+        """
+        Includes a location associated with an immediate billing type.
+
+        Args:
+            immediate_billing_type (ImmediateBillingType): The ImmediateBillingType object containing the details of the location to be included.
+
+        Returns:
+            Location: A Location object containing the details of the included location.
+
+        Raises:
+            SdkException: If an error occurs during the inclusion process.
+        """
+        logging.info("IncludeLocation pix {} {}".format(self.config.client_id, immediate_billing_type))
+
+        url = UrlUtils.build_url(self.config, Constants.URL_PIX_LOCATIONS)
+
+        json_data = JsonCodec.of(self.config).dumps({"tipoCob": immediate_billing_type.name})
+        json_response = await self.http.call_post(url, Constants.PIX_LOCATION_WRITE_SCOPE, "Error including location", json_data)
+        return Location.from_dict(json_response)
+
+    async def retrieve_location(self, location_id: str) -> Location:
+        """
+        Retrieves a location by its identifier.
+
+        Args:
+            location_id (str): The identifier of the location to be retrieved.
+
+        Returns:
+            Location: A Location object containing the details of the retrieved location.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveLocation {} id={}".format(self.config.client_id, location_id))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_LOCATIONS)}/{location_id}"
+
+        json_response = await self.http.call_get(url, Constants.PIX_LOCATION_READ_SCOPE, "Error retrieving location")
+        return Location.from_dict(json_response)
+
+    async def retrieve_locations_list(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveLocationFilter
+    ) -> List[Location]:
+        """
+        Retrieves a list of locations for a specified period, optionally filtered.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of locations. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of locations. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveLocationFilter]): The filter criteria for retrieving the locations.
+
+        Returns:
+            List[Location]: A list of Location objects containing the details of the retrieved locations.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        return await AsyncPaginationUtils.collect(
+            self.config,
+            lambda page: self._get_location_page(initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.locations
+        )
+
+    def iter_locations_list(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveLocationFilter
+    ) -> AsyncIterator[Location]:
+        """
+        Yields the locations for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of locations. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of locations. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveLocationFilter]): The filter criteria for retrieving the locations.
+
+        Returns:
+            AsyncIterator[Location]: The locations, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveLocationsList {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        return AsyncPaginationUtils.iterate(
+            self.config,
+            lambda page: self._get_location_page(initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.locations
+        )
+
+    async def retrieve_locations_page(
+        self,
+        initial_date: str,
+        final_date: str,
+        page: int,
+        page_size: int,
+        filter: RetrieveLocationFilter
+    ) -> LocationPage:
+        """
+        Retrieves a paginated list of locations for a specified period, optionally filtered.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of locations. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of locations. Format: YYYY-MM-DD.
+            page (int): The page number for pagination.
+            page_size (Optional[int]): The number of items per page. If None, a default size will be used.
+            filter (Optional[RetrieveLocationFilter]): The filter criteria for retrieving the locations.
+
+        Returns:
+            LocationPage: A LocationPage object containing the paginated list of retrieved locations.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveLocationsList {} {}-{} pagina={}".format(self.config.client_id, initial_date, final_date, page))
+
+        return await self._get_location_page(initial_date, final_date, page, page_size, filter)
+
+    async def unlink_location(self, id: str) -> Location:
+        """
+        Unlinks a location by its identifier.
+
+        Args:
+            id (str): The identifier of the location to be unlinked.
+
+        Returns:
+            Location: A Location object containing the details of the unlinked location.
+
+        Raises:
+            SdkException: If an error occurs during the unlinking process.
+        """
+        logging.info("UnlinkLocation {} id={}".format(self.config.client_id, id))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_LOCATIONS)}/{id}/txid"
+
+        json_response = await self.http.call_delete(url, Constants.PIX_LOCATION_WRITE_SCOPE, "Error unlinking location")
+        return Location.from_dict(json_response)
+
+    async def request_devolution(
+        self,
+        e2e_id: str,
+        id: str,
+        devolution_request_body: DevolutionRequestBody
+    ) -> DetailedDevolution:
+        """
+        Requests a devolution for a specific transaction.
+
+        Args:
+            e2e_id (str): The end-to-end identifier for the transaction.
+            id (str): The identifier of the devolution request.
+            devolution_request_body (DevolutionRequestBody): The body containing the details for the devolution request.
+
+        Returns:
+            DetailedDevolution: A DetailedDevolution object containing the details of the requested devolution.
+
+        Raises:
+            SdkException: If an error occurs during the request process.
+        """
+        logging.info("RequestDevolution {} e2eId={} id={}".format(self.config.client_id, e2e_id, id))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_PIX)}/{e2e_id}/devolucao/{id}"
+
+        json_data = JsonCodec.of(self.config).dumps(devolution_request_body.to_dict())
+        json_response = await self.http.call_put(url, Constants.PIX_WRITE_SCOPE, "Error requesting devolution", json_data)
+        return DetailedDevolution.from_dict(json_response)
+
+    async def retrieve_devolution(self, e2e_id: str, id: str) -> DetailedDevolution:
+        """
+        Retrieves the details of a specific devolution by its identifiers.
+
+        Args:
+            e2e_id (str): The end-to-end identifier for the transaction.
+            id (str): The identifier of the devolution to be retrieved.
+
+        Returns:
+            DetailedDevolution: A DetailedDevolution object containing the details of the retrieved devolution.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveDevolution {} e2eId={} id={}".format(self.config.client_id, e2e_id, id))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_PIX)}/{e2e_id}/devolucao/{id}"
+
+        json_response = await self.http.call_get(url, Constants.PIX_READ_SCOPE, "Error retrieving devolution")
+        return DetailedDevolution.from_dict(json_response)
+
+    async def retrieve_pix_list(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrievedPixFilter
+    ) -> List[Pix]:
+        """
+        Retrieves a list of PIX transactions for a specified period, optionally filtered.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of PIX transactions. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of PIX transactions. Format: YYYY-MM-DD.
+            filter (Optional[RetrievedPixFilter]): The filter criteria for retrieving the PIX transactions.
+
+        Returns:
+            List[Pix]: A list of Pix objects containing the details of the retrieved PIX transactions.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        return await AsyncPaginationUtils.collect(
+            self.config,
+            lambda page: self._get_pix_page(initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.pix_list
+        )
+
+    def iter_pix_list(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrievedPixFilter
+    ) -> AsyncIterator[Pix]:
+        """
+        Yields the Pix transactions for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of PIX transactions. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of PIX transactions. Format: YYYY-MM-DD.
+            filter (Optional[RetrievedPixFilter]): The filter criteria for retrieving the PIX transactions.
+
+        Returns:
+            AsyncIterator[Pix]: The Pix transactions, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrievePixList {} {}-{}".format(self.config.client_id, initial_date, final_date))
+
+        return AsyncPaginationUtils.iterate(
+            self.config,
+            lambda page: self._get_pix_page(initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.pix_list
+        )
+
+    async def retrieve_pix_page(
+        self,
+        initial_date: str,
+        final_date: str,
+        page: int,
+        page_size: int,
+        filter: RetrievedPixFilter
+    ) -> PixPage:
+        """
+        Retrieves a paginated list of PIX transactions for a specified period, optionally filtered.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of PIX transactions. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of PIX transactions. Format: YYYY-MM-DD.
+            page (int): The page number for pagination.
+            page_size (Optional[int]): The number of items per page. If None, a default size will be used.
+            filter (Optional[RetrievedPixFilter]): The filter criteria for retrieving the PIX transactions.
+
+        Returns:
+            PixPage: A PixPage object containing the paginated list of retrieved PIX transactions.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrievePixList {} {}-{} page={}".format(self.config.client_id, initial_date, final_date, page))
+
+        return await self._get_pix_page(initial_date, final_date, page, page_size, filter)
+
+    async def retrieve_pix(self, e2e_id: str) -> Pix:
+        """
+        Retrieves the details of a specific PIX transaction by its end-to-end identifier.
+
+        Args:
+            e2e_id (str): The end-to-end identifier for the PIX transaction.
+
+        Returns:
+            Pix: A Pix object containing the details of the retrieved PIX transaction.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrievePix {} e2eId={}".format(self.config.client_id, e2e_id))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_PIX)}/{e2e_id}"
+
+        json_response = await self.http.call_get(url, Constants.PIX_READ_SCOPE, "Error retrieving pix")
+        return Pix.from_dict(json_response)
+
+    async def retrieve_callbacks_in_range(
+        self,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: CallbackRetrieveFilter
+    ) -> List[RetrieveCallbackResponse]:
+        """
+        Retrieves a list of callback responses for a specified period, optionally filtered.
+
+        Args:
+            initial_date_hour (str): The starting date and hour for the retrieval of callbacks. Format: YYYY-MM-DD HH:mm.
+            final_date_hour (str): The ending date and hour for the retrieval of callbacks. Format: YYYY-MM-DD HH:mm.
+            filter (Optional[CallbackRetrieveFilter]): The filter criteria for retrieving the callback responses.
+
+        Returns:
+            List[RetrieveCallbackResponse]: A list of RetrieveCallbackResponse objects containing the details of the retrieved callbacks.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        return await AsyncPaginationUtils.collect(
+            self.config,
+            lambda page: self._get_callback_page(initial_date_hour, final_date_hour, page, None, filter),
+            lambda current_page: current_page.data
+        )
+
+    def iter_callbacks_in_range(
+        self,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: CallbackRetrieveFilter
+    ) -> AsyncIterator[RetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date_hour (str): The starting date and hour for the retrieval of callbacks. Format: YYYY-MM-DD HH:mm.
+            final_date_hour (str): The ending date and hour for the retrieval of callbacks. Format: YYYY-MM-DD HH:mm.
+            filter (Optional[CallbackRetrieveFilter]): The filter criteria for retrieving the callback responses.
+
+        Returns:
+            AsyncIterator[RetrieveCallbackResponse]: The callbacks, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveCallbacks pix {} {}-{}".format(self.config.client_id, initial_date_hour, final_date_hour))
+
+        return AsyncPaginationUtils.iterate(
+            self.config,
+            lambda page: self._get_callback_page(initial_date_hour, final_date_hour, page, None, filter),
+            lambda current_page: current_page.data
+        )
+
+    async def retrieve_callbacks_page(
+        self,
+        initial_date_hour: str,
+        final_date_hour: str,
+        page: int,
+        page_size: int,
+        filter: CallbackRetrieveFilter
+    ) -> PixCallbackPage:
+        """
+        Retrieves a paginated list of callback responses for a specified period, optionally filtered.
+
+        Args:
+            initial_date_hour (str): The starting date and hour for the retrieval of callbacks. Format: YYYY-MM-DD HH:mm.
+            final_date_hour (str): The ending date and hour for the retrieval of callbacks. Format: YYYY-MM-DD HH:mm.
+            page (int): The page number for pagination.
+            page_size (Optional[int]): The number of items per page. If None, a default size will be used.
+            filter (Optional[CallbackRetrieveFilter]): The filter criteria for retrieving the callback responses.
+
+        Returns:
+            PixCallbackPage: A PixCallbackPage object containing the paginated list of retrieved callbacks.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveCallbacks pix {} {}-{}".format(self.config.client_id, initial_date_hour, final_date_hour))
+
+        return await self._get_callback_page(initial_date_hour, final_date_hour, page, page_size, filter)
+
+    async def include_webhook(self, key: str, webhook_url: str) -> None:
+        """
+        Includes a new webhook for a specified key.
+
+        Args:
+            key (str): The identifier key for which the webhook is being included.
+            webhook_url (str): The URL of the webhook to be included.
+
+        Raises:
+            SdkException: If an error occurs during the inclusion of the webhook.
+        """
+        logging.info("IncludeWebhook pix {} {} {}".format(self.config.client_id, key, webhook_url))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_WEBHOOK)}/{key}"
+
+        json_data = JsonCodec.of(self.config).dumps(IncludeWebhookRequest(webhook_url=webhook_url).to_dict())
+        await self.http.call_put(url, Constants.PIX_WEBHOOK_WRITE_SCOPE, "Error including webhook", json_data)
+
+    async def retrieve_webhook(self, key: str) -> Webhook:
+        """
+        Retrieves the details of a specific webhook by its identifier key.
+
+        Args:
+            key (str): The identifier key for the webhook to be retrieved.
+
+        Returns:
+            Webhook: A Webhook object containing the details of the retrieved webhook.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        logging.info("RetrieveWebhook pix {} {}".format(self.config.client_id, key))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_WEBHOOK)}/{key}"
+
+        json_response = await self.http.call_get(url, Constants.PIX_WEBHOOK_READ_SCOPE, "Error retrieving webhook")
+        return Webhook.from_dict(json_response)
+
+    async def delete_webhook(self, key: str) -> None:
+        """
+        Deletes a specific webhook identified by its key.
+
+        Args:
+            key (str): The identifier key for the webhook to be deleted.
+
+        Raises:
+            SdkException: If an error occurs during the deletion process.
+        """
+        logging.info("DeleteWebhook pix {} {}".format(self.config.client_id, key))
+
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_WEBHOOK)}/{key}"
+
+        await self.http.call_delete(url, Constants.PIX_WEBHOOK_WRITE_SCOPE, "Error deleting webhook")
+
+    async def _get_due_billing_page(self, initial_date: str, final_date: str, page: int, page_size: Optional[int],
+                                    filter: RetrieveDueBillingFilter) -> DueBillingPage:
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_SCHEDULED_BILLINGS)}?inicio={initial_date}&fim={final_date}&paginacao.paginaAtual={page}"
+        if page_size is not None:
+            url += f"&paginacao.itensPorPagina={page_size}"
+        url += self.due_billing_client.add_filters(filter)
+
+        json_response = await self.http.call_get(url, Constants.PIX_SCHEDULED_BILLING_READ_SCOPE, "Error retrieving due billing")
+        return DueBillingPage.from_dict(json_response)
+
+    async def _get_due_billing_batch_page(self, initial_date: str, final_date: str, page: int, page_size: Optional[int]) -> DueBillingBatchPage:
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_SCHEDULED_BILLINGS_BATCH)}?inicio={initial_date}&fim={final_date}&paginacao.paginaAtual={page}"
+        if page_size is not None:
+            url += f"&paginacao.itensPorPagina={page_size}"
+
+        json_response = await self.http.call_get(url, Constants.PIX_SCHEDULED_BILLING_BATCH_READ_SCOPE, "Error retrieving due billing batch")
+        return DueBillingBatchPage.from_dict(json_response)
+
+    async def _get_immediate_billing_page(self, initial_date: str, final_date: str, page: int, page_size: Optional[int],
+                                          filter: RetrieveImmediateBillingsFilter) -> BillingPage:
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_IMMEDIATE_BILLINGS)}?inicio={initial_date}&fim={final_date}&paginacao.paginaAtual={page}"
+        if page_size is not None:
+            url += f"&paginacao.itensPorPagina={page_size}"
+        url += self.immediate_billing_client.add_filters(filter)
+
+        json_response = await self.http.call_get(url, Constants.PIX_IMMEDIATE_BILLING_READ_SCOPE, "Error retrieving list of immediate billings")
+        return BillingPage.from_dict(json_response)
+
+    async def _get_location_page(self, initial_date: str, final_date: str, page: int, page_size: Optional[int],
+                                 filter: RetrieveLocationFilter) -> LocationPage:
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_LOCATIONS)}?inicio={initial_date}&fim={final_date}&paginacao.paginaAtual={page}"
+        if page_size is not None:
+            url += f"&paginacao.itensPorPagina={page_size}"
+        url += self.location_client.add_filters(filter)
+
+        json_response = await self.http.call_get(url, Constants.PIX_LOCATION_READ_SCOPE, "Error retrieving locations")
+        return LocationPage.from_dict(json_response)
+
+    async def _get_pix_page(self, initial_date: str, final_date: str, page: int, page_size: Optional[int],
+                            filter: RetrievedPixFilter) -> PixPage:
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_PIX)}?inicio={initial_date}&fim={final_date}&paginacao.paginaAtual={page}"
+        if page_size is not None:
+            url += f"&paginacao.itensPorPagina={page_size}"
+        url += self.pix_client.add_filters(filter)
+
+        json_response = await self.http.call_get(url, Constants.PIX_READ_SCOPE, "Error retrieving pix")
+        return PixPage.from_dict(json_response, self.config.lazy_models)
+
+    async def _get_callback_page(self, initial_date_hour: str, final_date_hour: str, page: int, page_size: Optional[int],
+                                 filter: CallbackRetrieveFilter) -> PixCallbackPage:
+        url = f"{UrlUtils.build_url(self.config, Constants.URL_PIX_WEBHOOK_CALLBACKS)}"
+        url += f"?dataHoraInicio={initial_date_hour}&dataHoraFim={final_date_hour}&pagina={page}"
+        if page_size is not None:
+            url += f"&tamanhoPagina={page_size}"
+        url += self.pix_webhook_client.add_filters(filter)
+
+        json_response = await self.http.call_get(url, Constants.PIX_WEBHOOK_READ_SCOPE, "Error retrieving callbacks")
+        return PixCallbackPage.from_dict(json_response)
@@ -1,7 +1,9 @@
-from typing import List
+from datetime import timedelta
+from typing import Iterator, List, Optional
 
 from inter_sdk_python.commons.models.Config import Config
 from inter_sdk_python.commons.models.Webhook import Webhook
+from inter_sdk_python.commons.utils.DateRangeSharder import DateRangeSharder
 from inter_sdk_python.pix.duebilling.DueBillingClient import DueBillingClient
 from inter_sdk_python.pix.duebillingbatch.DueBillingBatchClient import DueBillingBatchClient
 from inter_sdk_python.pix.enums.ImmediateBillingType import ImmediateBillingType
@@ -108,6 +110,62 @@ class PixSdk:
 
         return self.due_billing_client.retrieve_due_billings_in_range(self.config, initial_date, final_date, filter)
 
+    def iter_due_billing_collection_in_range(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveDueBillingFilter
+    ) -> Iterator[DetailedDuePixBilling]:
+        """
+        Yields the due billings for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the billing collection retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing collection retrieval. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveDueBillingFilter]): Optional filter criteria to refine the billing collection retrieval.
+
+        Returns:
+            Iterator[DetailedDuePixBilling]: The due billings, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.due_billing_client is None:
+            self.due_billing_client = DueBillingClient()
+
+        return self.due_billing_client.iter_due_billings_in_range(self.config, initial_date, final_date, filter)
+
+    def iter_due_billing_collection_resumable(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveDueBillingFilter, 
+        checkpoint_file: str, 
+        page_size: Optional[int] = None
+    ) -> Iterator[DetailedDuePixBilling]:
+        """
+        Yields the due billings for a specific period page by page, resuming after the last page recorded in
+        checkpoint_file, where the progress is saved after each page.
+
+        Args:
+            initial_date (str): The starting date for the billing collection retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing collection retrieval. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveDueBillingFilter]): Optional filter criteria to refine the billing collection retrieval.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[DetailedDuePixBilling]: The due billings not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.due_billing_client is None:
+            self.due_billing_client = DueBillingClient()
+
+        return self.due_billing_client.iter_due_billings_resumable(self.config, initial_date, final_date, filter, checkpoint_file, page_size)
+
     def retrieve_due_billing_collection_page(
         self,
         initial_date: str,
@@ -240,6 +298,58 @@ class PixSdk:
 
         return self.due_billing_batch_client.retrieve_due_billing_batches_in_range(self.config, initial_date, final_date)
 
+    def iter_due_billing_batch_collection_in_range(
+        self,
+        initial_date: str,
+        final_date: str
+    ) -> Iterator[DueBillingBatch]:
+        """
+        Yields the due billing batches for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the billing batch collection retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing batch collection retrieval. Format: YYYY-MM-DD.
+
+        Returns:
+            Iterator[DueBillingBatch]: The due billing batches, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.due_billing_batch_client is None:
+            self.due_billing_batch_client = DueBillingBatchClient()
+
+        return self.due_billing_batch_client.iter_due_billing_batches_in_range(self.config, initial_date, final_date)
+
+    def iter_due_billing_batch_collection_resumable(
+        self,
+        initial_date: str,
+        final_date: str, 
+        checkpoint_file: str, 
+        page_size: Optional[int] = None
+    ) -> Iterator[DueBillingBatch]:
+        """
+        Yields the due billing batches for a specific period page by page, resuming after the last page recorded in
+        checkpoint_file, where the progress is saved after each page.
+
+        Args:
+            initial_date (str): The starting date for the billing batch collection retrieval. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the billing batch collection retrieval. Format: YYYY-MM-DD.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[DueBillingBatch]: The due billing batches not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.due_billing_batch_client is None:
+            self.due_billing_batch_client = DueBillingBatchClient()
+
+        return self.due_billing_batch_client.iter_due_billing_batches_resumable(self.config, initial_date, final_date, checkpoint_file, page_size)
+
     def retrieve_due_billing_batch_by_situation(self, id: str, situation: str) -> DueBillingBatch:
         """
         Retrieves the situation of a specific due billing batch by its identifier.
@@ -354,6 +464,62 @@ class PixSdk:
 
         return self.immediate_billing_client.retrieve_immediate_billings_in_range(self.config, initial_date, final_date, filter)
 
+    def iter_immediate_billing_list(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveImmediateBillingsFilter
+    ) -> Iterator[DetailedImmediatePixBilling]:
+        """
+        Yields the immediate billings for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of immediate billings. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of immediate billings. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveImmediateBillingsFilter]): The filter criteria for retrieving the immediate billings.
+
+        Returns:
+            Iterator[DetailedImmediatePixBilling]: The immediate billings, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.immediate_billing_client is None:
+            self.immediate_billing_client = ImmediateBillingClient()
+
+        return self.immediate_billing_client.iter_immediate_billings_in_range(self.config, initial_date, final_date, filter)
+
+    def iter_immediate_billing_list_resumable(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveImmediateBillingsFilter, 
+        checkpoint_file: str, 
+        page_size: Optional[int] = None
+    ) -> Iterator[DetailedImmediatePixBilling]:
+        """
+        Yields the immediate billings for a specific period page by page, resuming after the last page recorded in
+        checkpoint_file, where the progress is saved after each page.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of immediate billings. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of immediate billings. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveImmediateBillingsFilter]): The filter criteria for retrieving the immediate billings.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[DetailedImmediatePixBilling]: The immediate billings not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.immediate_billing_client is None:
+            self.immediate_billing_client = ImmediateBillingClient()
+
+        return self.immediate_billing_client.iter_immediate_billings_resumable(self.config, initial_date, final_date, filter, checkpoint_file, page_size)
+
     def retrieve_immediate_billing_page(
         self,
         initial_date: str,
@@ -462,6 +628,62 @@ class PixSdk:
 
         return self.location_client.retrieve_location_in_range(self.config, initial_date, final_date, filter)
 
+    def iter_locations_list(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveLocationFilter
+    ) -> Iterator[Location]:
+        """
+        Yields the locations for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of locations. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of locations. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveLocationFilter]): The filter criteria for retrieving the locations.
+
+        Returns:
+            Iterator[Location]: The locations, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.location_client is None:
+            self.location_client = LocationClient()
+
+        return self.location_client.iter_location_in_range(self.config, initial_date, final_date, filter)
+
+    def iter_locations_list_resumable(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveLocationFilter, 
+        checkpoint_file: str, 
+        page_size: Optional[int] = None
+    ) -> Iterator[Location]:
+        """
+        Yields the locations for a specific period page by page, resuming after the last page recorded in
+        checkpoint_file, where the progress is saved after each page.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of locations. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of locations. Format: YYYY-MM-DD.
+            filter (Optional[RetrieveLocationFilter]): The filter criteria for retrieving the locations.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[Location]: The locations not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.location_client is None:
+            self.location_client = LocationClient()
+
+        return self.location_client.iter_location_resumable(self.config, initial_date, final_date, filter, checkpoint_file, page_size)
+
     def retrieve_locations_page(
         self,
         initial_date: str,
@@ -578,6 +800,93 @@ class PixSdk:
 
         return self.pix_client.retrieve_pix_list_in_range(self.config, initial_date, final_date, filter)
 
+    def iter_pix_list(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrievedPixFilter
+    ) -> Iterator[Pix]:
+        """
+        Yields the Pix transactions for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of PIX transactions. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of PIX transactions. Format: YYYY-MM-DD.
+            filter (Optional[RetrievedPixFilter]): The filter criteria for retrieving the PIX transactions.
+
+        Returns:
+            Iterator[Pix]: The Pix transactions, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.pix_client is None:
+            self.pix_client = PixClient()
+
+        return self.pix_client.iter_pix_list_in_range(self.config, initial_date, final_date, filter)
+
+    def iter_pix_list_resumable(
+        self,
+        initial_date: str,
+        final_date: str,
+        filter: RetrievedPixFilter, 
+        checkpoint_file: str, 
+        page_size: Optional[int] = None
+    ) -> Iterator[Pix]:
+        """
+        Yields the Pix transactions for a specific period page by page, resuming after the last page recorded in
+        checkpoint_file, where the progress is saved after each page.
+
+        Args:
+            initial_date (str): The starting date for the retrieval of PIX transactions. Format: YYYY-MM-DD.
+            final_date (str): The ending date for the retrieval of PIX transactions. Format: YYYY-MM-DD.
+            filter (Optional[RetrievedPixFilter]): The filter criteria for retrieving the PIX transactions.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[Pix]: The Pix transactions not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.pix_client is None:
+            self.pix_client = PixClient()
+
+        return self.pix_client.iter_pix_list_resumable(self.config, initial_date, final_date, filter, checkpoint_file, page_size)
+
+    def iter_pix_list_sharded(
+        self, 
+        initial_date: str, 
+        final_date: str, 
+        filter: RetrievedPixFilter, 
+        shard_size: Optional[timedelta] = None, 
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[Pix]:
+        """
+        Yields the Pix transactions for a long period, split into hour windows retrieved concurrently by up to
+        set_pagination_workers workers. Windows with too many pages are split again and items are
+        yielded in chronological window order.
+
+        Args:
+            initial_date (str): Starting date, format: YYYY-MM-DDTHH:MM:SSZ.
+            final_date (str): Ending date, format: YYYY-MM-DDTHH:MM:SSZ.
+            filter (Optional[RetrievedPixFilter]): The filter criteria for retrieving the PIX transactions.
+            shard_size (Optional[timedelta]): Length of each window - default is one hour.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[Pix]: The Pix transactions, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+        """
+        if self.pix_client is None:
+            self.pix_client = PixClient()
+        
+        return self.pix_client.iter_pix_list_sharded(self.config, initial_date, final_date, filter, shard_size, max_pages_per_shard)
+
     def retrieve_pix_page(
         self,
         initial_date: str,
@@ -650,6 +959,93 @@ class PixSdk:
 
         return self.pix_webhook_sdk.retrieve_callbacks_in_range(self.config, initial_date_hour, final_date_hour, filter)
 
+    def iter_callbacks_in_range(
+        self,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: CallbackRetrieveFilter
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a specific period page by page, without keeping the whole collection in memory.
+
+        Args:
+            initial_date_hour (str): The starting date and hour for the retrieval of callbacks. Format: YYYY-MM-DD HH:mm.
+            final_date_hour (str): The ending date and hour for the retrieval of callbacks. Format: YYYY-MM-DD HH:mm.
+            filter (Optional[CallbackRetrieveFilter]): The filter criteria for retrieving the callback responses.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callbacks, in page order.
+
+        Raises:
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.pix_webhook_sdk is None:
+            self.pix_webhook_sdk = PixWebhookClient()
+
+        return self.pix_webhook_sdk.iter_callbacks_in_range(self.config, initial_date_hour, final_date_hour, filter)
+
+    def iter_callbacks_resumable(
+        self,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: CallbackRetrieveFilter, 
+        checkpoint_file: str, 
+        page_size: Optional[int] = None
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a specific period page by page, resuming after the last page recorded in
+        checkpoint_file, where the progress is saved after each page.
+
+        Args:
+            initial_date_hour (str): The starting date and hour for the retrieval of callbacks. Format: YYYY-MM-DD HH:mm.
+            final_date_hour (str): The ending date and hour for the retrieval of callbacks. Format: YYYY-MM-DD HH:mm.
+            filter (Optional[CallbackRetrieveFilter]): The filter criteria for retrieving the callback responses.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callbacks not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If an error occurs during the retrieval process.
+        """
+        if self.pix_webhook_sdk is None:
+            self.pix_webhook_sdk = PixWebhookClient()
+
+        return self.pix_webhook_sdk.iter_callbacks_resumable(self.config, initial_date_hour, final_date_hour, filter, checkpoint_file, page_size)
+
+    def iter_callbacks_sharded(
+        self, 
+        initial_date_hour: str, 
+        final_date_hour: str, 
+        filter: CallbackRetrieveFilter, 
+        shard_size: Optional[timedelta] = None, 
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callbacks for a long period, split into hour windows retrieved concurrently by up to
+        set_pagination_workers workers. Windows with too many pages are split again and items are
+        yielded in chronological window order.
+
+        Args:
+            initial_date_hour (str): Starting date, format: YYYY-MM-DDTHH:MM:SSZ.
+            final_date_hour (str): Ending date, format: YYYY-MM-DDTHH:MM:SSZ.
+            filter (Optional[CallbackRetrieveFilter]): The filter criteria for retrieving the callback responses.
+            shard_size (Optional[timedelta]): Length of each window - default is one hour.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callbacks, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process.
+        """
+        if self.pix_webhook_sdk is None:
+            self.pix_webhook_sdk = PixWebhookClient()
+        
+        return self.pix_webhook_sdk.iter_callbacks_sharded(self.config, initial_date_hour, final_date_hour, filter, shard_size, max_pages_per_shard)
+
     def retrieve_callbacks_page(
         self,
         initial_date_hour: str,
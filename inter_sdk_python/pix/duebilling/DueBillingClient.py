@@ -1,10 +1,13 @@
 import json
 import logging
-from typing import List
+from typing import Iterator, List, Optional
 
 from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
 from inter_sdk_python.commons.structures.Constants import Constants
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.commons.utils.PaginationUtils import PaginationUtils
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 from inter_sdk_python.pix.models.DetailedDuePixBilling import DetailedDuePixBilling
 from inter_sdk_python.pix.models.DueBilling import DueBilling
@@ -34,7 +37,7 @@ class DueBillingClient:
         url = f"{UrlUtils.build_url(config, Constants.URL_PIX_SCHEDULED_BILLINGS)}/{txid}"
         
         try:
-            json_data = billing.to_json()
+            json_data = JsonCodec.of(config).dumps(billing.to_dict())
             json_response = HttpUtils.call_put(config, url, Constants.PIX_SCHEDULED_BILLING_WRITE_SCOPE, "Error including due billing", json_data)
             return GeneratedDueBilling.from_dict(json_response)
         except json.JSONDecodeError as io_exception:
@@ -116,22 +119,83 @@ class DueBillingClient:
         Returns:
             List[DetailedDuePixBilling]: A list of objects containing all retrieved billings.
 
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        return list(self.iter_due_billings_in_range(config, initial_date, final_date, filter))
+
+    def iter_due_billings_in_range(
+        self, 
+        config: Config, 
+        initial_date: str, 
+        final_date: str, 
+        filter: RetrieveDueBillingFilter
+    ) -> Iterator[DetailedDuePixBilling]:
+        """
+        Yields the scheduled Pix billings within the specified date range page by page, so at most config.pagination_workers
+        pages are kept in memory and the first items are available as soon as the first page is retrieved.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (Optional[RetrieveDueBillingFilter]): Optional filters to be applied during retrieval.
+
+        Returns:
+            Iterator[DetailedDuePixBilling]: The scheduled Pix billings, in page order.
+
         Raises:
             SdkException: If there is an error during the retrieval process, such as network issues
                            or API response errors.
         """
         logging.info("RetrieveDueBillingList {} {}-{}".format(config.client_id, initial_date, final_date))
-        page = 0
-        billings = []
 
-        while True:
-            due_billing_page = self.get_page(config, initial_date, final_date, page, None, filter)
-            billings.extend(due_billing_page.due_billings)
-            page += 1
-            if page >= due_billing_page.total_pages:
-                break
+        yield from PaginationUtils.iterate(
+            config,
+            lambda page: self.get_page(config, initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.due_billings
+        )
+
+    def iter_due_billings_resumable(
+        self,
+        config: Config,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveDueBillingFilter,
+        checkpoint_file: str,
+        page_size: Optional[int] = None
+    ) -> Iterator[DetailedDuePixBilling]:
+        """
+        Yields the scheduled Pix billings within the specified date range, resuming after the last page recorded in
+        checkpoint_file. The checkpoint is saved there after each page, so an interrupted retrieval
+        continues from the next page when called again with the same arguments.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (Optional[RetrieveDueBillingFilter]): Optional filters to be applied during retrieval.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[DetailedDuePixBilling]: The scheduled Pix billings not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveDueBillingList {} {}-{}".format(config.client_id, initial_date, final_date))
 
-        return billings
+        checkpoint = PaginationCheckpoint.of(Constants.URL_PIX_SCHEDULED_BILLINGS, initial_date, final_date, filter, None, page_size)
+        yield from PaginationUtils.iterate_resumable(
+            checkpoint_file,
+            checkpoint,
+            lambda page: self.get_page(config, initial_date, final_date, page, page_size, filter),
+            lambda current_page: current_page.due_billings
+        )
 
     def review_due_billing(self, config: Config, txid: str, billing: DueBilling) -> GeneratedDueBilling:
         """
@@ -153,7 +217,7 @@ class DueBillingClient:
         
         try:
             url = f"{UrlUtils.build_url(config, Constants.URL_PIX_SCHEDULED_BILLINGS)}/{txid}"
-            json_data = billing.to_json()
+            json_data = JsonCodec.of(config).dumps(billing.to_dict())
             json_response = HttpUtils.call_patch(config, url, Constants.PIX_SCHEDULED_BILLING_WRITE_SCOPE, "Error retrieving due billing", json_data)
             return GeneratedDueBilling.from_dict(json_response)
         except json.JSONDecodeError as io_exception:
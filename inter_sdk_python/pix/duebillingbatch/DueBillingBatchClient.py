@@ -1,10 +1,13 @@
 import json
 import logging
-from typing import List
+from typing import Iterator, List, Optional
 
 from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
 from inter_sdk_python.commons.structures.Constants import Constants
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.commons.utils.PaginationUtils import PaginationUtils
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 from inter_sdk_python.pix.models.DueBillingBatch import DueBillingBatch
 from inter_sdk_python.pix.models.DueBillingBatchPage import DueBillingBatchPage
@@ -32,7 +35,7 @@ class DueBillingBatchClient:
         url = f"{UrlUtils.build_url(config, Constants.URL_PIX_SCHEDULED_BILLINGS_BATCH)}/{batch_id}"
         
         try:
-            json_data = request.to_json()
+            json_data = JsonCodec.of(config).dumps(request.to_dict())
             HttpUtils.call_put(config, url, Constants.PIX_SCHEDULED_BILLING_BATCH_WRITE_SCOPE, "Error including due billing in batch", json_data)
         except json.JSONDecodeError as io_exception:
             logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
@@ -109,22 +112,79 @@ class DueBillingBatchClient:
         Returns:
             List[DueBillingBatch]: A list of objects containing all retrieved billing batches.
 
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        return list(self.iter_due_billing_batches_in_range(config, initial_date, final_date))
+
+    def iter_due_billing_batches_in_range(
+        self, 
+        config: Config, 
+        initial_date: str, 
+        final_date: str
+    ) -> Iterator[DueBillingBatch]:
+        """
+        Yields the due billing batches within the specified date range page by page, so at most config.pagination_workers
+        pages are kept in memory and the first items are available as soon as the first page is retrieved.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+
+        Returns:
+            Iterator[DueBillingBatch]: The due billing batches, in page order.
+
         Raises:
             SdkException: If there is an error during the retrieval process, such as network issues
                            or API response errors.
         """
         logging.info("RetrieveDueBillingBatchList {} {}-{}".format(config.client_id, initial_date, final_date))
-        page = 0
-        batches = []
 
-        while True:
-            due_billing_page = self.get_page(config, initial_date, final_date, page, None)
-            batches.extend(due_billing_page.batches)
-            page += 1
-            if page >= due_billing_page.total_pages:
-                break
+        yield from PaginationUtils.iterate(
+            config,
+            lambda page: self.get_page(config, initial_date, final_date, page, None),
+            lambda current_page: current_page.batches
+        )
+
+    def iter_due_billing_batches_resumable(
+        self,
+        config: Config,
+        initial_date: str,
+        final_date: str,
+        checkpoint_file: str,
+        page_size: Optional[int] = None
+    ) -> Iterator[DueBillingBatch]:
+        """
+        Yields the due billing batches within the specified date range, resuming after the last page recorded in
+        checkpoint_file. The checkpoint is saved there after each page, so an interrupted retrieval
+        continues from the next page when called again with the same arguments.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[DueBillingBatch]: The due billing batches not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveDueBillingBatchList {} {}-{}".format(config.client_id, initial_date, final_date))
 
-        return batches
+        checkpoint = PaginationCheckpoint.of(Constants.URL_PIX_SCHEDULED_BILLINGS_BATCH, initial_date, final_date, None, None, page_size)
+        yield from PaginationUtils.iterate_resumable(
+            checkpoint_file,
+            checkpoint,
+            lambda page: self.get_page(config, initial_date, final_date, page, page_size),
+            lambda current_page: current_page.batches
+        )
 
     def review_due_billing_batch(self, config: Config, batch_id: str, request: IncludeDueBillingBatchRequest) -> None:
         """
@@ -143,7 +203,7 @@ class DueBillingBatchClient:
         url = f"{UrlUtils.build_url(config, Constants.URL_PIX_SCHEDULED_BILLINGS_BATCH)}/{batch_id}"
         
         try:
-            json_data = request.to_json()
+            json_data = JsonCodec.of(config).dumps(request.to_dict())
             HttpUtils.call_patch(config, url, Constants.PIX_SCHEDULED_BILLING_BATCH_WRITE_SCOPE, "Error reviewing due billing in batch", json_data)
         except json.JSONDecodeError as io_exception:
             logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
@@ -1,10 +1,13 @@
 import json
 import logging
-from typing import List
+from typing import Iterator, List, Optional
 
 from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
 from inter_sdk_python.commons.structures.Constants import Constants
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.commons.utils.PaginationUtils import PaginationUtils
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 from inter_sdk_python.pix.models.BillingPage import BillingPage
 from inter_sdk_python.pix.models.DetailedImmediatePixBilling import DetailedImmediatePixBilling
@@ -33,7 +36,7 @@ class ImmediateBillingClient:
         url = UrlUtils.build_url(config, Constants.URL_PIX_IMMEDIATE_BILLINGS)
         
         try:
-            json_data = billing.to_json()
+            json_data = JsonCodec.of(config).dumps(billing.to_dict())
             if billing.txid is None:
                 json_response = HttpUtils.call_post(config, url, Constants.PIX_IMMEDIATE_BILLING_WRITE_SCOPE, "Error including immediate billing", json_data)
             else:
@@ -120,22 +123,83 @@ class ImmediateBillingClient:
         Returns:
             List[DetailedImmediatePixBilling]: A list of objects containing all retrieved immediate billings.
 
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        return list(self.iter_immediate_billings_in_range(config, initial_date, final_date, filter))
+
+    def iter_immediate_billings_in_range(
+        self, 
+        config: Config, 
+        initial_date: str, 
+        final_date: str, 
+        filter: RetrieveImmediateBillingsFilter
+    ) -> Iterator[DetailedImmediatePixBilling]:
+        """
+        Yields the immediate billings within the specified date range page by page, so at most config.pagination_workers
+        pages are kept in memory and the first items are available as soon as the first page is retrieved.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (RetrieveImmediateBillingsFilter): An object containing filter criteria.
+
+        Returns:
+            Iterator[DetailedImmediatePixBilling]: The immediate billings, in page order.
+
         Raises:
             SdkException: If there is an error during the retrieval process, such as network issues
                            or API response errors.
         """
         logging.info("RetrieveImmediateBillingList {} {}-{}".format(config.client_id, initial_date, final_date))
-        page = 0
-        cobrancas = []
 
-        while True:
-            billing_page = self.get_page(config, initial_date, final_date, page, None, filter)
-            cobrancas.extend(billing_page.billings)
-            page += 1
-            if page >= billing_page.total_pages:
-                break
+        yield from PaginationUtils.iterate(
+            config,
+            lambda page: self.get_page(config, initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.billings
+        )
+
+    def iter_immediate_billings_resumable(
+        self,
+        config: Config,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveImmediateBillingsFilter,
+        checkpoint_file: str,
+        page_size: Optional[int] = None
+    ) -> Iterator[DetailedImmediatePixBilling]:
+        """
+        Yields the immediate billings within the specified date range, resuming after the last page recorded in
+        checkpoint_file. The checkpoint is saved there after each page, so an interrupted retrieval
+        continues from the next page when called again with the same arguments.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (RetrieveImmediateBillingsFilter): An object containing filter criteria.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[DetailedImmediatePixBilling]: The immediate billings not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveImmediateBillingList {} {}-{}".format(config.client_id, initial_date, final_date))
 
-        return cobrancas
+        checkpoint = PaginationCheckpoint.of(Constants.URL_PIX_IMMEDIATE_BILLINGS, initial_date, final_date, filter, None, page_size)
+        yield from PaginationUtils.iterate_resumable(
+            checkpoint_file,
+            checkpoint,
+            lambda page: self.get_page(config, initial_date, final_date, page, page_size, filter),
+            lambda current_page: current_page.billings
+        )
 
     def review_immediate_billing(self, config: Config, cobranca: PixBilling) -> GeneratedImmediateBilling:
         """
@@ -156,7 +220,7 @@ class ImmediateBillingClient:
         
         try:
             url = f"{UrlUtils.build_url(config, Constants.URL_PIX_IMMEDIATE_BILLINGS)}/{cobranca.txid}"
-            json_data = cobranca.to_json()
+            json_data = JsonCodec.of(config).dumps(cobranca.to_dict())
             
             json_response = HttpUtils.call_patch(config, url, Constants.PIX_IMMEDIATE_BILLING_WRITE_SCOPE, "Error reviewing immediate billing", json_data)
             return GeneratedImmediateBilling.from_dict(json_response)
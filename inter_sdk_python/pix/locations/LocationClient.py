@@ -1,10 +1,13 @@
 import json
 import logging
-from typing import List
+from typing import Iterator, List, Optional
 
 from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
 from inter_sdk_python.commons.structures.Constants import Constants
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.commons.utils.PaginationUtils import PaginationUtils
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 from inter_sdk_python.pix.enums.ImmediateBillingType import ImmediateBillingType
 from inter_sdk_python.pix.models.Location import Location
@@ -34,7 +37,7 @@ class LocationClient:
         request = {"tipoCob": immediate_billing_type.name}
 
         try:
-            json_data = json.dumps(request, indent=4)
+            json_data = JsonCodec.of(config).dumps(request)
             json_response = HttpUtils.call_post(config, url, Constants.PIX_LOCATION_WRITE_SCOPE, "Error including location", json_data)
             return Location.from_dict(json_response)
 
@@ -118,24 +121,83 @@ class LocationClient:
         Returns:
             List[Location]: A list of objects containing all retrieved locations.
 
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        return list(self.iter_location_in_range(config, initial_date, final_date, filter))
+
+    def iter_location_in_range(
+        self, 
+        config: Config, 
+        initial_date: str, 
+        final_date: str, 
+        filter: RetrieveLocationFilter
+    ) -> Iterator[Location]:
+        """
+        Yields the locations within the specified date range page by page, so at most config.pagination_workers
+        pages are kept in memory and the first items are available as soon as the first page is retrieved.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (RetrieveLocationFilter): An object containing filter criteria.
+
+        Returns:
+            Iterator[Location]: The locations, in page order.
+
         Raises:
             SdkException: If there is an error during the retrieval process, such as network issues
                            or API response errors.
         """
         logging.info("RetrieveLocationsList {} {}-{}".format(config.client_id, initial_date, final_date))
-        
-        page = 0
-        locs = []
-        location_page = None
-
-        while True:
-            location_page = self.get_page(config, initial_date, final_date, page, None, filter)
-            locs.extend(location_page.locations)
-            page += 1
-            if page >= location_page.total_pages:
-                break
-        
-        return locs
+
+        yield from PaginationUtils.iterate(
+            config,
+            lambda page: self.get_page(config, initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.locations
+        )
+
+    def iter_location_resumable(
+        self,
+        config: Config,
+        initial_date: str,
+        final_date: str,
+        filter: RetrieveLocationFilter,
+        checkpoint_file: str,
+        page_size: Optional[int] = None
+    ) -> Iterator[Location]:
+        """
+        Yields the locations within the specified date range, resuming after the last page recorded in
+        checkpoint_file. The checkpoint is saved there after each page, so an interrupted retrieval
+        continues from the next page when called again with the same arguments.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (RetrieveLocationFilter): An object containing filter criteria.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[Location]: The locations not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveLocationsList {} {}-{}".format(config.client_id, initial_date, final_date))
+
+        checkpoint = PaginationCheckpoint.of(Constants.URL_PIX_LOCATIONS, initial_date, final_date, filter, None, page_size)
+        yield from PaginationUtils.iterate_resumable(
+            checkpoint_file,
+            checkpoint,
+            lambda page: self.get_page(config, initial_date, final_date, page, page_size, filter),
+            lambda current_page: current_page.locations
+        )
     
     def unlink_location(self, config: Config, id: str) -> Location:
         """
@@ -5,7 +5,7 @@ from inter_sdk_python.pix.models.DetailedImmediatePixBilling import DetailedImme
 from inter_sdk_python.pix.models.Parameters import Parameters
 
 
-@dataclass
+@dataclass(slots=True)
 class BillingPage:
     """
     The BillingPage class represents a paginated response
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class CallbackRetrieveFilter:
     """
     The CallbackRetrieveFilter class is used to filter callback requests
@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.enums.AgentModality import AgentModality
 
 
-@dataclass
+@dataclass(slots=True)
 class Change:
     """
     The Change class represents details regarding change to be
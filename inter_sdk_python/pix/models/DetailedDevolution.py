@@ -5,7 +5,7 @@ from inter_sdk_python.pix.enums.DevolutionNature import DevolutionNature
 from inter_sdk_python.pix.models.CobMoment import CobMoment
 
 
-@dataclass
+@dataclass(slots=True)
 class DetailedDevolution:
     """
     The DetailedDevolution class represents detailed information about a
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Optional, List
 
 from inter_sdk_python.pix.enums.BillingStatus import BillingStatus
@@ -7,7 +7,7 @@ from inter_sdk_python.pix.models.Pix import Pix
 from inter_sdk_python.pix.models.Receiver import Receiver
 
 
-@dataclass
+@dataclass(slots=True)
 class DetailedDuePixBilling(DueBilling):
     """
     The DetailedDuePixBilling class extends the DueBilling
@@ -47,7 +47,7 @@ class DetailedDuePixBilling(DueBilling):
         """
         due_billing = DueBilling.from_dict(data)
         return DetailedDuePixBilling(
-            **due_billing.__dict__,
+            **{item.name: getattr(due_billing, item.name) for item in fields(DueBilling)},
             pix_copy_and_paste=data.get("pixCopiaECola"),
             receiver=Receiver.from_dict(data["recebedor"]) if data.get("recebedor") else None,
             status=BillingStatus(data["status"]) if data.get("status") else None,
@@ -62,7 +62,7 @@ class DetailedDuePixBilling(DueBilling):
         Returns:
             dict: A dictionary representation of the DetailedDuePixBilling instance.
         """
-        due_billing_dict = super().to_dict()
+        due_billing_dict = DueBilling.to_dict(self)
         due_billing_dict.update({
             "pixCopiaECola": self.pix_copy_and_paste,
             "recebedor": self.receiver.to_dict() if self.receiver else None,
@@ -9,7 +9,7 @@ from inter_sdk_python.pix.models.Pix import Pix
 from inter_sdk_python.pix.models.PixValue import PixValue
 
 
-@dataclass
+@dataclass(slots=True)
 class DetailedImmediatePixBilling:
     """
     The DetailedImmediatePixBilling class extends the basic charge details by
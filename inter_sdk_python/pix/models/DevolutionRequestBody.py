@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.enums.DevolutionNature import DevolutionNature
 
 
-@dataclass
+@dataclass(slots=True)
 class DevolutionRequestBody:
     """
     The DevolutionRequestBody class represents the body
@@ -4,7 +4,7 @@ from typing import Optional, List
 from inter_sdk_python.pix.models.FixedDateDiscount import FixedDateDiscount
 
 
-@dataclass
+@dataclass(slots=True)
 class Discount:
     """
     The Discount class represents the details of a discount
@@ -9,7 +9,7 @@ from inter_sdk_python.pix.models.DueBillingValue import DueBillingValue
 from inter_sdk_python.pix.models.Location import Location
 
 
-@dataclass
+@dataclass(slots=True)
 class DueBilling:
     """
     The DueBilling class represents the details of a billing
@@ -4,7 +4,7 @@ from typing import Optional, List
 from inter_sdk_python.pix.models.DueBillingEntity import DueBillingEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class DueBillingBatch:
     """
     The DueBillingBatch class represents a batch of due billing
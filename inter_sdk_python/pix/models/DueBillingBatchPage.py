@@ -5,7 +5,7 @@ from inter_sdk_python.pix.models.DueBillingBatch import DueBillingBatch
 from inter_sdk_python.pix.models.Parameters import Parameters
 
 
-@dataclass
+@dataclass(slots=True)
 class DueBillingBatchPage:
     """
     The DueBillingBatchPage class represents a paginated
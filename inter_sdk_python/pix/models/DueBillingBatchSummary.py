@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class DueBillingBatchSummary:
     """
     The DueBillingBatchSummary class summarizes the results
@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.models.Problem import Problem
 
 
-@dataclass
+@dataclass(slots=True)
 class DueBillingEntity:
     """
     The DueBillingEntity class represents a single billing
@@ -5,7 +5,7 @@ from inter_sdk_python.pix.models.DetailedDuePixBilling import DetailedDuePixBill
 from inter_sdk_python.pix.models.Parameters import Parameters
 
 
-@dataclass
+@dataclass(slots=True)
 class DueBillingPage:
     """
     The DueBillingPage class represents a paginated response
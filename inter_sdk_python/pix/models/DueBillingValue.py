@@ -7,7 +7,7 @@ from inter_sdk_python.pix.models.Fine import Fine
 from inter_sdk_python.pix.models.Reduction import Reduction
 
 
-@dataclass
+@dataclass(slots=True)
 class DueBillingValue:
     """
     The DueBillingValue class represents the structure of a billing
@@ -9,7 +9,7 @@ from inter_sdk_python.pix.models.Location import Location
 from inter_sdk_python.pix.models.Receiver import Receiver
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedDueBilling:
     """
     The GeneratedDueBilling class represents a generated
@@ -9,7 +9,7 @@ from inter_sdk_python.pix.models.PixValue import PixValue
 from inter_sdk_python.pix.models.Receiver import Receiver
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedImmediateBilling:
     """
     The GeneratedImmediateBilling class represents a generated
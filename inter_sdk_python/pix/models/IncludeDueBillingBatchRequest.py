@@ -5,7 +5,7 @@ from typing import Optional, List
 from inter_sdk_python.pix.models.DueBilling import DueBilling
 
 
-@dataclass
+@dataclass(slots=True)
 class IncludeDueBillingBatchRequest:
     """
     The IncludeDueBillingBatchRequest class represents a request
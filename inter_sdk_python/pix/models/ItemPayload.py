@@ -5,7 +5,7 @@ from inter_sdk_python.pix.models.DevolutionRequestBody import DevolutionRequestB
 from inter_sdk_python.pix.models.ValueComponent import ValueComponent
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemPayload:
     """
     The ItemPayload class represents the payload for a transaction item,
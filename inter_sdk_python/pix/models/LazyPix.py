@@ -0,0 +1,11 @@
+from inter_sdk_python.commons.models.LazyModel import LazyModel
+from inter_sdk_python.pix.models.Pix import Pix
+
+
+class LazyPix(LazyModel, Pix):
+    """
+    The LazyPix class is a Pix that decodes each field from the raw
+    dictionary on first access, refunds and value components included.
+    """
+
+    __slots__ = ("_data", "_cache")
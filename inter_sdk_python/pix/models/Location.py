@@ -5,7 +5,7 @@ from typing import Optional
 from inter_sdk_python.pix.enums.ImmediateBillingType import ImmediateBillingType
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """
     The Location class represents information about a payment location
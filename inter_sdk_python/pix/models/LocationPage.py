@@ -5,7 +5,7 @@ from inter_sdk_python.pix.models.Location import Location
 from inter_sdk_python.pix.models.Parameters import Parameters
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationPage:
     """
     The LocationPage class represents a paginated response
@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.models.Pagination import Pagination
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameters:
     """
     The Parameters class represents a collection of parameters
@@ -2,11 +2,13 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
 
+from inter_sdk_python.commons.models.FieldMapping import FieldMapping
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
 from inter_sdk_python.pix.models.DetailedDevolution import DetailedDevolution
 from inter_sdk_python.pix.models.ValueComponent import ValueComponent
 
 
-@dataclass
+@dataclass(slots=True)
 class Pix:
     """
     The Pix class represents information related to a Pix payment.
@@ -40,6 +42,18 @@ class Pix:
     value_components: Optional[ValueComponent] = None
     """Components of the value associated with the payment."""
 
+    FIELD_MAP = (
+        FieldMapping("end_to_end_id", "endToEndId"),
+        FieldMapping("txid", "txid"),
+        FieldMapping("value", "valor"),
+        FieldMapping("key", "chave"),
+        FieldMapping("timestamp", "horario", FieldMapping.DATETIME),
+        FieldMapping("payer_info", "infoPagador"),
+        FieldMapping("refunds", "devolucoes", FieldMapping.MODEL_LIST, DetailedDevolution),
+        FieldMapping("value_components", "componentesValor", FieldMapping.MODEL, ValueComponent)
+    )
+    """The API key and conversion of each attribute, compiled by ModelCodec."""
+
     @staticmethod
     def from_dict(data: dict) -> 'Pix':
         """
@@ -51,16 +65,7 @@ class Pix:
         Returns:
             Pix: An instance of Pix.
         """
-        return Pix(
-            end_to_end_id=data.get("endToEndId"),
-            txid=data.get("txid"),
-            value=data.get("valor"),
-            key=data.get("chave"),
-            timestamp=datetime.fromisoformat(data["horario"]) if data.get("horario") else None,
-            payer_info=data.get("infoPagador"),
-            refunds=[DetailedDevolution.from_dict(refund) for refund in data.get("devolucoes", [])],
-            value_components=ValueComponent.from_dict(data["componentesValor"]) if data.get("componentesValor") else None
-        )
+        return ModelCodec.of(Pix).decode(data)
 
     def to_dict(self) -> dict:
         """
@@ -69,13 +74,4 @@ class Pix:
         Returns:
             dict: A dictionary representation of the Pix instance.
         """
-        return {
-            "endToEndId": self.end_to_end_id,
-            "txid": self.txid,
-            "valor": self.value,
-            "chave": self.key,
-            "horario": self.timestamp.isoformat() if self.timestamp else None,
-            "infoPagador": self.payer_info,
-            "devolucoes": [refund.to_dict() for refund in self.refunds],
-            "componentesValor": self.value_components.to_dict() if self.value_components else None
-        }
\ No newline at end of file
+        return ModelCodec.of(Pix).encode(self)
\ No newline at end of file
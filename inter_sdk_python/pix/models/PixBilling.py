@@ -9,7 +9,7 @@ from inter_sdk_python.pix.models.Location import Location
 from inter_sdk_python.pix.models.PixValue import PixValue
 
 
-@dataclass
+@dataclass(slots=True)
 class PixBilling:
     """
     The PixBilling class represents the detailed information
@@ -4,7 +4,7 @@ from typing import Optional, List
 from inter_sdk_python.pix.models.RetrieveCallbackResponse import RetrieveCallbackResponse
 
 
-@dataclass
+@dataclass(slots=True)
 class PixCallbackPage:
     """
     The PixCallbackPage class represents a paginated response
@@ -59,6 +59,7 @@ class PixCallbackPage:
         Returns:
             PixCallbackPage: An instance of PixCallbackPage.
         """
+        items = data.get("data")
         return PixCallbackPage(
             total_pages=data.get("totalPaginas"),
             total_elements=data.get("totalElementos"),
@@ -66,7 +67,7 @@ class PixCallbackPage:
             first_page=data.get("primeiraPagina"),
             page_size=data.get("tamanhoPagina"),
             number_of_elements=data.get("numeroDeElementos"),
-            data=[RetrieveCallbackResponse.from_dict(item) for item in data.get("data", [])] if data.get("data") else None
+            data=[RetrieveCallbackResponse.from_dict(item) for item in items] if items else None
         )
 
     def to_dict(self) -> dict:
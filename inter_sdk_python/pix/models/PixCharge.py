@@ -8,7 +8,7 @@ from inter_sdk_python.pix.models.Location import Location
 from inter_sdk_python.pix.models.PixValue import PixValue
 
 
-@dataclass
+@dataclass(slots=True)
 class PixCharge:
     """
     The PixCharge class represents a payment request or transaction
@@ -1,11 +1,13 @@
 from dataclasses import dataclass, field
 from typing import Optional, List
 
+from inter_sdk_python.commons.utils.ModelCodec import ModelCodec
+from inter_sdk_python.pix.models.LazyPix import LazyPix
 from inter_sdk_python.pix.models.Parameters import Parameters
 from inter_sdk_python.pix.models.Pix import Pix
 
 
-@dataclass
+@dataclass(slots=True)
 class PixPage:
     """
     The PixPage class represents a paginated response containing
@@ -33,19 +35,21 @@ class PixPage:
         return self.parameters.pagination.total_pages
 
     @staticmethod
-    def from_dict(data: dict) -> 'PixPage':
+    def from_dict(data: dict, lazy: bool = False) -> 'PixPage':
         """
         Create a PixPage instance from a dictionary.
 
         Args:
             data (dict): A dictionary containing the PixPage data.
+            lazy (bool): Indicates if the Pix items decode each field only on first access - default is False.
 
         Returns:
             PixPage: An instance of PixPage.
         """
+        decode = LazyPix.wrap if lazy else ModelCodec.of(Pix).decode
         return PixPage(
             parameters=Parameters.from_dict(data["parametros"]) if data.get("parametros") else None,
-            pix_list=[Pix.from_dict(pix) for pix in data.get("pix", [])]
+            pix_list=[decode(pix) for pix in data.get("pix", [])]
         )
 
     def to_dict(self) -> dict:
@@ -4,7 +4,7 @@ from typing import List
 from inter_sdk_python.pix.models.ItemPayload import ItemPayload
 
 
-@dataclass
+@dataclass(slots=True)
 class PixPayload:
     """
     The PixPayload class represents a container for a list of
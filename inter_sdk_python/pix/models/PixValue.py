@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.models.WithdrawalTransaction import WithdrawalTransaction
 
 
-@dataclass
+@dataclass(slots=True)
 class PixValue:
     """
     The PixValue class represents the amount involved in a
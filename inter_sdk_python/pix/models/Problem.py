@@ -4,7 +4,7 @@ from typing import Optional, List
 from inter_sdk_python.pix.models.Violation import Violation
 
 
-@dataclass
+@dataclass(slots=True)
 class Problem:
     """
     The Problem class represents an error or problem encountered
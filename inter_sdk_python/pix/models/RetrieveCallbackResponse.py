@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.models.PixPayload import PixPayload
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrieveCallbackResponse:
     """
     The RetrieveCallbackResponse class represents the response
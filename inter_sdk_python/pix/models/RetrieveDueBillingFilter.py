@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.enums.BillingStatus import BillingStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrieveDueBillingFilter:
     """
     The RetrieveDueBillingFilter class is used to filter billing
@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.enums.BillingStatus import BillingStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrieveImmediateBillingsFilter:
     """
     The RetrieveImmediateBillingsFilter class is used to filter
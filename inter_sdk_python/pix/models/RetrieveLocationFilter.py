@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.enums.ImmediateBillingType import ImmediateBillingType
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrieveLocationFilter:
     """
     The RetrieveLocationFilter class is used to filter location
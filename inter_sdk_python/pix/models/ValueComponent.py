@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.models.ComponentValue import ComponentValue
 
 
-@dataclass
+@dataclass(slots=True)
 class ValueComponent:
     """
     The ValueComponent class represents various monetary
@@ -4,7 +4,7 @@ from typing import Optional
 from inter_sdk_python.pix.enums.AgentModality import AgentModality
 
 
-@dataclass
+@dataclass(slots=True)
 class Withdrawal:
     """
     The Withdrawal class represents details regarding a withdrawal
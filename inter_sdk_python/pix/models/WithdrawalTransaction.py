@@ -5,7 +5,7 @@ from inter_sdk_python.pix.models.Change import Change
 from inter_sdk_python.pix.models.Withdrawal import Withdrawal
 
 
-@dataclass
+@dataclass(slots=True)
 class WithdrawalTransaction:
     """
     The WithdrawalTransaction class represents details of a
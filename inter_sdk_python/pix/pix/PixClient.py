@@ -1,10 +1,15 @@
 import json
 import logging
-from typing import List
+from datetime import timedelta
+from typing import Iterator, List, Optional
 
 from inter_sdk_python.commons.models.Config import Config
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
 from inter_sdk_python.commons.structures.Constants import Constants
+from inter_sdk_python.commons.utils.DateRangeSharder import DateRangeSharder
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.JsonCodec import JsonCodec
+from inter_sdk_python.commons.utils.PaginationUtils import PaginationUtils
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 from inter_sdk_python.pix.models.DetailedDevolution import DetailedDevolution
 from inter_sdk_python.pix.models.DevolutionRequestBody import DevolutionRequestBody
@@ -42,7 +47,7 @@ class PixClient:
         url = f"{UrlUtils.build_url(config, Constants.URL_PIX_PIX)}/{e2e_id}/devolucao/{id}"
         
         try:
-            json_data = json.dumps(devolution_request_body.to_dict(), indent=4)
+            json_data = JsonCodec.of(config).dumps(devolution_request_body.to_dict())
             json_response = HttpUtils.call_put(config, url, Constants.PIX_WRITE_SCOPE, "Error requesting devolution", json_data)
             return DetailedDevolution.from_dict(json_response)
         except json.JSONDecodeError as io_exception:
@@ -152,23 +157,123 @@ class PixClient:
         Returns:
             List[Pix]: A list of objects containing all retrieved Pix transactions.
 
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        return list(self.iter_pix_list_in_range(config, initial_date, final_date, filter))
+
+    def iter_pix_list_in_range(
+        self, 
+        config: Config, 
+        initial_date: str, 
+        final_date: str, 
+        filter: RetrievedPixFilter
+    ) -> Iterator[Pix]:
+        """
+        Yields the Pix transactions within the specified date range page by page, so at most config.pagination_workers
+        pages are kept in memory and the first items are available as soon as the first page is retrieved.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (RetrievedPixFilter): An object containing filter criteria.
+
+        Returns:
+            Iterator[Pix]: The Pix transactions, in page order.
+
         Raises:
             SdkException: If there is an error during the retrieval process, such as network issues
                            or API response errors.
         """
         logging.info("RetrievePixList {} {}-{}".format(config.client_id, initial_date, final_date))
-        
-        page = 0
-        pix_list = []
 
-        while True:
-            pix_page = self.get_page(config, initial_date, final_date, page, None, filter)
-            pix_list.extend(pix_page.pix_list)
-            page += 1
-            if page >= pix_page.total_pages:
-                break
-        
-        return pix_list
+        yield from PaginationUtils.iterate(
+            config,
+            lambda page: self.get_page(config, initial_date, final_date, page, None, filter),
+            lambda current_page: current_page.pix_list
+        )
+
+    def iter_pix_list_resumable(
+        self,
+        config: Config,
+        initial_date: str,
+        final_date: str,
+        filter: RetrievedPixFilter,
+        checkpoint_file: str,
+        page_size: Optional[int] = None
+    ) -> Iterator[Pix]:
+        """
+        Yields the Pix transactions within the specified date range, resuming after the last page recorded in
+        checkpoint_file. The checkpoint is saved there after each page, so an interrupted retrieval
+        continues from the next page when called again with the same arguments.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start date for the retrieval range (inclusive).
+            final_date (str): The end date for the retrieval range (inclusive).
+            filter (RetrievedPixFilter): An object containing filter criteria.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[Pix]: The Pix transactions not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrievePixList {} {}-{}".format(config.client_id, initial_date, final_date))
+
+        checkpoint = PaginationCheckpoint.of(Constants.URL_PIX_PIX, initial_date, final_date, filter, None, page_size)
+        yield from PaginationUtils.iterate_resumable(
+            checkpoint_file,
+            checkpoint,
+            lambda page: self.get_page(config, initial_date, final_date, page, page_size, filter),
+            lambda current_page: current_page.pix_list
+        )
+
+    def iter_pix_list_sharded(
+        self,
+        config: Config,
+        initial_date: str,
+        final_date: str,
+        filter: RetrievedPixFilter,
+        shard_size: Optional[timedelta] = None,
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[Pix]:
+        """
+        Yields the Pix transactions within the specified range, splitting it into hour windows retrieved
+        concurrently by up to config.pagination_workers workers. Windows with too many pages are split
+        again, and items are yielded in chronological window order.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date (str): The start of the range (inclusive), YYYY-MM-DDTHH:MM:SSZ.
+            final_date (str): The end of the range (inclusive), YYYY-MM-DDTHH:MM:SSZ.
+            filter (RetrievedPixFilter): An object containing filter criteria.
+            shard_size (Optional[timedelta]): Length of each window - default is one hour.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[Pix]: The Pix transactions, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrievePixList {} {}-{}".format(config.client_id, initial_date, final_date))
+
+        yield from DateRangeSharder.of(config, shard_size, max_pages_per_shard).iterate(
+            initial_date,
+            final_date,
+            lambda start, end, page: self.get_page(config, start, end, page, None, filter),
+            lambda current_page: current_page.pix_list,
+            lambda pix: pix.end_to_end_id or repr(pix),
+            lambda pix: pix.timestamp
+        )
     
     def get_page(
         self, 
@@ -208,7 +313,7 @@ class PixClient:
         json_response = HttpUtils.call_get(config, url, Constants.PIX_READ_SCOPE, "Error retrieving pix")
         
         try:
-            return PixPage.from_dict(json_response)
+            return PixPage.from_dict(json_response, config.lazy_models)
         except json.JSONDecodeError as io_exception:
             logging.error(Constants.GENERIC_EXCEPTION_MESSAGE, exc_info=io_exception)
             raise
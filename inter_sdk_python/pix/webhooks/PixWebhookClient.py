@@ -1,14 +1,18 @@
 import json
 import logging
-from typing import List
+from datetime import timedelta
+from typing import Iterator, List, Optional
 
 from inter_sdk_python.commons.exceptions.SdkException import SdkException
 from inter_sdk_python.commons.models.Config import Config
 from inter_sdk_python.commons.models.Error import Error
 from inter_sdk_python.commons.models.IncludeWebhookRequest import IncludeWebhookRequest
 from inter_sdk_python.commons.models.Webhook import Webhook
+from inter_sdk_python.commons.models.PaginationCheckpoint import PaginationCheckpoint
 from inter_sdk_python.commons.structures.Constants import Constants
+from inter_sdk_python.commons.utils.DateRangeSharder import DateRangeSharder
 from inter_sdk_python.commons.utils.HttpUtils import HttpUtils
+from inter_sdk_python.commons.utils.PaginationUtils import PaginationUtils
 from inter_sdk_python.commons.utils.UrlUtils import UrlUtils
 from inter_sdk_python.commons.utils.WebhookUtil import WebhookUtil
 from inter_sdk_python.pix.models.CallbackRetrieveFilter import CallbackRetrieveFilter
@@ -105,23 +109,123 @@ class PixWebhookClient:
         Returns:
             List[RetrieveCallbackResponse]: A list of objects containing all retrieved callbacks.
 
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        return list(self.iter_callbacks_in_range(config, initial_date_hour, final_date_hour, filter))
+
+    def iter_callbacks_in_range(
+        self, 
+        config: Config, 
+        initial_date_hour: str, 
+        final_date_hour: str, 
+        filter: CallbackRetrieveFilter
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callback notifications within the specified date range page by page, so at most config.pagination_workers
+        pages are kept in memory and the first items are available as soon as the first page is retrieved.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date_hour (str): The start date and time for the retrieval range (inclusive).
+            final_date_hour (str): The end date and time for the retrieval range (inclusive).
+            filter (CallbackRetrieveFilter): An object containing filter criteria.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callback notifications, in page order.
+
         Raises:
             SdkException: If there is an error during the retrieval process, such as network issues
                            or API response errors.
         """
         logging.info("RetrieveCallbacks pix {} {}-{}".format(config.client_id, initial_date_hour, final_date_hour))
-        
-        page = 0
-        callbacks = []
-
-        while True:
-            callback_page = self.get_page(config, initial_date_hour, final_date_hour, page, None, filter)
-            callbacks.extend(callback_page.data)
-            page += 1
-            if page >= callback_page.total_pages:
-                break
-        
-        return callbacks
+
+        yield from PaginationUtils.iterate(
+            config,
+            lambda page: self.get_page(config, initial_date_hour, final_date_hour, page, None, filter),
+            lambda current_page: current_page.data
+        )
+
+    def iter_callbacks_resumable(
+        self,
+        config: Config,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: CallbackRetrieveFilter,
+        checkpoint_file: str,
+        page_size: Optional[int] = None
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callback notifications within the specified date range, resuming after the last page recorded in
+        checkpoint_file. The checkpoint is saved there after each page, so an interrupted retrieval
+        continues from the next page when called again with the same arguments.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date_hour (str): The start date and time for the retrieval range (inclusive).
+            final_date_hour (str): The end date and time for the retrieval range (inclusive).
+            filter (CallbackRetrieveFilter): An object containing filter criteria.
+            checkpoint_file (str): The JSON file keeping the progress; delete it to start over.
+            page_size (Optional[int]): The number of items per page - default is the API default.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callback notifications not consumed yet, in page order.
+
+        Raises:
+            ValueError: If checkpoint_file belongs to a different retrieval.
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveCallbacks pix {} {}-{}".format(config.client_id, initial_date_hour, final_date_hour))
+
+        checkpoint = PaginationCheckpoint.of(Constants.URL_PIX_WEBHOOK_CALLBACKS, initial_date_hour, final_date_hour, filter, None, page_size)
+        yield from PaginationUtils.iterate_resumable(
+            checkpoint_file,
+            checkpoint,
+            lambda page: self.get_page(config, initial_date_hour, final_date_hour, page, page_size, filter),
+            lambda current_page: current_page.data
+        )
+
+    def iter_callbacks_sharded(
+        self,
+        config: Config,
+        initial_date_hour: str,
+        final_date_hour: str,
+        filter: CallbackRetrieveFilter,
+        shard_size: Optional[timedelta] = None,
+        max_pages_per_shard: int = DateRangeSharder.DEFAULT_MAX_PAGES_PER_SHARD
+    ) -> Iterator[RetrieveCallbackResponse]:
+        """
+        Yields the callback notifications within the specified range, splitting it into hour windows retrieved
+        concurrently by up to config.pagination_workers workers. Windows with too many pages are split
+        again, and items are yielded in chronological window order.
+
+        Args:
+            config (Config): The configuration object containing client information.
+            initial_date_hour (str): The start of the range (inclusive), YYYY-MM-DDTHH:MM:SSZ.
+            final_date_hour (str): The end of the range (inclusive), YYYY-MM-DDTHH:MM:SSZ.
+            filter (CallbackRetrieveFilter): An object containing filter criteria.
+            shard_size (Optional[timedelta]): Length of each window - default is one hour.
+            max_pages_per_shard (int): Number of pages above which a window is split again - default is 10.
+
+        Returns:
+            Iterator[RetrieveCallbackResponse]: The callback notifications, in chronological window order.
+
+        Raises:
+            SdkException: If there is an error during the retrieval process, such as network issues
+                           or API response errors.
+        """
+        logging.info("RetrieveCallbacks pix {} {}-{}".format(config.client_id, initial_date_hour, final_date_hour))
+
+        yield from DateRangeSharder.of(config, shard_size, max_pages_per_shard).iterate(
+            initial_date_hour,
+            final_date_hour,
+            lambda start, end, page: self.get_page(config, start, end, page, None, filter),
+            lambda current_page: current_page.data,
+            repr,
+            lambda callback: callback.trigger_timestamp
+        )
     
     def retrieve_webhook(self, config: Config, key: str) -> Webhook:
         """